@@ -0,0 +1,174 @@
+# Copyright (C) 2026 RemoteRF
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Microbenchmark for the legacy GenericRPC codec in ``process_arg``.
+
+Decodes a Pluto ``rx`` / HackRF ``read_samples`` sized response (1M complex64
+samples by default) in each wire form a server may send, with the current
+``unmap_arg`` and with the per-element decoder it replaced::
+
+    python benchmarks/codec.py --samples 1000000 --repeat 5
+
+Prints one JSON document with median milliseconds per form and the speedup.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+
+import numpy as np
+
+from remoteRF.common.grpc import grpc_pb2
+from remoteRF.common.utils.process_arg import _JSON_TYPE_KEY, map_arg, unmap_arg
+
+
+def _previous_unmap_arg(arg):
+    """The decoder before vectorization, kept here as the baseline."""
+    kind = arg.WhichOneof("value")
+    if kind == "ndarray_value":
+        descriptor = arg.ndarray_value
+        return (
+            np.frombuffer(descriptor.data, dtype=np.dtype(descriptor.dtype))
+            .reshape(tuple(descriptor.shape))
+            .copy()
+        )
+    if kind == "real_array":
+        shape = tuple(arg.real_array.shape.dim)
+        return np.array(arg.real_array.data, dtype=np.float64).reshape(shape)
+    if kind == "complex_array":
+        shape = tuple(arg.complex_array.shape.dim)
+        data = [complex(item.real, item.imag) for item in arg.complex_array.data]
+        return np.array(data, dtype=np.complex64).reshape(shape)
+    if kind == "json_value":
+        return _previous_json_restore(json.loads(arg.json_value))
+    raise ValueError(kind)
+
+
+def _previous_json_restore(value):
+    if isinstance(value, dict):
+        kind = value.get(_JSON_TYPE_KEY)
+        if kind == "ndarray":
+            shape = tuple(value.get("shape", ()))
+            dtype = value.get("dtype")
+            if value.get("complex"):
+                data = [complex(real, imag) for real, imag in value.get("data", [])]
+                return np.array(data, dtype=dtype or np.complex64).reshape(shape)
+            return np.array(value.get("data", []), dtype=dtype).reshape(shape)
+        if kind == "complex":
+            return complex(value.get("real", 0.0), value.get("imag", 0.0))
+        return {key: _previous_json_restore(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_previous_json_restore(item) for item in value]
+    return value
+
+
+def _previous_json_pairs(array):
+    """The complex JSON encoding before vectorization."""
+    return [[float(num.real), float(num.imag)] for num in array.ravel()]
+
+
+def _complex_array_response(samples):
+    arg = grpc_pb2.Argument()
+    arg.complex_array.shape.dim.extend(samples.shape)
+    items = arg.complex_array.data
+    for value in samples.ravel():
+        item = items.add()
+        item.real = float(value.real)
+        item.imag = float(value.imag)
+    return arg
+
+
+def _real_array_response(values):
+    arg = grpc_pb2.Argument()
+    arg.real_array.shape.dim.extend(values.shape)
+    arg.real_array.data.extend(values.ravel().tolist())
+    return arg
+
+
+def _received(arg):
+    """Round-trip through bytes so the decoder sees a freshly parsed message."""
+    return grpc_pb2.Argument.FromString(arg.SerializeToString())
+
+
+def _median_ms(fn, arg, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(arg)
+        timings.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(timings)
+
+
+def run(sample_count: int = 1_000_000, repeat: int = 5) -> dict:
+    rng = np.random.default_rng(0)
+    # 12-bit ADC codes scaled like pyadi-iio output, so exact zeros occur.
+    codes = rng.integers(-2048, 2048, size=(sample_count, 2))
+    samples = (codes[:, 0] + 1j * codes[:, 1]).astype(np.complex64)
+
+    forms = {
+        "ndarray": _received(map_arg(samples)),
+        "real_array": _received(_real_array_response(samples.real)),
+        "complex_array": _received(_complex_array_response(samples)),
+        "json_tuple": _received(map_arg((sample_count, samples, {"error_code": "none"}))),
+    }
+    report = {}
+    for name, arg in forms.items():
+        before = _median_ms(_previous_unmap_arg, arg, repeat)
+        after = _median_ms(unmap_arg, arg, repeat)
+        result = {
+            "wire_bytes": arg.ByteSize(),
+            "previous_ms": round(before, 3),
+            "current_ms": round(after, 3),
+            "speedup": round(before / after, 2) if after else None,
+        }
+        if name == "json_tuple":
+            encode_before = _median_ms(_previous_json_pairs, samples, repeat)
+            encode_after = _median_ms(
+                lambda array: np.stack((array.real.ravel(), array.imag.ravel()), -1).tolist(),
+                samples,
+                repeat,
+            )
+            result["encode_pairs_previous_ms"] = round(encode_before, 3)
+            result["encode_pairs_current_ms"] = round(encode_after, 3)
+        if name == "ndarray":
+            view_ms = _median_ms(lambda item: unmap_arg(item, copy=False), arg, repeat)
+            result["zero_copy_ms"] = round(view_ms, 3)
+        decoded = unmap_arg(arg)
+        expected = samples.real if name == "real_array" else samples
+        decoded = decoded[1] if name == "json_tuple" else decoded
+        np.testing.assert_array_equal(decoded, expected)
+        report[name] = result
+    return {
+        "benchmark": "process_arg_codec",
+        "samples": sample_count,
+        "repeat": repeat,
+        "forms": report,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.samples, max(1, args.repeat)), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
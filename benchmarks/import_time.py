@@ -0,0 +1,131 @@
+# Copyright (C) 2026 RemoteRF
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Measure cold import time of the RemoteRF client packages.
+
+Each module is imported in a fresh interpreter with ``-X importtime`` and a
+HOME that has no RemoteRF config, so any import-time I/O or channel setup
+shows up as a failure rather than as noise. Prints one JSON document::
+
+    python benchmarks/import_time.py --repeat 7 --max-ms 400
+
+The run exits non-zero when a module pulls in a lazy-only dependency
+(``grpc``, ``prompt_toolkit``, ``dotenv`` or ``remoteRF.core.grpc_client``),
+when an import builds the client channels, or when ``--max-ms`` is given and
+a median exceeds it.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+
+DEFAULT_MODULES = (
+    "remoteRF",
+    "remoteRF.core.grpc_client",
+    "remoteRF.drivers.hackrf",
+    "remoteRF.drivers.rtl_sdr",
+    "remoteRF.drivers.ti_mmwave",
+    "remoteRF.drivers.adalm_pluto",
+)
+LAZY_ONLY = ("grpc", "prompt_toolkit", "dotenv", "remoteRF.core.grpc_client")
+# grpc_client is the module that owns the network stack; it just must not
+# read config or build channels until the first RPC.
+_ALLOWED = {"remoteRF.core.grpc_client": {"grpc", "dotenv", "remoteRF.core.grpc_client"}}
+_IMPORTTIME = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def measure(module: str, home: str) -> dict:
+    """Import ``module`` once in a subprocess and return its timing report."""
+    probe = (
+        f"import {module}, sys, json; "
+        f"client = sys.modules.get('remoteRF.core.grpc_client'); "
+        f"loaded = [m for m in {list(LAZY_ONLY)!r} if m in sys.modules]; "
+        f"loaded += ['channels'] if getattr(client, '_client', None) else []; "
+        f"print(json.dumps(sorted(loaded)))"
+    )
+    env = dict(os.environ, HOME=home, USERPROFILE=home)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    total_us = 0
+    top_level = {}
+    for line in completed.stderr.splitlines():
+        match = _IMPORTTIME.match(line)
+        if match is None:
+            continue
+        cumulative, indent, name = int(match.group(2)), match.group(3), match.group(4)
+        if len(indent) == 1:
+            total_us += cumulative
+            top_level[name] = cumulative
+    loaded = json.loads(completed.stdout.strip().splitlines()[-1])
+    loaded = [name for name in loaded if name not in _ALLOWED.get(module, ())]
+    return {"total_ms": total_us / 1000.0, "top_level": top_level, "lazy_loaded": loaded}
+
+
+def run(modules, repeat: int) -> dict:
+    results = {}
+    with tempfile.TemporaryDirectory() as home:
+        for module in modules:
+            samples = [measure(module, home) for _ in range(repeat)]
+            totals = [sample["total_ms"] for sample in samples]
+            slowest = max(samples[-1]["top_level"].items(), key=lambda item: item[1])
+            results[module] = {
+                "median_ms": round(statistics.median(totals), 2),
+                "min_ms": round(min(totals), 2),
+                "max_ms": round(max(totals), 2),
+                "slowest_top_level": {"module": slowest[0], "ms": slowest[1] / 1000.0},
+                "lazy_loaded": samples[-1]["lazy_loaded"],
+            }
+    return {
+        "benchmark": "import_time",
+        "python": sys.version.split()[0],
+        "repeat": repeat,
+        "modules": results,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=list(DEFAULT_MODULES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    report = run(args.modules, max(1, args.repeat))
+    print(json.dumps(report, indent=2))
+
+    failed = False
+    for module, result in report["modules"].items():
+        if result["lazy_loaded"]:
+            print(f"{module} imported {', '.join(result['lazy_loaded'])}", file=sys.stderr)
+            failed = True
+        if args.max_ms is not None and result["median_ms"] > args.max_ms:
+            print(f"{module} took {result['median_ms']} ms", file=sys.stderr)
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
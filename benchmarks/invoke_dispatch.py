@@ -0,0 +1,201 @@
+# Copyright (C) 2026 RemoteRF
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Microbenchmark for the client-side CPU cost of a Dynamic v2 control call.
+
+Builds the packaged USRP bindings on an in-process stub transport, so no RPC
+is made. It then times hot control calls with the compiled ``OverloadBinder``
+and with the per-call binder it replaced::
+
+    python benchmarks/invoke_dispatch.py --calls 20000
+
+Prints one JSON document with median microseconds per call for argument
+binding alone and for the whole invoke path.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import numbers
+import statistics
+import sys
+import time
+
+import numpy as np
+
+from remoteRF.drivers import dynamic_v2
+from remoteRF.drivers.support import uhd_v2
+from remoteRF.drivers.usrp import usrp_remote
+
+
+def _previous_matches_type(value, wire_type: str) -> bool:
+    choices = {item.strip() for item in str(wire_type or "any").split("|")}
+    if value is None:
+        return "None" in choices or "any" in choices
+    if "any" in choices:
+        return True
+    for choice in choices:
+        if choice == "bool" and isinstance(value, (bool, np.bool_)):
+            return True
+        if choice == "int" and isinstance(value, (numbers.Integral, np.integer)) and not isinstance(value, bool):
+            return True
+        if (
+            choice == "float"
+            and isinstance(value, (numbers.Real, np.integer, np.floating))
+            and not isinstance(value, bool)
+        ):
+            return True
+        if choice == "str" and isinstance(value, str):
+            return True
+        if choice.startswith("uhd."):
+            expected = getattr(uhd_v2, choice.rsplit(".", 1)[-1], None)
+            if isinstance(expected, type) and isinstance(value, expected):
+                return True
+    return False
+
+
+class _PreviousBinder:
+    """The binder before compilation: rebuilt per call, overloads tried in turn."""
+
+    def __init__(self, descriptor):
+        self.descriptor = descriptor
+
+    def bind(self, args, kwargs):
+        for candidate in self.descriptor.get("overloads", ()):
+            try:
+                return candidate["id"], self._bind_one(candidate, args, kwargs)
+            except TypeError:
+                pass
+        raise TypeError(f"{self.descriptor['name']}(): incompatible arguments")
+
+    def _bind_one(self, candidate, args, kwargs):
+        positional = list(args)
+        keywords = dict(kwargs)
+        bound = {}
+        for spec in candidate.get("parameters", ()):
+            name = spec["name"]
+            if positional:
+                value = positional.pop(0)
+                supplied = True
+            elif name in keywords:
+                value = keywords.pop(name)
+                supplied = True
+            elif not spec.get("required", True):
+                value, supplied = spec.get("default"), False
+            else:
+                raise TypeError(f"missing required argument {name!r}")
+            if supplied and not _previous_matches_type(value, spec.get("type", "any")):
+                raise TypeError(f"argument {name!r} has the wrong type")
+            bound[name] = value
+        if positional or keywords:
+            raise TypeError("too many arguments")
+        return bound
+
+
+class StubTransport:
+    """Answers control calls locally so only client-side work is timed."""
+
+    def negotiate(self):
+        return None
+
+    def open_session(self, token, schema_hash):
+        return {
+            "session_id": "session",
+            "device_handle": "device",
+            "schema": None,
+            "schema_hash": schema_hash,
+            "capabilities": {},
+            "uhd_version": usrp_remote._SCHEMA["native_api"]["version"],
+        }
+
+    def invoke(self, session_id, handle, method, args, overload_id=""):
+        if method == "get_time_now":
+            return {"__uhd_type__": "TimeSpec", "secs": 1.5}, {}
+        return None, {}
+
+    def close_session(self, session_id):
+        return True
+
+
+def _calls(uhd):
+    return {
+        "get_time_now": ((), {}),
+        "set_command_time": ((uhd.types.TimeSpec(2.0),), {}),
+        "issue_stream_cmd": ((uhd.types.StreamCMD(uhd.types.StreamMode.start_cont),), {"chan": 0}),
+        "set_rx_gain(name)": ((10.0, "PGA", 0), {}),
+    }
+
+
+def _median_us(fn, calls: int, rounds: int = 5) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        timings.append((time.perf_counter() - start) * 1e6 / calls)
+    return statistics.median(timings)
+
+
+def run(calls: int) -> dict:
+    uhd, MultiUSRP = dynamic_v2.build_uhd_bindings(
+        usrp_remote._SCHEMA,
+        transport_factory=StubTransport,
+        precompiled=usrp_remote._PRECOMPILED,
+    )
+    usrp = MultiUSRP("token")
+    descriptors = {
+        descriptor["name"]: descriptor
+        for descriptor in usrp_remote._SCHEMA["methods"]
+        if descriptor["owner"] == "uhd.usrp.MultiUSRP"
+    }
+    report = {}
+    current_binder = dynamic_v2._binder
+    for label, (args, kwargs) in _calls(uhd).items():
+        name = label.partition("(")[0]
+        descriptor = descriptors[name]
+        binder = current_binder(usrp, descriptor)
+        assert binder.bind(args, kwargs) == _PreviousBinder(descriptor).bind(args, kwargs)
+        method = getattr(usrp, name)
+        result = {
+            "bind_previous_us": _median_us(
+                lambda: _PreviousBinder(descriptor).bind(args, kwargs), calls
+            ),
+            "bind_current_us": _median_us(lambda: binder.bind(args, kwargs), calls),
+        }
+        dynamic_v2._binder = lambda owner, item: _PreviousBinder(item)
+        try:
+            result["invoke_previous_us"] = _median_us(lambda: method(*args, **kwargs), calls)
+        finally:
+            dynamic_v2._binder = current_binder
+        result["invoke_current_us"] = _median_us(lambda: method(*args, **kwargs), calls)
+        result = {key: round(value, 3) for key, value in result.items()}
+        result["invoke_speedup"] = round(
+            result["invoke_previous_us"] / result["invoke_current_us"], 2
+        )
+        report[label] = result
+    usrp.close()
+    return {"benchmark": "v2_invoke_dispatch", "calls": calls, "methods": report}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20_000)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(max(1, args.calls)), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
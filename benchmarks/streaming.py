@@ -0,0 +1,378 @@
+# Copyright (C) 2026 RemoteRF
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""End-to-end benchmark of the RemoteRF client over a loopback gRPC server.
+
+Starts an in-process stand-in server that implements ``GenericRPC``,
+``DynamicControlV2`` and ``SampleDataV1``. The server answers instantly with
+zero-filled sample blocks, so the numbers are client, codec and gRPC cost
+with no radio in the loop. The packaged USRP driver connects to it over a
+plaintext loopback channel. The benchmark measures:
+
+* ``RXStreamer.recv`` / ``TXStreamer.send`` throughput in MS/s per channel,
+  across buffer sizes, sample formats and channel counts (RX also runs with
+  ``remoterf_credits``);
+* Dynamic v2 ``invoke`` latency percentiles; and
+* legacy ``rpc_client`` (``GenericRPC.Call``) latency percentiles.
+
+::
+
+    python benchmarks/streaming.py --sizes 1024,16384,262144 --seconds 1
+
+Prints one JSON document to track from release to release.
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import platform
+import statistics
+import sys
+import time
+from concurrent import futures
+
+import grpc
+import numpy as np
+
+from remoteRF.common.grpc import grpc_pb2, grpc_pb2_grpc
+from remoteRF.common.grpc.v2_codec import encode_value
+from remoteRF.common.utils.process_arg import map_arg
+from remoteRF.core import grpc_client
+from remoteRF.core.channel_pool import POOL_NAMES, ChannelPool
+from remoteRF.core.dynamic_v2_transport import (
+    CONTROL_PROTOCOL_VERSION,
+    SCHEMA_VERSION,
+    STREAMING_PROTOCOL_VERSION,
+    _response_dtype,
+)
+from remoteRF.drivers.usrp import usrp_remote
+
+# name -> (cpu_format, otw_format, buffer dtype)
+FORMATS = {
+    "fc32": ("fc32", "", np.complex64),
+    "fc64": ("fc64", "", np.complex128),
+    "fc32/sc16": ("fc32", "sc16", np.complex64),
+}
+_HANDLE_TYPES = {
+    "get_rx_stream": "uhd.usrp.RXStreamer",
+    "get_tx_stream": "uhd.usrp.TXStreamer",
+}
+_CAPABILITIES = {
+    "hardware_profile": "usrp2901",
+    "sample_wire_formats": ["sc16", "sc8"],
+    "remote_resource_limits": {"maximum_sample_payload_bytes": 64 * 1024 * 1024},
+}
+
+
+def _reply(frame, **fields):
+    return grpc_pb2.SampleFrame(
+        session_id=frame.session_id,
+        handle=frame.handle,
+        generation=frame.generation,
+        operation_id=frame.operation_id,
+        sequence=frame.sequence,
+        direction=frame.direction,
+        **fields,
+    )
+
+
+class ControlServicer(grpc_pb2_grpc.DynamicControlV2Servicer):
+    """Opens sessions on the packaged USRP schema and answers calls at once."""
+
+    def __init__(self, schema: dict):
+        self.schema = schema
+        self.schema_json = json.dumps(schema)
+        self.handles = itertools.count(1)
+
+    def Negotiate(self, request, context):
+        return grpc_pb2.NegotiateResponse(
+            schema_version=SCHEMA_VERSION,
+            control_protocol_version=CONTROL_PROTOCOL_VERSION,
+            streaming_protocol_version=STREAMING_PROTOCOL_VERSION,
+        )
+
+    def GetSchema(self, request, context):
+        return grpc_pb2.GetSchemaResponse(
+            schema_version=SCHEMA_VERSION,
+            schema_hash=self.schema["schema_hash"],
+            schema_json="" if request.hash_only else self.schema_json,
+        )
+
+    def OpenSession(self, request, context):
+        return grpc_pb2.OpenSessionResponse(
+            session_id="bench-session",
+            device_handle="bench-device",
+            schema_hash=self.schema["schema_hash"],
+            schema_json="" if request.omit_schema else self.schema_json,
+            capabilities_json=json.dumps(_CAPABILITIES),
+            uhd_version=self.schema["native_api"]["version"],
+            hardware_profile=_CAPABILITIES["hardware_profile"],
+        )
+
+    def Invoke(self, request, context):
+        return self._invoke(request)
+
+    def InvokeBatch(self, request, context):
+        return grpc_pb2.InvokeBatchResponse(
+            results=[self._invoke(call) for call in request.calls]
+        )
+
+    def CloseHandle(self, request, context):
+        return grpc_pb2.CloseResponse(closed=True)
+
+    def CloseSession(self, request, context):
+        return grpc_pb2.CloseResponse(closed=True)
+
+    def _invoke(self, request):
+        result = None
+        if request.method in _HANDLE_TYPES:
+            result = {
+                "__remoterf_handle__": f"{request.method}-{next(self.handles)}",
+                "__remoterf_type__": _HANDLE_TYPES[request.method],
+                "generation": 1,
+            }
+        elif request.method == "get_time_now":
+            result = {"__uhd_type__": "TimeSpec", "secs": time.monotonic()}
+        return grpc_pb2.InvokeResponse(result=encode_value(result))
+
+
+class SampleServicer(grpc_pb2_grpc.SampleDataV1Servicer):
+    """Answers RX requests with zero-filled blocks and acknowledges TX data."""
+
+    def __init__(self):
+        self._payloads = {}
+
+    def _data(self, request):
+        dtype = _response_dtype(request.dtype)
+        shape = [int(item) for item in request.shape]
+        size = int(np.prod(shape)) * dtype.itemsize
+        payload = self._payloads.get(size)
+        if payload is None:
+            payload = self._payloads[size] = bytes(size)
+        return _reply(
+            request,
+            kind=grpc_pb2.SAMPLE_FRAME_DATA,
+            dtype=request.dtype,
+            shape=shape,
+            channels=list(request.channels),
+            sample_count=request.sample_count,
+            payload=payload,
+            metadata_json='{"error_code":"none"}',
+        )
+
+    def SampleStream(self, request_iterator, context):
+        pipelined = None
+        for frame in request_iterator:
+            if frame.kind == grpc_pb2.SAMPLE_FRAME_OPEN:
+                yield _reply(frame, kind=grpc_pb2.SAMPLE_FRAME_RESULT)
+            elif frame.kind == grpc_pb2.SAMPLE_FRAME_CLOSE:
+                return
+            elif frame.kind == grpc_pb2.SAMPLE_FRAME_REQUEST and frame.credits:
+                pipelined = frame
+                for _ in range(frame.credits):
+                    yield self._data(pipelined)
+            elif frame.kind == grpc_pb2.SAMPLE_FRAME_CREDIT and pipelined is not None:
+                for _ in range(frame.credits):
+                    yield self._data(pipelined)
+            elif frame.kind == grpc_pb2.SAMPLE_FRAME_CANCEL:
+                pipelined = None
+                yield _reply(frame, kind=grpc_pb2.SAMPLE_FRAME_RESULT, cancelled=True)
+            elif frame.kind == grpc_pb2.SAMPLE_FRAME_REQUEST:
+                yield self._data(frame)
+            elif frame.kind == grpc_pb2.SAMPLE_FRAME_DATA:
+                yield _reply(
+                    frame,
+                    kind=grpc_pb2.SAMPLE_FRAME_RESULT,
+                    sample_count=frame.sample_count,
+                )
+
+
+class GenericServicer(grpc_pb2_grpc.GenericRPCServicer):
+    """Answers legacy property reads like a Pluto ``GET``."""
+
+    def Call(self, request, context):
+        name = request.function_name.split(":")[1]
+        return grpc_pb2.GenericRPCResponse(results={name: map_arg(2.4e9)})
+
+
+class LoopbackServer:
+    """The stand-in server plus client channel pools pointed at it."""
+
+    def __init__(self, workers: int = 8):
+        options = list(grpc_client._BASE_OPTIONS)
+        self.server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=workers), options=options
+        )
+        grpc_pb2_grpc.add_GenericRPCServicer_to_server(GenericServicer(), self.server)
+        grpc_pb2_grpc.add_DynamicControlV2Servicer_to_server(
+            ControlServicer(usrp_remote._SCHEMA), self.server
+        )
+        grpc_pb2_grpc.add_SampleDataV1Servicer_to_server(SampleServicer(), self.server)
+        self.addr = f"127.0.0.1:{self.server.add_insecure_port('127.0.0.1:0')}"
+        self.options = options
+        self.pool_options = {name: list(options) for name in POOL_NAMES}
+        self.pools = {
+            name: ChannelPool(name, self._channel, options) for name in POOL_NAMES
+        }
+
+    def _channel(self, channel_options):
+        return grpc.insecure_channel(self.addr, options=channel_options)
+
+    def __enter__(self):
+        self.server.start()
+        self._previous, grpc_client._client = grpc_client._client, self
+        return self
+
+    def __exit__(self, *exc_info):
+        grpc_client._client = self._previous
+        for pool in self.pools.values():
+            pool.close()
+        self.server.stop(0.5).wait()
+
+
+def _percentiles_us(fn, calls: int) -> dict:
+    for _ in range(min(calls, 50)):
+        fn()
+    timings = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1e6)
+    timings.sort()
+    return {
+        "calls": calls,
+        "p50_us": round(timings[len(timings) // 2], 1),
+        "p99_us": round(timings[min(len(timings) - 1, int(len(timings) * 0.99))], 1),
+        "mean_us": round(statistics.fmean(timings), 1),
+    }
+
+
+def _throughput(fn, samples_per_call: int, seconds: float) -> dict:
+    fn()
+    fn()
+    calls = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < seconds or calls < 3:
+        fn()
+        calls += 1
+        elapsed = time.perf_counter() - start
+    return {"calls": calls, "msps": round(samples_per_call * calls / elapsed / 1e6, 3)}
+
+
+def _streamers(usrp, fmt: str, channels: int):
+    cpu_format, otw_format, _dtype = FORMATS[fmt]
+    stream_args = usrp_remote.uhd.usrp.StreamArgs(cpu_format, otw_format)
+    stream_args.channels = list(range(channels))
+    return usrp.get_rx_stream(stream_args), usrp.get_tx_stream(stream_args)
+
+
+def stream_cases(usrp, sizes, formats, channel_counts, seconds, credits) -> list:
+    uhd = usrp_remote.uhd
+    results = []
+    for fmt, channels in itertools.product(formats, channel_counts):
+        rx, tx = _streamers(usrp, fmt, channels)
+        assert rx.remoterf_wire_format == (FORMATS[fmt][1] or None)
+        rx_metadata = uhd.types.RXMetadata()
+        tx_metadata = uhd.types.TXMetadata()
+        modes = [("rx", 0), ("tx", 0)]
+        if credits:
+            modes.insert(1, (f"rx_credits_{credits}", credits))
+        try:
+            for size in sizes:
+                shape = (size,) if channels == 1 else (channels, size)
+                buffer = np.zeros(shape, dtype=FORMATS[fmt][2])
+                for mode, mode_credits in modes:
+                    if mode == "tx":
+                        operation = lambda: tx.send(buffer, tx_metadata, 5.0)
+                    else:
+                        rx.remoterf_credits = mode_credits
+                        operation = lambda: rx.recv(buffer, rx_metadata, 5.0)
+                    results.append(
+                        {
+                            "format": fmt,
+                            "channels": channels,
+                            "samples": size,
+                            "mode": mode,
+                            **_throughput(operation, size, seconds),
+                        }
+                    )
+                rx.remoterf_credits = 0
+        finally:
+            rx.close()
+            tx.close()
+    return results
+
+
+def run(sizes, formats, channel_counts, seconds, credits, calls) -> dict:
+    with LoopbackServer():
+        usrp = usrp_remote.MultiUSRP("bench-token")
+        try:
+            streams = stream_cases(usrp, sizes, formats, channel_counts, seconds, credits)
+            invoke = {
+                "get_time_now": _percentiles_us(usrp.get_time_now, calls),
+                "set_rx_gain": _percentiles_us(lambda: usrp.set_rx_gain(10.0, 0), calls),
+            }
+        finally:
+            usrp.close()
+        token = map_arg("bench-token")
+        legacy = _percentiles_us(
+            lambda: grpc_client.rpc_client(
+                function_name="Pluto:rx_lo:GET", args={"a": token}
+            ),
+            calls,
+        )
+    return {
+        "benchmark": "loopback_streaming",
+        "python": platform.python_version(),
+        "grpc": grpc.__version__,
+        "seconds_per_case": seconds,
+        "streams": streams,
+        "invoke": invoke,
+        "rpc_client": legacy,
+    }
+
+
+def _csv(kind):
+    return lambda text: [kind(item) for item in text.split(",") if item.strip()]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=_csv(int), default=[1024, 16384, 262144])
+    parser.add_argument("--formats", type=_csv(str), default=list(FORMATS))
+    parser.add_argument("--channels", type=_csv(int), default=[1, 2])
+    parser.add_argument("--seconds", type=float, default=1.0)
+    parser.add_argument("--credits", type=int, default=4)
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args(argv)
+    unknown = set(args.formats) - set(FORMATS)
+    if unknown:
+        parser.error(f"unknown formats: {', '.join(sorted(unknown))}")
+    report = run(
+        args.sizes,
+        args.formats,
+        args.channels,
+        max(0.01, args.seconds),
+        max(0, args.credits),
+        max(1, args.calls),
+    )
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+# Copyright (C) 2026 RemoteRF
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Import-time benchmark for generated Dynamic v2 driver modules.
+
+Generates a driver module from the packaged USRP schema, with its methods
+replicated ``--scale`` times to stand in for a large UHD surface. It then
+times executing the module body from its marshalled code object, which is
+what importing it from ``__pycache__`` costs. Two forms are compared: the
+previous ``build_uhd_bindings(_SCHEMA)`` form, which validates at import,
+and the current form with ``_PRECOMPILED``::
+
+    python benchmarks/v2_bindings.py --scale 8 --repeat 25
+
+Prints one JSON document with median milliseconds per form and the speedup.
+"""
+from __future__ import annotations
+
+import argparse
+import copy
+import hashlib
+import json
+import marshal
+import statistics
+import sys
+import tempfile
+import time
+import types
+from pathlib import Path
+
+from remoteRF.drivers import dynamic_device
+from remoteRF.drivers.usrp import usrp_remote
+
+_PRECOMPILED_CALL = "build_uhd_bindings(_SCHEMA, precompiled=_PRECOMPILED)"
+
+
+def large_schema(scale: int) -> dict:
+    """Return the packaged USRP schema with its methods repeated ``scale`` times."""
+    schema = copy.deepcopy(usrp_remote._SCHEMA)
+    methods = list(schema["methods"])
+    for copy_index in range(1, scale):
+        for descriptor in methods:
+            if descriptor["owner"] != "uhd.usrp.MultiUSRP":
+                continue
+            schema["methods"].append(
+                dict(descriptor, name=f"{descriptor['name']}_{copy_index}")
+            )
+    schema.pop("schema_hash")
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    schema["schema_hash"] = "sha256:" + hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    return schema
+
+
+def generated_sources(schema: dict) -> dict:
+    with tempfile.TemporaryDirectory() as directory:
+        old = dynamic_device._DRIVERS_DIR
+        dynamic_device._DRIVERS_DIR = Path(directory)
+        try:
+            package = dynamic_device._write_driver_files(schema)
+        finally:
+            dynamic_device._DRIVERS_DIR = old
+        current = (package / "usrp_remote.py").read_text(encoding="utf-8")
+    return {
+        "validated": current.replace(_PRECOMPILED_CALL, "build_uhd_bindings(_SCHEMA)"),
+        "precompiled": current,
+    }
+
+
+def _median_ms(code_bytes: bytes, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        module = types.ModuleType("remoteRF.drivers.usrp.usrp_remote")
+        module.__package__ = "remoteRF.drivers.usrp"
+        start = time.perf_counter()
+        exec(marshal.loads(code_bytes), module.__dict__)
+        timings.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(timings)
+
+
+def run(scale: int, repeat: int) -> dict:
+    schema = large_schema(scale)
+    forms = {}
+    for name, source in generated_sources(schema).items():
+        code_bytes = marshal.dumps(compile(source, "usrp_remote.py", "exec"))
+        _median_ms(code_bytes, 1)  # warm the lazily imported support modules
+        forms[name] = {
+            "source_bytes": len(source.encode("utf-8")),
+            "median_ms": round(_median_ms(code_bytes, repeat), 3),
+        }
+    before = forms["validated"]["median_ms"]
+    after = forms["precompiled"]["median_ms"]
+    return {
+        "benchmark": "v2_driver_import",
+        "methods": len(schema["methods"]),
+        "scale": scale,
+        "repeat": repeat,
+        "forms": forms,
+        "speedup": round(before / after, 2) if after else None,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=25)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(max(1, args.scale), max(1, args.repeat)), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,4 +13,13 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from . import grpc_pb2, grpc_pb2_grpc
\ No newline at end of file
+from importlib import import_module
+
+from . import grpc_pb2
+
+
+def __getattr__(name):
+    # The service stubs pull in the grpc runtime; message types alone do not.
+    if name == "grpc_pb2_grpc":
+        return import_module(f"{__name__}.grpc_pb2_grpc")
+    raise AttributeError(name)
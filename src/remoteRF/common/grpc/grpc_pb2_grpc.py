@@ -153,6 +153,11 @@ class DynamicControlV2Stub(object):
                 request_serializer=grpc__pb2.CloseSessionRequest.SerializeToString,
                 response_deserializer=grpc__pb2.CloseResponse.FromString,
                 _registered_method=True)
+        self.InvokeBatch = channel.unary_unary(
+                '/remote_rf.DynamicControlV2/InvokeBatch',
+                request_serializer=grpc__pb2.InvokeBatchRequest.SerializeToString,
+                response_deserializer=grpc__pb2.InvokeBatchResponse.FromString,
+                _registered_method=True)
 
 
 class DynamicControlV2Servicer(object):
@@ -196,6 +201,12 @@ class DynamicControlV2Servicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def InvokeBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_DynamicControlV2Servicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -229,6 +240,11 @@ def add_DynamicControlV2Servicer_to_server(servicer, server):
                     request_deserializer=grpc__pb2.CloseSessionRequest.FromString,
                     response_serializer=grpc__pb2.CloseResponse.SerializeToString,
             ),
+            'InvokeBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.InvokeBatch,
+                    request_deserializer=grpc__pb2.InvokeBatchRequest.FromString,
+                    response_serializer=grpc__pb2.InvokeBatchResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'remote_rf.DynamicControlV2', rpc_method_handlers)
@@ -404,6 +420,33 @@ class DynamicControlV2(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def InvokeBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/remote_rf.DynamicControlV2/InvokeBatch',
+            grpc__pb2.InvokeBatchRequest.SerializeToString,
+            grpc__pb2.InvokeBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
 
 class SampleDataV1Stub(object):
     """Missing associated documentation comment in .proto file."""
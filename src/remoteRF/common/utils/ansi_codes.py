@@ -17,8 +17,6 @@ import os
 import sys
 from enum import Enum
 
-from prompt_toolkit import print_formatted_text
-from prompt_toolkit.formatted_text import FormattedText
 
 class Sty(Enum):
     # Basic colors
@@ -167,6 +165,11 @@ def printf(*args) -> str:
         
         formatted_text.append((_style_string(resolved_styles), message))
     
+    # prompt_toolkit is only needed once something is printed; importing it
+    # lazily keeps it out of driver imports.
+    from prompt_toolkit import print_formatted_text
+    from prompt_toolkit.formatted_text import FormattedText
+
     # Create FormattedText object from pairs
     text = FormattedText(formatted_text)
     
@@ -192,4 +195,6 @@ def stylize(*args):
         
         styled_parts.append((_style_string(resolved_styles), text))
     
+    from prompt_toolkit.formatted_text import FormattedText
+
     return FormattedText(styled_parts)
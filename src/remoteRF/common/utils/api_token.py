@@ -17,7 +17,6 @@ import os
 import hashlib
 import base64
 import secrets
-from dotenv import load_dotenv, find_dotenv
 
 ### API Token Management
 # API Tokens are used to authenticate clients to the device
@@ -16,8 +16,10 @@
 """Serialization helpers for the legacy GenericRPC protocol."""
 from __future__ import annotations
 
+import itertools
 import json
 import math
+import operator
 from typing import Any
 
 import numpy as np
@@ -28,6 +30,7 @@ _JSON_TYPE_KEY = "__remoterf_json_type__"
 _MAX_NDARRAY_BYTES = 64 * 1024 * 1024
 _MAX_NDARRAY_DIMENSIONS = 8
 _SUPPORTED_NDARRAY_KINDS = {"b", "i", "u", "f", "c"}
+_REAL_IMAG = operator.attrgetter("real", "imag")
 
 
 def _validate_ndarray(dtype: np.dtype, shape) -> int:
@@ -48,7 +51,7 @@ def _validate_ndarray(dtype: np.dtype, shape) -> int:
     return expected
 
 
-def _decode_ndarray(descriptor: grpc_pb2.NDArrayValue) -> np.ndarray:
+def _decode_ndarray(descriptor: grpc_pb2.NDArrayValue, *, copy: bool = True) -> np.ndarray:
     try:
         dtype = np.dtype(descriptor.dtype)
     except (TypeError, ValueError) as exc:
@@ -61,7 +64,10 @@ def _decode_ndarray(descriptor: grpc_pb2.NDArrayValue) -> np.ndarray:
         raise ValueError(
             f"ndarray byte length mismatch: expected {expected}, got {actual}"
         )
-    return np.frombuffer(descriptor.data, dtype=dtype).reshape(shape).copy()
+    # Reading a bytes field already hands back a private copy; without
+    # ``copy`` the result is a read-only view of that buffer.
+    array = np.frombuffer(descriptor.data, dtype=dtype).reshape(shape)
+    return array.copy() if copy else array
 
 
 def _json_safe(value: Any):
@@ -72,7 +78,7 @@ def _json_safe(value: Any):
             raise ValueError(f"Cannot JSON-map object-dtype array: {value!r}")
         array = np.asarray(value)
         if np.iscomplexobj(array):
-            data = [[float(num.real), float(num.imag)] for num in array.ravel()]
+            data = np.stack((array.real.ravel(), array.imag.ravel()), -1).tolist()
             return {
                 _JSON_TYPE_KEY: "ndarray",
                 "dtype": str(array.dtype),
@@ -113,8 +119,12 @@ def _json_restore(value: Any):
             shape = tuple(value.get("shape", ()))
             dtype = value.get("dtype")
             if value.get("complex"):
-                data = [complex(real, imag) for real, imag in value.get("data", [])]
-                return np.array(data, dtype=dtype or np.complex64).reshape(shape)
+                pairs = value.get("data", [])
+                flat = np.fromiter(
+                    itertools.chain.from_iterable(pairs), dtype=np.float64, count=2 * len(pairs)
+                )
+                data = flat.view(np.complex128).astype(dtype or np.complex64)
+                return data.reshape(shape)
             return np.array(value.get("data", []), dtype=dtype).reshape(shape)
         if kind == "complex":
             return complex(value.get("real", 0.0), value.get("imag", 0.0))
@@ -124,7 +134,12 @@ def _json_restore(value: Any):
     return value
 
 
-def unmap_arg(arg: grpc_pb2.Argument):
+def unmap_arg(arg: grpc_pb2.Argument, *, copy: bool = True):
+    """Decode an ``Argument``.
+
+    With ``copy=False`` binary ndarrays come back as read-only views of the
+    received payload instead of private writable copies.
+    """
     kind = arg.WhichOneof("value")
     if kind == "int64_value":
         return arg.int64_value
@@ -135,14 +150,23 @@ def unmap_arg(arg: grpc_pb2.Argument):
     if kind == "bool_value":
         return arg.bool_value
     if kind == "ndarray_value":
-        return _decode_ndarray(arg.ndarray_value)
+        return _decode_ndarray(arg.ndarray_value, copy=copy)
     if kind == "real_array":
+        # Packed floats: fromiter fills the array without a list of Python floats.
+        data = arg.real_array.data
         shape = tuple(arg.real_array.shape.dim)
-        return np.array(arg.real_array.data, dtype=np.float64).reshape(shape)
+        return np.fromiter(data, dtype=np.float64, count=len(data)).reshape(shape)
     if kind == "complex_array":
+        # Each ComplexNumber is a sub-message, so its fields are read one by
+        # one, but straight into a float buffer rather than via complex().
+        data = arg.complex_array.data
         shape = tuple(arg.complex_array.shape.dim)
-        data = [complex(item.real, item.imag) for item in arg.complex_array.data]
-        return np.array(data, dtype=np.complex64).reshape(shape)
+        pairs = np.fromiter(
+            itertools.chain.from_iterable(map(_REAL_IMAG, data)),
+            dtype=np.float64,
+            count=2 * len(data),
+        )
+        return pairs.view(np.complex128).astype(np.complex64).reshape(shape)
     if kind == "json_value":
         return _json_restore(json.loads(arg.json_value))
     if kind == "bytes_value":
@@ -13,7 +13,10 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from remoteRF.core.grpc_client import addr as server_addr, handle_admin_command
+from remoteRF.core import grpc_client
+from remoteRF.core.grpc_client import handle_admin_command
+from remoteRF.core.availability import AvailabilityIndex
+from remoteRF.core.reservations import ReservationCache
 from . import *
 from ..common.utils import *
 
@@ -27,6 +30,7 @@ from pathlib import Path
 from prompt_toolkit import PromptSession
 
 account = RemoteRFAccount()
+reservation_cache = ReservationCache(account)
 session = PromptSession()
 
 DEFAULT_TOS_URL = "https://remoterf.net/tos"
@@ -81,7 +85,7 @@ def _format_reservation_range(start_time: datetime.datetime, end_time: datetime.
 
 def welcome(*, show_banner: bool = True):
     if show_banner:
-        print_client_banner(print_my_version(), server=server_addr)
+        print_client_banner(print_my_version(), server=grpc_client.addr)
     try:
         inpu = session.prompt(stylize("Please ", Sty.DEFAULT, "login", Sty.GREEN, " or ", Sty.DEFAULT, "register", Sty.RED, " to continue. (", Sty.DEFAULT, 'l', Sty.GREEN, "/", Sty.DEFAULT, 'r', Sty.RED, "): ", Sty.DEFAULT))
         if inpu == 'r':
@@ -120,7 +124,7 @@ def welcome(*, show_banner: bool = True):
 def title():
     print_internal_banner(
         print_my_version(),
-        server=server_addr,
+        server=grpc_client.addr,
         tos_url=_tos_url(),
     )
     printf("Input ", Sty.DEFAULT, "'help' ", Sty.BRIGHT_GREEN, "for a list of available commands.", Sty.DEFAULT)
@@ -195,96 +199,54 @@ def newest_version_pip(project="remoterf"):
         return None
 
     
+def _query_reservations(**filters):
+    """Cached reservations matching ``filters``, or None after printing the error."""
+    try:
+        return list(reservation_cache.get(**filters).rows())
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        return None
+
 def reservations():
-    data = account.get_reservations()
-    if 'ace' in data.results:
-        print(f"Error: {unmap_arg(data.results['ace'])}")
+    sorted_entries = _query_reservations()
+    if sorted_entries is None:
         return
-    entries = []
-
-    for key, value in data.results.items():
-        parts = unmap_arg(value).split(',')
-        # Create a dictionary for each entry with named fields
-        entry = {
-            'username': parts[0],
-            'device_id': int(parts[1]),  # Convert device_id to integer for proper numerical sorting
-            'start_time': _parse_reservation_time(parts[2]),  # Convert start_time to datetime
-            'end_time': _parse_reservation_time(parts[3])
-        }
-        entries.append(entry)
         
-    if (entries == []):
+    if (sorted_entries == []):
         printf("No reservations found.", Sty.BOLD)
         return
     
     printf("Reservations:", (Sty.BOLD, Sty.BLUE))
 
-    # Sort the entries by device_id and then by start_time
-    sorted_entries = sorted(entries, key=lambda x: (x['device_id'], x['start_time']))
-
-    # Format the sorted entries into strings
+    # Rows arrive sorted by device_id and then by start_time
     for entry in sorted_entries:
         printf("Device ID: ", Sty.GRAY, f'{entry["device_id"]}', Sty.MAGENTA, ", Time: ", Sty.GRAY, _format_reservation_range(entry["start_time"], entry["end_time"]), Sty.CYAN)
         
 def my_reservations():
-    data = account.get_reservations()
-    if 'ace' in data.results:
-        print(f"Error: {unmap_arg(data.results['ace'])}")
+    # The server filters to this user's rows.
+    sorted_entries = _query_reservations(user=account.username)
+    if sorted_entries is None:
         return
-    entries = []
-
-    for key, value in data.results.items():
-        parts = unmap_arg(value).split(',')
-        # Create a dictionary for each entry with named fields
-        entry = {
-            'username': parts[0],
-            'device_id': int(parts[1]),  # Convert device_id to integer for proper numerical sorting
-            'start_time': _parse_reservation_time(parts[2]),  # Convert start_time to datetime
-            'end_time': _parse_reservation_time(parts[3])
-        }
-        entries.append(entry)
         
-    if (entries == []):
+    if (sorted_entries == []):
         printf("No reservations found.", Sty.BOLD)
         return
     
     printf("Current Reservations Held By ", (Sty.BOLD, Sty.BLUE), f'{account.username}:', Sty.MAGENTA)
 
-    # Sort the entries by device_id and then by start_time
-    sorted_entries = sorted(entries, key=lambda x: (x['device_id'], x['start_time']))
-    
     for entry in sorted_entries:
-        if account.username == entry['username']:
-            printf("Device ID: ", Sty.GRAY, f'{entry["device_id"]}', Sty.MAGENTA, ", Time: ", Sty.GRAY, _format_reservation_range(entry["start_time"], entry["end_time"]), Sty.CYAN)
+        printf("Device ID: ", Sty.GRAY, f'{entry["device_id"]}', Sty.MAGENTA, ", Time: ", Sty.GRAY, _format_reservation_range(entry["start_time"], entry["end_time"]), Sty.CYAN)
 
 def cancel_my_reservation():
     ## print all of ur reservations and their ids
     ## ask for id to cancel
     ## remove said reservation
-    data = account.get_reservations()
-    if 'ace' in data.results:
-        print(f"Error: {unmap_arg(data.results['ace'])}")
+    sorted_entries = _query_reservations(user=account.username)
+    if sorted_entries is None:
         return
     
-    entries:list = []
-
-    for key, value in data.results.items():
-        parts = unmap_arg(value).split(',')
-        # Create a dictionary for each entry with named fields
-        entry = {
-            'id': -1,
-            'internal_id': key,
-            'username': parts[0],
-            'device_id': int(parts[1]),  # Convert device_id to integer for proper numerical sorting
-            'start_time': _parse_reservation_time(parts[2]),  # Convert start_time to datetime
-            'end_time': _parse_reservation_time(parts[3])
-        }
-        if account.username == entry['username']:
-            entries.append(entry)
-    
     printf("Current Reservation(s) under ", (Sty.BOLD, Sty.BLUE), f'{account.username}:', Sty.MAGENTA)
     
-    sorted_entries = sorted(entries, key=lambda x: (x['device_id'], x['start_time'])) # sort by device_id and start_time
     for i, entry in enumerate(sorted_entries):  # label all reservations with unique id
         entry['id'] = i
         printf("Reservation ID: ", Sty.GRAY, f'{i}', Sty.CYAN, " Device ID: ", Sty.GRAY, f'{entry["device_id"]}', Sty.MAGENTA, " Time: ", Sty.GRAY, _format_reservation_range(entry["start_time"], entry["end_time"]), Sty.CYAN)
@@ -476,40 +438,28 @@ def enroll():
 # New block scheduling
 
 def fetch_all_reservations():
-    data = account.get_reservations()
-    if 'ace' in data.results:
-        print(f"Error: {unmap_arg(data.results['ace'])}")
-        return []
-    entries = []
-
-    for key, value in data.results.items():
-        parts = unmap_arg(value).split(',')
-        # Convert both start and end times to datetime objects.
-        entry = {
-            'username': parts[0],
-            'device_id': int(parts[1]),  # Stored as an int
-            'start_time': _parse_reservation_time(parts[2]),
-            'end_time': _parse_reservation_time(parts[3])
-        }
-        entries.append(entry)
-    return entries
-
-def fetch_reservations_for_range(start_day: datetime.date, end_day: datetime.date):
-    all_res = fetch_all_reservations()  # This calls the network only once.
-    res_dict = {}
-    for res in all_res:
-        res_day = res['start_time'].date()
-        if start_day <= res_day <= end_day:
-            key = (str(res['device_id']), res_day)
-            res_dict.setdefault(key, []).append((res['start_time'], res['end_time']))
-    return res_dict
-
-def is_slot_conflicting(slot: tuple, reservations: list):
-    slot_start, slot_end = slot
-    for res_start, res_end in reservations:
-        if slot_start < res_end and slot_end > res_start:
-            return True
-    return False
+    """Reservations that have not ended before today, for slot searches."""
+    today = datetime.datetime.combine(datetime.date.today(), datetime.time.min)
+    return _query_reservations(start=today) or []
+
+def find_free_slots(device_id, block_minutes: int, num_days: int):
+    """Free ``block_minutes`` blocks of ``device_id`` from the current block
+    through the end of day ``num_days``, as ``(day, (start, end))`` pairs."""
+    block = datetime.timedelta(minutes=block_minutes)
+    now = datetime.datetime.now()
+    midnight = datetime.datetime.combine(now.date(), datetime.time.min)
+    # The block in progress is still offered, as it always was.
+    current_block = now - (now - midnight) % block
+    index = AvailabilityIndex.from_reservations(fetch_all_reservations())
+    windows = index.next_free(
+        [int(device_id)],
+        block,
+        start=current_block,
+        end=midnight + datetime.timedelta(days=num_days),
+        count=None,
+        align=block,
+    )
+    return [(window.start.date(), (window.start, window.end)) for window in windows]
 
 def interactive_reserve_next_days(block_minutes=60):
     try:
@@ -554,51 +504,7 @@ def interactive_reserve_next_days(block_minutes=60):
         
         # --- 5) Find all free time slots for the chosen device over the next `num_days` days ---
         
-        today = datetime.date.today()
-        end_day = today + datetime.timedelta(days=num_days - 1)
-        
-        # We only need one call to fetch reservations for the range:
-        reservations_range = fetch_reservations_for_range(today, end_day)
-        
-        # We'll keep a list of (day, (slot_start, slot_end)) for which the device is free
-        available_slots = []
-        
-        now = datetime.datetime.now()
-        
-        # Helper to build time slots of length 'block_minutes' starting at 00:00 up to 24:00
-        def build_time_slots(date: datetime.date, block_size: int):
-            slots = []
-            start_of_day = datetime.datetime.combine(date, datetime.time(0, 0))
-            minutes_in_day = 24 * 60  # 1440
-            current_offset = 0
-            while current_offset < minutes_in_day:
-                slot_start = start_of_day + datetime.timedelta(minutes=current_offset)
-                slot_end   = slot_start + datetime.timedelta(minutes=block_size)
-                # Stop if slot_end bleeds into the next calendar day
-                if slot_end.date() != date and slot_end.time() != datetime.time.min:
-                    break
-                slots.append((slot_start, slot_end))
-                current_offset += block_size
-            return slots
-        
-        # Build free slots for each day in [today, end_day]
-        for i in range(num_days):
-            day = today + datetime.timedelta(days=i)
-            all_slots = build_time_slots(day, block_minutes)
-            
-            # The reservations for the chosen device on this day:
-            key = (str(chosen_device_id), day)
-            day_reservations = reservations_range.get(key, [])
-            
-            for slot in all_slots:
-                slot_start, slot_end = slot
-                # Skip if it's for "today" and the slot ends in the past
-                if day == today and slot_end <= now:
-                    continue
-                
-                # Check for conflict
-                if not is_slot_conflicting(slot, day_reservations):
-                    available_slots.append((day, slot))
+        available_slots = find_free_slots(chosen_device_id, block_minutes, num_days)
         
         if not available_slots:
             printf("No available time slots for device ", Sty.BOLD, f"{chosen_device_id}", Sty.MAGENTA, f" in the next {num_days} days.", Sty.DEFAULT)
@@ -844,40 +750,7 @@ def interactive_reserve_next_days_auto():
         # ---------------------------
         # 4) Compute availability (same logic you already have)
         # ---------------------------
-        today = datetime.date.today()
-        end_day = today + datetime.timedelta(days=num_days - 1)
-
-        reservations_range = fetch_reservations_for_range(today, end_day)
-        available_slots = []
-        now = datetime.datetime.now()
-
-        def build_time_slots(date: datetime.date, block_size: int):
-            slots = []
-            start_of_day = datetime.datetime.combine(date, datetime.time(0, 0))
-            minutes_in_day = 24 * 60
-            current_offset = 0
-            while current_offset < minutes_in_day:
-                slot_start = start_of_day + datetime.timedelta(minutes=current_offset)
-                slot_end = slot_start + datetime.timedelta(minutes=block_size)
-                if slot_end.date() != date and slot_end.time() != datetime.time.min:
-                    break
-                slots.append((slot_start, slot_end))
-                current_offset += block_size
-            return slots
-
-        for i in range(num_days):
-            day = today + datetime.timedelta(days=i)
-            all_slots = build_time_slots(day, block_minutes)
-
-            key = (str(chosen_device_id), day)
-            day_reservations = reservations_range.get(key, [])
-
-            for slot in all_slots:
-                slot_start, slot_end = slot
-                if day == today and slot_end <= now:
-                    continue
-                if not is_slot_conflicting(slot, day_reservations):
-                    available_slots.append((day, slot))
+        available_slots = find_free_slots(chosen_device_id, block_minutes, num_days)
 
         if not available_slots:
             printf("No available ", Sty.DEFAULT, f"{block_minutes}-minute", Sty.CYAN, " slots for device ", Sty.DEFAULT, f"{chosen_device_id}", Sty.MAGENTA, f" in the next {num_days} days.", Sty.DEFAULT)
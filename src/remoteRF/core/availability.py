@@ -0,0 +1,176 @@
+# Copyright (C) 2026 RemoteRF
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Free-window search over device reservations.
+
+Each device's reservations are merged into a sorted list of busy intervals.
+Checking whether ``[start, end)`` is free, or finding the next time it could
+be, is then a binary search. The search does not scan every slot::
+
+    index = AvailabilityIndex.from_reservations(fetch_all_reservations())
+    windows = index.next_free(
+        [3, 4],
+        datetime.timedelta(minutes=30),
+        start=now,
+        end=now + datetime.timedelta(days=14),
+        count=5,
+        together=2,  # both radios at once
+    )
+
+A window lists every queried device that is free for all of it. ``align``
+snaps window starts to a grid anchored at midnight, like the blocks the
+``resdev`` prompt offers.
+"""
+from __future__ import annotations
+
+import bisect
+import datetime
+from typing import Hashable, Iterable, NamedTuple
+
+
+class FreeWindow(NamedTuple):
+    start: datetime.datetime
+    end: datetime.datetime
+    device_ids: tuple
+
+
+class IntervalIndex:
+    """Disjoint, sorted busy intervals of one device."""
+
+    def __init__(self, intervals: Iterable[tuple] = ()):
+        self._starts = []
+        self._ends = []
+        merged = []
+        for start, end in sorted(intervals):
+            if end <= start:
+                continue
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        for start, end in merged:
+            self._starts.append(start)
+            self._ends.append(end)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __iter__(self):
+        return iter(zip(self._starts, self._ends))
+
+    def add(self, start, end) -> None:
+        """Mark ``[start, end)`` busy, merging it with touching intervals."""
+        if end <= start:
+            return
+        first = bisect.bisect_left(self._ends, start)
+        last = bisect.bisect_right(self._starts, end)
+        if first < last:
+            start = min(start, self._starts[first])
+            end = max(end, self._ends[last - 1])
+        self._starts[first:last] = [start]
+        self._ends[first:last] = [end]
+
+    def is_free(self, start, end) -> bool:
+        """True when no busy interval overlaps ``[start, end)``."""
+        index = bisect.bisect_right(self._ends, start)
+        return index == len(self._starts) or self._starts[index] >= end
+
+    def next_free(self, start, length):
+        """Earliest ``t >= start`` with ``[t, t + length)`` free."""
+        index = bisect.bisect_right(self._ends, start)
+        while index < len(self._starts) and self._starts[index] < start + length:
+            start = max(start, self._ends[index])
+            index += 1
+        return start
+
+
+class AvailabilityIndex:
+    """Per-device :class:`IntervalIndex` with multi-device window queries."""
+
+    def __init__(self):
+        self._devices = {}
+
+    @classmethod
+    def from_reservations(cls, reservations: Iterable[dict]) -> "AvailabilityIndex":
+        """Index entries with ``device_id``, ``start_time`` and ``end_time``."""
+        grouped = {}
+        for entry in reservations:
+            grouped.setdefault(entry["device_id"], []).append(
+                (entry["start_time"], entry["end_time"])
+            )
+        index = cls()
+        index._devices = {
+            device_id: IntervalIndex(intervals)
+            for device_id, intervals in grouped.items()
+        }
+        return index
+
+    def add(self, device_id: Hashable, start, end) -> None:
+        self.busy(device_id).add(start, end)
+
+    def busy(self, device_id: Hashable) -> IntervalIndex:
+        intervals = self._devices.get(device_id)
+        if intervals is None:
+            intervals = self._devices[device_id] = IntervalIndex()
+        return intervals
+
+    def next_free(
+        self,
+        device_ids: Iterable[Hashable],
+        length: datetime.timedelta,
+        *,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        count: int | None = 1,
+        together: int = 1,
+        align: datetime.timedelta | None = None,
+    ) -> list:
+        """Return up to ``count`` (None: all) non-overlapping free windows.
+
+        Each window is ``length`` long, lies in ``[start, end)`` and has at
+        least ``together`` of ``device_ids`` free for its whole span.
+        """
+        if length <= datetime.timedelta(0):
+            raise ValueError("length must be positive")
+        device_ids = list(dict.fromkeys(device_ids))
+        if together < 1 or together > len(device_ids):
+            return []
+        indexes = [self._devices.get(device_id) for device_id in device_ids]
+        windows = []
+        t = _align_up(start, align)
+        while t + length <= end and (count is None or len(windows) < count):
+            free = []
+            retry = None
+            for device_id, intervals in zip(device_ids, indexes):
+                if intervals is None or intervals.is_free(t, t + length):
+                    free.append(device_id)
+                    continue
+                candidate = intervals.next_free(t, length)
+                retry = candidate if retry is None else min(retry, candidate)
+            if len(free) >= together:
+                windows.append(FreeWindow(t, t + length, tuple(free)))
+                t = _align_up(t + length, align)
+            else:
+                # Nothing can free up before the earliest blocked device does.
+                t = _align_up(retry, align)
+        return windows
+
+
+def _align_up(moment: datetime.datetime, align: datetime.timedelta | None):
+    if align is None:
+        return moment
+    midnight = datetime.datetime.combine(moment.date(), datetime.time.min, moment.tzinfo)
+    remainder = (moment - midnight) % align
+    return moment if not remainder else moment + (align - remainder)
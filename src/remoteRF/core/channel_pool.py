@@ -0,0 +1,192 @@
+# Copyright (C) 2026 RemoteRF
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Pools of gRPC channels that keep bulk samples off the control connection.
+
+The client keeps two pools: ``control`` carries GenericRPC, reservation and
+Dynamic v2 control calls, ``samples`` carries ``SampleStream``. Every channel
+uses its own subchannel pool, so each one is a separate TCP/HTTP2 connection
+and a multi-megabyte DATA frame cannot head-of-line block a small control
+RPC. Each pool is tuned from the client ``.env``; a pool-specific key wins
+over the shared one::
+
+    REMOTERF_CONTROL_CHANNELS=1        # connections per pool
+    REMOTERF_SAMPLE_CHANNELS=2
+    REMOTERF_CHANNEL_POLICY=per_device # or round_robin (default)
+    REMOTERF_KEEPALIVE_TIME_MS=30000
+    REMOTERF_SAMPLE_WINDOW_BYTES=8388608
+"""
+from __future__ import annotations
+
+import itertools
+import threading
+import zlib
+from collections.abc import Callable, Mapping
+
+POOL_NAMES = ("control", "samples")
+CHANNEL_POLICIES = ("round_robin", "per_device")
+
+# .env name (without the REMOTERF_[<POOL>_] prefix) -> (gRPC channel arg, type)
+_ENV_CHANNEL_ARGS = {
+    "KEEPALIVE_TIME_MS": ("grpc.keepalive_time_ms", int),
+    "KEEPALIVE_TIMEOUT_MS": ("grpc.keepalive_timeout_ms", int),
+    "KEEPALIVE_PERMIT_WITHOUT_CALLS": ("grpc.keepalive_permit_without_calls", bool),
+    "MAX_PINGS_WITHOUT_DATA": ("grpc.http2.max_pings_without_data", int),
+    "WINDOW_BYTES": ("grpc.http2.lookahead_bytes", int),
+    "MAX_FRAME_BYTES": ("grpc.http2.max_frame_size", int),
+    "WRITE_BUFFER_BYTES": ("grpc.http2.write_buffer_size", int),
+}
+_ENV_POOL_PREFIX = {"control": "CONTROL", "samples": "SAMPLE"}
+_TRUE = {"1", "true", "yes", "on"}
+_FALSE = {"0", "false", "no", "off"}
+
+
+def _env_value(environ: Mapping[str, str], pool: str, name: str) -> str | None:
+    for key in (f"REMOTERF_{_ENV_POOL_PREFIX[pool]}_{name}", f"REMOTERF_{name}"):
+        value = (environ.get(key) or "").strip().strip('"').strip("'")
+        if value:
+            return value
+    return None
+
+
+def _parse(key: str, value: str, kind):
+    if kind is bool:
+        lowered = value.lower()
+        if lowered in _TRUE:
+            return 1
+        if lowered in _FALSE:
+            return 0
+        raise ValueError(f"{key} must be a boolean, got {value!r}")
+    try:
+        parsed = int(value)
+    except ValueError:
+        raise ValueError(f"{key} must be an integer, got {value!r}") from None
+    if parsed < 0:
+        raise ValueError(f"{key} must be non-negative")
+    return parsed
+
+
+def pool_size_from_env(environ: Mapping[str, str], pool: str) -> int:
+    value = _env_value(environ, pool, "CHANNELS")
+    size = 1 if value is None else _parse(f"{pool} CHANNELS", value, int)
+    if size < 1:
+        raise ValueError(f"{pool} pool needs at least one channel")
+    return size
+
+
+def channel_policy_from_env(environ: Mapping[str, str]) -> str:
+    policy = (environ.get("REMOTERF_CHANNEL_POLICY") or "round_robin").strip().lower()
+    if policy not in CHANNEL_POLICIES:
+        raise ValueError(
+            f"REMOTERF_CHANNEL_POLICY must be one of {', '.join(CHANNEL_POLICIES)}"
+        )
+    return policy
+
+
+def pool_options_from_env(
+    environ: Mapping[str, str],
+    pool: str,
+    base_options: list[tuple[str, object]],
+) -> list[tuple[str, object]]:
+    """Return gRPC channel args for ``pool``: the base options plus .env tuning."""
+    if pool not in POOL_NAMES:
+        raise ValueError(f"unknown channel pool {pool!r}")
+    options = dict(base_options)
+    for name, (channel_arg, kind) in _ENV_CHANNEL_ARGS.items():
+        value = _env_value(environ, pool, name)
+        if value is not None:
+            options[channel_arg] = _parse(f"REMOTERF_{name}", value, kind)
+    if "grpc.http2.lookahead_bytes" in options:
+        # A fixed window only sticks when BDP probing does not resize it.
+        options.setdefault("grpc.http2.bdp_probe", 0)
+    options["grpc.use_local_subchannel_pool"] = 1
+    return list(options.items())
+
+
+class ChannelPool:
+    """``size`` gRPC channels handed out round-robin or pinned per device key."""
+
+    def __init__(
+        self,
+        name: str,
+        factory: Callable[[list], object],
+        options: list[tuple[str, object]],
+        *,
+        size: int = 1,
+        policy: str = "round_robin",
+    ):
+        if size < 1:
+            raise ValueError("a channel pool needs at least one channel")
+        if policy not in CHANNEL_POLICIES:
+            raise ValueError(f"unknown channel policy {policy!r}")
+        self.name = name
+        self.size = int(size)
+        self.policy = policy
+        self._factory = factory
+        self._options = list(options)
+        self._channels = [None] * self.size
+        self._stubs = [{} for _ in range(self.size)]
+        self._next = itertools.count()
+        self._lock = threading.Lock()
+
+    def _index(self, key) -> int:
+        if self.size == 1:
+            return 0
+        if self.policy == "per_device" and key:
+            return zlib.crc32(str(key).encode("utf-8")) % self.size
+        return next(self._next) % self.size
+
+    def _channel_at(self, index: int):
+        channel = self._channels[index]
+        if channel is None:
+            with self._lock:
+                channel = self._channels[index]
+                if channel is None:
+                    options = [
+                        *self._options,
+                        # Distinct args keep gRPC from merging the connections.
+                        ("grpc.remoterf_channel", f"{self.name}-{index}"),
+                    ]
+                    channel = self._factory(options)
+                    self._channels[index] = channel
+        return channel
+
+    def channel(self, key=None):
+        """Return a channel; ``key`` (a device token) pins it under per_device."""
+        return self._channel_at(self._index(key))
+
+    def stub(self, stub_class, key=None):
+        """Return a cached ``stub_class`` bound to the channel chosen for ``key``."""
+        index = self._index(key)
+        stubs = self._stubs[index]
+        stub = stubs.get(stub_class)
+        if stub is None:
+            stub = stubs.setdefault(stub_class, stub_class(self._channel_at(index)))
+        return stub
+
+    def _detach(self) -> list:
+        with self._lock:
+            channels, self._channels = self._channels, [None] * self.size
+            self._stubs = [{} for _ in range(self.size)]
+        return [channel for channel in channels if channel is not None]
+
+    def close(self) -> None:
+        for channel in self._detach():
+            channel.close()
+
+    async def aclose(self) -> None:
+        """:meth:`close` for a pool of ``grpc.aio`` channels."""
+        for channel in self._detach():
+            await channel.close()
@@ -0,0 +1,608 @@
+# Copyright (C) 2026 RemoteRF
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""``grpc.aio`` client transport for Dynamic control v2 and sample streaming v1.
+
+Requests and responses are built and checked by the same helpers as
+:class:`~remoteRF.core.dynamic_v2_transport.DynamicV2Transport`; only the
+I/O is awaited.
+"""
+from __future__ import annotations
+
+import asyncio
+
+import grpc
+import numpy as np
+
+from ..common.grpc import grpc_pb2, grpc_pb2_grpc
+from . import rpc_metrics
+from .dynamic_v2_transport import (
+    _SAMPLE_DIRECTIONS,
+    _SAMPLE_METHOD,
+    _STREAM_CLOSE_GRACE_SEC,
+    _DynamicV2TransportBase,
+    _check_negotiated,
+    _control_method,
+    _decode_closed,
+    _decode_invoke,
+    _decode_invoke_batch,
+    _decode_rx_data,
+    _decode_schema,
+    _decode_schema_hash,
+    _decode_session,
+    _fill_rx_buffer,
+    _invoke_request,
+    _negotiate_request,
+    _open_frame,
+    _open_session_request,
+    _operation_timeout,
+    _rpc_failure,
+    _rx_request_frame,
+    _rx_response,
+    _sample_identity,
+    _schema_request,
+    _tx_data_frame,
+    _tx_response,
+    _tx_result_count,
+    _wire_dtype,
+)
+from .v2_errors import (
+    RemoteRFError,
+    RemoteRFProtocolError,
+    RemoteRFTransportError,
+)
+
+
+class AsyncDynamicV2Transport(_DynamicV2TransportBase):
+    def __init__(
+        self,
+        *,
+        control_stub=None,
+        sample_stub=None,
+        control_timeout_sec: float = 30.0,
+        stream_timeout_margin_sec: float = 5.0,
+        channel_key=None,
+    ):
+        super().__init__(
+            control_timeout_sec=control_timeout_sec,
+            stream_timeout_margin_sec=stream_timeout_margin_sec,
+        )
+        self._control = control_stub
+        self._samples = sample_stub
+        self._pooled_control = control_stub is None
+        self._pooled_samples = sample_stub is None
+        # aio channels belong to a running loop, so pooled stubs are picked on
+        # first use; without an explicit key, open_session() re-picks them by
+        # reservation token as the sync transport does.
+        self._channel_key = channel_key
+        self._invoke_batch_supported = (
+            control_stub is None or hasattr(control_stub, "InvokeBatch")
+        )
+
+    def _bind_channels(self, key):
+        from .grpc_client import aio_channel
+        if self._pooled_control:
+            self._control = grpc_pb2_grpc.DynamicControlV2Stub(
+                aio_channel("control", key)
+            )
+        if self._pooled_samples:
+            self._samples = grpc_pb2_grpc.SampleDataV1Stub(
+                aio_channel("samples", key)
+            )
+
+    @property
+    def control(self):
+        if self._control is None:
+            self._bind_channels(self._channel_key)
+        return self._control
+
+    @property
+    def samples(self):
+        if self._samples is None:
+            self._bind_channels(self._channel_key)
+        return self._samples
+
+    async def _call(self, fn, request):
+        try:
+            with rpc_metrics.timed(_control_method(request), request) as timer:
+                response = await fn(request, timeout=self.control_timeout_sec)
+                timer.response(response)
+            return response
+        except grpc.RpcError as exc:
+            raise _rpc_failure(exc) from exc
+
+    async def negotiate(self):
+        return _check_negotiated(
+            await self._call(self.control.Negotiate, _negotiate_request())
+        )
+
+    async def get_schema(self, token: str) -> dict:
+        await self.negotiate()
+        return _decode_schema(
+            await self._call(self.control.GetSchema, _schema_request(token))
+        )
+
+    async def get_schema_hash(self, token: str) -> str:
+        await self.negotiate()
+        return _decode_schema_hash(
+            await self._call(
+                self.control.GetSchema,
+                _schema_request(token, hash_only=True),
+            )
+        )
+
+    async def open_session(self, token: str, schema_hash: str):
+        if self._channel_key is None and (
+            self._pooled_control or self._pooled_samples
+        ):
+            self._channel_key = str(token)
+            self._bind_channels(self._channel_key)
+        return _decode_session(
+            await self._call(
+                self.control.OpenSession,
+                _open_session_request(token, schema_hash),
+            ),
+            schema_hash,
+        )
+
+    async def invoke(
+        self,
+        session_id: str,
+        handle: str,
+        method: str,
+        args: dict,
+        *,
+        overload_id: str = "",
+    ):
+        return _decode_invoke(
+            await self._call(
+                self.control.Invoke,
+                _invoke_request(session_id, handle, method, args, overload_id),
+            )
+        )
+
+    async def invoke_batch(self, session_id: str, calls) -> list:
+        """Run ``(handle, method, args, overload_id)`` calls in one round trip.
+
+        Same contract as
+        :meth:`~remoteRF.core.dynamic_v2_transport.DynamicV2Transport.invoke_batch`.
+        """
+        calls = list(calls)
+        if self._invoke_batch_supported:
+            request = grpc_pb2.InvokeBatchRequest(
+                session_id=session_id,
+                calls=[
+                    _invoke_request(session_id, handle, method, args, overload_id)
+                    for handle, method, args, overload_id in calls
+                ],
+            )
+            try:
+                with rpc_metrics.timed(_control_method(request), request) as timer:
+                    response = await self.control.InvokeBatch(
+                        request, timeout=self.control_timeout_sec
+                    )
+                    timer.response(response)
+            except grpc.RpcError as exc:
+                if exc.code() != grpc.StatusCode.UNIMPLEMENTED:
+                    raise _rpc_failure(exc) from exc
+                self._invoke_batch_supported = False
+            else:
+                outcomes = _decode_invoke_batch(response)
+                if len(outcomes) < len(calls) and not (
+                    outcomes and isinstance(outcomes[-1], RemoteRFError)
+                ):
+                    raise RemoteRFProtocolError(
+                        "InvokeBatch returned fewer results than calls"
+                    )
+                return outcomes
+        outcomes = []
+        for handle, method, args, overload_id in calls:
+            try:
+                outcomes.append(
+                    await self.invoke(
+                        session_id,
+                        handle,
+                        method,
+                        args,
+                        overload_id=overload_id,
+                    )
+                )
+            except RemoteRFTransportError:
+                raise
+            except RemoteRFError as exc:
+                outcomes.append(exc)
+                break
+        return outcomes
+
+    async def close_handle(self, session_id: str, handle: str) -> bool:
+        return _decode_closed(
+            await self._call(
+                self.control.CloseHandle,
+                grpc_pb2.CloseHandleRequest(session_id=session_id, handle=handle),
+            )
+        )
+
+    async def close_session(self, session_id: str) -> bool:
+        return _decode_closed(
+            await self._call(
+                self.control.CloseSession,
+                grpc_pb2.CloseSessionRequest(session_id=session_id),
+            )
+        )
+
+    async def close(self):
+        """Drop this transport's pooled stubs.
+
+        The channels stay open for other sessions on the loop;
+        :func:`~remoteRF.core.grpc_client.close_aio_channels` closes them.
+        """
+        if self._pooled_control:
+            self._control = None
+        if self._pooled_samples:
+            self._samples = None
+
+    async def _sample_call(self, frames, *, operation_timeout_sec: float):
+        self._ensure_sample_transport()
+        rpc_timeout = (
+            _operation_timeout(operation_timeout_sec)
+            + self.stream_timeout_margin_sec
+        )
+        frames = list(frames)
+        try:
+            with rpc_metrics.timed(_SAMPLE_METHOD, *frames) as timer:
+                call = self.samples.SampleStream(iter(frames), timeout=rpc_timeout)
+                responses = [response async for response in call]
+                for response in responses:
+                    timer.response(response)
+        except grpc.RpcError as exc:
+            raise self._sample_rpc_error(exc) from exc
+        for response in responses:
+            self._raise_for_sample_frame(response)
+        return responses
+
+    def open_sample_stream(
+        self,
+        *,
+        session_id: str,
+        handle: str,
+        generation: int,
+        direction: str,
+        sequence: int = 1,
+    ) -> "AsyncSampleStream":
+        """Return a long-lived sample stream; the call starts on first use."""
+        return AsyncSampleStream(
+            self,
+            session_id=session_id,
+            handle=handle,
+            generation=generation,
+            direction=direction,
+            sequence=sequence,
+        )
+
+    async def recv(
+        self,
+        *,
+        session_id: str,
+        handle: str,
+        generation: int,
+        sequence: int,
+        buffer: np.ndarray,
+        sample_count: int,
+        channels,
+        timeout: float,
+        one_packet: bool,
+        metadata,
+        compression=None,
+        wire_format=None,
+    ):
+        common = _sample_identity(
+            session_id,
+            handle,
+            generation,
+            grpc_pb2.SAMPLE_DIRECTION_RX,
+        )
+        responses = await self._sample_call(
+            [
+                _open_frame(common, sequence),
+                _rx_request_frame(
+                    common,
+                    sequence=sequence,
+                    buffer=buffer,
+                    sample_count=sample_count,
+                    channels=channels,
+                    timeout=timeout,
+                    one_packet=one_packet,
+                    metadata=metadata,
+                    compression=compression,
+                    wire_format=wire_format,
+                ),
+            ],
+            operation_timeout_sec=timeout,
+        )
+        return _rx_response(
+            responses,
+            common,
+            sequence=sequence,
+            buffer=buffer,
+            sample_count=sample_count,
+            channels=channels,
+            compression=compression,
+            wire_format=wire_format,
+        )
+
+    async def send(
+        self,
+        *,
+        session_id: str,
+        handle: str,
+        generation: int,
+        sequence: int,
+        samples: np.ndarray,
+        channels,
+        timeout: float,
+        metadata,
+        compression=None,
+        wire_format=None,
+    ) -> int:
+        array = np.asarray(samples, dtype=_wire_dtype(samples.dtype))
+        common = _sample_identity(
+            session_id,
+            handle,
+            generation,
+            grpc_pb2.SAMPLE_DIRECTION_TX,
+        )
+        responses = await self._sample_call(
+            [
+                _open_frame(common, sequence),
+                _tx_data_frame(
+                    common,
+                    sequence=sequence,
+                    array=array,
+                    channels=channels,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=compression,
+                    wire_format=wire_format,
+                ),
+            ],
+            operation_timeout_sec=timeout,
+        )
+        return _tx_response(responses, common, sequence=sequence, array=array)
+
+
+class AsyncSampleStream:
+    """One ``SampleDataV1.SampleStream`` aio call kept open for a streamer.
+
+    Same framing as :class:`~remoteRF.core.dynamic_v2_transport.SampleStream`
+    without the reader thread: frames are written with ``call.write`` and
+    answers awaited with ``call.read``. Credit pipelining is sync-only.
+    """
+
+    def __init__(
+        self,
+        transport: AsyncDynamicV2Transport,
+        *,
+        session_id: str,
+        handle: str,
+        generation: int,
+        direction: str,
+        sequence: int = 1,
+    ):
+        if direction not in _SAMPLE_DIRECTIONS:
+            raise ValueError(f"unsupported sample stream direction: {direction!r}")
+        transport._ensure_sample_transport()
+        self._transport = transport
+        self._direction = direction
+        self._common = _sample_identity(
+            session_id,
+            handle,
+            generation,
+            _SAMPLE_DIRECTIONS[direction],
+        )
+        self._open_sequence = int(sequence)
+        self._sequence = max(0, int(sequence) - 1)
+        self._lock = asyncio.Lock()
+        self._closed = False
+        self._call = None
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def pipelined(self) -> bool:
+        return False
+
+    def _abort(self):
+        self._closed = True
+        call, self._call = self._call, None
+        if call is not None:
+            call.cancel()
+
+    def _ensure_usable(self):
+        if self._closed:
+            raise RemoteRFProtocolError("sample stream is closed")
+        self._transport._ensure_sample_transport()
+
+    async def _reply(self, sequence: int, terminal_kind):
+        while True:
+            response = await self._call.read()
+            if response is grpc.aio.EOF:
+                self._transport._poison_sample_transport(
+                    {"grpc_code": grpc.StatusCode.UNAVAILABLE.name}
+                )
+                raise RemoteRFTransportError(
+                    "sample stream ended unexpectedly",
+                    details=dict(self._transport._stream_failure_details),
+                    fatal_to_session=True,
+                )
+            self._transport._raise_for_sample_frame(response)
+            _DynamicV2TransportBase._validate_sample_responses(
+                [response],
+                self._common,
+                sequence,
+            )
+            if response.kind == terminal_kind and response.sequence == sequence:
+                return response
+
+    async def _exchange(self, frame, *, sequence: int, terminal_kind, timeout: float):
+        self._ensure_usable()
+        self._sequence = int(sequence)
+        method = f"{_SAMPLE_METHOD}/{self._direction}"
+        try:
+            with rpc_metrics.timed(method, frame) as timer:
+                if self._call is None:
+                    self._call = self._transport.samples.SampleStream()
+                    await self._call.write(
+                        _open_frame(self._common, self._open_sequence)
+                    )
+                await self._call.write(frame)
+                response = await asyncio.wait_for(
+                    self._reply(sequence, terminal_kind),
+                    _operation_timeout(timeout)
+                    + self._transport.stream_timeout_margin_sec,
+                )
+                timer.response(response)
+            return response
+        except asyncio.TimeoutError:
+            self._abort()
+            self._transport._poison_sample_transport(
+                {"grpc_code": grpc.StatusCode.DEADLINE_EXCEEDED.name}
+            )
+            raise RemoteRFTransportError(
+                "sample stream did not answer before the operation deadline",
+                details=dict(self._transport._stream_failure_details),
+                retryable=True,
+                fatal_to_session=True,
+            ) from None
+        except grpc.RpcError as exc:
+            self._abort()
+            raise self._transport._sample_rpc_error(exc) from exc
+        except BaseException:
+            # The server may still answer this sequence; never reuse a call
+            # whose frame ordering is no longer known.
+            self._abort()
+            raise
+
+    async def recv(
+        self,
+        *,
+        sequence: int,
+        buffer: np.ndarray,
+        sample_count: int,
+        channels,
+        timeout: float,
+        one_packet: bool,
+        metadata,
+        compression=None,
+        wire_format=None,
+    ):
+        if self._direction != "rx":
+            raise RemoteRFProtocolError("recv() requires an RX sample stream")
+        frame = _rx_request_frame(
+            self._common,
+            sequence=sequence,
+            buffer=buffer,
+            sample_count=sample_count,
+            channels=channels,
+            timeout=timeout,
+            one_packet=one_packet,
+            metadata=metadata,
+            compression=compression,
+            wire_format=wire_format,
+        )
+        async with self._lock:
+            data = await self._exchange(
+                frame,
+                sequence=sequence,
+                terminal_kind=grpc_pb2.SAMPLE_FRAME_DATA,
+                timeout=timeout,
+            )
+        count, samples, metadata = _decode_rx_data(
+            data,
+            buffer=buffer,
+            sample_count=sample_count,
+            channels=channels,
+            compression=compression,
+            wire_format=wire_format,
+        )
+        return count, _fill_rx_buffer(buffer, samples, wire_format), metadata
+
+    async def send(
+        self,
+        *,
+        sequence: int,
+        samples: np.ndarray,
+        channels,
+        timeout: float,
+        metadata,
+        compression=None,
+        wire_format=None,
+    ) -> int:
+        if self._direction != "tx":
+            raise RemoteRFProtocolError("send() requires a TX sample stream")
+        array = np.asarray(samples, dtype=_wire_dtype(samples.dtype))
+        frame = _tx_data_frame(
+            self._common,
+            sequence=sequence,
+            array=array,
+            channels=channels,
+            timeout=timeout,
+            metadata=metadata,
+            compression=compression,
+            wire_format=wire_format,
+        )
+        async with self._lock:
+            result = await self._exchange(
+                frame,
+                sequence=sequence,
+                terminal_kind=grpc_pb2.SAMPLE_FRAME_RESULT,
+                timeout=timeout,
+            )
+        return _tx_result_count(result, array)
+
+    async def close(self) -> bool:
+        async with self._lock:
+            if self._closed:
+                return False
+            self._closed = True
+            call, self._call = self._call, None
+            if call is None:
+                return True
+            try:
+                await call.write(
+                    grpc_pb2.SampleFrame(
+                        **self._common,
+                        sequence=self._sequence + 1,
+                        kind=grpc_pb2.SAMPLE_FRAME_CLOSE,
+                    )
+                )
+                await call.done_writing()
+                await asyncio.wait_for(_drain(call), _STREAM_CLOSE_GRACE_SEC)
+            except (asyncio.TimeoutError, grpc.RpcError):
+                call.cancel()
+            return True
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+        return False
+
+
+async def _drain(call):
+    while await call.read() is not grpc.aio.EOF:
+        pass
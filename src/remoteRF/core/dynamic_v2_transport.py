@@ -18,13 +18,20 @@ from __future__ import annotations
 
 import json
 import math
+import queue
+import threading
+import time
 import uuid
+import weakref
 
 import grpc
 import numpy as np
 
 from ..common.grpc import grpc_pb2, grpc_pb2_grpc
 from ..common.grpc.v2_codec import decode_value, encode_value
+from . import rpc_metrics
+from .sample_compression import decode_payload
+from .sample_formats import WIRE_DTYPES
 from .v2_errors import (
     RemoteRFError,
     RemoteRFProtocolError,
@@ -35,12 +42,20 @@ from .v2_errors import (
 SCHEMA_VERSION = "2.0"
 CONTROL_PROTOCOL_VERSION = "2.0"
 STREAMING_PROTOCOL_VERSION = "1.0"
+_SAMPLE_DIRECTIONS = {
+    "rx": grpc_pb2.SAMPLE_DIRECTION_RX,
+    "tx": grpc_pb2.SAMPLE_DIRECTION_TX,
+}
+_STREAM_END = object()
+_STREAM_CLOSE_GRACE_SEC = 1.0
+_SAMPLE_METHOD = "SampleDataV1.SampleStream"
 _SAMPLE_DTYPES = {
     "<c8": np.dtype("<c8"),
     "<c16": np.dtype("<c16"),
     "<i2": np.dtype("<i2"),
     "<f4": np.dtype("<f4"),
     "<f8": np.dtype("<f8"),
+    **WIRE_DTYPES,
 }
 
 
@@ -75,12 +90,169 @@ def _payload(value):
     return value
 
 
-class DynamicV2Transport:
+def _control_method(request) -> str:
+    """Metrics name of the control RPC carrying ``request``."""
+    name = "DynamicControlV2." + type(request).__name__.removesuffix("Request")
+    method = getattr(request, "method", "")
+    return f"{name}/{method}" if method else name
+
+
+def _rpc_failure(exc) -> RemoteRFTransportError:
+    return RemoteRFTransportError(
+        f"Dynamic v2 RPC failed: {exc.code().name}: {exc.details()}",
+        details={"grpc_code": exc.code().name},
+        retryable=exc.code() in {
+            grpc.StatusCode.UNAVAILABLE,
+            grpc.StatusCode.DEADLINE_EXCEEDED,
+        },
+    )
+
+
+def _negotiate_request():
+    return grpc_pb2.NegotiateRequest(
+        schema_versions=[SCHEMA_VERSION],
+        control_protocol_versions=[CONTROL_PROTOCOL_VERSION],
+        streaming_protocol_versions=[STREAMING_PROTOCOL_VERSION],
+    )
+
+
+def _check_negotiated(response):
+    raise_for_envelope(response.error)
+    if (
+        response.schema_version != SCHEMA_VERSION
+        or response.control_protocol_version != CONTROL_PROTOCOL_VERSION
+        or response.streaming_protocol_version != STREAMING_PROTOCOL_VERSION
+    ):
+        raise RemoteRFProtocolError(
+            "server selected unexpected Dynamic protocol versions"
+        )
+    return response
+
+
+def _schema_request(token: str, *, hash_only: bool = False):
+    return grpc_pb2.GetSchemaRequest(
+        token=str(token),
+        schema_versions=[SCHEMA_VERSION],
+        hash_only=hash_only,
+    )
+
+
+def _decode_schema(response) -> dict:
+    raise_for_envelope(response.error)
+    try:
+        schema = json.loads(response.schema_json)
+    except (TypeError, json.JSONDecodeError) as exc:
+        raise RemoteRFProtocolError("server returned invalid schema JSON") from exc
+    if (
+        response.schema_version != SCHEMA_VERSION
+        or schema.get("schema_version") != SCHEMA_VERSION
+        or response.schema_hash != schema.get("schema_hash")
+    ):
+        raise RemoteRFProtocolError(
+            "server schema version/hash fields are inconsistent"
+        )
+    return schema
+
+
+def _decode_schema_hash(response) -> str:
+    """Read the hash from a ``hash_only`` reply; old servers send the schema too."""
+    raise_for_envelope(response.error)
+    if response.schema_version != SCHEMA_VERSION or not response.schema_hash:
+        raise RemoteRFProtocolError(
+            "server schema version/hash fields are inconsistent"
+        )
+    return response.schema_hash
+
+
+def _open_session_request(token: str, schema_hash: str):
+    # The client always opens by hash, so it already holds the schema.
+    return grpc_pb2.OpenSessionRequest(
+        token=str(token),
+        requested_schema_hash=str(schema_hash),
+        control_protocol_version=CONTROL_PROTOCOL_VERSION,
+        streaming_protocol_version=STREAMING_PROTOCOL_VERSION,
+        omit_schema=True,
+    )
+
+
+def _decode_session(response, schema_hash: str) -> dict:
+    raise_for_envelope(response.error)
+    try:
+        # Servers honouring omit_schema leave schema_json empty.
+        schema = json.loads(response.schema_json) if response.schema_json else None
+        capabilities = json.loads(response.capabilities_json or "{}")
+    except (TypeError, json.JSONDecodeError) as exc:
+        raise RemoteRFProtocolError(
+            "server returned invalid session JSON"
+        ) from exc
+    if response.schema_hash != str(schema_hash) or (
+        schema is not None
+        and (
+            schema.get("schema_hash") != str(schema_hash)
+            or schema.get("schema_version") != SCHEMA_VERSION
+        )
+    ):
+        raise RemoteRFProtocolError(
+            "opened session does not match the requested schema"
+        )
+    return {
+        "session_id": response.session_id,
+        "device_handle": response.device_handle,
+        "schema": schema,
+        "schema_hash": response.schema_hash,
+        "capabilities": capabilities,
+        "uhd_version": response.uhd_version,
+        "uhd_abi": response.uhd_abi,
+        "hardware_profile": response.hardware_profile,
+    }
+
+
+def _invoke_request(session_id, handle, method, args, overload_id):
+    request = grpc_pb2.InvokeRequest(
+        session_id=session_id,
+        handle=handle,
+        method=method,
+        overload_id=overload_id,
+    )
+    for name, value in args.items():
+        request.args.add(name=str(name), value=encode_value(_payload(value)))
+    return request
+
+
+def _decode_invoke(response):
+    raise_for_envelope(response.error)
+    result = decode_value(response.result)
+    mutations = {
+        item.target: decode_value(item.value)
+        for item in response.mutations
+    }
+    return result, mutations
+
+
+def _decode_invoke_batch(response) -> list:
+    """Decode batch results in order; a failed call ends the list as its error."""
+    raise_for_envelope(response.error)
+    outcomes = []
+    for item in response.results:
+        try:
+            outcomes.append(_decode_invoke(item))
+        except RemoteRFError as exc:
+            outcomes.append(exc)
+            break
+    return outcomes
+
+
+def _decode_closed(response) -> bool:
+    raise_for_envelope(response.error)
+    return bool(response.closed)
+
+
+class _DynamicV2TransportBase:
+    """Timeouts and sample-transport failure state shared by sync and asyncio."""
+
     def __init__(
         self,
         *,
-        control_stub=None,
-        sample_stub=None,
         control_timeout_sec: float = 30.0,
         stream_timeout_margin_sec: float = 5.0,
     ):
@@ -100,106 +272,146 @@ class DynamicV2Transport:
             )
         self._stream_poisoned = False
         self._stream_failure_details = {}
-        if control_stub is None or sample_stub is None:
-            from .grpc_client import channel
-            control_stub = control_stub or grpc_pb2_grpc.DynamicControlV2Stub(channel)
-            sample_stub = sample_stub or grpc_pb2_grpc.SampleDataV1Stub(channel)
+
+    def _ensure_sample_transport(self):
+        if self._stream_poisoned:
+            raise RemoteRFTransportError(
+                "sample transport previously failed; open a new device "
+                "session and streamer",
+                details={
+                    **self._stream_failure_details,
+                    "requires_new_session": True,
+                },
+                retryable=False,
+                fatal_to_session=True,
+            )
+
+    def _poison_sample_transport(self, details):
+        self._stream_poisoned = True
+        self._stream_failure_details = {
+            **details,
+            "requires_new_session": True,
+        }
+
+    def _sample_rpc_error(self, exc) -> RemoteRFTransportError:
+        self._poison_sample_transport({"grpc_code": exc.code().name})
+        return RemoteRFTransportError(
+            f"sample stream failed: {exc.code().name}: {exc.details()}",
+            details=dict(self._stream_failure_details),
+            retryable=exc.code() in {
+                grpc.StatusCode.UNAVAILABLE,
+                grpc.StatusCode.DEADLINE_EXCEEDED,
+            },
+            fatal_to_session=True,
+        )
+
+    def _raise_for_sample_frame(self, response):
+        try:
+            raise_for_envelope(response.error)
+        except RemoteRFError as exc:
+            if exc.fatal_to_session:
+                self._poison_sample_transport(exc.details)
+            raise
+
+    @staticmethod
+    def _validate_sample_responses(responses, common, request_sequence):
+        if not responses:
+            raise RemoteRFProtocolError("sample stream returned no frames")
+        for response in responses:
+            if (
+                response.session_id != common["session_id"]
+                or response.handle != common["handle"]
+                or response.generation != common["generation"]
+                or response.operation_id != common["operation_id"]
+                or response.direction != common["direction"]
+            ):
+                raise RemoteRFProtocolError(
+                    "sample response identity does not match the request"
+                )
+            if response.sequence not in {
+                max(0, request_sequence - 1),
+                request_sequence,
+            }:
+                raise RemoteRFProtocolError(
+                    "sample response sequence does not match the request"
+                )
+
+
+class DynamicV2Transport(_DynamicV2TransportBase):
+    def __init__(
+        self,
+        *,
+        control_stub=None,
+        sample_stub=None,
+        control_timeout_sec: float = 30.0,
+        stream_timeout_margin_sec: float = 5.0,
+        channel_key=None,
+    ):
+        super().__init__(
+            control_timeout_sec=control_timeout_sec,
+            stream_timeout_margin_sec=stream_timeout_margin_sec,
+        )
         self.control = control_stub
         self.samples = sample_stub
+        self._pooled_control = control_stub is None
+        self._pooled_samples = sample_stub is None
+        # Without an explicit key, open_session() pins the pooled channels to
+        # the reservation token so per_device spreads sessions across them.
+        self._channel_key = channel_key
+        self._bind_channels(channel_key)
+        self._invoke_batch_supported = hasattr(self.control, "InvokeBatch")
+
+    def _bind_channels(self, key):
+        if not (self._pooled_control or self._pooled_samples):
+            return
+        from .grpc_client import control_channel, sample_channel
+        if self._pooled_control:
+            self.control = grpc_pb2_grpc.DynamicControlV2Stub(control_channel(key))
+        if self._pooled_samples:
+            self.samples = grpc_pb2_grpc.SampleDataV1Stub(sample_channel(key))
 
     def _call(self, fn, request):
         try:
-            return fn(request, timeout=self.control_timeout_sec)
+            return rpc_metrics.unary_call(
+                _control_method(request),
+                fn,
+                request,
+                timeout=self.control_timeout_sec,
+            )
         except grpc.RpcError as exc:
-            raise RemoteRFTransportError(
-                f"Dynamic v2 RPC failed: {exc.code().name}: {exc.details()}",
-                details={"grpc_code": exc.code().name},
-                retryable=exc.code() in {
-                    grpc.StatusCode.UNAVAILABLE,
-                    grpc.StatusCode.DEADLINE_EXCEEDED,
-                },
-            ) from exc
+            raise _rpc_failure(exc) from exc
 
     def negotiate(self):
-        response = self._call(
-            self.control.Negotiate,
-            grpc_pb2.NegotiateRequest(
-                schema_versions=[SCHEMA_VERSION],
-                control_protocol_versions=[CONTROL_PROTOCOL_VERSION],
-                streaming_protocol_versions=[STREAMING_PROTOCOL_VERSION],
-            ),
+        return _check_negotiated(
+            self._call(self.control.Negotiate, _negotiate_request())
         )
-        raise_for_envelope(response.error)
-        if (
-            response.schema_version != SCHEMA_VERSION
-            or response.control_protocol_version != CONTROL_PROTOCOL_VERSION
-            or response.streaming_protocol_version != STREAMING_PROTOCOL_VERSION
-        ):
-            raise RemoteRFProtocolError(
-                "server selected unexpected Dynamic protocol versions"
-            )
-        return response
 
     def get_schema(self, token: str) -> dict:
         self.negotiate()
-        response = self._call(
-            self.control.GetSchema,
-            grpc_pb2.GetSchemaRequest(
-                token=str(token),
-                schema_versions=[SCHEMA_VERSION],
-            ),
+        return _decode_schema(
+            self._call(self.control.GetSchema, _schema_request(token))
         )
-        raise_for_envelope(response.error)
-        try:
-            schema = json.loads(response.schema_json)
-        except (TypeError, json.JSONDecodeError) as exc:
-            raise RemoteRFProtocolError("server returned invalid schema JSON") from exc
-        if (
-            response.schema_version != SCHEMA_VERSION
-            or schema.get("schema_version") != SCHEMA_VERSION
-            or response.schema_hash != schema.get("schema_hash")
-        ):
-            raise RemoteRFProtocolError(
-                "server schema version/hash fields are inconsistent"
+
+    def get_schema_hash(self, token: str) -> str:
+        self.negotiate()
+        return _decode_schema_hash(
+            self._call(
+                self.control.GetSchema,
+                _schema_request(token, hash_only=True),
             )
-        return schema
+        )
 
     def open_session(self, token: str, schema_hash: str):
-        response = self._call(
-            self.control.OpenSession,
-            grpc_pb2.OpenSessionRequest(
-                token=str(token),
-                requested_schema_hash=str(schema_hash),
-                control_protocol_version=CONTROL_PROTOCOL_VERSION,
-                streaming_protocol_version=STREAMING_PROTOCOL_VERSION,
+        if self._channel_key is None:
+            self._channel_key = str(token)
+            self._bind_channels(self._channel_key)
+        return _decode_session(
+            self._call(
+                self.control.OpenSession,
+                _open_session_request(token, schema_hash),
             ),
+            schema_hash,
         )
-        raise_for_envelope(response.error)
-        try:
-            schema = json.loads(response.schema_json)
-            capabilities = json.loads(response.capabilities_json or "{}")
-        except (TypeError, json.JSONDecodeError) as exc:
-            raise RemoteRFProtocolError(
-                "server returned invalid session JSON"
-            ) from exc
-        if (
-            response.schema_hash != str(schema_hash)
-            or schema.get("schema_hash") != str(schema_hash)
-            or schema.get("schema_version") != SCHEMA_VERSION
-        ):
-            raise RemoteRFProtocolError(
-                "opened session does not match the requested schema"
-            )
-        return {
-            "session_id": response.session_id,
-            "device_handle": response.device_handle,
-            "schema": schema,
-            "schema_hash": response.schema_hash,
-            "capabilities": capabilities,
-            "uhd_version": response.uhd_version,
-            "uhd_abi": response.uhd_abi,
-            "hardware_profile": response.hardware_profile,
-        }
 
     def invoke(
         self,
@@ -210,116 +422,126 @@ class DynamicV2Transport:
         *,
         overload_id: str = "",
     ):
-        request = grpc_pb2.InvokeRequest(
-            session_id=session_id,
-            handle=handle,
-            method=method,
-            overload_id=overload_id,
-        )
-        for name, value in args.items():
-            request.args.add(name=str(name), value=encode_value(_payload(value)))
-        response = self._call(self.control.Invoke, request)
-        raise_for_envelope(response.error)
-        result = decode_value(response.result)
-        mutations = {
-            item.target: decode_value(item.value)
-            for item in response.mutations
-        }
-        return result, mutations
+        return _decode_invoke(
+            self._call(
+                self.control.Invoke,
+                _invoke_request(session_id, handle, method, args, overload_id),
+            )
+        )
+
+    def invoke_batch(self, session_id: str, calls) -> list:
+        """Run ``(handle, method, args, overload_id)`` calls in one round trip.
+
+        Returns one ``(result, mutations)`` pair per executed call, in order.
+        If a call fails, its :class:`RemoteRFError` ends the list and later
+        calls were not run. Servers without ``InvokeBatch`` get the calls as
+        ordinary sequential ``Invoke`` RPCs.
+        """
+        calls = list(calls)
+        if self._invoke_batch_supported:
+            request = grpc_pb2.InvokeBatchRequest(
+                session_id=session_id,
+                calls=[
+                    _invoke_request(session_id, handle, method, args, overload_id)
+                    for handle, method, args, overload_id in calls
+                ],
+            )
+            try:
+                response = rpc_metrics.unary_call(
+                    _control_method(request),
+                    self.control.InvokeBatch,
+                    request,
+                    timeout=self.control_timeout_sec,
+                )
+            except grpc.RpcError as exc:
+                if exc.code() != grpc.StatusCode.UNIMPLEMENTED:
+                    raise _rpc_failure(exc) from exc
+                self._invoke_batch_supported = False
+            else:
+                outcomes = _decode_invoke_batch(response)
+                if len(outcomes) < len(calls) and not (
+                    outcomes and isinstance(outcomes[-1], RemoteRFError)
+                ):
+                    raise RemoteRFProtocolError(
+                        "InvokeBatch returned fewer results than calls"
+                    )
+                return outcomes
+        outcomes = []
+        for handle, method, args, overload_id in calls:
+            try:
+                outcomes.append(
+                    self.invoke(
+                        session_id,
+                        handle,
+                        method,
+                        args,
+                        overload_id=overload_id,
+                    )
+                )
+            except RemoteRFTransportError:
+                raise
+            except RemoteRFError as exc:
+                outcomes.append(exc)
+                break
+        return outcomes
 
     def close_handle(self, session_id: str, handle: str) -> bool:
-        response = self._call(
-            self.control.CloseHandle,
-            grpc_pb2.CloseHandleRequest(session_id=session_id, handle=handle),
+        return _decode_closed(
+            self._call(
+                self.control.CloseHandle,
+                grpc_pb2.CloseHandleRequest(session_id=session_id, handle=handle),
+            )
         )
-        raise_for_envelope(response.error)
-        return bool(response.closed)
 
     def close_session(self, session_id: str) -> bool:
-        response = self._call(
-            self.control.CloseSession,
-            grpc_pb2.CloseSessionRequest(session_id=session_id),
+        return _decode_closed(
+            self._call(
+                self.control.CloseSession,
+                grpc_pb2.CloseSessionRequest(session_id=session_id),
+            )
         )
-        raise_for_envelope(response.error)
-        return bool(response.closed)
 
     def _sample_call(self, frames, *, operation_timeout_sec: float):
-        if self._stream_poisoned:
-            raise RemoteRFTransportError(
-                "sample transport previously failed; open a new device "
-                "session and streamer",
-                details={
-                    **self._stream_failure_details,
-                    "requires_new_session": True,
-                },
-                retryable=False,
-                fatal_to_session=True,
-            )
-        operation_timeout_sec = float(operation_timeout_sec)
-        if not math.isfinite(operation_timeout_sec) or operation_timeout_sec < 0:
-            raise ValueError(
-                "sample operation timeout must be finite and non-negative"
-            )
+        self._ensure_sample_transport()
         rpc_timeout = (
-            operation_timeout_sec + self.stream_timeout_margin_sec
+            _operation_timeout(operation_timeout_sec)
+            + self.stream_timeout_margin_sec
         )
+        frames = list(frames)
         try:
-            responses = list(
-                self.samples.SampleStream(
-                    iter(frames),
-                    timeout=rpc_timeout,
+            with rpc_metrics.timed(_SAMPLE_METHOD, *frames) as timer:
+                responses = list(
+                    self.samples.SampleStream(
+                        iter(frames),
+                        timeout=rpc_timeout,
+                    )
                 )
-            )
+                for response in responses:
+                    timer.response(response)
         except grpc.RpcError as exc:
-            self._stream_poisoned = True
-            self._stream_failure_details = {
-                "grpc_code": exc.code().name,
-                "requires_new_session": True,
-            }
-            raise RemoteRFTransportError(
-                f"sample stream failed: {exc.code().name}: {exc.details()}",
-                details=dict(self._stream_failure_details),
-                retryable=exc.code() in {
-                    grpc.StatusCode.UNAVAILABLE,
-                    grpc.StatusCode.DEADLINE_EXCEEDED,
-                },
-                fatal_to_session=True,
-            ) from exc
+            raise self._sample_rpc_error(exc) from exc
         for response in responses:
-            try:
-                raise_for_envelope(response.error)
-            except RemoteRFError as exc:
-                if exc.fatal_to_session:
-                    self._stream_poisoned = True
-                    self._stream_failure_details = {
-                        **exc.details,
-                        "requires_new_session": True,
-                    }
-                raise
+            self._raise_for_sample_frame(response)
         return responses
 
-    @staticmethod
-    def _validate_sample_responses(responses, common, request_sequence):
-        if not responses:
-            raise RemoteRFProtocolError("sample stream returned no frames")
-        for response in responses:
-            if (
-                response.session_id != common["session_id"]
-                or response.handle != common["handle"]
-                or response.generation != common["generation"]
-                or response.operation_id != common["operation_id"]
-                or response.direction != common["direction"]
-            ):
-                raise RemoteRFProtocolError(
-                    "sample response identity does not match the request"
-                )
-            if response.sequence not in {
-                max(0, request_sequence - 1),
-                request_sequence,
-            }:
-                raise RemoteRFProtocolError(
-                    "sample response sequence does not match the request"
-                )
+    def open_sample_stream(
+        self,
+        *,
+        session_id: str,
+        handle: str,
+        generation: int,
+        direction: str,
+        sequence: int = 1,
+    ) -> "SampleStream":
+        """Open one long-lived sample stream for a streamer handle."""
+        return SampleStream(
+            self,
+            session_id=session_id,
+            handle=handle,
+            generation=generation,
+            direction=direction,
+            sequence=sequence,
+        )
 
     def recv(
         self,
@@ -334,102 +556,43 @@ class DynamicV2Transport:
         timeout: float,
         one_packet: bool,
         metadata,
+        compression=None,
+        wire_format=None,
     ):
-        operation_id = uuid.uuid4().hex
-        shape = list(buffer.shape)
-        shape[-1] = int(sample_count)
-        wire_dtype = _wire_dtype(buffer.dtype)
-        common = dict(
-            session_id=session_id,
-            handle=handle,
-            generation=int(generation),
-            operation_id=operation_id,
-            direction=grpc_pb2.SAMPLE_DIRECTION_RX,
+        common = _sample_identity(
+            session_id,
+            handle,
+            generation,
+            grpc_pb2.SAMPLE_DIRECTION_RX,
         )
         responses = self._sample_call(
             [
-                grpc_pb2.SampleFrame(
-                    **common,
-                    sequence=max(0, sequence - 1),
-                    kind=grpc_pb2.SAMPLE_FRAME_OPEN,
-                    credits=1,
-                ),
-                grpc_pb2.SampleFrame(
-                    **common,
+                _open_frame(common, sequence),
+                _rx_request_frame(
+                    common,
                     sequence=sequence,
-                    kind=grpc_pb2.SAMPLE_FRAME_REQUEST,
-                    dtype=wire_dtype.str,
-                    shape=shape,
-                    channels=list(channels),
-                    sample_count=int(sample_count),
-                    timeout_sec=float(timeout),
-                    one_packet=bool(one_packet),
-                    metadata_json=json.dumps(_payload(metadata), separators=(",", ":")),
+                    buffer=buffer,
+                    sample_count=sample_count,
+                    channels=channels,
+                    timeout=timeout,
+                    one_packet=one_packet,
+                    metadata=metadata,
+                    compression=compression,
+                    wire_format=wire_format,
                 ),
             ],
             operation_timeout_sec=timeout,
         )
-        self._validate_sample_responses(responses, common, sequence)
-        data_frames = [
-            item for item in responses
-            if item.kind == grpc_pb2.SAMPLE_FRAME_DATA
-            and item.sequence == sequence
-        ]
-        if len(data_frames) != 1:
-            raise RemoteRFProtocolError(
-                "RX operation must return exactly one DATA frame"
-            )
-        data = data_frames[0]
-        dtype = _response_dtype(data.dtype)
-        if dtype != wire_dtype:
-            raise RemoteRFProtocolError(
-                "RX response dtype does not match the requested buffer"
-            )
-        received_shape = tuple(int(item) for item in data.shape)
-        if (
-            len(received_shape) not in {1, 2}
-            or any(item < 0 for item in received_shape)
-            or not received_shape
-            or int(data.sample_count) != received_shape[-1]
-            or int(data.sample_count) > int(sample_count)
-        ):
-            raise RemoteRFProtocolError("RX response has invalid sample shape/count")
-        if len(received_shape) != buffer.ndim:
-            raise RemoteRFProtocolError(
-                "RX response dimensionality does not match the requested buffer"
-            )
-        if (
-            len(received_shape) == 2
-            and received_shape[0] != len(channels)
-        ) or (
-            len(received_shape) == 1
-            and len(channels) != 1
-        ):
-            raise RemoteRFProtocolError(
-                "RX response channel dimension does not match channel metadata"
-            )
-        expected_bytes = math.prod(received_shape) * dtype.itemsize
-        if expected_bytes != len(data.payload):
-            raise RemoteRFProtocolError(
-                "RX response byte length does not match dtype/shape"
-            )
-        if list(data.channels) != list(channels):
-            raise RemoteRFProtocolError("RX response channels do not match")
-        try:
-            samples = np.frombuffer(
-                data.payload,
-                dtype=dtype,
-            ).reshape(received_shape)
-            metadata = json.loads(data.metadata_json or "{}")
-        except (TypeError, ValueError, json.JSONDecodeError) as exc:
-            raise RemoteRFProtocolError(
-                "RX response contains malformed binary data or metadata"
-            ) from exc
-        if not isinstance(metadata, dict):
-            raise RemoteRFProtocolError(
-                "RX response metadata must be a JSON object"
-            )
-        return int(data.sample_count), samples.copy(), metadata
+        return _rx_response(
+            responses,
+            common,
+            sequence=sequence,
+            buffer=buffer,
+            sample_count=sample_count,
+            channels=channels,
+            compression=compression,
+            wire_format=wire_format,
+        )
 
     def send(
         self,
@@ -442,51 +605,700 @@ class DynamicV2Transport:
         channels,
         timeout: float,
         metadata,
+        compression=None,
+        wire_format=None,
     ) -> int:
-        wire_dtype = _wire_dtype(samples.dtype)
-        array = np.ascontiguousarray(samples, dtype=wire_dtype)
-        operation_id = uuid.uuid4().hex
-        common = dict(
-            session_id=session_id,
-            handle=handle,
-            generation=int(generation),
-            operation_id=operation_id,
-            direction=grpc_pb2.SAMPLE_DIRECTION_TX,
+        array = np.asarray(samples, dtype=_wire_dtype(samples.dtype))
+        common = _sample_identity(
+            session_id,
+            handle,
+            generation,
+            grpc_pb2.SAMPLE_DIRECTION_TX,
         )
         responses = self._sample_call(
             [
-                grpc_pb2.SampleFrame(
-                    **common,
-                    sequence=max(0, sequence - 1),
-                    kind=grpc_pb2.SAMPLE_FRAME_OPEN,
-                    credits=1,
-                ),
-                grpc_pb2.SampleFrame(
-                    **common,
+                _open_frame(common, sequence),
+                _tx_data_frame(
+                    common,
                     sequence=sequence,
-                    kind=grpc_pb2.SAMPLE_FRAME_DATA,
-                    dtype=array.dtype.str,
-                    shape=list(array.shape),
-                    channels=list(channels),
-                    sample_count=int(array.shape[-1] if array.ndim else 0),
-                    payload=array.tobytes(order="C"),
-                    timeout_sec=float(timeout),
-                    metadata_json=json.dumps(_payload(metadata), separators=(",", ":")),
+                    array=array,
+                    channels=channels,
+                    timeout=timeout,
+                    metadata=metadata,
+                    compression=compression,
+                    wire_format=wire_format,
                 ),
             ],
             operation_timeout_sec=timeout,
         )
-        self._validate_sample_responses(responses, common, sequence)
-        result_frames = [
-            item for item in responses
-            if item.kind == grpc_pb2.SAMPLE_FRAME_RESULT
-            and item.sequence == sequence
-        ]
-        if len(result_frames) != 1:
+        return _tx_response(responses, common, sequence=sequence, array=array)
+
+
+class SampleStream:
+    """One ``SampleDataV1.SampleStream`` call kept open for a streamer handle.
+
+    The OPEN frame is sent once. Every ``recv``/``send`` then writes its
+    REQUEST or DATA frame onto the same call and waits for the matching DATA
+    or RESULT frame, and ``close`` ends the call with a CLOSE frame.
+
+    RX streams can also run a credit pipeline: one REQUEST grants the server
+    ``credits`` DATA frames that it pushes back to back, and every frame taken
+    off the local queue is granted again with a CREDIT frame.
+    """
+
+    def __init__(
+        self,
+        transport: DynamicV2Transport,
+        *,
+        session_id: str,
+        handle: str,
+        generation: int,
+        direction: str,
+        sequence: int = 1,
+    ):
+        if direction not in _SAMPLE_DIRECTIONS:
+            raise ValueError(f"unsupported sample stream direction: {direction!r}")
+        transport._ensure_sample_transport()
+        self._transport = transport
+        self._direction = direction
+        self._common = _sample_identity(
+            session_id,
+            handle,
+            generation,
+            _SAMPLE_DIRECTIONS[direction],
+        )
+        self._sequence = max(0, int(sequence) - 1)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._pipeline = None
+        self._requests = queue.SimpleQueue()
+        self._responses = queue.SimpleQueue()
+        self._requests.put(_open_frame(self._common, int(sequence)))
+        try:
+            self._call = transport.samples.SampleStream(
+                iter(self._requests.get, _STREAM_END)
+            )
+        except grpc.RpcError as exc:
+            raise transport._sample_rpc_error(exc) from exc
+        self._reader = threading.Thread(
+            target=_pump_responses,
+            args=(self._call, self._responses),
+            name=f"remoterf-sample-{direction}-{self._common['handle']}",
+            daemon=True,
+        )
+        self._reader.start()
+        self._finalizer = weakref.finalize(
+            self,
+            _abort_stream,
+            self._requests,
+            self._call,
+        )
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def pipelined(self) -> bool:
+        return self._pipeline is not None
+
+    def _abort(self):
+        self._closed = True
+        self._pipeline = None
+        self._finalizer()
+
+    def _ensure_usable(self):
+        if self._closed:
+            raise RemoteRFProtocolError("sample stream is closed")
+        self._transport._ensure_sample_transport()
+
+    def _deadline(self, timeout: float) -> float:
+        return (
+            time.monotonic()
+            + _operation_timeout(timeout)
+            + self._transport.stream_timeout_margin_sec
+        )
+
+    def _next_response(self, deadline: float):
+        try:
+            item = self._responses.get(
+                timeout=max(0.0, deadline - time.monotonic())
+            )
+        except queue.Empty:
+            self._abort()
+            self._transport._poison_sample_transport(
+                {"grpc_code": grpc.StatusCode.DEADLINE_EXCEEDED.name}
+            )
+            raise RemoteRFTransportError(
+                "sample stream did not answer before the operation deadline",
+                details=dict(self._transport._stream_failure_details),
+                retryable=True,
+                fatal_to_session=True,
+            ) from None
+        if isinstance(item, grpc.RpcError):
+            self._abort()
+            raise self._transport._sample_rpc_error(item) from item
+        if item is _STREAM_END or isinstance(item, BaseException):
+            self._abort()
+            self._transport._poison_sample_transport(
+                {"grpc_code": grpc.StatusCode.UNAVAILABLE.name}
+            )
+            raise RemoteRFTransportError(
+                "sample stream ended unexpectedly",
+                details=dict(self._transport._stream_failure_details),
+                fatal_to_session=True,
+            )
+        return item
+
+    def _exchange(self, frame, *, sequence: int, terminal_kind, timeout: float):
+        self._ensure_usable()
+        if self._pipeline is not None:
             raise RemoteRFProtocolError(
-                "TX operation must return exactly one RESULT frame"
+                "stop the RX credit pipeline before single requests"
+            )
+        deadline = self._deadline(timeout)
+        self._sequence = int(sequence)
+        try:
+            method = f"{_SAMPLE_METHOD}/{self._direction}"
+            with rpc_metrics.timed(method, frame) as timer:
+                self._requests.put(frame)
+                while True:
+                    response = self._next_response(deadline)
+                    timer.response(response)
+                    self._transport._raise_for_sample_frame(response)
+                    DynamicV2Transport._validate_sample_responses(
+                        [response],
+                        self._common,
+                        sequence,
+                    )
+                    if response.kind == terminal_kind and response.sequence == sequence:
+                        return response
+        except BaseException:
+            # The server may still answer this sequence; never reuse a call
+            # whose frame ordering is no longer known.
+            self._abort()
+            raise
+
+    def recv(
+        self,
+        *,
+        sequence: int,
+        buffer: np.ndarray,
+        sample_count: int,
+        channels,
+        timeout: float,
+        one_packet: bool,
+        metadata,
+        compression=None,
+        wire_format=None,
+    ):
+        if self._direction != "rx":
+            raise RemoteRFProtocolError("recv() requires an RX sample stream")
+        frame = _rx_request_frame(
+            self._common,
+            sequence=sequence,
+            buffer=buffer,
+            sample_count=sample_count,
+            channels=channels,
+            timeout=timeout,
+            one_packet=one_packet,
+            metadata=metadata,
+            compression=compression,
+            wire_format=wire_format,
+        )
+        with self._lock:
+            data = self._exchange(
+                frame,
+                sequence=sequence,
+                terminal_kind=grpc_pb2.SAMPLE_FRAME_DATA,
+                timeout=timeout,
             )
-        result = result_frames[0]
-        if int(result.sample_count) > int(array.shape[-1]):
-            raise RemoteRFProtocolError("TX response sample count exceeds request")
-        return int(result.sample_count)
+        count, samples, metadata = _decode_rx_data(
+            data,
+            buffer=buffer,
+            sample_count=sample_count,
+            channels=channels,
+            compression=compression,
+            wire_format=wire_format,
+        )
+        return count, _fill_rx_buffer(buffer, samples, wire_format), metadata
+
+    def start_rx_pipeline(
+        self,
+        *,
+        credits: int,
+        sequence: int,
+        buffer: np.ndarray,
+        sample_count: int,
+        channels,
+        timeout: float,
+        one_packet: bool,
+        metadata,
+        compression=None,
+        wire_format=None,
+    ):
+        """Grant ``credits`` RX blocks shaped like ``buffer[..., :sample_count]``."""
+        if self._direction != "rx":
+            raise RemoteRFProtocolError("RX pipelines require an RX sample stream")
+        credits = int(credits)
+        if credits < 1:
+            raise ValueError("RX pipeline credits must be positive")
+        frame = _rx_request_frame(
+            self._common,
+            sequence=sequence,
+            buffer=buffer,
+            sample_count=sample_count,
+            channels=channels,
+            timeout=timeout,
+            one_packet=one_packet,
+            metadata=metadata,
+            credits=credits,
+            compression=compression,
+            wire_format=wire_format,
+        )
+        with self._lock:
+            self._ensure_usable()
+            if self._pipeline is not None:
+                raise RemoteRFProtocolError("RX pipeline is already running")
+            self._sequence = int(sequence)
+            self._requests.put(frame)
+            self._pipeline = {
+                "sequence": int(sequence),
+                "credits": credits,
+                "owed": 0,
+                "template": np.empty(buffer.shape[:-1] + (0,), dtype=buffer.dtype),
+                "sample_count": int(sample_count),
+                "channels": list(channels),
+                "compression": compression,
+                "wire_format": wire_format,
+                "pending": None,
+            }
+
+    def _grant(self, pipeline, credits: int):
+        pipeline["owed"] += credits
+        if pipeline["owed"] < max(1, pipeline["credits"] // 2):
+            return
+        self._requests.put(
+            grpc_pb2.SampleFrame(
+                **self._common,
+                sequence=pipeline["sequence"],
+                kind=grpc_pb2.SAMPLE_FRAME_CREDIT,
+                credits=pipeline["owed"],
+            )
+        )
+        pipeline["owed"] = 0
+
+    def _next_pipelined_block(self, pipeline, timeout: float):
+        deadline = self._deadline(timeout)
+        try:
+            with rpc_metrics.timed(f"{_SAMPLE_METHOD}/rx_pipeline") as timer:
+                while True:
+                    response = self._next_response(deadline)
+                    timer.response(response)
+                    self._transport._raise_for_sample_frame(response)
+                    DynamicV2Transport._validate_sample_responses(
+                        [response],
+                        self._common,
+                        pipeline["sequence"],
+                    )
+                    if (
+                        response.kind == grpc_pb2.SAMPLE_FRAME_DATA
+                        and response.sequence == pipeline["sequence"]
+                    ):
+                        break
+            block = _decode_rx_data(
+                response,
+                buffer=pipeline["template"],
+                sample_count=pipeline["sample_count"],
+                channels=pipeline["channels"],
+                compression=pipeline["compression"],
+                wire_format=pipeline["wire_format"],
+            )
+        except BaseException:
+            self._abort()
+            raise
+        self._grant(pipeline, 1)
+        return block
+
+    def recv_pipelined(self, *, buffer: np.ndarray, sample_count: int, timeout: float):
+        """Drain the next queued RX block, splitting it across small buffers.
+
+        A block larger than ``sample_count`` is returned over several calls
+        with ``more_fragments``/``fragment_offset`` set, like native UHD.
+        """
+        with self._lock:
+            self._ensure_usable()
+            pipeline = self._pipeline
+            if pipeline is None:
+                raise RemoteRFProtocolError("RX pipeline is not running")
+            template = pipeline["template"]
+            if (
+                buffer.dtype != template.dtype
+                or buffer.shape[:-1] != template.shape[:-1]
+            ):
+                raise ValueError(
+                    "RX buffer dtype/channel layout does not match the "
+                    "running credit pipeline"
+                )
+            if pipeline["pending"] is None:
+                count, samples, metadata = self._next_pipelined_block(
+                    pipeline, timeout
+                )
+                pipeline["pending"] = (count, samples, metadata, 0)
+            count, samples, metadata, offset = pipeline["pending"]
+            end = min(count, offset + max(0, int(sample_count)))
+            fragment = dict(metadata)
+            if offset or end < count:
+                fragment["more_fragments"] = end < count
+                fragment["fragment_offset"] = offset
+            pipeline["pending"] = (
+                None if end >= count else (count, samples, metadata, end)
+            )
+            return (
+                end - offset,
+                _fill_rx_buffer(
+                    buffer, samples[..., offset:end], pipeline["wire_format"]
+                ),
+                fragment,
+            )
+
+    def stop_rx_pipeline(self, *, sequence: int, timeout: float) -> bool:
+        """Cancel the credit pipeline and discard blocks still in flight."""
+        with self._lock:
+            if self._pipeline is None or self._closed:
+                self._pipeline = None
+                return False
+            self._pipeline = None
+            self._sequence = int(sequence)
+            self._requests.put(
+                grpc_pb2.SampleFrame(
+                    **self._common,
+                    sequence=sequence,
+                    kind=grpc_pb2.SAMPLE_FRAME_CANCEL,
+                    cancelled=True,
+                )
+            )
+            deadline = self._deadline(timeout)
+            try:
+                while True:
+                    response = self._next_response(deadline)
+                    self._transport._raise_for_sample_frame(response)
+                    if (
+                        response.kind == grpc_pb2.SAMPLE_FRAME_RESULT
+                        and response.sequence == sequence
+                    ):
+                        return True
+            except BaseException:
+                self._abort()
+                raise
+
+    def send(
+        self,
+        *,
+        sequence: int,
+        samples: np.ndarray,
+        channels,
+        timeout: float,
+        metadata,
+        compression=None,
+        wire_format=None,
+    ) -> int:
+        if self._direction != "tx":
+            raise RemoteRFProtocolError("send() requires a TX sample stream")
+        array = np.asarray(samples, dtype=_wire_dtype(samples.dtype))
+        frame = _tx_data_frame(
+            self._common,
+            sequence=sequence,
+            array=array,
+            channels=channels,
+            timeout=timeout,
+            metadata=metadata,
+            compression=compression,
+            wire_format=wire_format,
+        )
+        with self._lock:
+            result = self._exchange(
+                frame,
+                sequence=sequence,
+                terminal_kind=grpc_pb2.SAMPLE_FRAME_RESULT,
+                timeout=timeout,
+            )
+        return _tx_result_count(result, array)
+
+    def close(self) -> bool:
+        with self._lock:
+            if self._closed:
+                return False
+            self._closed = True
+            self._finalizer.detach()
+            self._requests.put(
+                grpc_pb2.SampleFrame(
+                    **self._common,
+                    sequence=self._sequence + 1,
+                    kind=grpc_pb2.SAMPLE_FRAME_CLOSE,
+                )
+            )
+            self._requests.put(_STREAM_END)
+            self._reader.join(_STREAM_CLOSE_GRACE_SEC)
+            if self._reader.is_alive():
+                _cancel_call(self._call)
+            return True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def _operation_timeout(value) -> float:
+    value = float(value)
+    if not math.isfinite(value) or value < 0:
+        raise ValueError(
+            "sample operation timeout must be finite and non-negative"
+        )
+    return value
+
+
+def _metadata_json(metadata) -> str:
+    return json.dumps(_payload(metadata), separators=(",", ":"))
+
+
+def _sample_identity(session_id, handle, generation, direction) -> dict:
+    return dict(
+        session_id=session_id,
+        handle=handle,
+        generation=int(generation),
+        operation_id=uuid.uuid4().hex,
+        direction=direction,
+    )
+
+
+def _open_frame(common, sequence):
+    return grpc_pb2.SampleFrame(
+        **common,
+        sequence=max(0, sequence - 1),
+        kind=grpc_pb2.SAMPLE_FRAME_OPEN,
+        credits=1,
+    )
+
+
+def _rx_request_frame(
+    common,
+    *,
+    sequence,
+    buffer,
+    sample_count,
+    channels,
+    timeout,
+    one_packet,
+    metadata,
+    credits=0,
+    compression=None,
+    wire_format=None,
+):
+    shape = list(buffer.shape)
+    shape[-1] = int(sample_count)
+    return grpc_pb2.SampleFrame(
+        **common,
+        sequence=sequence,
+        kind=grpc_pb2.SAMPLE_FRAME_REQUEST,
+        dtype=(
+            wire_format.name if wire_format is not None
+            else _wire_dtype(buffer.dtype).str
+        ),
+        shape=shape,
+        channels=list(channels),
+        sample_count=int(sample_count),
+        timeout_sec=float(timeout),
+        one_packet=bool(one_packet),
+        metadata_json=_metadata_json(metadata),
+        credits=int(credits),
+        flags=compression.flags if compression is not None else 0,
+    )
+
+
+def _tx_data_frame(
+    common,
+    *,
+    sequence,
+    array,
+    channels,
+    timeout,
+    metadata,
+    compression=None,
+    wire_format=None,
+):
+    # protobuf only accepts ``bytes`` for the payload field, so the samples
+    # are gathered exactly once, straight from ``array`` (which may be a
+    # strided view of a larger caller array) with no contiguous staging copy.
+    if wire_format is not None:
+        array = wire_format.to_wire(array)
+    if compression is None:
+        payload, flags = array.tobytes(order="C"), 0
+    else:
+        payload, flags = compression.encode(array)
+    return grpc_pb2.SampleFrame(
+        **common,
+        sequence=sequence,
+        kind=grpc_pb2.SAMPLE_FRAME_DATA,
+        dtype=wire_format.name if wire_format is not None else array.dtype.str,
+        shape=list(array.shape),
+        channels=list(channels),
+        sample_count=int(array.shape[-1] if array.ndim else 0),
+        payload=payload,
+        timeout_sec=float(timeout),
+        metadata_json=_metadata_json(metadata),
+        flags=flags,
+    )
+
+
+def _decode_rx_data(
+    data, *, buffer, sample_count, channels, compression=None, wire_format=None
+):
+    wire_dtype = (
+        wire_format.dtype if wire_format is not None else _wire_dtype(buffer.dtype)
+    )
+    dtype = _response_dtype(data.dtype)
+    if dtype != wire_dtype:
+        raise RemoteRFProtocolError(
+            "RX response dtype does not match the requested buffer"
+        )
+    received_shape = tuple(int(item) for item in data.shape)
+    if (
+        len(received_shape) not in {1, 2}
+        or any(item < 0 for item in received_shape)
+        or not received_shape
+        or int(data.sample_count) != received_shape[-1]
+        or int(data.sample_count) > int(sample_count)
+    ):
+        raise RemoteRFProtocolError("RX response has invalid sample shape/count")
+    if len(received_shape) != buffer.ndim:
+        raise RemoteRFProtocolError(
+            "RX response dimensionality does not match the requested buffer"
+        )
+    if (
+        len(received_shape) == 2
+        and received_shape[0] != len(channels)
+    ) or (
+        len(received_shape) == 1
+        and len(channels) != 1
+    ):
+        raise RemoteRFProtocolError(
+            "RX response channel dimension does not match channel metadata"
+        )
+    # upb materialises a fresh ``bytes`` on every field access, so read the
+    # payload once and view it in place rather than copying it again.
+    payload = data.payload
+    expected_bytes = math.prod(received_shape) * dtype.itemsize
+    if compression is not None:
+        wire_bytes = len(payload)
+        payload = decode_payload(payload, data.flags, dtype, expected_bytes)
+        compression.note_received(len(payload), wire_bytes)
+    if expected_bytes != len(payload):
+        raise RemoteRFProtocolError(
+            "RX response byte length does not match dtype/shape"
+        )
+    if list(data.channels) != list(channels):
+        raise RemoteRFProtocolError("RX response channels do not match")
+    try:
+        samples = np.frombuffer(
+            payload,
+            dtype=dtype,
+        ).reshape(received_shape)
+        metadata = json.loads(data.metadata_json or "{}")
+    except (TypeError, ValueError, json.JSONDecodeError) as exc:
+        raise RemoteRFProtocolError(
+            "RX response contains malformed binary data or metadata"
+        ) from exc
+    if not isinstance(metadata, dict):
+        raise RemoteRFProtocolError(
+            "RX response metadata must be a JSON object"
+        )
+    return int(data.sample_count), samples, metadata
+
+
+def _fill_rx_buffer(buffer, samples, wire_format=None):
+    """Copy a decoded RX block into the head of ``buffer`` and return that view."""
+    view = buffer[..., :samples.shape[-1]]
+    if wire_format is not None:
+        wire_format.fill(view, samples)
+    else:
+        view[...] = samples
+    return view
+
+
+def _rx_response(
+    responses,
+    common,
+    *,
+    sequence,
+    buffer,
+    sample_count,
+    channels,
+    compression=None,
+    wire_format=None,
+):
+    """Decode the frames of a one-shot RX call into ``buffer``."""
+    _DynamicV2TransportBase._validate_sample_responses(responses, common, sequence)
+    data_frames = [
+        item for item in responses
+        if item.kind == grpc_pb2.SAMPLE_FRAME_DATA
+        and item.sequence == sequence
+    ]
+    if len(data_frames) != 1:
+        raise RemoteRFProtocolError(
+            "RX operation must return exactly one DATA frame"
+        )
+    count, samples, metadata = _decode_rx_data(
+        data_frames[0],
+        buffer=buffer,
+        sample_count=sample_count,
+        channels=channels,
+        compression=compression,
+        wire_format=wire_format,
+    )
+    return count, _fill_rx_buffer(buffer, samples, wire_format), metadata
+
+
+def _tx_response(responses, common, *, sequence, array) -> int:
+    """Return the sample count acknowledged by a one-shot TX call."""
+    _DynamicV2TransportBase._validate_sample_responses(responses, common, sequence)
+    result_frames = [
+        item for item in responses
+        if item.kind == grpc_pb2.SAMPLE_FRAME_RESULT
+        and item.sequence == sequence
+    ]
+    if len(result_frames) != 1:
+        raise RemoteRFProtocolError(
+            "TX operation must return exactly one RESULT frame"
+        )
+    return _tx_result_count(result_frames[0], array)
+
+
+def _tx_result_count(result, array) -> int:
+    if int(result.sample_count) > int(array.shape[-1]):
+        raise RemoteRFProtocolError("TX response sample count exceeds request")
+    return int(result.sample_count)
+
+
+def _pump_responses(call, responses):
+    try:
+        for frame in call:
+            responses.put(frame)
+    except Exception as exc:
+        responses.put(exc)
+    finally:
+        responses.put(_STREAM_END)
+
+
+def _cancel_call(call):
+    cancel = getattr(call, "cancel", None)
+    if callable(cancel):
+        cancel()
+
+
+def _abort_stream(requests, call):
+    requests.put(_STREAM_END)
+    _cancel_call(call)
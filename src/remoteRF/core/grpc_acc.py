@@ -14,18 +14,74 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import ast
+import os
 from .grpc_client import rpc_client
+from .reservations import ReservationChanges, ReservationTable, epoch_seconds
+from .session_tokens import DEFAULT_TTL_SEC, SESSION_METADATA_KEY, store_from_env
 from ..common.utils import *
 
 import datetime
 
 class RemoteRFAccount:
-    def __init__(self, username:str=None, password:str=None, email:str=None):
+    def __init__(self, username:str=None, password:str=None, email:str=None, *, sessions=None):
         self.username = username
         self.password = password
         self.email = email
         self.enrollment_code = ""
         self.is_admin = False
+        self._legacy_reservations = False
+        self._sessions = sessions  # SessionStore; built from the client .env on first use
+        self._session_capable = False  # the server has issued this account a token
+
+    @property
+    def sessions(self):
+        if self._sessions is None:
+            self._sessions = store_from_env(os.environ)
+        return self._sessions
+
+    def _server(self) -> str:
+        return (os.getenv("REMOTERF_ADDR") or "").strip().strip('"').strip("'")
+
+    def _call(self, function_name:str, args:dict=None):
+        """Account RPC sent with the session token when one is held, else the password.
+
+        An expired or revoked token is renewed with one ``ACC:login`` so the
+        password is not sent again on every later call.
+        """
+        token = self.sessions.get(self._server(), self.username)
+        if token is None and self._session_capable and self.password is not None:
+            token = self._renew_session()
+        if token is None:
+            return self._send(function_name, args, None)
+        self._session_capable = True
+        response = self._send(function_name, args, token)
+        if 'SX' not in response.results:
+            return response
+        self.sessions.discard(self._server(), self.username)
+        if self.password is None:
+            raise RuntimeError(f"Session for {self.username} expired; log in again.")
+        return self._send(function_name, args, self._renew_session())
+
+    def _send(self, function_name:str, args:dict, token):
+        call_args = {"un": map_arg(self.username)}
+        if token is None:
+            call_args["pw"] = map_arg(self.password)
+        call_args.update(args or {})
+        if token is None:
+            return rpc_client(function_name=function_name, args=call_args)
+        return rpc_client(function_name=function_name, args=call_args, metadata=((SESSION_METADATA_KEY, token.value),))
+
+    def _renew_session(self):
+        response = rpc_client(function_name="ACC:login", args={"un":map_arg(self.username), "pw":map_arg(self.password)})
+        return self._keep_session(response)
+
+    def _keep_session(self, response):
+        """Store the token a successful ``ACC:login`` reply carries, if any."""
+        if 'UC' not in response.results or 'session' not in response.results:
+            return None
+        self._session_capable = True
+        ttl = unmap_arg(response.results['session_ttl']) if 'session_ttl' in response.results else DEFAULT_TTL_SEC
+        return self.sessions.put(self._server(), self.username, unmap_arg(response.results['session']), ttl)
     
     def create_user(self):
         response = rpc_client(function_name="ACC:create_user", args={"un":map_arg(self.username), "pw":map_arg(self.password), "em":map_arg(self.email), "ec":map_arg(self.enrollment_code)})
@@ -41,6 +97,7 @@ class RemoteRFAccount:
         password = self.password
         response = rpc_client(function_name="ACC:login", args={"un":map_arg(username), "pw":map_arg(password)})
         if 'UC' in response.results:
+            self._keep_session(response)
             print(f'User {unmap_arg(response.results["UC"])} successful login.')
             return True
         elif 'UE' in response.results:
@@ -48,7 +105,7 @@ class RemoteRFAccount:
             return False
     
     def reserve_device(self, device_id:int, start_time:datetime, end_time:datetime):
-        response = rpc_client(function_name="ACC:reserve_device", args={"un":map_arg(self.username), "pw":map_arg(self.password), "dd":map_arg(device_id), "st":map_arg(int(start_time.timestamp())), "et":map_arg(int(end_time.timestamp()))})
+        response = self._call("ACC:reserve_device", {"dd":map_arg(device_id), "st":map_arg(int(start_time.timestamp())), "et":map_arg(int(end_time.timestamp()))})
 
         if 'ace' in response.results:
             raise Exception(f'{unmap_arg(response.results["ace"])}')
@@ -62,18 +119,57 @@ class RemoteRFAccount:
             return token
             
     def get_reservations(self):
-        return rpc_client(function_name='ACC:get_res', args={"un":map_arg(self.username), "pw":map_arg(self.password)})
+        return self._call('ACC:get_res')
     
+    def query_reservations(self, *, user=None, device_ids=None, start=None, end=None, since=None):
+        """Reservations matching the filters, or only what changed after ``since``.
+
+        Returns ``ReservationChanges(rows, removed, cursor, full)``; see
+        ``remoteRF.core.reservations``. Raises ``RuntimeError`` with the
+        server's message when the query is refused.
+        """
+        refused = False
+        if not self._legacy_reservations:
+            filters = {
+                "fu": user,
+                "dd": None if device_ids is None else [int(item) for item in device_ids],
+                "st": epoch_seconds(start),
+                "et": epoch_seconds(end),
+                "since": since,
+            }
+            args = {key: map_arg(value) for key, value in filters.items() if value is not None}
+            results = self._call('ACC:query_res', args).results
+            if 'cursor' in results:
+                column = lambda key: unmap_arg(results[key]) if key in results else ()
+                rows = ReservationTable(column("id"), column("user"), column("dd"), column("st"), column("et"))
+                removed = tuple(str(item) for item in column("removed"))
+                full = bool(unmap_arg(results["full"])) if "full" in results else since is None
+                return ReservationChanges(rows, removed, unmap_arg(results["cursor"]), full)
+            # Servers without ACC:query_res: read every row on each call instead.
+            # Old servers may answer the unknown function with an 'ace' error.
+            refused = 'ace' in results
+            self._legacy_reservations = not refused
+        results = self.get_reservations().results
+        if 'ace' in results:
+            raise RuntimeError(unmap_arg(results['ace']))
+        if refused:
+            # ACC:get_res works where ACC:query_res did not, so the server
+            # lacks the newer call; skip it for the rest of the session.
+            self._legacy_reservations = True
+        table = ReservationTable.from_legacy_rows({key: unmap_arg(value) for key, value in results.items()})
+        table = table.filter(user=user, device_ids=device_ids, start=start, end=end)
+        return ReservationChanges(table, (), None, True)
+
     def get_devices(self):
-        return rpc_client(function_name='ACC:get_dev', args={"un":map_arg(self.username), "pw":map_arg(self.password)})
+        return self._call('ACC:get_dev')
     
     def cancel_reservation(self, res_id:int):
-        return rpc_client(function_name='ACC:cancel_res', args={"un":map_arg(self.username), "pw":map_arg(self.password), "res_id":map_arg(res_id)})
+        return self._call('ACC:cancel_res', {"res_id":map_arg(res_id)})
     
     def get_perms(self):
-        return rpc_client(function_name='ACC:get_perms', args={"un":map_arg(self.username), "pw":map_arg(self.password)})
+        return self._call('ACC:get_perms')
     
     def set_enroll(self):
-        return rpc_client(function_name='ACC:set_enroll', args={"un":map_arg(self.username), "pw":map_arg(self.password), "ec":map_arg(self.enrollment_code)})
+        return self._call('ACC:set_enroll', {"ec":map_arg(self.enrollment_code)})
     
     
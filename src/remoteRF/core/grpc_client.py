@@ -13,8 +13,11 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import asyncio
 import socket
 import getpass
+import threading
+import weakref
 from pathlib import Path
 import os
 from dotenv import load_dotenv
@@ -23,6 +26,14 @@ import grpc
 from ..common.grpc import grpc_pb2
 from ..common.grpc import grpc_pb2_grpc
 from ..common.utils import *
+from . import rpc_metrics
+from .channel_pool import (
+    POOL_NAMES,
+    ChannelPool,
+    channel_policy_from_env,
+    pool_options_from_env,
+    pool_size_from_env,
+)
 
 _CONFIG_PATH = Path.home() / ".config" / "remoterf-client" / ".env"
 _CONFIG_HELP = (
@@ -57,43 +68,155 @@ def _load_client_config() -> tuple[str, str]:
     return addr, ca_path
 
 
-addr, ca_path = _load_client_config()
-
-options = [
+_BASE_OPTIONS = [
       ('grpc.max_send_message_length', 100 * 1024 * 1024),
       ('grpc.max_receive_message_length', 100 * 1024 * 1024),
 ]
 
-# A server reached over Tailscale may present the same certificate it uses on
-# its public or LAN address. Keep certificate verification enabled while
-# allowing the configured certificate identity to differ from REMOTERF_ADDR.
-tls_server_name = (os.getenv("REMOTERF_TLS_SERVER_NAME") or "").strip()
-if tls_server_name:
-    options.extend(
-        [
-            ("grpc.ssl_target_name_override", tls_server_name),
-            ("grpc.default_authority", tls_server_name),
-        ]
-    )
 
-# Server.crt
-certs_path = Path(ca_path).expanduser().resolve()
-with certs_path.open('rb') as f:
-    trusted_certs = f.read()
-    
-credentials = grpc.ssl_channel_credentials(root_certificates=trusted_certs)
-channel = grpc.secure_channel(addr, credentials, options=options)
-stub = grpc_pb2_grpc.GenericRPCStub(channel)
+class _ClientChannels:
+    """Configuration, TLS credentials and channel pools, built on first use."""
+
+    def __init__(self):
+        self.addr, self.ca_path = _load_client_config()
+        self.options = list(_BASE_OPTIONS)
+        rpc_metrics.configure_from_env(os.environ)
+
+        # A server reached over Tailscale may present the same certificate it
+        # uses on its public or LAN address. Keep certificate verification
+        # enabled while allowing the configured certificate identity to differ
+        # from REMOTERF_ADDR.
+        tls_server_name = (os.getenv("REMOTERF_TLS_SERVER_NAME") or "").strip()
+        if tls_server_name:
+            self.options.extend(
+                [
+                    ("grpc.ssl_target_name_override", tls_server_name),
+                    ("grpc.default_authority", tls_server_name),
+                ]
+            )
+
+        # Server.crt
+        certs_path = Path(self.ca_path).expanduser().resolve()
+        with certs_path.open('rb') as f:
+            trusted_certs = f.read()
+        self.credentials = grpc.ssl_channel_credentials(root_certificates=trusted_certs)
+
+        # Control RPCs and bulk SampleStream traffic use separate connections;
+        # see channel_pool for the .env keys that size and tune each pool.
+        self.pool_options = {
+            name: pool_options_from_env(os.environ, name, self.options)
+            for name in POOL_NAMES
+        }
+        policy = channel_policy_from_env(os.environ)
+        self.pools = {
+            name: ChannelPool(
+                name,
+                self._secure_channel,
+                self.pool_options[name],
+                size=pool_size_from_env(os.environ, name),
+                policy=policy,
+            )
+            for name in POOL_NAMES
+        }
+        # grpc.aio channels belong to the event loop that creates them, so
+        # each loop gets its own pools with the same size and policy.
+        self._aio_pools = weakref.WeakKeyDictionary()
+        self._aio_lock = threading.Lock()
+
+    def _secure_channel(self, channel_options):
+        return grpc.secure_channel(self.addr, self.credentials, options=channel_options)
+
+    def _aio_secure_channel(self, channel_options):
+        return grpc.aio.secure_channel(
+            self.addr, self.credentials, options=channel_options
+        )
+
+    def aio_pools(self, loop) -> dict:
+        with self._aio_lock:
+            pools = self._aio_pools.get(loop)
+            if pools is None:
+                pools = self._aio_pools[loop] = {
+                    name: ChannelPool(
+                        name,
+                        self._aio_secure_channel,
+                        self.pool_options[name],
+                        size=pool.size,
+                        policy=pool.policy,
+                    )
+                    for name, pool in self.pools.items()
+                }
+        return pools
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def _channels() -> _ClientChannels:
+    """Read the client config and set up TLS the first time an RPC needs it."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = _ClientChannels()
+    return _client
+
+
+def __getattr__(name):
+    # Module attributes older callers import directly; resolving them here
+    # keeps ``import remoteRF.core.grpc_client`` free of I/O.
+    if name in {"addr", "ca_path", "options", "credentials"}:
+        return getattr(_channels(), name)
+    if name == "channel":
+        return _channels().pools["control"].channel()
+    if name == "stub":
+        return _channels().pools["control"].stub(grpc_pb2_grpc.GenericRPCStub)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def control_channel(key=None):
+    """Return a channel from the control pool (``key`` pins it per device)."""
+    return _channels().pools["control"].channel(key)
+
+
+def sample_channel(key=None):
+    """Return a channel from the sample pool, separate from control traffic."""
+    return _channels().pools["samples"].channel(key)
+
+
+def aio_channel(pool="control", key=None):
+    """Return a ``grpc.aio`` channel from ``pool`` for the running event loop.
+
+    ``key`` pins the channel per device like :func:`control_channel`. The
+    channels are shared by every caller on the loop; close them with
+    :func:`close_aio_channels` before the loop ends.
+    """
+    return _channels().aio_pools(asyncio.get_running_loop())[pool].channel(key)
+
+
+async def close_aio_channels():
+    """Close the pooled ``grpc.aio`` channels of the running event loop."""
+    if _client is None:
+        return
+    with _client._aio_lock:
+        pools = _client._aio_pools.pop(asyncio.get_running_loop(), {})
+    for pool in pools.values():
+        await pool.aclose()
+
+
+_GENERIC_METHOD = "GenericRPC.Call"
 
-tcp_calls = 0
 
 def get_tcp_calls():
-    return tcp_calls
-        
-def rpc_client(*, function_name, args):
-    global tcp_calls
-    tcp_calls += 1
-    # print(tcp_calls)
+    """Number of ``GenericRPC.Call`` RPCs made, as counted by ``rpc_metrics``."""
+    methods = rpc_metrics.metrics.snapshot()["methods"]
+    return sum(
+        stats["calls"]
+        for name, stats in methods.items()
+        if name.startswith(_GENERIC_METHOD + "/")
+    )
+
+def rpc_client(*, function_name, args, metadata=None):
     # if not is_connected:
     #     response = rpc_client(function_name="UserLogin", args={"username": grpc_pb2.Argument(string_value=input("Username: ")), "password": grpc_pb2.Argument(string_value=getpass.getpass("Password: ")), "client_ip": grpc_pb2.Argument(string_value=local_ip)})
     #     if (response.results['status'].string_value == 'Success'):
@@ -107,7 +230,17 @@ def rpc_client(*, function_name, args):
     # TODO: Handle Errors
     
     # print(f"Calling function: {function_name}")
-    response = stub.Call(grpc_pb2.GenericRPCRequest(function_name=function_name, args=args))
+    token = args.get('a') if isinstance(args, dict) else None
+    call_stub = _channels().pools["control"].stub(
+        grpc_pb2_grpc.GenericRPCStub,
+        key=getattr(token, "string_value", None),
+    )
+    response = rpc_metrics.unary_call(
+        f"{_GENERIC_METHOD}/{function_name}",
+        call_stub.Call,
+        grpc_pb2.GenericRPCRequest(function_name=function_name, args=args),
+        metadata=metadata,
+    )
     
     if 'a' in response.results:
         raise RuntimeError(unmap_arg(response.results['a']))
@@ -0,0 +1,191 @@
+# Copyright (C) 2026 RemoteRF
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Columnar reservation queries with server-side filters and change cursors.
+
+``ACC:query_res`` takes the account credentials plus optional filters:
+
+* ``fu``: only this username's reservations;
+* ``dd``: only these device ids;
+* ``st`` / ``et``: only reservations overlapping ``[st, et)``, in epoch seconds;
+* ``since``: a cursor from an earlier reply, to get only what changed.
+
+The reply carries one column per field. ``id`` and ``user`` are JSON lists;
+``dd``, ``st`` and ``et`` are int64 arrays. ``removed`` lists the ids
+cancelled since the cursor, and ``cursor`` is the value to send next time.
+``full`` is true when the reply is a complete snapshot rather than a delta,
+for example when the cursor has expired. Servers without ``ACC:query_res``
+are read through the legacy ``ACC:get_res`` rows and filtered here.
+"""
+from __future__ import annotations
+
+import datetime
+from typing import Iterable, NamedTuple
+
+import numpy as np
+
+SERVER_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def epoch_seconds(value) -> int | None:
+    """``value`` (datetime, epoch number or None) as integer epoch seconds."""
+    if value is None:
+        return None
+    if isinstance(value, datetime.datetime):
+        return int(value.timestamp())
+    return int(value)
+
+
+class ReservationTable:
+    """Reservations as parallel columns, sorted by device and start time.
+
+    ``starts`` and ``ends`` are int64 epoch seconds; ``ids`` and ``users``
+    are object arrays of strings.
+    """
+
+    __slots__ = ("ids", "users", "device_ids", "starts", "ends")
+
+    def __init__(self, ids=(), users=(), device_ids=(), starts=(), ends=()):
+        self.ids = np.asarray([str(item) for item in ids], dtype=object)
+        self.users = np.asarray([str(item) for item in users], dtype=object)
+        self.device_ids = np.asarray(device_ids, dtype=np.int64).reshape(-1)
+        self.starts = np.asarray(starts, dtype=np.int64).reshape(-1)
+        self.ends = np.asarray(ends, dtype=np.int64).reshape(-1)
+        if not (
+            len(self.ids) == len(self.users) == len(self.device_ids)
+            == len(self.starts) == len(self.ends)
+        ):
+            raise ValueError("reservation columns differ in length")
+        order = np.lexsort((self.starts, self.device_ids))
+        if len(order) and np.any(order != np.arange(len(order))):
+            self._take(order)
+
+    @classmethod
+    def from_legacy_rows(cls, results: dict) -> "ReservationTable":
+        """Parse ``ACC:get_res`` rows ``{id: "user,device,start,end"}``."""
+        ids, users, device_ids, starts, ends = [], [], [], [], []
+        for key, row in results.items():
+            parts = row.split(",")
+            ids.append(key)
+            users.append(parts[0])
+            device_ids.append(int(parts[1]))
+            for column, text in ((starts, parts[2]), (ends, parts[3])):
+                moment = datetime.datetime.strptime(text, SERVER_TIME_FORMAT)
+                column.append(int(moment.timestamp()))
+        return cls(ids, users, device_ids, starts, ends)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _take(self, selector) -> None:
+        for name in self.__slots__:
+            setattr(self, name, getattr(self, name)[selector])
+
+    def select(self, mask) -> "ReservationTable":
+        table = ReservationTable.__new__(ReservationTable)
+        for name in self.__slots__:
+            setattr(table, name, getattr(self, name)[mask])
+        return table
+
+    def filter(
+        self,
+        *,
+        user: str | None = None,
+        device_ids: Iterable[int] | None = None,
+        start=None,
+        end=None,
+    ) -> "ReservationTable":
+        """Rows matching every given filter; times select overlapping rows."""
+        mask = np.ones(len(self), dtype=bool)
+        if user is not None:
+            mask &= self.users == str(user)
+        if device_ids is not None:
+            mask &= np.isin(self.device_ids, np.fromiter(device_ids, dtype=np.int64))
+        if start is not None:
+            mask &= self.ends > epoch_seconds(start)
+        if end is not None:
+            mask &= self.starts < epoch_seconds(end)
+        return self if mask.all() else self.select(mask)
+
+    def merge(self, changes: "ReservationTable", removed: Iterable[str] = ()) -> "ReservationTable":
+        """This table with ``removed`` ids dropped and ``changes`` upserted."""
+        dropped = np.asarray([str(item) for item in removed], dtype=object)
+        stale = np.isin(self.ids, np.concatenate([dropped, changes.ids]))
+        kept = self.select(~stale)
+        return ReservationTable(
+            np.concatenate([kept.ids, changes.ids]),
+            np.concatenate([kept.users, changes.users]),
+            np.concatenate([kept.device_ids, changes.device_ids]),
+            np.concatenate([kept.starts, changes.starts]),
+            np.concatenate([kept.ends, changes.ends]),
+        )
+
+    def rows(self):
+        """One dict per reservation, in the shape the CLI has always used."""
+        from_epoch = datetime.datetime.fromtimestamp
+        for index in range(len(self)):
+            yield {
+                "internal_id": self.ids[index],
+                "username": self.users[index],
+                "device_id": int(self.device_ids[index]),
+                "start_time": from_epoch(int(self.starts[index])),
+                "end_time": from_epoch(int(self.ends[index])),
+            }
+
+
+class ReservationChanges(NamedTuple):
+    rows: ReservationTable
+    removed: tuple
+    cursor: object
+    full: bool
+
+
+class ReservationCache:
+    """Keeps one table per filter set and refreshes it by cursor.
+
+    Each :meth:`get` asks the server only for what changed since the previous
+    call with the same filters. Servers without cursors are re-read in full.
+    """
+
+    def __init__(self, account):
+        self.account = account
+        self._tables = {}
+
+    def get(self, **filters) -> ReservationTable:
+        key = _filter_key(filters)
+        table, cursor = self._tables.get(key, (None, None))
+        changes = self.account.query_reservations(since=cursor, **filters)
+        if table is None or changes.full:
+            table = changes.rows
+        else:
+            table = table.merge(changes.rows, changes.removed)
+        self._tables[key] = (table, changes.cursor)
+        return table
+
+    def invalidate(self) -> None:
+        self._tables.clear()
+
+
+def _filter_key(filters: dict) -> tuple:
+    key = []
+    for name, value in sorted(filters.items()):
+        if value is None:
+            continue
+        if name == "device_ids":
+            value = tuple(sorted(int(item) for item in value))
+        elif name in {"start", "end"}:
+            value = epoch_seconds(value)
+        key.append((name, value))
+    return tuple(key)
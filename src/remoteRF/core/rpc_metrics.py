@@ -0,0 +1,329 @@
+# Copyright (C) 2026 RemoteRF
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Client-side metrics for every RemoteRF RPC.
+
+Each call is recorded under a method name such as ``GenericRPC.Call/IDL:get_drivers``,
+``DynamicControlV2.Invoke/set_rx_freq`` or ``SampleDataV1.SampleStream/rx``.
+For each method the registry keeps the call count, a latency histogram,
+request and response bytes, errors by code and the retries gRPC reported.
+Latency is measured on the client, so it covers the network, the server and
+the client's own encoding.
+
+    from remoteRF.core.rpc_metrics import metrics
+
+    print(metrics.snapshot()["methods"])
+    metrics.start_periodic_dump("rpc-metrics.json", interval_sec=10)
+
+Setting ``REMOTERF_METRICS_FILE`` (and optionally
+``REMOTERF_METRICS_INTERVAL_SEC``) in the client ``.env`` starts the periodic
+dump when the client first connects. ``REMOTERF_METRICS=0`` turns recording off.
+"""
+from __future__ import annotations
+
+import bisect
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+# Upper bounds of the latency histogram buckets, in milliseconds.
+LATENCY_BUCKETS_MS = (
+    0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000,
+)
+_RETRY_METADATA_KEY = "grpc-previous-rpc-attempts"
+# Bytes a SampleFrame carries besides its payload: identity, dtype, shape,
+# channels and metadata JSON are typically well under this.
+_SAMPLE_FRAME_OVERHEAD = 128
+
+
+class _MethodStats:
+    __slots__ = (
+        "calls",
+        "errors",
+        "retries",
+        "request_bytes",
+        "response_bytes",
+        "total_ms",
+        "min_ms",
+        "max_ms",
+        "buckets",
+    )
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = {}
+        self.retries = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.total_ms = 0.0
+        self.min_ms = None
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def as_dict(self) -> dict:
+        labels = [f"le_{bound:g}ms" for bound in LATENCY_BUCKETS_MS] + ["inf"]
+        return {
+            "calls": self.calls,
+            "errors": dict(self.errors),
+            "retries": self.retries,
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "latency_ms": {
+                "mean": self.total_ms / self.calls if self.calls else 0.0,
+                "min": self.min_ms or 0.0,
+                "max": self.max_ms,
+                "p50": self._quantile(0.50),
+                "p90": self._quantile(0.90),
+                "p99": self._quantile(0.99),
+                "buckets": dict(zip(labels, self.buckets)),
+            },
+        }
+
+    def _quantile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding ``fraction`` of the calls."""
+        if not self.calls:
+            return 0.0
+        rank = fraction * self.calls
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank and count:
+                if index == len(LATENCY_BUCKETS_MS):
+                    return self.max_ms
+                return min(float(LATENCY_BUCKETS_MS[index]), self.max_ms)
+        return self.max_ms
+
+
+class RPCMetrics:
+    """Thread-safe per-method RPC statistics with snapshots and file dumps."""
+
+    def __init__(self, *, enabled: bool = True):
+        self.enabled = bool(enabled)
+        self._lock = threading.Lock()
+        self._methods = {}
+        self._since = time.time()
+        self._dump_thread = None
+        self._dump_stop = None
+
+    def record(
+        self,
+        method: str,
+        seconds: float,
+        *,
+        request_bytes: int = 0,
+        response_bytes: int = 0,
+        error: str = "",
+        retries: int = 0,
+    ) -> None:
+        """Add one finished call; ``error`` is its status or error code, if any."""
+        if not self.enabled:
+            return
+        elapsed_ms = max(0.0, float(seconds)) * 1000.0
+        bucket = bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)
+        with self._lock:
+            stats = self._methods.get(method)
+            if stats is None:
+                stats = self._methods[method] = _MethodStats()
+            stats.calls += 1
+            stats.request_bytes += int(request_bytes)
+            stats.response_bytes += int(response_bytes)
+            stats.retries += int(retries)
+            stats.total_ms += elapsed_ms
+            stats.max_ms = max(stats.max_ms, elapsed_ms)
+            stats.min_ms = elapsed_ms if stats.min_ms is None else min(stats.min_ms, elapsed_ms)
+            stats.buckets[bucket] += 1
+            if error:
+                stats.errors[error] = stats.errors.get(error, 0) + 1
+
+    def snapshot(self, *, reset: bool = False) -> dict:
+        """Return every method's statistics; ``reset`` starts a new interval."""
+        with self._lock:
+            methods = {name: stats.as_dict() for name, stats in sorted(self._methods.items())}
+            since = self._since
+            if reset:
+                self._methods = {}
+                self._since = time.time()
+        return {"since": since, "taken": time.time(), "methods": methods}
+
+    def reset(self) -> None:
+        self.snapshot(reset=True)
+
+    def dump(self, path) -> Path:
+        """Write a snapshot to ``path`` as JSON, replacing it atomically."""
+        path = Path(path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        staging = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        staging.write_text(json.dumps(self.snapshot(), indent=2) + "\n", encoding="utf-8")
+        os.replace(staging, path)
+        return path
+
+    def start_periodic_dump(self, path, interval_sec: float = 60.0) -> None:
+        """Dump to ``path`` every ``interval_sec`` seconds and once more on stop."""
+        interval_sec = float(interval_sec)
+        if interval_sec <= 0:
+            raise ValueError("interval_sec must be positive")
+        self.stop_periodic_dump()
+        stop = threading.Event()
+
+        def run():
+            while not stop.wait(interval_sec):
+                self._try_dump(path)
+            self._try_dump(path)
+
+        self._dump_stop = stop
+        self._dump_thread = threading.Thread(
+            target=run, name="remoterf-metrics-dump", daemon=True
+        )
+        self._dump_thread.start()
+
+    def stop_periodic_dump(self) -> None:
+        thread, stop = self._dump_thread, self._dump_stop
+        self._dump_thread = self._dump_stop = None
+        if thread is not None:
+            stop.set()
+            thread.join()
+
+    def _try_dump(self, path):
+        try:
+            self.dump(path)
+        except OSError:
+            pass
+
+
+def _enabled(flag: str) -> bool:
+    return flag.strip().lower() not in {"0", "false", "no", "off"}
+
+
+metrics = RPCMetrics(enabled=_enabled(os.environ.get("REMOTERF_METRICS", "1")))
+
+
+def configure_from_env(environ) -> None:
+    """Apply the ``REMOTERF_METRICS*`` settings from the client ``.env``."""
+    flag = environ.get("REMOTERF_METRICS") or ""
+    if flag.strip():
+        metrics.enabled = _enabled(flag)
+    path = (environ.get("REMOTERF_METRICS_FILE") or "").strip()
+    if path and metrics._dump_thread is None:
+        interval = float(environ.get("REMOTERF_METRICS_INTERVAL_SEC") or 60.0)
+        metrics.start_periodic_dump(path, interval)
+
+
+def message_size(message) -> int:
+    """Serialized size of a protobuf message, 0 for anything else.
+
+    ``ByteSize()`` serializes the message under upb, which costs as much as
+    sending it, so sample frames are estimated from their payload instead.
+    """
+    descriptor = getattr(message, "DESCRIPTOR", None)
+    if getattr(descriptor, "name", None) == "SampleFrame":
+        return len(message.payload) + _SAMPLE_FRAME_OVERHEAD
+    byte_size = getattr(message, "ByteSize", None)
+    return int(byte_size()) if byte_size is not None else 0
+
+
+def error_code(exc) -> str:
+    """Short code for a failed call: the gRPC status or the error type."""
+    details = getattr(exc, "details", None)
+    if isinstance(details, dict) and details.get("grpc_code"):
+        return str(details["grpc_code"])
+    code = getattr(exc, "code", None)
+    if callable(code):
+        try:
+            return code().name
+        except Exception:
+            pass
+    return type(exc).__name__
+
+
+def previous_attempts(call) -> int:
+    """Retries gRPC made before ``call`` completed, from its trailing metadata."""
+    trailing = getattr(call, "trailing_metadata", None)
+    if trailing is None:
+        return 0
+    try:
+        for key, value in trailing() or ():
+            if key == _RETRY_METADATA_KEY:
+                return int(value)
+    except Exception:
+        pass
+    return 0
+
+
+class _Timer:
+    """Context manager that records one call when its block exits."""
+
+    __slots__ = ("method", "request_bytes", "response_bytes", "error", "retries", "_start")
+
+    def __init__(self, method: str, request_bytes: int):
+        self.method = method
+        self.request_bytes = request_bytes
+        self.response_bytes = 0
+        self.error = ""
+        self.retries = 0
+
+    def response(self, message) -> None:
+        """Count ``message`` as received; an ``ErrorEnvelope`` marks an error."""
+        if not metrics.enabled:
+            return
+        self.response_bytes += message_size(message)
+        code = getattr(getattr(message, "error", None), "code", "")
+        if code:
+            self.error = code
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc is not None and not isinstance(exc, GeneratorExit):
+            self.error = error_code(exc)
+            self.retries = self.retries or previous_attempts(exc)
+        metrics.record(
+            self.method,
+            time.perf_counter() - self._start,
+            request_bytes=self.request_bytes,
+            response_bytes=self.response_bytes,
+            error=self.error,
+            retries=self.retries,
+        )
+        return False
+
+
+def timed(method: str, *requests) -> _Timer:
+    """Time a block as one call to ``method`` carrying ``requests``."""
+    if not metrics.enabled:
+        return _Timer(method, 0)
+    return _Timer(method, sum(message_size(request) for request in requests))
+
+
+def unary_call(method: str, fn, request, **kwargs):
+    """Invoke the unary ``fn(request, **kwargs)`` and record it under ``method``.
+
+    Real gRPC callables are invoked through ``with_call`` so the retries gRPC
+    made are read from the call's trailing metadata.
+    """
+    if not metrics.enabled:
+        return fn(request, **kwargs)
+    with timed(method, request) as timer:
+        with_call = getattr(fn, "with_call", None)
+        if with_call is None:
+            response = fn(request, **kwargs)
+        else:
+            response, call = with_call(request, **kwargs)
+            timer.retries = previous_attempts(call)
+        timer.response(response)
+    return response
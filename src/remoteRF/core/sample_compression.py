@@ -0,0 +1,148 @@
+# Copyright (C) 2026 RemoteRF
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Optional DATA-frame compression for ``SampleDataV1``.
+
+The server lists the codecs it accepts in the session capabilities under
+``sample_compression``. A compressed DATA frame sets bits in
+``SampleFrame.flags``; an RX REQUEST frame sets the same bits (plus the
+level) to ask the server to compress its answer. Either side may still send
+any frame raw, so a payload that does not shrink costs nothing on the wire.
+
+``shuffle-zlib`` groups byte ``k`` of every I/Q component together before
+deflating, which exposes the mostly constant high bytes of sc16-style
+samples to the compressor.
+"""
+from __future__ import annotations
+
+import zlib
+
+import numpy as np
+
+from .v2_errors import RemoteRFProtocolError
+
+CODECS = ("zlib", "shuffle-zlib")
+DEFAULT_LEVEL = 1
+FLAG_DEFLATE = 1 << 0
+FLAG_SHUFFLE = 1 << 1
+_LEVEL_SHIFT = 8
+# Frames that save less than this fraction are sent raw, and the next few
+# frames skip the compression attempt before probing again.
+_MIN_SAVING = 1 / 16
+_BACKOFF_FRAMES = 8
+
+
+def supported_codecs(capabilities) -> tuple:
+    """Return the codecs a session's capabilities say the server accepts."""
+    offered = (capabilities or {}).get("sample_compression") or ()
+    if isinstance(offered, str):
+        offered = (offered,)
+    return tuple(codec for codec in CODECS if codec in offered)
+
+
+def _component_size(dtype: np.dtype) -> int:
+    paired = dtype.kind == "c" or dtype.names is not None
+    return dtype.itemsize // 2 if paired else dtype.itemsize
+
+
+class SampleCompression:
+    """Per-streamer compression setting and its running byte counts."""
+
+    def __init__(self, codec: str = "shuffle-zlib", level: int = DEFAULT_LEVEL):
+        if codec not in CODECS:
+            raise ValueError(
+                f"unsupported sample compression {codec!r}; "
+                f"expected one of {', '.join(CODECS)}"
+            )
+        level = int(level)
+        if not 1 <= level <= 9:
+            raise ValueError("sample compression level must be between 1 and 9")
+        self.codec = codec
+        self.level = level
+        self.raw_bytes = 0
+        self.wire_bytes = 0
+        self._skip = 0
+
+    @property
+    def flags(self) -> int:
+        """Flags that mark a compressed frame or request a compressed answer."""
+        flags = FLAG_DEFLATE | (self.level << _LEVEL_SHIFT)
+        if self.codec == "shuffle-zlib":
+            flags |= FLAG_SHUFFLE
+        return flags
+
+    def encode(self, array: np.ndarray) -> tuple[bytes, int]:
+        """Return ``(payload, flags)`` for a TX DATA frame carrying ``array``."""
+        if self._skip:
+            self._skip -= 1
+            return self._count(array.tobytes(order="C"), 0, array.nbytes)
+        if self.codec == "shuffle-zlib":
+            planes = (
+                np.ascontiguousarray(array)
+                .view(np.uint8)
+                .reshape(-1, _component_size(array.dtype))
+                .T.tobytes()
+            )
+        else:
+            planes = array.tobytes(order="C")
+        packed = zlib.compress(planes, self.level)
+        if len(packed) > array.nbytes * (1 - _MIN_SAVING):
+            self._skip = _BACKOFF_FRAMES
+            if self.codec == "shuffle-zlib":
+                planes = array.tobytes(order="C")
+            return self._count(planes, 0, array.nbytes)
+        return self._count(packed, self.flags, array.nbytes)
+
+    def note_received(self, raw_bytes: int, wire_bytes: int):
+        self.raw_bytes += int(raw_bytes)
+        self.wire_bytes += int(wire_bytes)
+
+    def _count(self, payload: bytes, flags: int, raw_bytes: int):
+        self.note_received(raw_bytes, len(payload))
+        return payload, flags
+
+    def stats(self) -> dict:
+        return {
+            "codec": self.codec,
+            "level": self.level,
+            "raw_bytes": self.raw_bytes,
+            "wire_bytes": self.wire_bytes,
+        }
+
+    def __repr__(self):
+        return f"SampleCompression({self.codec!r}, level={self.level})"
+
+
+def decode_payload(payload: bytes, flags: int, dtype: np.dtype, expected_bytes: int) -> bytes:
+    """Undo the compression marked in ``flags``; raw payloads pass through."""
+    if not flags & FLAG_DEFLATE:
+        return payload
+    inflater = zlib.decompressobj()
+    try:
+        # max_length 0 would mean "unbounded", so allow one byte to detect
+        # a non-empty stream where none was expected.
+        raw = inflater.decompress(payload, max(1, expected_bytes))
+    except zlib.error as exc:
+        raise RemoteRFProtocolError(
+            "RX response contains a corrupt compressed payload"
+        ) from exc
+    if len(raw) != expected_bytes or inflater.unconsumed_tail or not inflater.eof:
+        raise RemoteRFProtocolError(
+            "RX response byte length does not match dtype/shape"
+        )
+    if flags & FLAG_SHUFFLE and expected_bytes:
+        size = _component_size(dtype)
+        raw = np.frombuffer(raw, dtype=np.uint8).reshape(size, -1).T.tobytes()
+    return raw
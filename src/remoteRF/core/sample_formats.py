@@ -0,0 +1,100 @@
+# Copyright (C) 2026 RemoteRF
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Narrow over-the-wire sample formats for ``SampleDataV1``.
+
+With a ``StreamArgs.otw_format`` of ``sc16`` or ``sc8`` and a float CPU
+format, sample frames carry interleaved integer I/Q (``SampleFrame.dtype``
+``"sc16"``/``"sc8"``) instead of complex floats. The client converts between
+the wire integers and the caller's ``fc32``/``fc64`` buffer in one NumPy pass,
+scaling like UHD: ``fullscale`` (1.0 unless set in ``StreamArgs.args``) maps
+to the largest integer code.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+WIRE_DTYPES = {
+    "sc16": np.dtype([("re", "<i2"), ("im", "<i2")]),
+    "sc8": np.dtype([("re", "i1"), ("im", "i1")]),
+}
+_CPU_FORMATS = {"fc32": np.dtype(np.float32), "fc64": np.dtype(np.float64)}
+
+
+def _components(array: np.ndarray, dtype) -> np.ndarray:
+    """View complex or I/Q-pair samples as their interleaved components."""
+    return array.view(dtype)
+
+
+class NarrowWireFormat:
+    """Converts one streamer's samples to and from ``sc16``/``sc8`` frames."""
+
+    __slots__ = ("name", "dtype", "component", "scale")
+
+    def __init__(self, name: str, fullscale: float = 1.0):
+        if name not in WIRE_DTYPES:
+            raise ValueError(f"unsupported over-the-wire format: {name!r}")
+        fullscale = float(fullscale)
+        if not fullscale > 0:
+            raise ValueError("fullscale must be positive")
+        self.name = name
+        self.dtype = WIRE_DTYPES[name]
+        self.component = self.dtype["re"]
+        self.scale = float(np.iinfo(self.component).max) / fullscale
+
+    def to_wire(self, samples: np.ndarray) -> np.ndarray:
+        """Round and saturate complex ``samples`` into wire I/Q pairs."""
+        floats = _components(np.ascontiguousarray(samples), samples.real.dtype)
+        scaled = np.multiply(floats, self.scale, dtype=floats.dtype)
+        limit = np.iinfo(self.component).max
+        np.clip(scaled, -limit, limit, out=scaled)
+        wire = np.empty(samples.shape, dtype=self.dtype)
+        np.rint(scaled, out=_components(wire, self.component), casting="unsafe")
+        return wire
+
+    def fill(self, view: np.ndarray, wire: np.ndarray):
+        """Scale wire I/Q pairs into the complex ``view`` in place."""
+        try:
+            out = _components(view, view.real.dtype)
+        except ValueError:
+            # Strided views such as ``buffer[0, ::2]`` cannot be reinterpreted.
+            staged = np.empty(view.shape, dtype=view.dtype)
+            self.fill(staged, wire)
+            view[...] = staged
+            return
+        np.multiply(
+            _components(np.ascontiguousarray(wire), self.component),
+            1.0 / self.scale,
+            out=out,
+            casting="unsafe",
+        )
+
+    def __repr__(self):
+        return f"NarrowWireFormat({self.name!r}, scale={self.scale:g})"
+
+
+def narrow_wire_format(cpu_format, otw_format, capabilities, args=None):
+    """Return the wire format a streamer should use, or None for native frames.
+
+    Narrow frames are used only for float CPU formats and only when the
+    server lists the format under ``sample_wire_formats``.
+    """
+    otw_format = str(otw_format or "").lower()
+    if str(cpu_format or "").lower() not in _CPU_FORMATS or otw_format not in WIRE_DTYPES:
+        return None
+    if otw_format not in ((capabilities or {}).get("sample_wire_formats") or ()):
+        return None
+    fullscale = (args or {}).get("fullscale", 1.0)
+    return NarrowWireFormat(otw_format, fullscale)
@@ -0,0 +1,116 @@
+# Copyright (C) 2026 RemoteRF
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Content-addressed on-disk cache of device IDL schemas.
+
+Schemas are stored one JSON file per ``schema_hash`` under
+``~/.config/remoterf-client/schemas``. A client asks the server for the
+current hash alone and only downloads the full schema on a cache miss. The
+cache is best effort: unreadable, corrupt or mismatched entries count as
+misses and failed writes are ignored. Legacy v1 schemas published without a
+``schema_hash`` are keyed by :func:`content_hash` instead.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+
+_HASH_PATTERN = re.compile(r"[A-Za-z0-9]+:[A-Za-z0-9_-]{1,128}")
+
+
+def content_hash(schema: dict) -> str:
+    """``sha256:`` of the canonical JSON of ``schema`` without its ``schema_hash``."""
+    body = dict(schema)
+    body.pop("schema_hash", None)
+    canonical = json.dumps(body, sort_keys=True, separators=(",", ":"))
+    return "sha256:" + hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _default_root() -> Path:
+    return Path(os.path.expanduser("~")) / ".config" / "remoterf-client" / "schemas"
+
+
+class SchemaCache:
+    """Maps ``schema_hash`` values to schema dicts stored under ``root``."""
+
+    def __init__(self, root=None):
+        self.root = Path(root) if root is not None else _default_root()
+        self._memo = {}
+        self._lock = threading.Lock()
+
+    def path(self, schema_hash) -> Path | None:
+        """Return the file for ``schema_hash``, or None if it cannot be cached."""
+        schema_hash = str(schema_hash or "")
+        if not _HASH_PATTERN.fullmatch(schema_hash):
+            return None
+        return self.root / (schema_hash.replace(":", "-") + ".json")
+
+    def load(self, schema_hash) -> dict | None:
+        """Return the cached schema for ``schema_hash``, or None on a miss."""
+        schema_hash = str(schema_hash or "")
+        with self._lock:
+            cached = self._memo.get(schema_hash)
+        if cached is not None:
+            return json.loads(cached)
+        path = self.path(schema_hash)
+        if path is None:
+            return None
+        try:
+            text = path.read_text(encoding="utf-8")
+            schema = json.loads(text)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(schema, dict) or schema.get("schema_hash") != schema_hash:
+            return None
+        with self._lock:
+            self._memo[schema_hash] = text
+        return schema
+
+    def store(self, schema: dict) -> Path | None:
+        """Write ``schema`` under its own ``schema_hash``; return the file written."""
+        schema_hash = str(schema.get("schema_hash") or "")
+        path = self.path(schema_hash)
+        if path is None:
+            return None
+        text = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+        with self._lock:
+            self._memo[schema_hash] = text
+        staging = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            staging.write_text(text, encoding="utf-8")
+            os.replace(staging, path)
+        except OSError:
+            try:
+                staging.unlink()
+            except OSError:
+                pass
+            return None
+        return path
+
+
+_default_cache = None
+
+
+def schema_cache() -> SchemaCache:
+    """Return the process-wide cache rooted in the client config directory."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = SchemaCache()
+    return _default_cache
@@ -0,0 +1,138 @@
+# Copyright (C) 2026 RemoteRF
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Short-lived account session tokens.
+
+A server that supports sessions answers ``ACC:login`` with ``session`` (the
+token) and ``session_ttl`` (its lifetime in seconds). Later account RPCs send
+the username and carry the token as ``remoterf-session`` call metadata instead
+of the password, so the server does not hash a password for every request.
+A reply containing ``SX`` means the token has expired or been revoked; the
+client drops it, logs in once for a new token and retries. Expired tokens are
+renewed the same way before the call is sent.
+
+Tokens are kept in memory. Setting ``REMOTERF_SESSION_FILE`` in the client
+``.env`` also keeps them on disk so that later processes can reuse them.
+Use ``1`` for ``~/.config/remoterf-client/sessions.json``, or give a path.
+The file and its directory are created owner-only, and a file that other
+users can read is ignored.
+"""
+from __future__ import annotations
+
+import json
+import os
+import stat
+import threading
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+SESSION_METADATA_KEY = "remoterf-session"
+DEFAULT_TTL_SEC = 15 * 60
+# Treat tokens this close to expiry as expired, so a call never races it.
+_EXPIRY_MARGIN_SEC = 30.0
+
+
+def _default_path() -> Path:
+    return Path(os.path.expanduser("~")) / ".config" / "remoterf-client" / "sessions.json"
+
+
+class SessionToken(NamedTuple):
+    value: str
+    expires_at: float  # time.time() seconds
+
+    def expired(self, now: float | None = None) -> bool:
+        now = time.time() if now is None else now
+        return now >= self.expires_at - _EXPIRY_MARGIN_SEC
+
+
+class SessionStore:
+    """Session tokens keyed by server address and username.
+
+    With a ``path`` the tokens are also written there, readable and writable
+    by the owner only.
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path).expanduser() if path is not None else None
+        self._tokens = {}
+        self._lock = threading.Lock()
+        if self.path is not None:
+            self._tokens = self._read()
+
+    @staticmethod
+    def _key(server: str, username: str) -> str:
+        return f"{server}|{username}"
+
+    def get(self, server: str, username: str) -> SessionToken | None:
+        """The live token for ``username`` on ``server``, if one is held."""
+        with self._lock:
+            token = self._tokens.get(self._key(server, username))
+        if token is None or token.expired():
+            return None
+        return token
+
+    def put(self, server: str, username: str, value: str, ttl_sec: float = DEFAULT_TTL_SEC) -> SessionToken:
+        token = SessionToken(str(value), time.time() + float(ttl_sec))
+        with self._lock:
+            self._tokens[self._key(server, username)] = token
+            self._write()
+        return token
+
+    def discard(self, server: str, username: str) -> None:
+        with self._lock:
+            if self._tokens.pop(self._key(server, username), None) is not None:
+                self._write()
+
+    def _read(self) -> dict:
+        try:
+            if os.name == "posix" and self.path.stat().st_mode & (stat.S_IRWXG | stat.S_IRWXO):
+                return {}
+            entries = json.loads(self.path.read_text(encoding="utf-8"))
+            return {
+                key: SessionToken(str(entry["token"]), float(entry["expires_at"]))
+                for key, entry in entries.items()
+            }
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return {}
+
+    def _write(self) -> None:
+        if self.path is None:
+            return
+        now = time.time()
+        live = {
+            key: {"token": token.value, "expires_at": token.expires_at}
+            for key, token in self._tokens.items()
+            if not token.expired(now)
+        }
+        staging = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            descriptor = os.open(staging, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
+                json.dump(live, handle)
+            os.replace(staging, self.path)
+        except OSError:
+            pass
+
+
+def store_from_env(environ) -> SessionStore:
+    """The session store ``REMOTERF_SESSION_FILE`` asks for (memory by default)."""
+    setting = (environ.get("REMOTERF_SESSION_FILE") or "").strip().strip('"').strip("'")
+    if not setting or setting.lower() in {"0", "false", "no", "off"}:
+        return SessionStore()
+    if setting.lower() in {"1", "true", "yes", "on"}:
+        return SessionStore(_default_path())
+    return SessionStore(setting)
@@ -17,6 +17,7 @@
 
 __all__ = [
     "fetch_idl",
+    "fetch_schema_hash",
     "fetch_schema_v2",
     "install_driver",
     "install_driver_if_stale",
@@ -27,6 +28,7 @@ __all__ = [
 def __getattr__(name):
     if name in {
         "fetch_idl",
+        "fetch_schema_hash",
         "install_driver",
         "install_driver_if_stale",
         "ensure_driver",
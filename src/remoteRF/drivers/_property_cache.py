@@ -0,0 +1,181 @@
+# Copyright (C) 2026 RemoteRF
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Opt-in client-side property cache for the v1 device drivers.
+
+Every v1 property read is a full RPC round trip, so scripts that poll
+``sdr.sample_rate`` or re-read configuration inside a loop pay the network
+latency each time.  A :class:`PropertyCache` remembers getter results and the
+values written through setters, and forgets them again when something on the
+device may have changed them:
+
+* a setter write drops every other entry, unless the IDL lists exactly which
+  properties the setter ``invalidates``.  The written value is cached only
+  once the write succeeded, and not at all for ``quantized`` properties,
+  whose next read returns the value the hardware actually applied;
+* a call drops every entry, unless the IDL marks it ``side_effecting: false``
+  or lists the properties it ``invalidates``;
+* an entry older than its TTL is refetched.  A TTL of ``0`` never caches the
+  property (use it for live readings such as counters or sample buffers).
+
+The cache is off by default; drivers expose ``remoterf_enable_cache``.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Iterable, Mapping
+
+_MISSING = object()
+
+
+class PropertyCache:
+    """Per-device memo of property values with TTL and invalidation rules."""
+
+    def __init__(
+        self,
+        ttl: float | None = None,
+        *,
+        ttls: Mapping[str, float | None] | None = None,
+        setter_invalidates: Mapping[str, Iterable[str]] | None = None,
+        call_invalidates: Mapping[str, Iterable[str]] | None = None,
+        quantized: Iterable[str] = (),
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = _checked_ttl(ttl, "ttl")
+        self.ttls = {
+            str(prop): _checked_ttl(value, f"ttl for {prop!r}")
+            for prop, value in dict(ttls or {}).items()
+        }
+        self._setter_invalidates = {
+            str(prop): frozenset(props)
+            for prop, props in dict(setter_invalidates or {}).items()
+        }
+        self._call_invalidates = {
+            str(method): frozenset(props)
+            for method, props in dict(call_invalidates or {}).items()
+        }
+        self._quantized = frozenset(str(prop) for prop in quantized)
+        self._clock = clock
+        self._entries: dict[str, tuple[Any, float | None]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_policy(
+        cls,
+        policy: Mapping[str, Any],
+        ttl: float | None = None,
+        *,
+        ttls: Mapping[str, float | None] | None = None,
+    ) -> "PropertyCache":
+        """Build a cache from a driver's IDL policy; ``ttls`` override the IDL."""
+        return cls(
+            ttl,
+            ttls={**dict(policy.get("ttls", {})), **dict(ttls or {})},
+            setter_invalidates=policy.get("setter_invalidates"),
+            call_invalidates=policy.get("call_invalidates"),
+            quantized=policy.get("quantized", ()),
+        )
+
+    def _ttl_for(self, prop: str) -> float | None:
+        return self.ttls.get(prop, self.ttl)
+
+    def _store(self, prop: str, value: Any) -> None:
+        ttl = self._ttl_for(prop)
+        if ttl == 0:
+            self._entries.pop(prop, None)
+            return
+        expires = None if ttl is None else self._clock() + ttl
+        self._entries[prop] = (value, expires)
+
+    def lookup(self, prop: str) -> Any:
+        """Return the cached value, or the module's ``_MISSING`` sentinel."""
+        entry = self._entries.get(prop)
+        if entry is None:
+            return _MISSING
+        value, expires = entry
+        if expires is not None and self._clock() >= expires:
+            del self._entries[prop]
+            return _MISSING
+        return value
+
+    def get(self, prop: str, fetch: Callable[[], Any]) -> Any:
+        value = self.lookup(prop)
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = fetch()
+        self._store(prop, value)
+        return value
+
+    def set(self, prop: str, value: Any, write: Callable[[Any], Any]) -> None:
+        affected = self._setter_invalidates.get(prop)
+        self._drop(None if affected is None else {prop, *affected})
+        write(value)
+        if prop not in self._quantized:
+            self._store(prop, value)
+
+    def note_call(self, method: str) -> None:
+        """Apply the invalidation rule for a call that is about to run."""
+        self._drop(self._call_invalidates.get(method))
+
+    def invalidate(self, *props: str) -> None:
+        """Forget ``props``, or every entry when called without arguments."""
+        self._drop(props or None)
+
+    def _drop(self, props: Iterable[str] | None) -> None:
+        if props is None:
+            self._entries.clear()
+            return
+        for prop in props:
+            self._entries.pop(prop, None)
+
+    def __contains__(self, prop: str) -> bool:
+        return self.lookup(prop) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _checked_ttl(value, field: str) -> float | None:
+    if value is None:
+        return None
+    ttl = float(value)
+    if ttl < 0:
+        raise ValueError(f"{field} must be non-negative or None")
+    return ttl
+
+
+def cached_get(device, prop: str, fetch: Callable[[], Any]) -> Any:
+    cache = device.remoterf_cache
+    if cache is None:
+        return fetch()
+    return cache.get(prop, fetch)
+
+
+def cached_set(device, prop: str, value: Any, write: Callable[[Any], Any]) -> None:
+    cache = device.remoterf_cache
+    if cache is None:
+        write(value)
+    else:
+        cache.set(prop, value, write)
+
+
+def note_call(device, method: str) -> None:
+    cache = device.remoterf_cache
+    if cache is not None:
+        cache.note_call(method)
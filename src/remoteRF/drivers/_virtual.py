@@ -2,7 +2,10 @@
 
 This module intentionally models only enough device behavior for application
 scripts to run without a RemoteRF server or physical hardware.  It is not an
-RF or channel emulator.
+RF emulator: with ``loopback`` off, RX delivers zeros.  With digital loopback
+(1), RX replays the last TX buffer unchanged.  With RF loopback (2), RX also
+rotates it by the ``tx_lo - rx_lo`` offset and adds AWGN when an SNR is
+configured.
 """
 
 from __future__ import annotations
@@ -15,6 +18,8 @@ import numpy as np
 
 
 _VIRTUAL_IDS = count(1)
+_LOOPBACK_DIGITAL = 1
+_LOOPBACK_RF = 2
 
 
 def _pluto_defaults() -> dict[str, Any]:
@@ -53,6 +58,15 @@ class _VirtualDeviceState:
     virtual_id: int = field(default_factory=lambda: next(_VIRTUAL_IDS))
     values: dict[str, Any] = field(default_factory=dict)
     last_tx: np.ndarray | None = None
+    snr_db: float | None = None
+    rng: np.random.Generator = field(default_factory=np.random.default_rng)
+    # Loopback source: one complex64 row per TX channel and its mean power.
+    _tx_rows: np.ndarray | None = None
+    _tx_power: np.ndarray | None = None
+    _tx_cyclic: bool = False
+    _rx_sample: int = 0  # samples delivered since the last tx()
+    _lo_phase: float = 0.0  # radians, carried between rx() calls
+    _scratch: dict[str, np.ndarray] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         if self.device_type in {"pluto", "adalm_pluto", "adalm_pluto_mimo"}:
@@ -66,10 +80,80 @@ class _VirtualDeviceState:
         if name in {"__repr__", "repr"}:
             return f"<VirtualPluto uri={self.uri}>"
         if name == "rx":
-            size = max(0, int(self.values.get("rx_buffer_size", 1024)))
-            return np.zeros(size, dtype=np.complex64)
+            return self._rx()
         return self.values.get(name)
 
+    def _rx(self) -> np.ndarray | list[np.ndarray]:
+        size = max(0, int(self.values.get("rx_buffer_size", 1024)))
+        channels = len(self.values.get("rx_enabled_channels") or [0])
+        mode = int(self.values.get("loopback") or 0)
+        if self._tx_rows is None or mode not in {_LOOPBACK_DIGITAL, _LOOPBACK_RF}:
+            blocks = [np.zeros(size, dtype=np.complex64) for _ in range(channels)]
+        else:
+            rotation = self._lo_rotation(size) if mode == _LOOPBACK_RF else None
+            blocks = [self._loopback(index, size, rotation) for index in range(channels)]
+        self._rx_sample += size
+        return blocks[0] if channels == 1 else blocks
+
+    def _loopback(
+        self, channel: int, size: int, rotation: np.ndarray | None
+    ) -> np.ndarray:
+        out = np.zeros(size, dtype=np.complex64)
+        if channel >= len(self._tx_rows):
+            return out
+        waveform = self._tx_rows[channel]
+        if self._tx_cyclic:
+            _fill_cyclic(out, waveform, self._rx_sample)
+        else:
+            tail = waveform[self._rx_sample : self._rx_sample + size]
+            out[: len(tail)] = tail
+        if rotation is not None:
+            out *= rotation
+            if self.snr_db is not None:
+                power = float(self._tx_power[channel]) / 10.0 ** (self.snr_db / 10.0)
+                noise = self._buffer("noise", 2 * size, np.float32)
+                self.rng.standard_normal(dtype=np.float32, out=noise)
+                noise *= np.float32(np.sqrt(power / 2.0))
+                out += noise.view(np.complex64)
+        return out
+
+    def _lo_rotation(self, size: int) -> np.ndarray:
+        """``exp(j*phase)`` of the LO offset for the next ``size`` samples."""
+        offset = float(self.values.get("tx_lo", 0)) - float(self.values.get("rx_lo", 0))
+        step = 2.0 * np.pi * offset / float(self.values.get("sample_rate") or 1.0)
+        rotation = self._buffer("rotation", size, np.complex64)
+        phase = self._buffer("phase", size, np.float64)
+        np.multiply(self._buffer("ramp", size, np.float64), step, out=phase)
+        phase += self._lo_phase
+        np.cos(phase, out=rotation.real)
+        np.sin(phase, out=rotation.imag)
+        self._lo_phase = (self._lo_phase + step * size) % (2.0 * np.pi)
+        return rotation
+
+    def _buffer(self, name: str, size: int, dtype) -> np.ndarray:
+        """Reusable scratch array; ``ramp`` holds ``0..size-1``."""
+        buffer = self._scratch.get(name)
+        if buffer is None or len(buffer) != size:
+            if name == "ramp":
+                buffer = np.arange(size, dtype=dtype)
+            else:
+                buffer = np.empty(size, dtype=dtype)
+            self._scratch[name] = buffer
+        return buffer
+
+    def _load_tx(self, value: Any) -> None:
+        rows = np.array(np.atleast_2d(np.asarray(value)), dtype=np.complex64)
+        self._tx_rows = rows
+        power = np.abs(rows) ** 2
+        self._tx_power = power.mean(axis=1) if rows.shape[1] else power.sum(axis=1)
+        self._tx_cyclic = bool(self.values.get("tx_cyclic_buffer"))
+        self._rx_sample = 0
+
+    def configure_channel(self, *, snr_db: float | None, seed: int | None) -> None:
+        self.snr_db = None if snr_db is None else float(snr_db)
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+
     def set(self, name: str, value: Any) -> None:
         if isinstance(value, np.ndarray):
             value = value.copy()
@@ -84,9 +168,14 @@ class _VirtualDeviceState:
             return self.get("rx")
         if name == "tx":
             self.last_tx = np.asarray(arg).copy() if has_arg else None
+            if self.last_tx is None:
+                self._tx_rows = None
+            else:
+                self._load_tx(arg)
             return None
         if name == "tx_destroy_buffer":
             self.last_tx = None
+            self._tx_rows = None
             return None
         if name == "rx_destroy_buffer":
             return None
@@ -98,6 +187,23 @@ class _VirtualDeviceState:
         return None
 
 
+def _fill_cyclic(out: np.ndarray, waveform: np.ndarray, start: int) -> None:
+    """Fill ``out`` with ``waveform`` repeated, beginning at sample ``start``."""
+    period = len(waveform)
+    if not period:
+        return
+    first = min(period, len(out))
+    offset = start % period
+    head = waveform[offset : offset + first]
+    out[: len(head)] = head
+    out[len(head) : first] = waveform[: first - len(head)]
+    filled = first
+    while filled < len(out):  # double the repeated prefix
+        chunk = min(filled, len(out) - filled)
+        out[filled : filled + chunk] = out[:chunk]
+        filled += chunk
+
+
 class VirtualToken(str):
     """String-compatible token carrying isolated local virtual-device state."""
 
@@ -135,6 +241,15 @@ def virtual_set(token: VirtualToken, name: str, value: Any) -> None:
     token.state.set(name, value)
 
 
+def virtual_configure_channel(
+    token: VirtualToken,
+    *,
+    snr_db: float | None = None,
+    seed: int | None = None,
+) -> None:
+    token.state.configure_channel(snr_db=snr_db, seed=seed)
+
+
 def virtual_call(
     token: VirtualToken,
     name: str,
@@ -14,11 +14,13 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from ...common.utils import *
+from .._property_cache import PropertyCache, cached_get, cached_set, note_call
 from .._virtual import (
     is_virtual_token,
     make_virtual_token,
     retag_virtual_token,
     virtual_call,
+    virtual_configure_channel,
     virtual_get,
     virtual_set,
 )
@@ -30,11 +32,22 @@ def _rpc_client(*, function_name, args):
 
     return rpc_client(function_name=function_name, args=args)
 
+def _get(function_name, token):
+    if is_virtual_token(token):
+        return virtual_get(token, function_name)
+    return unmap_arg(_rpc_client(function_name=f"Pluto:{function_name}:GET", args={'a':map_arg(token)}).results[function_name])
+
+def _set(function_name, value, token):
+    if is_virtual_token(token):
+        virtual_set(token, function_name, value)
+        return None
+    _rpc_client(function_name=f"Pluto:{function_name}:SET", args={function_name: map_arg(value), 'a':map_arg(token)})
+
 def try_get(function_name, token):
     if is_virtual_token(token):
         return virtual_get(token, function_name)
     try:
-        return unmap_arg(_rpc_client(function_name=f"Pluto:{function_name}:GET", args={'a':map_arg(token)}).results[function_name])
+        return _get(function_name, token)
     except Exception as e:
         input(f"Error: {e}\nHit enter to continue...")
     return None
@@ -44,7 +57,7 @@ def try_set(function_name, value, token):
         virtual_set(token, function_name, value)
         return None
     try:
-        _rpc_client(function_name=f"Pluto:{function_name}:SET", args={function_name: map_arg(value), 'a':map_arg(token)})
+        _set(function_name, value, token)
     except Exception as e:
         input(f"Error: {e}\nHit enter to continue...")
         
@@ -80,6 +93,45 @@ def try_call_1_arg(function_name, arg, token):  # 1 argument call
         input(f"RPC_1_call Error: {e}\nHit enter to continue...")
     return None
 
+# rx() is a sample capture, not a setting; pushing samples or tearing down the
+# DMA buffers leaves the AD9364 configuration untouched. The AGC moves the RX
+# gain on its own, and rates, LOs, bandwidths and TX attenuation are rounded
+# to what the AD9364 supports, so those are re-read rather than remembered.
+_CACHE_POLICY = {
+    "ttls": {"rx_hardwaregain_chan0": 0},
+    "quantized": [
+        "sample_rate",
+        "rx_lo",
+        "tx_lo",
+        "rx_rf_bandwidth",
+        "tx_rf_bandwidth",
+        "tx_hardwaregain_chan0",
+    ],
+    "call_invalidates": {
+        "tx": [],
+        "tx_destroy_buffer": [],
+        "rx_destroy_buffer": [],
+    },
+}
+
+# The cache callbacks raise, so a failed RPC never leaves a value behind.
+def _cached_get(device, prop):
+    try:
+        return cached_get(device, prop, lambda: _get(prop, device.token))
+    except Exception as e:
+        if is_virtual_token(device.token):
+            raise
+        input(f"Error: {e}\nHit enter to continue...")
+    return None
+
+def _cached_set(device, prop, value):
+    try:
+        cached_set(device, prop, value, lambda v: _set(prop, v, device.token))
+    except Exception as e:
+        if is_virtual_token(device.token):
+            raise
+        input(f"Error: {e}\nHit enter to continue...")
+
 class rx_def:
     pass
 
@@ -105,7 +157,22 @@ class Pluto: # client
         try_call_0_arg(function_name="ip", token=token)
         
         
+    remoterf_cache = None
+
+    def remoterf_enable_cache(self, ttl=None, *, ttls=None):
+        """Remember property reads and writes client-side; see PropertyCache."""
+        self.remoterf_cache = PropertyCache.from_policy(_CACHE_POLICY, ttl, ttls=ttls)
+        return self.remoterf_cache
+
+    def remoterf_virtual_channel(self, *, snr_db=None, seed=None):
+        """Set the AWGN SNR (dB, None for none) of a virtual Pluto's RF loopback."""
+        if not self.virtual:
+            raise ValueError("remoterf_virtual_channel() needs Pluto(virtual=True)")
+        virtual_configure_channel(self.token, snr_db=snr_db, seed=seed)
+
     def api_token(self, token:str) -> None:
+        if self.remoterf_cache is not None:
+            self.remoterf_cache.invalidate()
         if self.virtual:
             self.token = retag_virtual_token(self.token, token)
             return
@@ -125,109 +192,111 @@ class Pluto: # client
 
     @property
     def filter(self):
-        return try_get("filter", self.token)
+        return _cached_get(self, "filter")
 
     @filter.setter
     def filter(self, value):
-        try_set("filter", value, self.token)
+        _cached_set(self, "filter", value)
 
     @property
     def loopback(self):
         """loopback: Set loopback mode. Options are:
         0 (Disable), 1 (Digital), 2 (RF)"""
-        return try_get("loopback", self.token)
+        return _cached_get(self, "loopback")
 
     @loopback.setter
     def loopback(self, value):
-        try_set("loopback", value, self.token)
+        _cached_set(self, "loopback", value)
 
     @property
     def gain_control_mode_chan0(self):
         """gain_control_mode_chan0: Mode of receive path AGC. Options are:
         slow_attack, fast_attack, manual"""
-        return try_get("gain_control_mode_chan0", self.token)
+        return _cached_get(self, "gain_control_mode_chan0")
 
     @gain_control_mode_chan0.setter
     def gain_control_mode_chan0(self, value):
-        try_set("gain_control_mode_chan0", value, self.token)
+        _cached_set(self, "gain_control_mode_chan0", value)
 
     @property
     def rx_hardwaregain_chan0(self):
         """rx_hardwaregain_chan0: Gain applied to RX path. Only applicable when
         gain_control_mode is set to 'manual'"""
-        return try_get("rx_hardwaregain_chan0", self.token)
+        return _cached_get(self, "rx_hardwaregain_chan0")
 
     @rx_hardwaregain_chan0.setter
     def rx_hardwaregain_chan0(self, value):
-        try_set("rx_hardwaregain_chan0", value, self.token)
+        _cached_set(self, "rx_hardwaregain_chan0", value)
 
     @property
     def tx_hardwaregain_chan0(self):
         """tx_hardwaregain_chan0: Attenuation applied to TX path"""
-        return try_get("tx_hardwaregain_chan0", self.token)
+        return _cached_get(self, "tx_hardwaregain_chan0")
 
     @tx_hardwaregain_chan0.setter
     def tx_hardwaregain_chan0(self, value):
-        try_set("tx_hardwaregain_chan0", value, self.token)
+        _cached_set(self, "tx_hardwaregain_chan0", value)
 
     @property
     def rx_rf_bandwidth(self):
         """rx_rf_bandwidth: Bandwidth of front-end analog filter of RX path"""
-        return try_get("rx_rf_bandwidth", self.token)
+        return _cached_get(self, "rx_rf_bandwidth")
 
     @rx_rf_bandwidth.setter
     def rx_rf_bandwidth(self, value):
-        try_set("rx_rf_bandwidth", value, self.token)
+        _cached_set(self, "rx_rf_bandwidth", value)
 
     @property
     def tx_rf_bandwidth(self):
         """tx_rf_bandwidth: Bandwidth of front-end analog filter of TX path"""
-        return try_get("tx_rf_bandwidth", self.token)
+        return _cached_get(self, "tx_rf_bandwidth")
 
     @tx_rf_bandwidth.setter
     def tx_rf_bandwidth(self, value):
-        try_set("tx_rf_bandwidth", value, self.token)
+        _cached_set(self, "tx_rf_bandwidth", value)
 
     @property
     def sample_rate(self):                # ! UNTESTED !
         """sample_rate: Sample rate RX and TX paths in samples per second"""
-        return try_get("sample_rate", self.token)
+        return _cached_get(self, "sample_rate")
 
     @sample_rate.setter
     def sample_rate(self, rate):          # ! UNTESTED !
-        try_set("sample_rate", rate, self.token)
+        _cached_set(self, "sample_rate", rate)
 
     @property
     def rx_lo(self):
         """rx_lo: Carrier frequency of RX path"""
-        return try_get("rx_lo", self.token)
+        return _cached_get(self, "rx_lo")
 
     @rx_lo.setter
     def rx_lo(self, value):
-        try_set("rx_lo", value, self.token)
+        _cached_set(self, "rx_lo", value)
 
     @property
     def tx_lo(self):
         """tx_lo: Carrier frequency of TX path"""
-        return try_get("tx_lo", self.token)
+        return _cached_get(self, "tx_lo")
 
     @tx_lo.setter
     def tx_lo(self, value):
-        try_set("tx_lo", value, self.token)
+        _cached_set(self, "tx_lo", value)
         
     @property
     def tx_cyclic_buffer(self):
         """tx_cyclic_buffer: Size of cyclic buffer"""
-        return try_get("tx_cyclic_buffer", self.token)
+        return _cached_get(self, "tx_cyclic_buffer")
     
     @tx_cyclic_buffer.setter
     def tx_cyclic_buffer(self, value):
-        try_set("tx_cyclic_buffer", value, self.token)
+        _cached_set(self, "tx_cyclic_buffer", value)
         
     def tx_destroy_buffer(self):
+        note_call(self, "tx_destroy_buffer")
         try_call_0_arg("tx_destroy_buffer", self.token)
 
     def rx_destroy_buffer(self):
+        note_call(self, "rx_destroy_buffer")
         try_call_0_arg("rx_destroy_buffer", self.token)
 
     #endregion
@@ -238,16 +307,17 @@ class Pluto: # client
     
     @property
     def rx_buffer_size(self):
-        return try_get("rx_buffer_size", self.token)
+        return _cached_get(self, "rx_buffer_size")
     
     @rx_buffer_size.setter
     def rx_buffer_size(self, value):
-        try_set("rx_buffer_size", value, self.token)
+        _cached_set(self, "rx_buffer_size", value)
     
     #endregion
     #region tx_def
     
     def tx(self, value):
+        note_call(self, "tx")
         return try_call_1_arg("tx", value, self.token)
     
     # @tx.setter
@@ -271,21 +341,21 @@ class Pluto: # client
     @property
     def rx_dec8_filter_en(self) -> bool:         # ! UNTESTED !
         """rx_dec8_filter_en: Enable decimate by 8 filter in FPGA"""
-        return try_get("rx_dec8_filter_en", self.token)
+        return _cached_get(self, "rx_dec8_filter_en")
 
     @rx_dec8_filter_en.setter
     def rx_dec8_filter_en(self, value: bool):    # ! UNTESTED !
         """rx_dec8_filter_en: Enable decimate by 8 filter in FPGA"""
-        return try_set("rx_dec8_filter_en", value, self.token)
+        return _cached_set(self, "rx_dec8_filter_en", value)
 
     @property
     def tx_int8_filter_en(self) -> bool:         # ! UNTESTED !
         """tx_int8_filter_en: Enable interpolate by 8 filter in FPGA"""
-        return try_get("tx_int8_filter_en", self.token)
+        return _cached_get(self, "tx_int8_filter_en")
 
     @tx_int8_filter_en.setter
     def tx_int8_filter_en(self, value: bool):    # ! UNTESTED !
         """tx_int8_filter_en: Enable interpolate by 8 filter in FPGA"""
-        return try_set("tx_int8_filter_en", value, self.token)
+        return _cached_set(self, "tx_int8_filter_en", value)
 
     #endregion
@@ -34,6 +34,7 @@ On first device init, pass device_id to also check for schema updates:
 
 from __future__ import annotations
 
+import functools
 import json
 import keyword
 from pathlib import Path
@@ -64,12 +65,100 @@ _GPL_NOTICE_LINES = (
 # IDL fetch
 # ─────────────────────────────────────────────────────────────────────────────
 
+def _idl_args(token, device_id, device_name) -> dict:
+    if token is not None:
+        return {'token': map_arg(str(token))}
+    if device_id is not None:
+        return {'device_id': map_arg(int(device_id))}
+    if device_name is not None:
+        return {'device_name': map_arg(str(device_name))}
+    raise ValueError("fetch_idl requires token, device_id, or device_name")
+
+
+def _get_drivers(args: dict) -> dict:
+    from ..core.grpc_client import rpc_client
+
+    return rpc_client(function_name="IDL:get_drivers", args=args).results
+
+
+def _decode_idl(results) -> dict:
+    """Parse a v1 schema; legacy ones without a schema_hash get a content hash."""
+    from ..core.schema_cache import content_hash
+
+    schema = json.loads(unmap_arg(results['schema']))
+    if not schema.get("schema_hash"):
+        schema["schema_hash"] = content_hash(schema)
+    return schema
+
+
+def _probe_idl_hash(args: dict, cache) -> str | None:
+    """
+    Ask IDL:get_drivers for the schema hash alone.
+
+    Servers that ignore hash_only answer with the full schema, which is
+    cached on the way through. Returns None if the probe was refused.
+    """
+    results = _get_drivers({**args, 'hash_only': map_arg(True)})
+    if 'error' in results:
+        return None
+    if 'schema' in results:
+        schema = _decode_idl(results)
+        if cache:
+            cache.store(schema)
+        return schema["schema_hash"]
+    if 'schema_hash' in results:
+        return str(unmap_arg(results['schema_hash']))
+    return None
+
+
+def _try_v2(call, token):
+    """Run a v2 schema call; None if the device or server only speaks v1."""
+    from ..core.v2_errors import RemoteRFProtocolError, RemoteRFTransportError
+
+    try:
+        return call(str(token))
+    except RemoteRFProtocolError:
+        # The selected device may only publish v1 (for example Pluto).
+        return None
+    except RemoteRFTransportError as exc:
+        # Old servers report the additive v2 service as UNIMPLEMENTED.
+        if exc.details.get("grpc_code") != "UNIMPLEMENTED":
+            raise
+        return None
+
+
+def fetch_schema_hash(
+    *,
+    token: str = None,
+    device_id: int = None,
+    device_name: str = None,
+    prefer_v2: bool = True,
+) -> str | None:
+    """
+    Return the server's current schema_hash without downloading the schema.
+
+    Takes the same selectors as fetch_idl(). Returns None if the server
+    cannot answer a hash-only request.
+    """
+    if token is not None and prefer_v2:
+        from ..core.dynamic_v2_transport import DynamicV2Transport
+
+        schema_hash = _try_v2(DynamicV2Transport().get_schema_hash, token)
+        if schema_hash is not None:
+            return schema_hash
+
+    from ..core.schema_cache import schema_cache
+
+    return _probe_idl_hash(_idl_args(token, device_id, device_name), schema_cache())
+
+
 def fetch_idl(
     *,
     token: str = None,
     device_id: int = None,
     device_name: str = None,
     prefer_v2: bool = True,
+    cache=None,
 ) -> dict:
     """
     Fetch the IDL schema from the server.
@@ -77,6 +166,10 @@ def fetch_idl(
     Pass one of: token (preferred — uses the reservation token to resolve
     the device), device_id, or device_name.
 
+    The server is asked for the schema hash first; the full schema is only
+    downloaded when that hash is not in the local schema cache. Pass
+    cache=False to always download it.
+
     Returns the parsed schema dict:
         {
             "schema_version": "1.0",
@@ -89,38 +182,38 @@ def fetch_idl(
             "schema_hash": "sha256:...",
         }
     """
+    if cache is None:
+        from ..core.schema_cache import schema_cache
+
+        cache = schema_cache()
+
     if token is not None and prefer_v2:
         from .dynamic_v2 import fetch_schema_v2
-        from ..core.v2_errors import RemoteRFProtocolError, RemoteRFTransportError
-
-        try:
-            return fetch_schema_v2(str(token))
-        except RemoteRFProtocolError:
-            # The selected device may only publish v1 (for example Pluto).
-            pass
-        except RemoteRFTransportError as exc:
-            # Old servers report the additive v2 service as UNIMPLEMENTED.
-            if exc.details.get("grpc_code") != "UNIMPLEMENTED":
-                raise
-
-    args: dict = {}
-    if token is not None:
-        args['token'] = map_arg(str(token))
-    elif device_id is not None:
-        args['device_id'] = map_arg(int(device_id))
-    elif device_name is not None:
-        args['device_name'] = map_arg(str(device_name))
-    else:
-        raise ValueError("fetch_idl requires token, device_id, or device_name")
 
-    from ..core.grpc_client import rpc_client
+        schema = _try_v2(functools.partial(fetch_schema_v2, cache=cache), token)
+        if schema is not None:
+            return schema
+
+    args = _idl_args(token, device_id, device_name)
+    return _load_idl(args, cache, _probe_idl_hash(args, cache) if cache else None)
 
-    resp = rpc_client(function_name="IDL:get_drivers", args=args)
 
-    if 'error' in resp.results:
-        raise RuntimeError(f"IDL fetch failed: {unmap_arg(resp.results['error'])}")
+def _load_idl(args: dict, cache, schema_hash) -> dict:
+    """The v1 schema for an already probed ``schema_hash``, downloaded on a miss."""
+    if cache and schema_hash:
+        cached = cache.load(schema_hash)
+        if cached is not None:
+            return cached
 
-    return json.loads(unmap_arg(resp.results['schema']))
+    results = _get_drivers(args)
+
+    if 'error' in results:
+        raise RuntimeError(f"IDL fetch failed: {unmap_arg(results['error'])}")
+
+    schema = _decode_idl(results)
+    if cache:
+        cache.store(schema)
+    return schema
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -564,6 +657,55 @@ def _schema_maps(schema: dict) -> tuple[str, str, str, str, str, dict, dict, dic
     )
 
 
+def _cache_policy(getter_map: dict, setter_map: dict, call_map: dict) -> dict:
+    """Collect the IDL's property-cache annotations for PropertyCache.from_policy."""
+    known = set(getter_map) | set(setter_map)
+
+    def invalidated(info, context):
+        props = info.get("invalidates")
+        if not isinstance(props, list) or not all(isinstance(p, str) for p in props):
+            raise ValueError(f"{context} invalidates must be a list of property names")
+        unknown = sorted(set(props) - known)
+        if unknown:
+            raise ValueError(f"{context} invalidates unknown properties: {', '.join(unknown)}")
+        return sorted(props)
+
+    ttls = {}
+    for prop, info in sorted(getter_map.items()):
+        if "cache_ttl" not in info:
+            continue
+        ttl = info["cache_ttl"]
+        if ttl is not None and (
+            isinstance(ttl, bool) or not isinstance(ttl, (int, float)) or ttl < 0
+        ):
+            raise ValueError(f"getter 'get_{prop}' cache_ttl must be a non-negative number")
+        ttls[prop] = ttl
+
+    setter_invalidates = {}
+    for prop, info in sorted(setter_map.items()):
+        if "invalidates" in info:
+            setter_invalidates[prop] = invalidated(info, f"setter 'set_{prop}'")
+
+    call_invalidates = {}
+    for method, info in sorted(call_map.items()):
+        side_effecting = info.get("side_effecting", True)
+        if not isinstance(side_effecting, bool):
+            raise ValueError(f"call {method!r} side_effecting must be a bool")
+        if "invalidates" in info:
+            call_invalidates[method] = invalidated(info, f"call {method!r}")
+        elif not side_effecting:
+            call_invalidates[method] = []
+
+    policy = {}
+    if ttls:
+        policy["ttls"] = ttls
+    if setter_invalidates:
+        policy["setter_invalidates"] = setter_invalidates
+    if call_invalidates:
+        policy["call_invalidates"] = call_invalidates
+    return policy
+
+
 def _append_doc(lines: list[str], indent: str, doc) -> None:
     if doc:
         lines.append(f"{indent}{str(doc)!r}")
@@ -1073,6 +1215,7 @@ _HELPERS = '''\
 from importlib import import_module as _import_module
 
 from ...common.utils import map_arg, unmap_arg
+from .._property_cache import PropertyCache, cached_get, cached_set, note_call
 from .._virtual import (
     is_virtual_token,
     make_virtual_token,
@@ -1182,6 +1325,14 @@ def _try_calln(prop, token, kwargs):
     )
     result = resp.results.get(prop)
     return unmap_arg(result) if result is not None else None
+
+
+def _cached_get(device, prop):
+    return cached_get(device, prop, lambda: _try_get(prop, device.token))
+
+
+def _cached_set(device, prop, value):
+    cached_set(device, prop, value, lambda v: _try_set(prop, v, device.token))
 '''
 
 
@@ -1213,6 +1364,7 @@ def _codegen(schema: dict) -> str:
         f'_SCHEMA_HASH = "{schema_hash}"',
         f"_CLIENT_MODULES = {client_modules!r}",
         f"_CLIENT_OBJECTS = {client_objects!r}",
+        f"_CACHE_POLICY = {_cache_policy(getter_map, setter_map, call_map)!r}",
         "",
         _HELPERS,
     ]
@@ -1237,7 +1389,16 @@ def _codegen(schema: dict) -> str:
     ]
     if "ip" in call_map:
         lines.append('        _try_call("ip", token)')
-    lines.append("")
+    lines += [
+        "",
+        "    remoterf_cache = None",
+        "",
+        "    def remoterf_enable_cache(self, ttl=None, *, ttls=None):",
+        '        """Remember property reads and writes client-side; see PropertyCache."""',
+        "        self.remoterf_cache = PropertyCache.from_policy(_CACHE_POLICY, ttl, ttls=ttls)",
+        "        return self.remoterf_cache",
+        "",
+    ]
 
     # ── Properties ────────────────────────────────────────────────────
     all_props = sorted(set(getter_map) | set(setter_map))
@@ -1253,12 +1414,12 @@ def _codegen(schema: dict) -> str:
             getter_info = getter_map.get(prop) or {}
             client_return = getter_info.get("client_return")
             if client_return is not None:
-                lines.append(f'        _result = _try_get("{prop}", self.token)')
+                lines.append(f'        _result = _cached_get(self, "{prop}")')
                 lines.append(
                     f"        return _wrap_client_return({client_return!r}, self, _result)"
                 )
             else:
-                lines.append(f'        return _try_get("{prop}", self.token)')
+                lines.append(f'        return _cached_get(self, "{prop}")')
         else:
             lines.append(f'        raise AttributeError("{prop} is write-only")')
         lines.append("")
@@ -1266,7 +1427,7 @@ def _codegen(schema: dict) -> str:
         if has_setter:
             lines.append(f"    @{prop}.setter")
             lines.append(f"    def {prop}(self, value):")
-            lines.append(f'        _try_set("{prop}", value, self.token)')
+            lines.append(f'        _cached_set(self, "{prop}", value)')
             lines.append("")
 
     # ── Call methods ──────────────────────────────────────────────────
@@ -1277,6 +1438,7 @@ def _codegen(schema: dict) -> str:
         if args_meta is None:
             lines.append(f"    def {method}(self, _v=_NO_ARG):")
             _append_doc(lines, "        ", doc)
+            lines.append(f'        note_call(self, "{method}")')
             client_return = info.get("client_return")
             if client_return is not None:
                 lines.append(f'        _result = _try_call("{method}", self.token, _v)')
@@ -1321,6 +1483,7 @@ def _codegen(schema: dict) -> str:
         signature = ", ".join(["self", *params])
         lines.append(f"    def {method}({signature}):")
         _append_doc(lines, "        ", doc)
+        lines.append(f'        note_call(self, "{method}")')
 
         arg_names = [
             _require_identifier(str(arg.get("name", "")).strip(), field=f"call {method!r} arg")
@@ -1437,9 +1600,9 @@ def _write_driver_files(schema: dict) -> Path:
 
 
 def _write_v2_driver_files(schema: dict) -> Path:
-    from .dynamic_v2 import render_stub, validate_schema_v2
+    from .dynamic_v2 import precompile_bindings, render_stub
 
-    validate_schema_v2(schema)
+    precompiled = precompile_bindings(schema)
 
     device_type = _require_package_name(
         schema.get("device_type", "unknown"),
@@ -1466,7 +1629,9 @@ def _write_v2_driver_files(schema: dict) -> Path:
                 "",
                 f"_SCHEMA_HASH = {schema_hash!r}",
                 f"_SCHEMA = {schema!r}",
-                "uhd, " + class_name + " = build_uhd_bindings(_SCHEMA)",
+                "# Validated when generated; lets the import skip validation.",
+                f"_PRECOMPILED = {precompiled!r}",
+                "uhd, " + class_name + " = build_uhd_bindings(_SCHEMA, precompiled=_PRECOMPILED)",
                 "",
                 f"__all__ = ['uhd', {class_name!r}]",
                 "",
@@ -1537,8 +1702,9 @@ def ensure_driver(*, token: str = None, device_id: int = None, device_name: str
         from remoteRF.drivers.pluto import *
         sdr = adi.Pluto(token)
 
-    One IDL:get_drivers RPC is always made (to resolve device_type and hash).
-    Files are only written when missing or stale.
+    A hash-only schema probe is always made; the full schema is downloaded
+    only when its hash is not in the local schema cache. Files are only
+    written when missing or stale.
     """
     schema = fetch_idl(
         token=token,
@@ -1584,8 +1750,9 @@ def _read_schema_hash(path: Path) -> str | None:
 
 def install_driver_if_stale(*, token: str, current_hash: str) -> bool:
     """
-    Fetch the server schema hash via the reservation token and reinstall the
-    driver only if it has changed since the file on disk was generated.
+    Probe the server schema hash via the reservation token and reinstall the
+    driver only if it has changed since the file on disk was generated. The
+    full schema is fetched (or read from the schema cache) only then.
 
     Called automatically by every generated device __init__:
 
@@ -1597,7 +1764,16 @@ def install_driver_if_stale(*, token: str, current_hash: str) -> bool:
 
         from remoteRF.drivers.pluto import *
     """
-    schema = fetch_idl(token=token, prefer_v2=False)
+    from ..core.schema_cache import schema_cache
+
+    cache = schema_cache()
+    args = _idl_args(token, None, None)
+    schema_hash = _probe_idl_hash(args, cache)
+    if schema_hash is not None and schema_hash == current_hash:
+        return False
+    # Drivers generated from a hash-less legacy schema carry "?" and are
+    # regenerated once here with its content hash baked in.
+    schema = _load_idl(args, cache, schema_hash)
     if schema.get("schema_hash") == current_hash:
         return False
 
@@ -17,17 +17,21 @@
 from __future__ import annotations
 
 import functools
-import hashlib
 import json
 import keyword
 import numbers
 import re
+import threading
+import time
 import types
 import weakref
 
 import numpy as np
 
 from ..core.dynamic_v2_transport import DynamicV2Transport
+from ..core.sample_compression import DEFAULT_LEVEL, SampleCompression, supported_codecs
+from ..core.sample_formats import narrow_wire_format
+from ..core.schema_cache import content_hash, schema_cache
 from ..core.v2_errors import RemoteRFProtocolError
 from .support import uhd_dsp, uhd_v2
 
@@ -49,7 +53,11 @@ _GPL_NOTICE_LINES = (
     "",
 )
 
+# Bump when precompile_bindings() output changes shape; older generated
+# modules then fall back to validating their schema at import.
+_PRECOMPILED_FORMAT = 1
 _REMOTE_STREAM_BATCH_SAMPS = 64 * 1024
+_PIPELINE_CANCEL_TIMEOUT_SEC = 1.0
 _CPU_FORMAT_DTYPES = {
     "fc32": np.dtype(np.complex64),
     "fc64": np.dtype(np.complex128),
@@ -115,12 +123,7 @@ def validate_schema_v2(schema: dict) -> dict:
         raise RemoteRFProtocolError(
             "Dynamic schema has an invalid device_type or client_class"
         )
-    expected_hash = str(schema.get("schema_hash") or "")
-    body = dict(schema)
-    body.pop("schema_hash", None)
-    canonical = json.dumps(body, sort_keys=True, separators=(",", ":"))
-    actual_hash = "sha256:" + hashlib.sha256(canonical.encode("utf-8")).hexdigest()
-    if expected_hash != actual_hash:
+    if str(schema.get("schema_hash") or "") != content_hash(schema):
         raise RemoteRFProtocolError("Dynamic schema hash validation failed")
 
     object_paths = set()
@@ -194,65 +197,146 @@ def _validate_sample_array(array, *, operation: str):
         raise ValueError(f"{operation} uses unsupported sample dtype {array.dtype}")
 
 
-def fetch_schema_v2(token: str, *, transport=None) -> dict:
-    return validate_schema_v2(
-        (transport or DynamicV2Transport()).get_schema(token)
-    )
+def _tx_fragment_metadata(metadata, *, first: bool, last: bool):
+    """Return the share of one TX burst's metadata carried by a DATA frame."""
+    snapshot = uhd_v2.payload(metadata)
+    if not isinstance(snapshot, dict):
+        return metadata
+    snapshot = dict(snapshot)
+    if not first:
+        snapshot["has_time_spec"] = False
+        snapshot["start_of_burst"] = False
+    if not last:
+        snapshot["end_of_burst"] = False
+    return snapshot
+
+
+def fetch_schema_v2(token: str, *, transport=None, cache=None) -> dict:
+    """Return the device's v2 schema, downloading it only on a cache miss.
+
+    The server is first asked for the current ``schema_hash`` alone. ``cache``
+    defaults to the on-disk :class:`~remoteRF.core.schema_cache.SchemaCache`;
+    pass ``False`` to always download the full schema.
+    """
+    transport = transport or DynamicV2Transport()
+    if cache is False:
+        return validate_schema_v2(transport.get_schema(token))
+    cache = cache or schema_cache()
+    cached = cache.load(transport.get_schema_hash(token))
+    if cached is not None:
+        try:
+            return validate_schema_v2(cached)
+        except RemoteRFProtocolError:
+            pass
+    schema = validate_schema_v2(transport.get_schema(token))
+    cache.store(schema)
+    return schema
 
 
-def _matches_type(value, wire_type: str) -> bool:
+_SIMPLE_TYPES = {
+    "bool": (bool, np.bool_),
+    "str": (str,),
+    "bytes": (bytes, bytearray, memoryview),
+    "complex": (complex, np.complexfloating),
+    "list": (list, tuple),
+    "dict": (dict,),
+    "ndarray": (np.ndarray,),
+}
+# Numeric checks that must not accept ``bool``: concrete types are tried
+# first because isinstance() against the ``numbers`` ABCs is slow.
+_NUMBER_TYPES = {
+    "int": ((int, np.integer), (numbers.Integral,)),
+    "float": ((float, int, np.floating, np.integer), (numbers.Real,)),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _type_check(wire_type: str):
+    """Compile a schema wire type into a predicate; None means it accepts anything."""
     choices = {item.strip() for item in str(wire_type or "any").split("|")}
-    if value is None:
-        return "None" in choices or "any" in choices
     if "any" in choices:
-        return True
+        return None
+    allow_none = "None" in choices
+    simple = []
+    number = []
+    abstract = []
+    item_checks = []
     for choice in choices:
-        if choice == "None" and value is None:
-            return True
-        if choice == "bool" and isinstance(value, (bool, np.bool_)):
-            return True
-        if choice == "int" and isinstance(value, (numbers.Integral, np.integer)) and not isinstance(value, bool):
+        if choice in _SIMPLE_TYPES:
+            simple.extend(_SIMPLE_TYPES[choice])
+        elif choice in _NUMBER_TYPES:
+            number.extend(_NUMBER_TYPES[choice][0])
+            abstract.extend(_NUMBER_TYPES[choice][1])
+        elif choice.startswith("list["):
+            item_check = _type_check(choice.partition("[")[2].rpartition("]")[0])
+            if item_check is None:
+                simple.extend(_SIMPLE_TYPES["list"])
+            else:
+                item_checks.append(item_check)
+        elif choice.startswith("dict"):
+            simple.append(dict)
+        elif choice.startswith("uhd."):
+            class_name = choice.rsplit(".", 1)[-1]
+            expected = getattr(uhd_v2, class_name, None) or globals().get(class_name)
+            if isinstance(expected, type):
+                simple.append(expected)
+    simple = tuple(simple)
+    number = tuple(number)
+    abstract = tuple(abstract)
+    item_checks = tuple(item_checks)
+
+    def check(value) -> bool:
+        if value is None:
+            return allow_none
+        if isinstance(value, simple):
             return True
-        if (
-            choice == "float"
-            and isinstance(value, (numbers.Real, np.integer, np.floating))
-            and not isinstance(value, bool)
+        if number and not isinstance(value, bool) and (
+            isinstance(value, number) or isinstance(value, abstract)
         ):
             return True
-        if choice == "str" and isinstance(value, str):
-            return True
-        if choice == "bytes" and isinstance(value, (bytes, bytearray, memoryview)):
-            return True
-        if choice == "complex" and isinstance(value, (complex, np.complexfloating)):
-            return True
-        if choice.startswith("list") and isinstance(value, (list, tuple)):
-            if "[" not in choice:
-                return True
-            item_type = choice.partition("[")[2].rpartition("]")[0]
-            return all(_matches_type(item, item_type) for item in value)
-        if choice.startswith("dict") and isinstance(value, dict):
-            return True
-        if choice == "ndarray" and isinstance(value, np.ndarray):
-            return True
-        if choice.startswith("uhd."):
-            class_name = choice.rsplit(".", 1)[-1]
-            expected = getattr(uhd_v2, class_name, None) or globals().get(class_name)
-            if isinstance(expected, type) and isinstance(value, expected):
-                return True
-    return False
+        if item_checks and isinstance(value, (list, tuple)):
+            return any(all(item(entry) for entry in value) for item in item_checks)
+        return False
+
+    return check
+
+
+def _matches_type(value, wire_type: str) -> bool:
+    check = _type_check(wire_type)
+    return check is None or check(value)
+
+
+# Where a parameter's value comes from in a compiled overload plan.
+_FROM_ARGS, _FROM_KWARGS, _FROM_DEFAULT = range(3)
+# Distinct call shapes remembered per method before plans stop being cached.
+_MAX_CALL_SHAPES = 32
 
 
 class OverloadBinder:
+    """Binds call arguments to one of a method's declared overloads.
+
+    Overloads are compiled on first use into per-call-shape plans: for a given
+    positional count and set of keyword names the binder knows, without trying
+    and failing, which overloads can apply and where each parameter comes from.
+    Binding then only runs the precompiled type checks.
+    """
+
     def __init__(self, method_descriptor: dict):
         self.descriptor = method_descriptor
+        self._overloads = None
+        self._plans = {}
 
     def bind(self, args, kwargs):
-        errors = []
-        for candidate in self.descriptor.get("overloads", ()):
-            try:
-                return candidate["id"], self._bind_one(candidate, args, kwargs)
-            except TypeError as exc:
-                errors.append(str(exc))
+        shape = (len(args), frozenset(kwargs)) if kwargs else len(args)
+        plans = self._plans.get(shape)
+        if plans is None:
+            plans = self._compile_shape(len(args), frozenset(kwargs))
+            if len(self._plans) < _MAX_CALL_SHAPES:
+                self._plans[shape] = plans
+        for overload_id, steps, extra_start, extra_keywords in plans:
+            bound = _run_plan(steps, extra_start, extra_keywords, args, kwargs)
+            if bound is not None:
+                return overload_id, bound
         forms = ", ".join(
             str(item.get("id") or "native")
             for item in self.descriptor.get("overloads", ())
@@ -262,58 +346,98 @@ class OverloadBinder:
             f"supported overloads: {forms or 'none'}"
         )
 
-    def _bind_one(self, candidate, args, kwargs):
-        positional = list(args)
-        keywords = dict(kwargs)
-        bound = {}
-        call_positional = []
-        extra_positional = []
-        extra_keywords = {}
-        for spec in candidate.get("parameters", ()):
-            name = spec["name"]
-            kind = spec.get("kind", "positional_or_keyword")
-            if kind == "var_positional":
-                extra_positional = positional
-                positional = []
-                continue
-            if kind == "var_keyword":
-                extra_keywords = keywords
-                keywords = {}
-                continue
+    def _compile_shape(self, positional_count: int, keywords: frozenset) -> tuple:
+        if self._overloads is None:
+            self._overloads = tuple(
+                (
+                    candidate["id"],
+                    tuple(
+                        (
+                            spec["name"],
+                            spec.get("kind", "positional_or_keyword"),
+                            spec.get("required", True),
+                            spec.get("default"),
+                            _type_check(spec.get("type", "any")),
+                        )
+                        for spec in candidate.get("parameters", ())
+                    ),
+                )
+                for candidate in self.descriptor.get("overloads", ())
+            )
+        plans = []
+        for overload_id, parameters in self._overloads:
+            plan = _plan_overload(parameters, positional_count, keywords)
+            if plan is not None:
+                plans.append((overload_id, *plan))
+        return tuple(plans)
+
+
+def _plan_overload(parameters, positional_count: int, keywords: frozenset):
+    """Return ``(steps, extra_start, extra_keywords)`` or None if the shape cannot bind."""
+    steps = []
+    position = 0
+    remaining = set(keywords)
+    extra_start = None
+    extra_keywords = None
+    for name, kind, required, default, check in parameters:
+        if kind == "var_positional":
+            extra_start = position
+            position = positional_count
+            continue
+        if kind == "var_keyword":
+            extra_keywords = tuple(sorted(remaining))
+            remaining = set()
+            continue
+        positional_only = kind == "positional_only"
+        if kind in {"positional_only", "positional_or_keyword"} and position < positional_count:
+            if name in remaining:
+                return None
+            steps.append((name, _FROM_ARGS, position, check, positional_only))
+            position += 1
+        elif not positional_only and name in remaining:
+            remaining.discard(name)
+            steps.append((name, _FROM_KWARGS, name, check, positional_only))
+        elif not required:
+            steps.append((name, _FROM_DEFAULT, default, None, positional_only))
+        else:
+            return None
+    if position < positional_count or remaining:
+        return None
+    return tuple(steps), extra_start, extra_keywords
+
+
+def _run_plan(steps, extra_start, extra_keywords, args, kwargs):
+    bound = {}
+    call_positional = []
+    for name, source, ref, check, positional_only in steps:
+        if source == _FROM_ARGS:
+            value = args[ref]
+        elif source == _FROM_KWARGS:
+            value = kwargs[ref]
+        else:
+            value = ref
+        if check is not None and source != _FROM_DEFAULT and not check(value):
+            return None
+        if positional_only:
+            call_positional.append(value)
+        else:
+            bound[name] = value
+    extra_positional = list(args[extra_start:]) if extra_start is not None else []
+    if call_positional or extra_positional:
+        bound["__args__"] = call_positional + extra_positional
+    if extra_keywords:
+        bound["__kwargs__"] = {name: kwargs[name] for name in extra_keywords}
+    return bound
 
-            supplied = False
-            if kind in {"positional_only", "positional_or_keyword"} and positional:
-                value = positional.pop(0)
-                supplied = True
-                if name in keywords:
-                    raise TypeError(f"multiple values for argument {name!r}")
-            elif kind != "positional_only" and name in keywords:
-                value = keywords.pop(name)
-                supplied = True
-            elif not spec.get("required", True):
-                value = spec.get("default")
-            else:
-                raise TypeError(f"missing required argument {name!r}")
 
-            if supplied and not _matches_type(value, spec.get("type", "any")):
-                raise TypeError(
-                    f"argument {name!r} must match {spec.get('type')}, "
-                    f"not {type(value).__name__}"
-                )
-            if kind == "positional_only":
-                call_positional.append(value)
-            else:
-                bound[name] = value
+def _overload_binders(schema: dict) -> dict:
+    """One binder per schema method, keyed by descriptor identity."""
+    return {id(descriptor): OverloadBinder(descriptor) for descriptor in schema.get("methods", ())}
 
-        if positional:
-            raise TypeError("too many positional arguments")
-        if keywords:
-            raise TypeError(f"unexpected keyword arguments: {sorted(keywords)}")
-        if call_positional or extra_positional:
-            bound["__args__"] = call_positional + extra_positional
-        if extra_keywords:
-            bound["__kwargs__"] = extra_keywords
-        return bound
+
+def _binder(owner, descriptor) -> OverloadBinder:
+    binder = owner._binders.get(id(descriptor))
+    return binder if binder is not None else OverloadBinder(descriptor)
 
 
 def _apply_mutations(bound, mutations):
@@ -326,8 +450,257 @@ def _apply_mutations(bound, mutations):
             update(snapshot)
 
 
+def _payload_limit(streamer) -> int:
+    return int(
+        streamer._owner._capabilities.get("remote_resource_limits", {}).get(
+            "maximum_sample_payload_bytes",
+            4 * 1024 * 1024,
+        )
+    )
+
+
+def _wire_itemsize(streamer, dtype) -> int:
+    """Bytes one sample of CPU ``dtype`` takes in this streamer's DATA frames."""
+    wire_format = getattr(streamer, "_wire_format", None)
+    return np.dtype(dtype).itemsize if wire_format is None else wire_format.dtype.itemsize
+
+
+def _max_num_samps(streamer) -> int:
+    dtype = _CPU_FORMAT_DTYPES.get(streamer._cpu_format, np.dtype(np.complex64))
+    channels = max(1, len(streamer._channels))
+    payload_samps = _payload_limit(streamer) // (_wire_itemsize(streamer, dtype) * channels)
+    return max(1, min(_REMOTE_STREAM_BATCH_SAMPS, payload_samps))
+
+
+def _recv_arguments(streamer, buffs, args, kwargs):
+    """Parse UHD ``recv()`` arguments into buffer, count, metadata, timeout, one_packet."""
+    buffer = np.asarray(buffs)
+    _validate_sample_array(buffer, operation="RX")
+    if not buffer.flags.writeable:
+        raise ValueError("RX buffer must be writable")
+    if buffer.ndim not in {1, 2}:
+        raise ValueError("RX buffer must be one- or two-dimensional")
+
+    timeout = float(kwargs.pop("timeout", 0.1))
+    one_packet = bool(kwargs.pop("one_packet", False))
+    if kwargs:
+        raise TypeError(f"unexpected keyword arguments: {sorted(kwargs)}")
+    if not args:
+        raise TypeError("recv() missing metadata argument")
+    if isinstance(args[0], numbers.Integral):
+        sample_count = int(args[0])
+        if len(args) < 2:
+            raise TypeError("recv() missing metadata argument")
+        metadata = args[1]
+        if len(args) >= 3:
+            timeout = float(args[2])
+        if len(args) >= 4:
+            one_packet = bool(args[3])
+        if len(args) > 4:
+            raise TypeError("recv() received too many arguments")
+    else:
+        metadata = args[0]
+        sample_count = int(buffer.shape[-1])
+        if len(args) >= 2:
+            timeout = float(args[1])
+        if len(args) >= 3:
+            one_packet = bool(args[2])
+        if len(args) > 3:
+            raise TypeError("recv() received too many arguments")
+    if sample_count < 0 or sample_count > buffer.shape[-1]:
+        raise ValueError("nsamps_per_buff exceeds RX buffer capacity")
+    channels = streamer._channels
+    if buffer.ndim == 2 and channels and buffer.shape[0] != len(channels):
+        raise ValueError("RX channel dimension does not match StreamArgs.channels")
+    requested_shape = list(buffer.shape)
+    requested_shape[-1] = sample_count
+    requested_bytes = int(np.prod(requested_shape)) * _wire_itemsize(streamer, buffer.dtype)
+    maximum = _payload_limit(streamer)
+    if requested_bytes > maximum:
+        raise ValueError(f"RX request exceeds the {maximum}-byte remote limit")
+    return buffer, sample_count, metadata, timeout, one_packet
+
+
+def _update_rx_metadata(metadata, snapshot, count):
+    update = getattr(metadata, "update", None)
+    if not callable(update):
+        raise TypeError("metadata must be a mutable RXMetadata-like object")
+    update(snapshot)
+    return count
+
+
+def _send_arguments(streamer, buffs, args, kwargs):
+    """Parse UHD ``send()`` arguments into samples, count, metadata, timeout, limit."""
+    samples = np.asarray(buffs)
+    _validate_sample_array(samples, operation="TX")
+    if samples.ndim not in {1, 2}:
+        raise ValueError("TX samples must be one- or two-dimensional")
+    timeout = float(kwargs.pop("timeout", 0.1))
+    if kwargs:
+        raise TypeError(f"unexpected keyword arguments: {sorted(kwargs)}")
+    if not args:
+        raise TypeError("send() missing metadata argument")
+    if isinstance(args[0], numbers.Integral):
+        sample_count = int(args[0])
+        if len(args) < 2:
+            raise TypeError("send() missing metadata argument")
+        metadata = args[1]
+        if len(args) >= 3:
+            timeout = float(args[2])
+        if len(args) > 3:
+            raise TypeError("send() received too many arguments")
+    else:
+        metadata = args[0]
+        sample_count = int(samples.shape[-1])
+        if len(args) >= 2:
+            timeout = float(args[1])
+        if len(args) > 2:
+            raise TypeError("send() received too many arguments")
+    if sample_count < 0 or sample_count > samples.shape[-1]:
+        raise ValueError("nsamps_per_buff exceeds TX sample capacity")
+    channels = streamer._channels
+    if samples.ndim == 2 and channels and samples.shape[0] != len(channels):
+        raise ValueError("TX channel dimension does not match StreamArgs.channels")
+    subset = samples[..., :sample_count]
+    # Callers size frames by ``subset.nbytes``, so express the wire limit in
+    # CPU-format bytes: an sc16 frame of fc32 samples fits twice as many.
+    maximum = _payload_limit(streamer) * samples.dtype.itemsize // _wire_itemsize(streamer, samples.dtype)
+    return subset, sample_count, metadata, timeout, maximum
+
+
+def _tx_frame_spans(subset, maximum):
+    """Yield ``(start, end)`` sample spans that each fit in one DATA frame."""
+    sample_count = int(subset.shape[-1])
+    column_bytes = max(1, subset.nbytes // max(1, sample_count))
+    step = max(1, maximum // column_bytes)
+    for start in range(0, sample_count, step):
+        yield start, min(sample_count, start + step)
+
+
+class BatchedResult:
+    """Placeholder returned by a control call queued in a batch."""
+
+    __slots__ = ("method", "_done", "_value", "_error")
+
+    def __init__(self, method: str):
+        self.method = method
+        self._done = False
+        self._value = None
+        self._error = None
+
+    def done(self) -> bool:
+        return self._done
+
+    def result(self):
+        """Return the call's value once the batch was sent, or raise its error."""
+        if not self._done:
+            raise RemoteRFProtocolError(
+                f"{self.method}() is queued; leave the batch block first"
+            )
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+    def _resolve(self, value=None, error=None):
+        self._done = True
+        self._value = value
+        self._error = error
+
+    def __repr__(self):
+        state = "done" if self._done else "queued"
+        return f"<BatchedResult {self.method} {state}>"
+
+
+class InvokeBatch:
+    """Queue control calls on one device session and send them together.
+
+    Calls are bound and type-checked when queued. Leaving the ``with`` block
+    sends them as a single ``InvokeBatch`` request; results and mutations are
+    then applied in call order. The first failing call's error is raised and
+    the calls after it are not run. Nothing is sent if the block raises.
+    """
+
+    def __init__(self, owner):
+        self._owner = owner
+        self._calls = []
+
+    def queue(self, handle: str, descriptor: dict, args, kwargs) -> BatchedResult:
+        overload_id, bound = _binder(self._owner, descriptor).bind(args, kwargs)
+        pending = BatchedResult(descriptor["name"])
+        self._calls.append((handle, descriptor, overload_id, bound, pending))
+        return pending
+
+    def flush(self) -> list:
+        """Send the queued calls now and return their results in order."""
+        calls, self._calls = self._calls, []
+        if not calls:
+            return []
+        owner = self._owner
+        requests = [
+            (handle, descriptor["name"], bound, overload_id)
+            for handle, descriptor, overload_id, bound, _ in calls
+        ]
+        try:
+            invoke_batch = getattr(owner._transport, "invoke_batch", None)
+            if invoke_batch is not None:
+                outcomes = invoke_batch(owner._session_id, requests)
+            else:
+                outcomes = []
+                for handle, method, bound, overload_id in requests:
+                    outcomes.append(
+                        owner._transport.invoke(
+                            owner._session_id,
+                            handle,
+                            method,
+                            bound,
+                            overload_id=overload_id,
+                        )
+                    )
+        except BaseException as exc:
+            for *_, pending in calls:
+                pending._resolve(error=exc)
+            raise
+        error = None
+        results = []
+        for (_, descriptor, _, bound, pending), outcome in zip(calls, outcomes):
+            if isinstance(outcome, BaseException):
+                error = outcome
+                pending._resolve(error=outcome)
+                break
+            result, mutations = outcome
+            _apply_mutations(bound, mutations)
+            value = owner._wrap_result(result, descriptor, bound)
+            pending._resolve(value)
+            results.append(value)
+        for *_, pending in calls[len(results) + (error is not None):]:
+            pending._resolve(
+                error=RemoteRFProtocolError(
+                    "batched call was not run because an earlier call failed"
+                )
+            )
+        if error is not None:
+            raise error
+        return results
+
+    def __enter__(self):
+        if self._owner._batch is not None:
+            raise RemoteRFProtocolError("a control batch is already open")
+        self._owner._ensure_open()
+        self._owner._batch = self
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._owner._batch = None
+        if exc_type is not None:
+            self._calls = []
+            return False
+        self.flush()
+        return False
+
+
 class RemoteHandleProxy:
     _type_id = "remote_handle"
+    _stream_direction = ""
 
     def __init__(self, owner, handle, generation=0):
         self._owner = owner
@@ -339,6 +712,7 @@ class RemoteHandleProxy:
         self._channels = []
         self._cpu_format = "fc32"
         self._sequence = 1
+        self._sample_stream = None
         self._finalizer = weakref.finalize(
             self,
             type(self)._finalize,
@@ -363,7 +737,9 @@ class RemoteHandleProxy:
 
     def _invoke(self, descriptor, args, kwargs):
         self._ensure_open()
-        overload_id, bound = OverloadBinder(descriptor).bind(args, kwargs)
+        if self._owner._batch is not None:
+            return self._owner._batch.queue(self._handle, descriptor, args, kwargs)
+        overload_id, bound = _binder(self._owner, descriptor).bind(args, kwargs)
         result, mutations = self._transport.invoke(
             self._session_id,
             self._handle,
@@ -374,6 +750,32 @@ class RemoteHandleProxy:
         _apply_mutations(bound, mutations)
         return self._owner._wrap_result(result, descriptor, bound)
 
+    def _open_sample_stream(self):
+        """Return this streamer's long-lived sample stream, if supported."""
+        stream = self._sample_stream
+        if stream is not None and not stream.closed:
+            return stream
+        opener = getattr(self._transport, "open_sample_stream", None)
+        if opener is None:
+            return None
+        self._sample_stream = opener(
+            session_id=self._session_id,
+            handle=self._handle,
+            generation=self._generation,
+            direction=self._stream_direction,
+            sequence=self._sequence,
+        )
+        return self._sample_stream
+
+    def _close_sample_stream(self):
+        stream, self._sample_stream = self._sample_stream, None
+        if stream is None:
+            return
+        try:
+            stream.close()
+        except Exception:
+            pass
+
     def as_payload(self):
         self._ensure_open()
         return {
@@ -387,6 +789,7 @@ class RemoteHandleProxy:
             return False
         self._closed = True
         self._finalizer.detach()
+        self._close_sample_stream()
         return self._transport.close_handle(self._session_id, self._handle)
 
     def __enter__(self):
@@ -398,78 +801,142 @@ class RemoteHandleProxy:
         return False
 
 
-class RXStreamer(RemoteHandleProxy):
+class _SampleFrameControls:
+    """Per-streamer DATA-frame encoding shared by sync and async streamers."""
+
+    _compression = None
+    _compression_level = DEFAULT_LEVEL
+    _wire_format = None
+
+    @property
+    def remoterf_wire_format(self):
+        """``"sc16"``/``"sc8"`` when samples travel as scaled integers, else None."""
+        wire_format = self._wire_format
+        return None if wire_format is None else wire_format.name
+
+    @property
+    def remoterf_compression(self):
+        """Codec for this streamer's sample frames, or None when sent raw."""
+        compression = self._compression
+        return None if compression is None else compression.codec
+
+    @remoterf_compression.setter
+    def remoterf_compression(self, value):
+        self._ensure_open()
+        if value is None or value is False or value == "none":
+            self._compression = None
+            return
+        offered = supported_codecs(self._owner._capabilities)
+        if value is True:
+            value = "shuffle-zlib" if "shuffle-zlib" in offered else next(
+                iter(offered), "shuffle-zlib"
+            )
+        if value not in offered:
+            raise ValueError(
+                f"server does not accept {value!r} sample compression"
+                + (f"; it offers {', '.join(offered)}" if offered else "")
+            )
+        self._compression = SampleCompression(value, self._compression_level)
+
+    @property
+    def remoterf_compression_level(self) -> int:
+        """zlib level (1-9) used for TX frames and requested for RX frames."""
+        return self._compression_level
+
+    @remoterf_compression_level.setter
+    def remoterf_compression_level(self, value):
+        level = int(value)
+        if not 1 <= level <= 9:
+            raise ValueError("remoterf_compression_level must be between 1 and 9")
+        self._compression_level = level
+        if self._compression is not None:
+            self._compression.level = level
+
+    @property
+    def remoterf_compression_stats(self):
+        """Sample bytes before and after compression, or None when disabled."""
+        compression = self._compression
+        return None if compression is None else compression.stats()
+
+    def _sample_request(self, **request) -> dict:
+        if self._compression is not None:
+            request["compression"] = self._compression
+        if self._wire_format is not None:
+            request["wire_format"] = self._wire_format
+        return request
+
+
+class RXStreamer(_SampleFrameControls, RemoteHandleProxy):
     _type_id = "uhd.usrp.RXStreamer"
+    _stream_direction = "rx"
+    _credits = 0
+    _prefetch_depth = 0
+    _prefetch = None
+
+    @property
+    def remoterf_prefetch(self) -> int:
+        """RX blocks a background thread may buffer ahead of ``recv()``; 0 disables."""
+        return self._prefetch_depth
+
+    @remoterf_prefetch.setter
+    def remoterf_prefetch(self, value):
+        self._ensure_open()
+        depth = int(value)
+        if depth < 0:
+            raise ValueError("remoterf_prefetch must be non-negative")
+        self._stop_prefetch()
+        self._prefetch_depth = depth
+
+    @property
+    def remoterf_credits(self) -> int:
+        """RX blocks the server may push ahead of ``recv()``; 0 disables."""
+        return self._credits
+
+    @remoterf_credits.setter
+    def remoterf_credits(self, value):
+        self._ensure_open()
+        credits = int(value)
+        if credits < 0:
+            raise ValueError("remoterf_credits must be non-negative")
+        maximum = self._owner._capabilities.get("remote_resource_limits", {}).get(
+            "maximum_sample_credits"
+        )
+        if maximum is not None and credits > int(maximum):
+            raise ValueError(f"remoterf_credits exceeds the server limit of {maximum}")
+        if credits and getattr(self._transport, "open_sample_stream", None) is None:
+            raise ValueError("credit-based RX requires a persistent sample stream")
+        self._stop_prefetch()
+        stream = self._sample_stream
+        if stream is not None and stream.pipelined:
+            stream.stop_rx_pipeline(
+                sequence=self._sequence,
+                timeout=_PIPELINE_CANCEL_TIMEOUT_SEC,
+            )
+            self._sequence += 2
+        self._credits = credits
 
     def get_max_num_samps(self):
         """Return the efficient RemoteRF batch size, bounded by wire limits."""
         self._ensure_open()
-        maximum_bytes = int(
-            self._owner._capabilities.get("remote_resource_limits", {}).get(
-                "maximum_sample_payload_bytes",
-                4 * 1024 * 1024,
-            )
-        )
-        dtype = _CPU_FORMAT_DTYPES.get(self._cpu_format, np.dtype(np.complex64))
-        channels = max(1, len(self._channels))
-        payload_samps = maximum_bytes // (dtype.itemsize * channels)
-        return max(1, min(_REMOTE_STREAM_BATCH_SAMPS, payload_samps))
+        return _max_num_samps(self)
 
     def recv(self, buffs, *args, **kwargs):
         self._ensure_open()
-        buffer = np.asarray(buffs)
-        _validate_sample_array(buffer, operation="RX")
-        if not buffer.flags.writeable:
-            raise ValueError("RX buffer must be writable")
-        if buffer.ndim not in {1, 2}:
-            raise ValueError("RX buffer must be one- or two-dimensional")
-
-        timeout = float(kwargs.pop("timeout", 0.1))
-        one_packet = bool(kwargs.pop("one_packet", False))
-        if kwargs:
-            raise TypeError(f"unexpected keyword arguments: {sorted(kwargs)}")
-        if not args:
-            raise TypeError("recv() missing metadata argument")
-        if isinstance(args[0], numbers.Integral):
-            sample_count = int(args[0])
-            if len(args) < 2:
-                raise TypeError("recv() missing metadata argument")
-            metadata = args[1]
-            if len(args) >= 3:
-                timeout = float(args[2])
-            if len(args) >= 4:
-                one_packet = bool(args[3])
-            if len(args) > 4:
-                raise TypeError("recv() received too many arguments")
+        buffer, sample_count, metadata, timeout, one_packet = _recv_arguments(
+            self, buffs, args, kwargs
+        )
+        if self._prefetch_depth:
+            count, metadata_snapshot = self._recv_prefetched(
+                buffer, sample_count, timeout, one_packet
+            )
         else:
-            metadata = args[0]
-            sample_count = int(buffer.shape[-1])
-            if len(args) >= 2:
-                timeout = float(args[1])
-            if len(args) >= 3:
-                one_packet = bool(args[2])
-            if len(args) > 3:
-                raise TypeError("recv() received too many arguments")
-        if sample_count < 0 or sample_count > buffer.shape[-1]:
-            raise ValueError("nsamps_per_buff exceeds RX buffer capacity")
-        if buffer.ndim == 2 and self._channels and buffer.shape[0] != len(self._channels):
-            raise ValueError("RX channel dimension does not match StreamArgs.channels")
-        requested_shape = list(buffer.shape)
-        requested_shape[-1] = sample_count
-        requested_bytes = int(np.prod(requested_shape)) * buffer.dtype.itemsize
-        maximum = int(
-            self._owner._capabilities.get("remote_resource_limits", {}).get(
-                "maximum_sample_payload_bytes",
-                4 * 1024 * 1024,
+            count, metadata_snapshot = self._receive(
+                buffer, sample_count, timeout, one_packet, metadata
             )
-        )
-        if requested_bytes > maximum:
-            raise ValueError(f"RX request exceeds the {maximum}-byte remote limit")
+        return _update_rx_metadata(metadata, metadata_snapshot, count)
 
-        count, samples, metadata_snapshot = self._transport.recv(
-            session_id=self._session_id,
-            handle=self._handle,
-            generation=self._generation,
+    def _receive(self, buffer, sample_count, timeout, one_packet, metadata):
+        request = self._sample_request(
             sequence=self._sequence,
             buffer=buffer,
             sample_count=sample_count,
@@ -478,121 +945,272 @@ class RXStreamer(RemoteHandleProxy):
             one_packet=one_packet,
             metadata=metadata,
         )
-        self._sequence += 2
-        if buffer.ndim == 1:
+        stream = self._open_sample_stream()
+        if self._credits:
+            if not stream.pipelined:
+                stream.start_rx_pipeline(credits=self._credits, **request)
+                self._sequence += 2
+            count, samples, metadata_snapshot = stream.recv_pipelined(
+                buffer=buffer,
+                sample_count=sample_count,
+                timeout=timeout,
+            )
+        elif stream is None:
+            count, samples, metadata_snapshot = self._transport.recv(
+                session_id=self._session_id,
+                handle=self._handle,
+                generation=self._generation,
+                **request,
+            )
+            self._sequence += 2
+        else:
+            count, samples, metadata_snapshot = stream.recv(**request)
+            self._sequence += 2
+        if np.may_share_memory(samples, buffer):
+            pass  # the transport already decoded straight into ``buffer``
+        elif buffer.ndim == 1:
             buffer[:count] = samples[:count]
         else:
             buffer[:, :count] = samples[:, :count]
-        update = getattr(metadata, "update", None)
-        if not callable(update):
-            raise TypeError("metadata must be a mutable RXMetadata-like object")
-        update(metadata_snapshot)
-        return count
+        return count, metadata_snapshot
+
+    def _recv_prefetched(self, buffer, sample_count, timeout, one_packet):
+        ring = self._prefetch
+        if ring is None:
+            ring = self._prefetch = _RXPrefetchRing(
+                self,
+                depth=self._prefetch_depth,
+                buffer=buffer,
+                sample_count=sample_count,
+                timeout=timeout,
+                one_packet=one_packet,
+            )
+        return ring.take(buffer, sample_count, timeout)
+
+    def _stop_prefetch(self):
+        ring, self._prefetch = self._prefetch, None
+        if ring is not None:
+            ring.stop()
 
+    def close(self):
+        self._stop_prefetch()
+        return super().close()
+
+
+class _RXPrefetchRing:
+    """Background receiver filling a preallocated ring of RX blocks.
+
+    The ring holds ``depth`` blocks shaped like the ``recv()`` call that
+    started it, plus one spare slot the thread receives into. When the
+    reader falls behind, the oldest block is dropped and the next ``recv()``
+    reports ``overflow`` with no samples, as UHD does.
+    """
+
+    def __init__(self, streamer, *, depth, buffer, sample_count, timeout, one_packet):
+        shape = buffer.shape[:-1] + (int(sample_count),)
+        self._blocks = np.empty((int(depth) + 1,) + shape, dtype=buffer.dtype)
+        self._counts = [0] * len(self._blocks)
+        self._metadata = [None] * len(self._blocks)
+        self._depth = int(depth)
+        self._head = 0
+        self._size = 0
+        self._offset = 0
+        self._overflow = False
+        self._error = None
+        self._stopped = False
+        self._ready = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(weakref.ref(streamer), float(timeout), bool(one_packet)),
+            name="remoterf-rx-prefetch",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _run(self, streamer_ref, timeout, one_packet):
+        slots = len(self._blocks)
+        while True:
+            with self._ready:
+                if self._stopped:
+                    return
+                slot = (self._head + self._size) % slots
+            streamer = streamer_ref()
+            if streamer is None:
+                return
+            try:
+                count, snapshot = streamer._receive(
+                    self._blocks[slot],
+                    self._blocks.shape[-1],
+                    timeout,
+                    one_packet,
+                    uhd_v2.RXMetadata(),
+                )
+            except BaseException as exc:
+                with self._ready:
+                    self._error = exc
+                    self._ready.notify_all()
+                return
+            finally:
+                del streamer
+            if not count and snapshot.get("error_code", "none") == "timeout":
+                continue
+            with self._ready:
+                if self._stopped:
+                    return
+                if self._size == self._depth:
+                    self._head = (self._head + 1) % slots
+                    self._size -= 1
+                    self._offset = 0
+                    self._overflow = True
+                self._counts[slot] = count
+                self._metadata[slot] = snapshot
+                self._size += 1
+                self._ready.notify_all()
+
+    def take(self, buffer, sample_count, timeout):
+        """Copy the next buffered samples into ``buffer``; never touches the network."""
+        if (
+            buffer.dtype != self._blocks.dtype
+            or buffer.shape[:-1] != self._blocks.shape[1:-1]
+        ):
+            raise ValueError(
+                "RX buffer dtype/channel layout does not match the "
+                "running prefetch ring"
+            )
+        deadline = time.monotonic() + max(0.0, float(timeout))
+        with self._ready:
+            while not self._size and not self._overflow and self._error is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return 0, {"error_code": "timeout", "error_code_repr": "timeout"}
+                self._ready.wait(remaining)
+            if self._overflow:
+                self._overflow = False
+                return 0, {"error_code": "overflow", "error_code_repr": "overflow"}
+            if not self._size:
+                raise self._error
+            slot = self._head
+            count = self._counts[slot]
+            offset = self._offset
+            end = min(count, offset + max(0, int(sample_count)))
+            buffer[..., :end - offset] = self._blocks[slot][..., offset:end]
+            fragment = dict(self._metadata[slot])
+            if offset or end < count:
+                fragment["more_fragments"] = end < count
+                fragment["fragment_offset"] = offset
+            if end < count:
+                self._offset = end
+            else:
+                self._head = (self._head + 1) % len(self._blocks)
+                self._size -= 1
+                self._offset = 0
+            return end - offset, fragment
 
-class TXStreamer(RemoteHandleProxy):
+    def stop(self):
+        with self._ready:
+            self._stopped = True
+            self._ready.notify_all()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+
+
+class TXStreamer(_SampleFrameControls, RemoteHandleProxy):
     _type_id = "uhd.usrp.TXStreamer"
+    _stream_direction = "tx"
 
     def get_max_num_samps(self):
         """Return the efficient RemoteRF batch size, bounded by wire limits."""
         self._ensure_open()
-        maximum_bytes = int(
-            self._owner._capabilities.get("remote_resource_limits", {}).get(
-                "maximum_sample_payload_bytes",
-                4 * 1024 * 1024,
-            )
-        )
-        dtype = _CPU_FORMAT_DTYPES.get(self._cpu_format, np.dtype(np.complex64))
-        channels = max(1, len(self._channels))
-        payload_samps = maximum_bytes // (dtype.itemsize * channels)
-        return max(1, min(_REMOTE_STREAM_BATCH_SAMPS, payload_samps))
+        return _max_num_samps(self)
 
     def send(self, buffs, *args, **kwargs):
         self._ensure_open()
-        samples = np.asarray(buffs)
-        _validate_sample_array(samples, operation="TX")
-        if samples.ndim not in {1, 2}:
-            raise ValueError("TX samples must be one- or two-dimensional")
-        timeout = float(kwargs.pop("timeout", 0.1))
-        if kwargs:
-            raise TypeError(f"unexpected keyword arguments: {sorted(kwargs)}")
-        if not args:
-            raise TypeError("send() missing metadata argument")
-        if isinstance(args[0], numbers.Integral):
-            sample_count = int(args[0])
-            if len(args) < 2:
-                raise TypeError("send() missing metadata argument")
-            metadata = args[1]
-            if len(args) >= 3:
-                timeout = float(args[2])
-            if len(args) > 3:
-                raise TypeError("send() received too many arguments")
-        else:
-            metadata = args[0]
-            sample_count = int(samples.shape[-1])
-            if len(args) >= 2:
-                timeout = float(args[1])
-            if len(args) > 2:
-                raise TypeError("send() received too many arguments")
-        if sample_count < 0 or sample_count > samples.shape[-1]:
-            raise ValueError("nsamps_per_buff exceeds TX sample capacity")
-        if samples.ndim == 2 and self._channels and samples.shape[0] != len(self._channels):
-            raise ValueError("TX channel dimension does not match StreamArgs.channels")
-        subset = samples[..., :sample_count]
-        maximum = int(
-            self._owner._capabilities.get("remote_resource_limits", {}).get(
-                "maximum_sample_payload_bytes",
-                4 * 1024 * 1024,
-            )
+        subset, sample_count, metadata, timeout, maximum = _send_arguments(
+            self, buffs, args, kwargs
         )
-        if subset.nbytes > maximum:
+        stream = self._open_sample_stream()
+        if subset.nbytes <= maximum:
+            return self._send_frame(stream, subset, metadata, timeout)
+        if stream is None:
             raise ValueError(f"TX request exceeds the {maximum}-byte remote limit")
-        count = self._transport.send(
-            session_id=self._session_id,
-            handle=self._handle,
-            generation=self._generation,
+        # Larger bursts go out as several DATA frames on the persistent
+        # stream. Each frame is a view into ``samples``; only the first
+        # carries the time spec/start of burst and only the last ends it.
+        sent = 0
+        for start, end in _tx_frame_spans(subset, maximum):
+            count = self._send_frame(
+                stream,
+                subset[..., start:end],
+                _tx_fragment_metadata(
+                    metadata,
+                    first=start == 0,
+                    last=end == sample_count,
+                ),
+                timeout,
+            )
+            sent += count
+            if count < end - start:
+                break
+        return sent
+
+    def _send_frame(self, stream, samples, metadata, timeout):
+        request = self._sample_request(
             sequence=self._sequence,
-            samples=subset,
+            samples=samples,
             channels=self._channels,
             timeout=timeout,
             metadata=metadata,
         )
+        if stream is None:
+            count = self._transport.send(
+                session_id=self._session_id,
+                handle=self._handle,
+                generation=self._generation,
+                **request,
+            )
+        else:
+            count = stream.send(**request)
         self._sequence += 2
         return count
 
 
+def _generic_descriptor(type_id: str, name: str) -> dict:
+    """Descriptor for a handle method the schema does not describe."""
+    return {
+        "owner": type_id,
+        "name": name,
+        "execution": "server_handle",
+        "mutations": [],
+        "overloads": [
+            {
+                "id": "native",
+                "parameters": [
+                    {
+                        "name": "args",
+                        "type": "list",
+                        "kind": "var_positional",
+                        "direction": "in",
+                        "required": True,
+                    },
+                    {
+                        "name": "kwargs",
+                        "type": "dict",
+                        "kind": "var_keyword",
+                        "direction": "in",
+                        "required": True,
+                    },
+                ],
+                "returns": "any",
+            }
+        ],
+    }
+
+
 class GenericRemoteHandle(RemoteHandleProxy):
     def __getattr__(self, name):
         if name.startswith("_"):
             raise AttributeError(name)
-        descriptor = {
-            "owner": self._type_id,
-            "name": name,
-            "execution": "server_handle",
-            "mutations": [],
-            "overloads": [
-                {
-                    "id": "native",
-                    "parameters": [
-                        {
-                            "name": "args",
-                            "type": "list",
-                            "kind": "var_positional",
-                            "direction": "in",
-                            "required": True,
-                        },
-                        {
-                            "name": "kwargs",
-                            "type": "dict",
-                            "kind": "var_keyword",
-                            "direction": "in",
-                            "required": True,
-                        },
-                    ],
-                    "returns": "any",
-                }
-            ],
-        }
+        descriptor = _generic_descriptor(self._type_id, name)
 
         def invoke(*args, **kwargs):
             return self._invoke(descriptor, args, kwargs)
@@ -601,8 +1219,7 @@ class GenericRemoteHandle(RemoteHandleProxy):
         return invoke
 
 
-def _method_impl(descriptor):
-    @functools.wraps(_method_impl)
+def _method_impl(descriptor, signature=None):
     def generated(self, *args, **kwargs):
         return self._invoke(descriptor, args, kwargs)
 
@@ -612,7 +1229,7 @@ def _method_impl(descriptor):
         f"Remote {descriptor['owner']}.{descriptor['name']} "
         f"({descriptor['execution']})."
     )
-    generated.__text_signature__ = _text_signature(descriptor)
+    generated.__text_signature__ = signature or _text_signature(descriptor)
     return generated
 
 
@@ -665,12 +1282,43 @@ def _assign_path(root, dotted_path, value):
     setattr(target, parts[-1], value)
 
 
-def build_uhd_bindings(schema: dict, *, transport_factory=DynamicV2Transport):
+def precompile_bindings(schema: dict) -> dict:
+    """Validate ``schema`` and precompute what ``build_uhd_bindings`` derives.
+
+    Generated driver modules embed the result next to ``_SCHEMA`` so that
+    importing them skips validation and signature rendering.
+    """
     validate_schema_v2(schema)
-    method_descriptors = list(schema.get("methods", ()))
-    by_owner = {}
-    for descriptor in method_descriptors:
-        by_owner.setdefault(descriptor["owner"], []).append(descriptor)
+    return {
+        "format": _PRECOMPILED_FORMAT,
+        "schema_hash": schema["schema_hash"],
+        "signatures": {
+            f"{descriptor['owner']}.{descriptor['name']}": _text_signature(descriptor)
+            for descriptor in schema.get("methods", ())
+            if descriptor["execution"] != "sample_stream"
+        },
+    }
+
+
+def build_uhd_bindings(
+    schema: dict,
+    *,
+    transport_factory=DynamicV2Transport,
+    precompiled: dict | None = None,
+):
+    """Build the ``uhd`` namespace and device class for a v2 schema.
+
+    ``precompiled`` is the output of :func:`precompile_bindings` for the same
+    ``schema_hash``; anything else falls back to validating ``schema`` here.
+    """
+    if (
+        not precompiled
+        or precompiled.get("format") != _PRECOMPILED_FORMAT
+        or precompiled.get("schema_hash") != schema.get("schema_hash")
+    ):
+        validate_schema_v2(schema)
+        precompiled = {}
+    signatures = precompiled.get("signatures", {})
     generated_handle_classes = {}
 
     class MultiUSRP:
@@ -679,28 +1327,19 @@ def build_uhd_bindings(schema: dict, *, transport_factory=DynamicV2Transport):
             self._transport = transport_factory()
             self._transport.negotiate()
             opened = self._transport.open_session(self.token, schema["schema_hash"])
-            required_uhd = str(
-                schema.get("native_api", {}).get("version") or ""
-            )
-            actual_uhd = str(opened.get("uhd_version") or "")
-            if (
-                required_uhd
-                and _canonical_native_version(actual_uhd)
-                != _canonical_native_version(required_uhd)
-            ):
+            mismatch = _native_version_mismatch(schema, opened)
+            if mismatch:
                 try:
                     self._transport.close_session(opened["session_id"])
                 finally:
-                    raise RemoteRFProtocolError(
-                        f"client requires UHD {required_uhd}; "
-                        f"server reports {actual_uhd or 'unknown'}"
-                    )
+                    raise RemoteRFProtocolError(mismatch)
             self._session_id = opened["session_id"]
             self._handle = opened["device_handle"]
             self._generation = 0
             self._closed = False
+            self._batch = None
             self._capabilities = opened["capabilities"]
-            self._schema = opened["schema"]
+            self._schema = opened["schema"] or schema
             self._handle_classes = {
                 "uhd.usrp.RXStreamer": RXStreamer,
                 "uhd.usrp.TXStreamer": TXStreamer,
@@ -724,13 +1363,19 @@ def build_uhd_bindings(schema: dict, *, transport_factory=DynamicV2Transport):
         def remoterf_capabilities(self):
             return dict(self._capabilities)
 
+        def remoterf_batch(self):
+            """Queue control calls made in a ``with`` block into one round trip."""
+            return InvokeBatch(self)
+
         def _ensure_open(self):
             if self._closed:
                 raise RemoteRFProtocolError("USRP device session is closed")
 
         def _invoke(self, descriptor, args, kwargs):
             self._ensure_open()
-            overload_id, bound = OverloadBinder(descriptor).bind(args, kwargs)
+            if self._batch is not None:
+                return self._batch.queue(self._handle, descriptor, args, kwargs)
+            overload_id, bound = _binder(self, descriptor).bind(args, kwargs)
             result, mutations = self._transport.invoke(
                 self._session_id,
                 self._handle,
@@ -742,24 +1387,7 @@ def build_uhd_bindings(schema: dict, *, transport_factory=DynamicV2Transport):
             return self._wrap_result(result, descriptor, bound)
 
         def _wrap_result(self, result, descriptor, bound):
-            if isinstance(result, dict) and "__remoterf_handle__" in result:
-                type_id = result["__remoterf_type__"]
-                cls = self._handle_classes.get(type_id, GenericRemoteHandle)
-                proxy = cls(
-                    self,
-                    result["__remoterf_handle__"],
-                    result.get("generation", 0),
-                )
-                stream_args = bound.get("stream_args")
-                if stream_args is None and bound.get("__args__"):
-                    stream_args = bound["__args__"][0]
-                if stream_args is not None:
-                    proxy._channels = list(getattr(stream_args, "channels", ()) or ())
-                    proxy._cpu_format = str(
-                        getattr(stream_args, "cpu_format", "fc32") or "fc32"
-                    ).lower()
-                return proxy
-            return uhd_v2.decode_snapshot(result)
+            return _wrap_result(self, result, bound, GenericRemoteHandle)
 
         def close(self):
             if self._closed:
@@ -784,7 +1412,79 @@ def build_uhd_bindings(schema: dict, *, transport_factory=DynamicV2Transport):
     MultiUSRP.__name__ = str(schema.get("client_class") or "MultiUSRP")
     MultiUSRP.__qualname__ = MultiUSRP.__name__
     MultiUSRP.__init__.__text_signature__ = "($self, /, token)"
+    MultiUSRP._binders = _overload_binders(schema)
 
+    generated_handle_classes.update(
+        _generated_handle_classes(schema, GenericRemoteHandle)
+    )
+    _attach_methods(
+        schema,
+        {
+            "uhd.usrp.MultiUSRP": MultiUSRP,
+            "uhd.usrp.RXStreamer": RXStreamer,
+            "uhd.usrp.TXStreamer": TXStreamer,
+            **generated_handle_classes,
+        },
+        lambda descriptor: _method_impl(
+            descriptor,
+            signatures.get(f"{descriptor['owner']}.{descriptor['name']}"),
+        ),
+    )
+    uhd = _uhd_namespace(
+        schema,
+        multi_usrp=MultiUSRP,
+        rx_streamer=RXStreamer,
+        tx_streamer=TXStreamer,
+        handle_classes=generated_handle_classes,
+    )
+    return uhd, MultiUSRP
+
+
+def _native_version_mismatch(schema: dict, opened: dict) -> str:
+    """Return why an opened session's UHD build does not fit ``schema``, or ""."""
+    required_uhd = str(schema.get("native_api", {}).get("version") or "")
+    actual_uhd = str(opened.get("uhd_version") or "")
+    if (
+        required_uhd
+        and _canonical_native_version(actual_uhd)
+        != _canonical_native_version(required_uhd)
+    ):
+        return (
+            f"client requires UHD {required_uhd}; "
+            f"server reports {actual_uhd or 'unknown'}"
+        )
+    return ""
+
+
+def _wrap_result(owner, result, bound, generic_class):
+    if isinstance(result, dict) and "__remoterf_handle__" in result:
+        type_id = result["__remoterf_type__"]
+        cls = owner._handle_classes.get(type_id, generic_class)
+        proxy = cls(
+            owner,
+            result["__remoterf_handle__"],
+            result.get("generation", 0),
+        )
+        stream_args = bound.get("stream_args")
+        if stream_args is None and bound.get("__args__"):
+            stream_args = bound["__args__"][0]
+        if stream_args is not None:
+            proxy._channels = list(getattr(stream_args, "channels", ()) or ())
+            proxy._cpu_format = str(
+                getattr(stream_args, "cpu_format", "fc32") or "fc32"
+            ).lower()
+            proxy._wire_format = narrow_wire_format(
+                proxy._cpu_format,
+                getattr(stream_args, "otw_format", ""),
+                owner._capabilities,
+                getattr(stream_args, "args", None),
+            )
+        return proxy
+    return uhd_v2.decode_snapshot(result)
+
+
+def _generated_handle_classes(schema: dict, base) -> dict:
+    classes = {}
     for object_descriptor in schema.get("objects", ()):
         path = str(object_descriptor.get("python_path") or "")
         if (
@@ -795,34 +1495,32 @@ def build_uhd_bindings(schema: dict, *, transport_factory=DynamicV2Transport):
                 "uhd.usrp.TXStreamer",
             }
         ):
-            generated_handle_classes[path] = type(
+            classes[path] = type(
                 path.replace(".", "_"),
-                (GenericRemoteHandle,),
+                (base,),
                 {"_type_id": path},
             )
+    return classes
 
-    owner_classes = {
-        "uhd.usrp.MultiUSRP": MultiUSRP,
-        "uhd.usrp.RXStreamer": RXStreamer,
-        "uhd.usrp.TXStreamer": TXStreamer,
-        **generated_handle_classes,
-    }
-    for owner, descriptors in by_owner.items():
-        cls = owner_classes.get(owner)
+
+def _attach_methods(schema: dict, owner_classes: dict, method_impl):
+    for descriptor in schema.get("methods", ()):
+        cls = owner_classes.get(descriptor["owner"])
         if cls is None:
             continue
-        for descriptor in descriptors:
-            if descriptor["execution"] == "sample_stream":
-                continue
-            if hasattr(cls, descriptor["name"]):
-                continue
-            setattr(cls, descriptor["name"], _method_impl(descriptor))
+        if descriptor["execution"] == "sample_stream":
+            continue
+        if hasattr(cls, descriptor["name"]):
+            continue
+        setattr(cls, descriptor["name"], method_impl(descriptor))
 
+
+def _uhd_namespace(schema, *, multi_usrp, rx_streamer, tx_streamer, handle_classes):
     uhd = types.ModuleType("uhd")
     uhd.usrp = types.SimpleNamespace(
-        MultiUSRP=MultiUSRP,
-        RXStreamer=RXStreamer,
-        TXStreamer=TXStreamer,
+        MultiUSRP=multi_usrp,
+        RXStreamer=rx_streamer,
+        TXStreamer=tx_streamer,
         StreamArgs=uhd_v2.StreamArgs,
         SubdevSpec=uhd_v2.SubdevSpec,
         SubdevSpecPair=uhd_v2.SubdevSpecPair,
@@ -870,7 +1568,7 @@ def build_uhd_bindings(schema: dict, *, transport_factory=DynamicV2Transport):
 
     for object_descriptor in schema.get("objects", ()):
         path = object_descriptor.get("python_path", "")
-        handle_class = generated_handle_classes.get(path)
+        handle_class = handle_classes.get(path)
         if handle_class is not None:
             _assign_path(uhd, path, handle_class)
         codec = object_descriptor.get("codec")
@@ -879,7 +1577,7 @@ def build_uhd_bindings(schema: dict, *, transport_factory=DynamicV2Transport):
             _assign_path(uhd, path, cls)
             for alias in object_descriptor.get("aliases", ()):
                 _assign_path(uhd, alias, cls)
-    return uhd, MultiUSRP
+    return uhd
 
 
 def render_stub(schema: dict) -> str:
@@ -0,0 +1,386 @@
+# Copyright (C) 2026 RemoteRF
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""asyncio flavour of the Dynamic IDL v2 UHD bindings.
+
+``build_async_uhd_bindings`` mirrors ``build_uhd_bindings`` but every remote
+call is a coroutine, so one event loop can drive several reserved radios::
+
+    uhd, AsyncMultiUSRP = build_async_uhd_bindings(schema)
+    async with AsyncMultiUSRP(token) as usrp:
+        await usrp.set_rx_freq(uhd.types.TuneRequest(2.4e9), 0)
+        rx = await usrp.get_rx_stream(uhd.usrp.StreamArgs("fc32", "sc16"))
+        await rx.recv(buffer, metadata, 0.5)
+
+Schema validation, overload binding and the value codec are shared with the
+synchronous runtime. Handles have no garbage-collection finalizer because a
+finalizer cannot await; close them (or the session) explicitly.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from ..core.dynamic_v2_aio import AsyncDynamicV2Transport
+from ..core.v2_errors import RemoteRFProtocolError
+from .dynamic_v2 import (
+    _SampleFrameControls,
+    _apply_mutations,
+    _attach_methods,
+    _binder,
+    _generated_handle_classes,
+    _generic_descriptor,
+    _max_num_samps,
+    _native_version_mismatch,
+    _overload_binders,
+    _recv_arguments,
+    _send_arguments,
+    _text_signature,
+    _tx_fragment_metadata,
+    _tx_frame_spans,
+    _uhd_namespace,
+    _update_rx_metadata,
+    _wrap_result,
+    validate_schema_v2,
+)
+
+
+class AsyncRemoteHandleProxy:
+    _type_id = "remote_handle"
+    _stream_direction = ""
+
+    def __init__(self, owner, handle, generation=0):
+        self._owner = owner
+        self._transport = owner._transport
+        self._session_id = owner._session_id
+        self._handle = str(handle)
+        self._generation = int(generation)
+        self._closed = False
+        self._channels = []
+        self._cpu_format = "fc32"
+        self._sequence = 1
+        self._sample_stream = None
+
+    def _ensure_open(self):
+        if self._closed or self._owner._closed:
+            raise RemoteRFProtocolError("remote handle is closed or stale")
+
+    async def _invoke(self, descriptor, args, kwargs):
+        self._ensure_open()
+        overload_id, bound = _binder(self._owner, descriptor).bind(args, kwargs)
+        result, mutations = await self._transport.invoke(
+            self._session_id,
+            self._handle,
+            descriptor["name"],
+            bound,
+            overload_id=overload_id,
+        )
+        _apply_mutations(bound, mutations)
+        return self._owner._wrap_result(result, descriptor, bound)
+
+    def _open_sample_stream(self):
+        """Return this streamer's long-lived sample stream, if supported."""
+        stream = self._sample_stream
+        if stream is not None and not stream.closed:
+            return stream
+        opener = getattr(self._transport, "open_sample_stream", None)
+        if opener is None:
+            return None
+        self._sample_stream = opener(
+            session_id=self._session_id,
+            handle=self._handle,
+            generation=self._generation,
+            direction=self._stream_direction,
+            sequence=self._sequence,
+        )
+        return self._sample_stream
+
+    async def _close_sample_stream(self):
+        stream, self._sample_stream = self._sample_stream, None
+        if stream is None:
+            return
+        try:
+            await stream.close()
+        except Exception:
+            pass
+
+    def as_payload(self):
+        self._ensure_open()
+        return {
+            "__remoterf_handle_arg__": self._handle,
+            "type_id": self._type_id,
+            "generation": self._generation,
+        }
+
+    async def close(self):
+        if self._closed:
+            return False
+        self._closed = True
+        await self._close_sample_stream()
+        return await self._transport.close_handle(self._session_id, self._handle)
+
+    async def __aenter__(self):
+        self._ensure_open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+        return False
+
+
+class AsyncRXStreamer(_SampleFrameControls, AsyncRemoteHandleProxy):
+    _type_id = "uhd.usrp.RXStreamer"
+    _stream_direction = "rx"
+
+    def get_max_num_samps(self):
+        """Return the efficient RemoteRF batch size, bounded by wire limits."""
+        self._ensure_open()
+        return _max_num_samps(self)
+
+    async def recv(self, buffs, *args, **kwargs):
+        self._ensure_open()
+        buffer, sample_count, metadata, timeout, one_packet = _recv_arguments(
+            self, buffs, args, kwargs
+        )
+        request = self._sample_request(
+            sequence=self._sequence,
+            buffer=buffer,
+            sample_count=sample_count,
+            channels=self._channels,
+            timeout=timeout,
+            one_packet=one_packet,
+            metadata=metadata,
+        )
+        stream = self._open_sample_stream()
+        if stream is None:
+            count, samples, metadata_snapshot = await self._transport.recv(
+                session_id=self._session_id,
+                handle=self._handle,
+                generation=self._generation,
+                **request,
+            )
+        else:
+            count, samples, metadata_snapshot = await stream.recv(**request)
+        self._sequence += 2
+        if not np.may_share_memory(samples, buffer):
+            buffer[..., :count] = samples[..., :count]
+        return _update_rx_metadata(metadata, metadata_snapshot, count)
+
+
+class AsyncTXStreamer(_SampleFrameControls, AsyncRemoteHandleProxy):
+    _type_id = "uhd.usrp.TXStreamer"
+    _stream_direction = "tx"
+
+    def get_max_num_samps(self):
+        """Return the efficient RemoteRF batch size, bounded by wire limits."""
+        self._ensure_open()
+        return _max_num_samps(self)
+
+    async def send(self, buffs, *args, **kwargs):
+        self._ensure_open()
+        subset, sample_count, metadata, timeout, maximum = _send_arguments(
+            self, buffs, args, kwargs
+        )
+        stream = self._open_sample_stream()
+        if subset.nbytes <= maximum:
+            return await self._send_frame(stream, subset, metadata, timeout)
+        if stream is None:
+            raise ValueError(f"TX request exceeds the {maximum}-byte remote limit")
+        sent = 0
+        for start, end in _tx_frame_spans(subset, maximum):
+            count = await self._send_frame(
+                stream,
+                subset[..., start:end],
+                _tx_fragment_metadata(
+                    metadata,
+                    first=start == 0,
+                    last=end == sample_count,
+                ),
+                timeout,
+            )
+            sent += count
+            if count < end - start:
+                break
+        return sent
+
+    async def _send_frame(self, stream, samples, metadata, timeout):
+        request = self._sample_request(
+            sequence=self._sequence,
+            samples=samples,
+            channels=self._channels,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        if stream is None:
+            count = await self._transport.send(
+                session_id=self._session_id,
+                handle=self._handle,
+                generation=self._generation,
+                **request,
+            )
+        else:
+            count = await stream.send(**request)
+        self._sequence += 2
+        return count
+
+
+class AsyncGenericRemoteHandle(AsyncRemoteHandleProxy):
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        descriptor = _generic_descriptor(self._type_id, name)
+
+        async def invoke(*args, **kwargs):
+            return await self._invoke(descriptor, args, kwargs)
+
+        invoke.__name__ = name
+        return invoke
+
+
+def _async_method_impl(descriptor):
+    async def generated(self, *args, **kwargs):
+        return await self._invoke(descriptor, args, kwargs)
+
+    generated.__name__ = descriptor["name"]
+    generated.__qualname__ = descriptor["name"]
+    generated.__doc__ = descriptor.get("doc") or (
+        f"Remote {descriptor['owner']}.{descriptor['name']} "
+        f"({descriptor['execution']})."
+    )
+    generated.__text_signature__ = _text_signature(descriptor)
+    return generated
+
+
+def build_async_uhd_bindings(
+    schema: dict,
+    *,
+    transport_factory=AsyncDynamicV2Transport,
+):
+    validate_schema_v2(schema)
+    generated_handle_classes = {}
+
+    class AsyncMultiUSRP:
+        """Remote MultiUSRP session; ``await`` it or use ``async with`` to open."""
+
+        def __init__(self, token: str):
+            self.token = str(token)
+            self._transport = transport_factory()
+            self._closed = True
+            self._opened = False
+
+        async def open(self):
+            if self._opened:
+                return self
+            await self._transport.negotiate()
+            opened = await self._transport.open_session(
+                self.token, schema["schema_hash"]
+            )
+            mismatch = _native_version_mismatch(schema, opened)
+            if mismatch:
+                try:
+                    await self._transport.close_session(opened["session_id"])
+                finally:
+                    raise RemoteRFProtocolError(mismatch)
+            self._session_id = opened["session_id"]
+            self._handle = opened["device_handle"]
+            self._generation = 0
+            self._capabilities = opened["capabilities"]
+            self._schema = opened["schema"] or schema
+            self._handle_classes = {
+                "uhd.usrp.RXStreamer": AsyncRXStreamer,
+                "uhd.usrp.TXStreamer": AsyncTXStreamer,
+                **generated_handle_classes,
+            }
+            self._opened = True
+            self._closed = False
+            return self
+
+        def __await__(self):
+            return self.open().__await__()
+
+        @property
+        def remoterf_capabilities(self):
+            return dict(self._capabilities)
+
+        def _ensure_open(self):
+            if self._closed:
+                raise RemoteRFProtocolError("USRP device session is closed")
+
+        async def _invoke(self, descriptor, args, kwargs):
+            self._ensure_open()
+            overload_id, bound = _binder(self, descriptor).bind(args, kwargs)
+            result, mutations = await self._transport.invoke(
+                self._session_id,
+                self._handle,
+                descriptor["name"],
+                bound,
+                overload_id=overload_id,
+            )
+            _apply_mutations(bound, mutations)
+            return self._wrap_result(result, descriptor, bound)
+
+        def _wrap_result(self, result, descriptor, bound):
+            return _wrap_result(self, result, bound, AsyncGenericRemoteHandle)
+
+        async def close(self):
+            if self._closed:
+                return False
+            self._closed = True
+            try:
+                return await self._transport.close_session(self._session_id)
+            finally:
+                close_transport = getattr(self._transport, "close", None)
+                if close_transport is not None:
+                    await close_transport()
+
+        async def __aenter__(self):
+            return await self.open()
+
+        async def __aexit__(self, exc_type, exc, tb):
+            await self.close()
+            return False
+
+        def __repr__(self):
+            state = "closed" if self._closed else "open"
+            profile = (
+                getattr(self, "_capabilities", {}).get("hardware_profile", "usrp")
+            )
+            return f"<RemoteRF {profile} AsyncMultiUSRP session={state}>"
+
+    AsyncMultiUSRP.__name__ = "Async" + str(schema.get("client_class") or "MultiUSRP")
+    AsyncMultiUSRP.__qualname__ = AsyncMultiUSRP.__name__
+    AsyncMultiUSRP.__init__.__text_signature__ = "($self, /, token)"
+    AsyncMultiUSRP._binders = _overload_binders(schema)
+
+    generated_handle_classes.update(
+        _generated_handle_classes(schema, AsyncGenericRemoteHandle)
+    )
+    _attach_methods(
+        schema,
+        {
+            "uhd.usrp.MultiUSRP": AsyncMultiUSRP,
+            "uhd.usrp.RXStreamer": AsyncRXStreamer,
+            "uhd.usrp.TXStreamer": AsyncTXStreamer,
+            **generated_handle_classes,
+        },
+        _async_method_impl,
+    )
+    uhd = _uhd_namespace(
+        schema,
+        multi_usrp=AsyncMultiUSRP,
+        rx_streamer=AsyncRXStreamer,
+        tx_streamer=AsyncTXStreamer,
+        handle_classes=generated_handle_classes,
+    )
+    return uhd, AsyncMultiUSRP
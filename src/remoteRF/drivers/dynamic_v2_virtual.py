@@ -0,0 +1,604 @@
+# Copyright (C) 2026 RemoteRF
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Offline stand-in for a reserved USRP behind the Dynamic v2 bindings.
+
+:class:`VirtualDynamicV2Transport` answers the calls ``build_uhd_bindings``
+makes of ``DynamicV2Transport`` without a server, reservation or hardware::
+
+    uhd, MultiUSRP = build_virtual_uhd_bindings(stream_latency_sec=0.002)
+    usrp = MultiUSRP("virtual")
+    usrp.set_rx_rate(10e6)
+    rx = usrp.get_rx_stream(uhd.usrp.StreamArgs("fc32", "sc16"))
+    rx.issue_stream_cmd(uhd.types.StreamCMD(uhd.types.StreamMode.start_cont))
+    rx.recv(buffer, metadata, 0.5)
+
+Settings are kept per session and read back by the matching getters; other
+getters answer a plausible default for their schema return type. RX streams
+deliver zero-filled (or ``rx_source``) samples paced at the configured sample
+rate and report ``overflow`` when the reader falls behind. TX streams consume
+samples at the same rate and queue ``underflow``, ``time_error`` and
+``burst_ack`` events for ``recv_async_msg``. It models timing, not RF.
+"""
+from __future__ import annotations
+
+import collections
+import functools
+import itertools
+import threading
+import time
+
+import numpy as np
+
+from ..core.dynamic_v2_transport import _payload
+from ..core.v2_errors import RemoteRFSessionExpiredError, RemoteRFStaleHandleError
+from .dynamic_v2 import build_uhd_bindings
+
+_ALL = 2**64 - 1  # ALL_CHANS / ALL_MBOARDS
+_WILDCARD_ARGS = ("chan", "mboard")
+_DEVICE_TYPE = "uhd.usrp.MultiUSRP"
+_STREAMER_TYPES = {
+    "get_rx_stream": "uhd.usrp.RXStreamer",
+    "get_tx_stream": "uhd.usrp.TXStreamer",
+}
+_SETTINGS = {
+    "rx_rate": 1e6,
+    "tx_rate": 1e6,
+    "master_clock_rate": 32e6,
+    "rx_bandwidth": 56e6,
+    "tx_bandwidth": 56e6,
+    "rx_antenna": "RX2",
+    "tx_antenna": "TX/RX",
+    "clock_source": "internal",
+    "time_source": "internal",
+}
+_LISTS = {
+    "rx_antennas": ["TX/RX", "RX2"],
+    "tx_antennas": ["TX/RX"],
+    "clock_sources": ["internal", "external", "gpsdo"],
+    "time_sources": ["none", "internal", "external", "gpsdo"],
+    "rx_gain_names": ["PGA"],
+    "tx_gain_names": ["PGA"],
+    "rx_sensor_names": ["lo_locked"],
+    "tx_sensor_names": ["lo_locked"],
+    "mboard_sensor_names": ["ref_locked"],
+}
+# Getter-name fragment -> (start, stop, step) of the MetaRange it returns.
+_RANGES = (
+    ("master_clock_rate", (5e6, 61.44e6, 0.0)),
+    ("freq", (70e6, 6e9, 0.0)),
+    ("gain", (0.0, 76.0, 1.0)),
+    ("rates", (62.5e3, 61.44e6, 0.0)),
+    ("bandwidth", (200e3, 56e6, 0.0)),
+)
+
+
+def _time_spec(secs: float) -> dict:
+    return {"__uhd_type__": "TimeSpec", "secs": float(secs)}
+
+
+def _meta_range(start: float, stop: float, step: float) -> dict:
+    return {
+        "__uhd_type__": "MetaRange",
+        "ranges": [
+            {"__uhd_type__": "Range", "start": start, "stop": stop, "step": step}
+        ],
+    }
+
+
+class _Stream:
+    def __init__(self, direction: str, stream_args: dict):
+        self.direction = direction
+        self.channels = [int(item) for item in stream_args.get("channels") or (0,)]
+        self.streaming = False
+        self.remaining = None  # samples left of a num_done/num_more command
+        self.rate = 0.0
+        self.wall_start = 0.0
+        self.device_start = 0.0
+        self.next_sample = 0
+        self.play_end = 0.0
+        self.in_burst = False
+
+
+class VirtualDynamicV2Transport:
+    """Serves one virtual USRP session in-process, in place of a server.
+
+    ``channels`` is the number of RX and TX channels the device reports.
+    With ``realtime`` (the default) streams run at the configured sample
+    rate. RX blocks wait until the device would have produced them and
+    report ``overflow`` once a reader falls more than ``overflow_after_sec``
+    behind. TX blocks wait while more than ``tx_buffer_sec`` of samples are
+    queued. Without ``realtime`` samples move as fast as the caller asks.
+    ``control_latency_sec`` and ``stream_latency_sec`` are added to every
+    control call and every sample block. ``rx_source(first_sample, count)``
+    may return the samples to deliver instead of zeros.
+    """
+
+    def __init__(
+        self,
+        *,
+        schema: dict | None = None,
+        hardware_profile: str = "b210",
+        channels: int = 2,
+        realtime: bool = True,
+        control_latency_sec: float = 0.0,
+        stream_latency_sec: float = 0.0,
+        overflow_after_sec: float | None = 1.0,
+        tx_buffer_sec: float = 0.1,
+        samples_per_packet: int = 2000,
+        rx_source=None,
+    ):
+        if schema is None:
+            from .usrp import usrp_remote
+
+            schema = usrp_remote._SCHEMA
+        self.hardware_profile = str(hardware_profile)
+        self.channels = max(1, int(channels))
+        self.realtime = bool(realtime)
+        self.control_latency_sec = max(0.0, float(control_latency_sec))
+        self.stream_latency_sec = max(0.0, float(stream_latency_sec))
+        self.overflow_after_sec = (
+            None if overflow_after_sec is None else float(overflow_after_sec)
+        )
+        self.tx_buffer_sec = max(0.0, float(tx_buffer_sec))
+        self.samples_per_packet = max(1, int(samples_per_packet))
+        self.rx_source = rx_source
+        self._uhd_version = str(schema.get("native_api", {}).get("version") or "")
+        self._overloads = {
+            (descriptor["owner"], descriptor["name"]): {
+                overload["id"]: (
+                    tuple(
+                        (parameter["name"], parameter.get("kind"))
+                        for parameter in overload.get("parameters", ())
+                    ),
+                    str(overload.get("returns") or "None"),
+                )
+                for overload in descriptor.get("overloads", ())
+            }
+            for descriptor in schema.get("methods", ())
+        }
+        self._lock = threading.Lock()
+        self._session_id = None
+        self._settings = {}
+        self._streams = {}
+        self._async_events = collections.deque()
+        self._handle_ids = itertools.count(1)
+        self._epoch = time.monotonic()
+        self._time_offset = 0.0
+
+    # -- session -----------------------------------------------------------
+
+    def negotiate(self):
+        return None
+
+    def open_session(self, token: str, schema_hash: str) -> dict:
+        self._control_delay()
+        self._session_id = f"virtual-session-{id(self):x}"
+        return {
+            "session_id": self._session_id,
+            "device_handle": "virtual-device",
+            "schema": None,
+            "schema_hash": schema_hash,
+            "capabilities": {
+                "hardware_profile": self.hardware_profile,
+                "virtual": True,
+                "remote_resource_limits": {
+                    "maximum_sample_payload_bytes": 64 * 1024 * 1024,
+                },
+            },
+            "uhd_version": self._uhd_version,
+            "uhd_abi": "virtual",
+            "hardware_profile": self.hardware_profile,
+        }
+
+    def close_handle(self, session_id: str, handle: str) -> bool:
+        self._check_session(session_id)
+        with self._lock:
+            return self._streams.pop(handle, None) is not None
+
+    def close_session(self, session_id: str) -> bool:
+        if session_id != self._session_id:
+            return False
+        with self._lock:
+            self._session_id = None
+            self._streams.clear()
+        return True
+
+    def _check_session(self, session_id: str):
+        if session_id is None or session_id != self._session_id:
+            raise RemoteRFSessionExpiredError("virtual session is closed")
+
+    def _stream(self, handle: str, direction: str) -> _Stream:
+        stream = self._streams.get(handle)
+        if stream is None or stream.direction != direction:
+            raise RemoteRFStaleHandleError(f"unknown virtual {direction} streamer")
+        return stream
+
+    def _control_delay(self):
+        if self.control_latency_sec:
+            time.sleep(self.control_latency_sec)
+
+    # -- device clock --------------------------------------------------------
+
+    def _device_time(self, wall: float | None = None) -> float:
+        wall = time.monotonic() if wall is None else wall
+        return wall - self._epoch + self._time_offset
+
+    def _wall_time(self, device_time: float) -> float:
+        return device_time - self._time_offset + self._epoch
+
+    # -- control -------------------------------------------------------------
+
+    def invoke(
+        self,
+        session_id: str,
+        handle: str,
+        method: str,
+        args: dict,
+        *,
+        overload_id: str = "",
+    ):
+        self._check_session(session_id)
+        self._control_delay()
+        with self._lock:
+            stream = self._streams.get(handle)
+            if stream is not None:
+                owner = _STREAMER_TYPES[f"get_{stream.direction}_stream"]
+                args = self._named_args(owner, method, overload_id, args)
+                return self._invoke_streamer(stream, method, args, overload_id)
+            if method == "recv_async_msg":
+                raise RemoteRFStaleHandleError("unknown virtual TX streamer")
+            args = self._named_args(_DEVICE_TYPE, method, overload_id, args)
+            return self._invoke_device(method, args, overload_id), {}
+
+    def _named_args(self, owner: str, method: str, overload_id: str, args: dict) -> dict:
+        """Return the bound arguments as payloads, in schema parameter order."""
+        overload = self._overloads.get((owner, method), {}).get(overload_id)
+        if overload is None:
+            return {
+                name: _payload(value)
+                for name, value in args.items()
+                if not name.startswith("__")
+            }
+        parameters, _returns = overload
+        positional = list(args.get("__args__", ()))
+        named = {}
+        for name, kind in parameters:
+            if kind == "positional_only" and positional:
+                named[name] = _payload(positional.pop(0))
+            elif name in args:
+                named[name] = _payload(args[name])
+        return named
+
+    def invoke_batch(self, session_id: str, calls) -> list:
+        outcomes = []
+        for handle, method, args, overload_id in calls:
+            outcomes.append(
+                self.invoke(session_id, handle, method, args, overload_id=overload_id)
+            )
+        return outcomes
+
+    def _invoke_device(self, method: str, args: dict, overload_id: str):
+        if method in _STREAMER_TYPES:
+            handle = f"virtual-{method[4:6]}-{next(self._handle_ids)}"
+            stream_args = args.get("stream_args") or {}
+            self._streams[handle] = _Stream(method[4:6], stream_args)
+            return {
+                "__remoterf_handle__": handle,
+                "__remoterf_type__": _STREAMER_TYPES[method],
+                "generation": 1,
+            }
+        if method in {"get_time_now", "get_time_last_pps"}:
+            now = self._device_time()
+            return _time_spec(now if method == "get_time_now" else int(now))
+        if method in {"set_time_now", "set_time_next_pps", "set_time_unknown_pps"}:
+            secs = float(args["time_spec"].get("secs", 0.0))
+            self._time_offset += secs - self._device_time()
+            return None
+        if method in {"get_rx_num_channels", "get_tx_num_channels"}:
+            return self.channels
+        if method == "get_num_mboards":
+            return 1
+        if method == "get_mboard_name":
+            return f"{self.hardware_profile.upper()} (virtual)"
+        if method == "get_pp_string":
+            return (
+                f"Virtual USRP {self.hardware_profile}: "
+                f"{self.channels} RX / {self.channels} TX channels"
+            )
+        if method.startswith("set_") and args:
+            return self._set(method[4:], args)
+        if method.startswith("get_"):
+            return self._get(method, args, overload_id)
+        return None
+
+    def _set(self, name: str, args: dict):
+        items = list(args.items())
+        value = items[0][1]
+        qualifier = tuple(items[1:])
+        if name in {"rx_freq", "tx_freq"}:
+            if isinstance(value, dict):
+                value = value.get("target_freq", 0.0)
+            start, stop, _step = dict(_RANGES)["freq"]
+            value = min(max(float(value), start), stop)
+        if any(
+            key in _WILDCARD_ARGS and item == _ALL for key, item in qualifier
+        ):
+            # An ALL_CHANS/ALL_MBOARDS write replaces earlier per-channel ones.
+            for key in [key for key in self._settings if key[0] == name]:
+                del self._settings[key]
+        self._settings[(name, qualifier)] = value
+        if name in {"rx_freq", "tx_freq"}:
+            return {
+                "__uhd_type__": "TuneResult",
+                "clipped_rf_freq": value,
+                "target_rf_freq": value,
+                "actual_rf_freq": value,
+                "target_dsp_freq": 0.0,
+                "actual_dsp_freq": 0.0,
+            }
+        return None
+
+    def _setting(self, name: str, qualifier: tuple, default=None):
+        value = self._settings.get((name, qualifier))
+        if value is None:
+            wildcard = tuple(
+                (key, _ALL if key in _WILDCARD_ARGS else item)
+                for key, item in qualifier
+            )
+            value = self._settings.get((name, wildcard))
+        return _SETTINGS.get(name, default) if value is None else value
+
+    def _get(self, method: str, args: dict, overload_id: str):
+        name = method[4:]
+        _parameters, returns = self._overloads.get((_DEVICE_TYPE, method), {}).get(
+            overload_id, ((), "")
+        )
+        kind = returns.split("|")[0]
+        if kind == "uhd.types.MetaRange":
+            for fragment, bounds in _RANGES:
+                if fragment in name:
+                    return _meta_range(*bounds)
+            return _meta_range(0.0, 0.0, 0.0)
+        if kind == "uhd.types.SensorValue":
+            sensor = str(args.get("name", ""))
+            return {
+                "__uhd_type__": "SensorValue",
+                "name": sensor,
+                "value": True,
+                "unit": "",
+                "type": "BOOLEAN",
+                "pretty": f"{sensor}: locked",
+            }
+        if kind.startswith("list"):
+            return list(_LISTS.get(name, ()))
+        if kind.startswith("dict"):
+            return {"mboard_id": "virtual", "mboard_serial": "virtual"}
+        default = {"float": 0.0, "int": 0, "bool": False, "str": ""}.get(kind)
+        return self._setting(name, tuple(args.items()), default)
+
+    def _invoke_streamer(self, stream: _Stream, method: str, args: dict, overload_id: str):
+        if method == "get_num_channels":
+            return len(stream.channels), {}
+        if method == "get_max_num_samps":
+            return self.samples_per_packet, {}
+        if method == "issue_stream_cmd":
+            self._stream_command(stream, args["stream_cmd"])
+            return None, {}
+        if method == "recv_async_msg":
+            event = self._async_events.popleft() if self._async_events else None
+            if event is None and self.realtime:
+                # Wait out the timeout outside the lock, like an empty queue.
+                self._lock.release()
+                try:
+                    time.sleep(max(0.0, float(args.get("timeout", 0.1))))
+                finally:
+                    self._lock.acquire()
+            if overload_id == "return_metadata":
+                return event, {}
+            if event is None:
+                return False, {}
+            return True, {"async_metadata": event}
+        return None, {}
+
+    def _stream_command(self, stream: _Stream, command: dict):
+        mode = str(command.get("mode", "start_cont"))
+        if mode == "stop_cont":
+            stream.streaming = False
+            stream.remaining = None
+            return
+        stream.streaming = True
+        stream.remaining = (
+            None if mode == "start_cont" else max(0, int(command.get("num_samps", 0)))
+        )
+        stream.rate = float(
+            self._setting("rx_rate", (("chan", stream.channels[0]),), 1e6)
+        )
+        now = time.monotonic()
+        if command.get("stream_now", True):
+            stream.device_start, stream.wall_start = self._device_time(now), now
+        else:
+            stream.device_start = float((command.get("time_spec") or {}).get("secs", 0.0))
+            stream.wall_start = self._wall_time(stream.device_start)
+        stream.next_sample = 0
+
+    # -- samples -------------------------------------------------------------
+
+    def recv(
+        self,
+        *,
+        session_id: str,
+        handle: str,
+        buffer: np.ndarray,
+        sample_count: int,
+        timeout: float,
+        one_packet: bool,
+        **_ignored,
+    ):
+        self._check_session(session_id)
+        stream = self._stream(handle, "rx")
+        if not stream.streaming:
+            if self.realtime:
+                time.sleep(max(0.0, float(timeout)))
+            return 0, buffer[..., :0], _rx_metadata("timeout")
+        count = int(sample_count)
+        if one_packet:
+            count = min(count, self.samples_per_packet)
+        if stream.remaining is not None:
+            count = min(count, stream.remaining)
+        if self.realtime:
+            count, overflowed = self._pace_rx(stream, count, float(timeout))
+            if overflowed:
+                return 0, buffer[..., :0], _rx_metadata(
+                    "overflow", self._rx_time(stream)
+                )
+        elif self.stream_latency_sec:
+            time.sleep(self.stream_latency_sec)
+        if count <= 0:
+            return 0, buffer[..., :0], _rx_metadata("timeout")
+        view = buffer[..., :count]
+        if self.rx_source is None:
+            view[...] = 0
+        else:
+            view[...] = self.rx_source(stream.next_sample, count)
+        metadata = _rx_metadata("none", self._rx_time(stream))
+        stream.next_sample += count
+        if stream.remaining is not None:
+            stream.remaining -= count
+            if stream.remaining <= 0:
+                stream.streaming = False
+        return count, view, metadata
+
+    def _rx_time(self, stream: _Stream) -> float:
+        rate = stream.rate or 1.0
+        return stream.device_start + stream.next_sample / rate
+
+    def _pace_rx(self, stream: _Stream, count: int, timeout: float):
+        """Wait until ``count`` samples exist; return (count ready, overflowed)."""
+        rate = stream.rate or 1.0
+        now = time.monotonic()
+        behind = now - (stream.wall_start + stream.next_sample / rate)
+        if self.overflow_after_sec is not None and behind > self.overflow_after_sec:
+            # The device buffer filled up: drop everything not yet read.
+            stream.next_sample = int((now - stream.wall_start) * rate)
+            return 0, True
+        latency = self.stream_latency_sec
+        ready = stream.wall_start + (stream.next_sample + count) / rate + latency
+        deadline = now + timeout
+        if ready > deadline:
+            available = int((deadline - latency - stream.wall_start) * rate)
+            count = max(0, min(count, available - stream.next_sample))
+            ready = deadline
+        _sleep_until(ready)
+        return count, False
+
+    def send(
+        self,
+        *,
+        session_id: str,
+        handle: str,
+        samples: np.ndarray,
+        timeout: float,
+        metadata,
+        **_ignored,
+    ) -> int:
+        self._check_session(session_id)
+        stream = self._stream(handle, "tx")
+        metadata = _payload(metadata) or {}
+        count = int(samples.shape[-1]) if samples.ndim else 0
+        if self.realtime:
+            count = self._pace_tx(stream, count, metadata, float(timeout))
+        elif self.stream_latency_sec:
+            time.sleep(self.stream_latency_sec)
+        stream.in_burst = not metadata.get("end_of_burst", False)
+        if metadata.get("end_of_burst"):
+            self._queue_event(stream, "burst_ack")
+        return count
+
+    def _pace_tx(self, stream: _Stream, count: int, metadata: dict, timeout: float) -> int:
+        rate = float(self._setting("tx_rate", (("chan", stream.channels[0]),), 1e6))
+        now = time.monotonic()
+        if metadata.get("has_time_spec") and not stream.in_burst:
+            start = self._wall_time(float(metadata["time_spec"].get("secs", 0.0)))
+            if start < now:
+                self._queue_event(stream, "time_error")
+                return count
+            stream.play_end = start
+        elif stream.play_end < now:
+            if stream.in_burst:
+                self._queue_event(stream, "underflow")
+            stream.play_end = now
+        stream.play_end += count / rate
+        # Block while more than ``tx_buffer_sec`` of samples are queued.
+        wait = stream.play_end - self.tx_buffer_sec - now
+        if wait > timeout:
+            rejected = min(count, int((wait - timeout) * rate))
+            stream.play_end -= rejected / rate
+            count -= rejected
+            wait = timeout
+        _sleep_until(now + max(wait, 0.0) + self.stream_latency_sec)
+        return count
+
+    def _queue_event(self, stream: _Stream, event_code: str):
+        self._async_events.append(
+            {
+                "__uhd_type__": "TXAsyncMetadata",
+                "event_code": event_code,
+                "event_code_repr": event_code,
+                "has_time_spec": True,
+                "time_spec": _time_spec(self._device_time()),
+                "channel": stream.channels[0],
+            }
+        )
+
+
+def _rx_metadata(error_code: str, device_time: float | None = None) -> dict:
+    metadata = {
+        "__uhd_type__": "RXMetadata",
+        "error_code": error_code,
+        "error_code_repr": error_code,
+        "has_time_spec": device_time is not None,
+        "more_fragments": False,
+        "fragment_offset": 0,
+    }
+    if device_time is not None:
+        metadata["time_spec"] = _time_spec(device_time)
+    return metadata
+
+
+def _sleep_until(wall: float) -> None:
+    delay = wall - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+
+
+def build_virtual_uhd_bindings(schema: dict | None = None, **options):
+    """Return ``(uhd, MultiUSRP)`` whose sessions run on a virtual USRP.
+
+    ``schema`` defaults to the packaged USRP schema; ``options`` are passed to
+    :class:`VirtualDynamicV2Transport`.
+    """
+    precompiled = None
+    if schema is None:
+        from .usrp import usrp_remote
+
+        schema, precompiled = usrp_remote._SCHEMA, usrp_remote._PRECOMPILED
+    return build_uhd_bindings(
+        schema,
+        transport_factory=functools.partial(
+            VirtualDynamicV2Transport, schema=schema, **options
+        ),
+        precompiled=precompiled,
+    )
@@ -20,15 +20,22 @@ _PREFIX = "Hackrf"
 _SCHEMA_HASH = "sha256:1d6e935e2e33959e753b89d943a1a5696d814ec28aac52a7c39142b3fce89693"
 _CLIENT_MODULES = {}
 _CLIENT_OBJECTS = {}
+_CACHE_POLICY = {}
 
 from importlib import import_module as _import_module
 
-from ...core.grpc_client import rpc_client
 from ...common.utils import map_arg, unmap_arg
+from .._property_cache import PropertyCache, cached_get, cached_set, note_call
 
 _NO_ARG = object()
 
 
+def _rpc_client(*, function_name, args):
+    from ...core.grpc_client import rpc_client
+
+    return rpc_client(function_name=function_name, args=args)
+
+
 for _alias, _module_path in _CLIENT_MODULES.items():
     globals()[_alias] = _import_module(_module_path)
 
@@ -71,14 +78,14 @@ def _wrap_client_return(spec, self_obj, result):
 
 
 def _try_get(prop, token):
-    return unmap_arg(rpc_client(
+    return unmap_arg(_rpc_client(
         function_name=f"{_PREFIX}:{prop}:GET",
         args={'a': map_arg(token)},
     ).results[prop])
 
 
 def _try_set(prop, value, token):
-    rpc_client(
+    _rpc_client(
         function_name=f"{_PREFIX}:{prop}:SET",
         args={prop: map_arg(value), 'a': map_arg(token)},
     )
@@ -86,12 +93,12 @@ def _try_set(prop, value, token):
 
 def _try_call(prop, token, arg=_NO_ARG):
     if arg is _NO_ARG:
-        resp = rpc_client(
+        resp = _rpc_client(
             function_name=f"{_PREFIX}:{prop}:CALL0",
             args={'a': map_arg(token)},
         )
     else:
-        resp = rpc_client(
+        resp = _rpc_client(
             function_name=f"{_PREFIX}:{prop}:CALL1",
             args={'a': map_arg(token), 'arg1': map_arg(arg)},
         )
@@ -105,13 +112,21 @@ def _try_calln(prop, token, kwargs):
         if value is _NO_ARG:
             continue
         payload[str(key)] = map_arg(value)
-    resp = rpc_client(
+    resp = _rpc_client(
         function_name=f"{_PREFIX}:{prop}:CALLN",
         args=payload,
     )
     result = resp.results.get(prop)
     return unmap_arg(result) if result is not None else None
 
+
+def _cached_get(device, prop):
+    return cached_get(device, prop, lambda: _try_get(prop, device.token))
+
+
+def _cached_set(device, prop, value):
+    cached_set(device, prop, value, lambda v: _try_set(prop, v, device.token))
+
 class HackRF:
 
     def __init__(self, token: str):
@@ -119,113 +134,127 @@ class HackRF:
         from ..dynamic_device import install_driver_if_stale
         install_driver_if_stale(token=token, current_hash=_SCHEMA_HASH)
 
+    remoterf_cache = None
+
+    def remoterf_enable_cache(self, ttl=None, *, ttls=None):
+        """Remember property reads and writes client-side; see PropertyCache."""
+        self.remoterf_cache = PropertyCache.from_policy(_CACHE_POLICY, ttl, ttls=ttls)
+        return self.remoterf_cache
+
     @property
     def amplifier_on(self):
         'Whether the 14 dB RF front-end amplifier is enabled.'
-        return _try_get("amplifier_on", self.token)
+        return _cached_get(self, "amplifier_on")
 
     @amplifier_on.setter
     def amplifier_on(self, value):
-        _try_set("amplifier_on", value, self.token)
+        _cached_set(self, "amplifier_on", value)
 
     @property
     def bias_tee_on(self):
         'Whether 3.3 V antenna bias (50 mA maximum) is enabled.'
-        return _try_get("bias_tee_on", self.token)
+        return _cached_get(self, "bias_tee_on")
 
     @bias_tee_on.setter
     def bias_tee_on(self, value):
-        _try_set("bias_tee_on", value, self.token)
+        _cached_set(self, "bias_tee_on", value)
 
     @property
     def center_freq(self):
         'Center frequency in Hz.'
-        return _try_get("center_freq", self.token)
+        return _cached_get(self, "center_freq")
 
     @center_freq.setter
     def center_freq(self, value):
-        _try_set("center_freq", value, self.token)
+        _cached_set(self, "center_freq", value)
 
     @property
     def filter_bandwidth(self):
         'Baseband filter bandwidth in Hz.'
-        return _try_get("filter_bandwidth", self.token)
+        return _cached_get(self, "filter_bandwidth")
 
     @filter_bandwidth.setter
     def filter_bandwidth(self, value):
-        _try_set("filter_bandwidth", value, self.token)
+        _cached_set(self, "filter_bandwidth", value)
 
     @property
     def lna_gain(self):
         'Receive IF LNA gain in dB (0 to 40, in 8 dB steps).'
-        return _try_get("lna_gain", self.token)
+        return _cached_get(self, "lna_gain")
 
     @lna_gain.setter
     def lna_gain(self, value):
-        _try_set("lna_gain", value, self.token)
+        _cached_set(self, "lna_gain", value)
 
     @property
     def sample_count_limit(self):
         'Asynchronous receive limit in raw IQ bytes; zero means unlimited.'
-        return _try_get("sample_count_limit", self.token)
+        return _cached_get(self, "sample_count_limit")
 
     @sample_count_limit.setter
     def sample_count_limit(self, value):
-        _try_set("sample_count_limit", value, self.token)
+        _cached_set(self, "sample_count_limit", value)
 
     @property
     def sample_rate(self):
         'Complex sample rate in samples per second.'
-        return _try_get("sample_rate", self.token)
+        return _cached_get(self, "sample_rate")
 
     @sample_rate.setter
     def sample_rate(self, value):
-        _try_set("sample_rate", value, self.token)
+        _cached_set(self, "sample_rate", value)
 
     @property
     def txvga_gain(self):
         'Transmit VGA gain in dB (0 to 47).'
-        return _try_get("txvga_gain", self.token)
+        return _cached_get(self, "txvga_gain")
 
     @txvga_gain.setter
     def txvga_gain(self, value):
-        _try_set("txvga_gain", value, self.token)
+        _cached_set(self, "txvga_gain", value)
 
     @property
     def vga_gain(self):
         'Receive baseband VGA gain in dB (0 to 62, in 2 dB steps).'
-        return _try_get("vga_gain", self.token)
+        return _cached_get(self, "vga_gain")
 
     @vga_gain.setter
     def vga_gain(self, value):
-        _try_set("vga_gain", value, self.token)
+        _cached_set(self, "vga_gain", value)
 
     def clear_buffer(self):
         'Clear any captured or queued IQ bytes while the radio is idle.'
+        note_call(self, "clear_buffer")
         return _try_call("clear_buffer", self.token)
 
     def enumerate(self):
         'Return attached serials as a JSON array for broad client compatibility.'
+        note_call(self, "enumerate")
         return _try_call("enumerate", self.token)
 
     def get_serial_no(self):
         'Read the serial number from the open device.'
+        note_call(self, "get_serial_no")
         return _try_call("get_serial_no", self.token)
 
     def load_tx_iq(self, samples):
         'Convert normalized IQ samples and load the native transmit buffer.'
+        note_call(self, "load_tx_iq")
         return _try_call("load_tx_iq", self.token, samples)
 
     def read_samples(self, num_samples=_NO_ARG):
         'Synchronously read a bounded complex64 IQ array.'
+        note_call(self, "read_samples")
         return _try_calln("read_samples", self.token, {
             "num_samples": num_samples,
         })
 
     def start_tx(self):
         'Start transmitting the IQ bytes previously loaded with load_tx_iq().'
+        note_call(self, "start_tx")
         return _try_call("start_tx", self.token)
 
     def stop_tx(self):
         'Stop an active HackRF transmission.'
+        note_call(self, "stop_tx")
         return _try_call("stop_tx", self.token)
@@ -20,15 +20,22 @@ _PREFIX = "Rtl_sdr"
 _SCHEMA_HASH = "sha256:1c84effc2c21be734398a87d24bb9da52ab5b7ea0def955c503da484b8d818c0"
 _CLIENT_MODULES = {}
 _CLIENT_OBJECTS = {}
+_CACHE_POLICY = {}
 
 from importlib import import_module as _import_module
 
-from ...core.grpc_client import rpc_client
 from ...common.utils import map_arg, unmap_arg
+from .._property_cache import PropertyCache, cached_get, cached_set, note_call
 
 _NO_ARG = object()
 
 
+def _rpc_client(*, function_name, args):
+    from ...core.grpc_client import rpc_client
+
+    return rpc_client(function_name=function_name, args=args)
+
+
 for _alias, _module_path in _CLIENT_MODULES.items():
     globals()[_alias] = _import_module(_module_path)
 
@@ -71,14 +78,14 @@ def _wrap_client_return(spec, self_obj, result):
 
 
 def _try_get(prop, token):
-    return unmap_arg(rpc_client(
+    return unmap_arg(_rpc_client(
         function_name=f"{_PREFIX}:{prop}:GET",
         args={'a': map_arg(token)},
     ).results[prop])
 
 
 def _try_set(prop, value, token):
-    rpc_client(
+    _rpc_client(
         function_name=f"{_PREFIX}:{prop}:SET",
         args={prop: map_arg(value), 'a': map_arg(token)},
     )
@@ -86,12 +93,12 @@ def _try_set(prop, value, token):
 
 def _try_call(prop, token, arg=_NO_ARG):
     if arg is _NO_ARG:
-        resp = rpc_client(
+        resp = _rpc_client(
             function_name=f"{_PREFIX}:{prop}:CALL0",
             args={'a': map_arg(token)},
         )
     else:
-        resp = rpc_client(
+        resp = _rpc_client(
             function_name=f"{_PREFIX}:{prop}:CALL1",
             args={'a': map_arg(token), 'arg1': map_arg(arg)},
         )
@@ -105,13 +112,21 @@ def _try_calln(prop, token, kwargs):
         if value is _NO_ARG:
             continue
         payload[str(key)] = map_arg(value)
-    resp = rpc_client(
+    resp = _rpc_client(
         function_name=f"{_PREFIX}:{prop}:CALLN",
         args=payload,
     )
     result = resp.results.get(prop)
     return unmap_arg(result) if result is not None else None
 
+
+def _cached_get(device, prop):
+    return cached_get(device, prop, lambda: _try_get(prop, device.token))
+
+
+def _cached_set(device, prop, value):
+    cached_set(device, prop, value, lambda v: _try_set(prop, v, device.token))
+
 class RtlSdr:
 
     def __init__(self, token: str):
@@ -119,141 +134,151 @@ class RtlSdr:
         from ..dynamic_device import install_driver_if_stale
         install_driver_if_stale(token=token, current_hash=_SCHEMA_HASH)
 
+    remoterf_cache = None
+
+    def remoterf_enable_cache(self, ttl=None, *, ttls=None):
+        """Remember property reads and writes client-side; see PropertyCache."""
+        self.remoterf_cache = PropertyCache.from_policy(_CACHE_POLICY, ttl, ttls=ttls)
+        return self.remoterf_cache
+
     @property
     def agc_mode(self):
-        return _try_get("agc_mode", self.token)
+        return _cached_get(self, "agc_mode")
 
     @agc_mode.setter
     def agc_mode(self, value):
-        _try_set("agc_mode", value, self.token)
+        _cached_set(self, "agc_mode", value)
 
     @property
     def bandwidth(self):
         'Tuner bandwidth in Hz; zero requests automatic selection.'
-        return _try_get("bandwidth", self.token)
+        return _cached_get(self, "bandwidth")
 
     @bandwidth.setter
     def bandwidth(self, value):
-        _try_set("bandwidth", value, self.token)
+        _cached_set(self, "bandwidth", value)
 
     @property
     def bias_tee(self):
-        return _try_get("bias_tee", self.token)
+        return _cached_get(self, "bias_tee")
 
     @bias_tee.setter
     def bias_tee(self, value):
-        _try_set("bias_tee", value, self.token)
+        _cached_set(self, "bias_tee", value)
 
     @property
     def center_freq(self):
         'Tuner center frequency in Hz.'
-        return _try_get("center_freq", self.token)
+        return _cached_get(self, "center_freq")
 
     @center_freq.setter
     def center_freq(self, value):
-        _try_set("center_freq", value, self.token)
+        _cached_set(self, "center_freq", value)
 
     @property
     def device_index(self):
-        return _try_get("device_index", self.token)
+        return _cached_get(self, "device_index")
 
     @property
     def direct_sampling(self):
-        return _try_get("direct_sampling", self.token)
+        return _cached_get(self, "direct_sampling")
 
     @direct_sampling.setter
     def direct_sampling(self, value):
-        _try_set("direct_sampling", value, self.token)
+        _cached_set(self, "direct_sampling", value)
 
     @property
     def dithering(self):
-        return _try_get("dithering", self.token)
+        return _cached_get(self, "dithering")
 
     @dithering.setter
     def dithering(self, value):
-        _try_set("dithering", value, self.token)
+        _cached_set(self, "dithering", value)
 
     @property
     def fc(self):
         'Alias for center_freq, matching PyRtlSdr.'
-        return _try_get("fc", self.token)
+        return _cached_get(self, "fc")
 
     @fc.setter
     def fc(self, value):
-        _try_set("fc", value, self.token)
+        _cached_set(self, "fc", value)
 
     @property
     def freq_correction(self):
         'Frequency correction in parts per million.'
-        return _try_get("freq_correction", self.token)
+        return _cached_get(self, "freq_correction")
 
     @freq_correction.setter
     def freq_correction(self, value):
-        _try_set("freq_correction", value, self.token)
+        _cached_set(self, "freq_correction", value)
 
     @property
     def gain(self):
         'Tuner gain in dB, or auto when automatic gain is enabled.'
-        return _try_get("gain", self.token)
+        return _cached_get(self, "gain")
 
     @gain.setter
     def gain(self, value):
-        _try_set("gain", value, self.token)
+        _cached_set(self, "gain", value)
 
     @property
     def offset_tuning(self):
-        return _try_get("offset_tuning", self.token)
+        return _cached_get(self, "offset_tuning")
 
     @offset_tuning.setter
     def offset_tuning(self, value):
-        _try_set("offset_tuning", value, self.token)
+        _cached_set(self, "offset_tuning", value)
 
     @property
     def rs(self):
         'Alias for sample_rate, matching PyRtlSdr.'
-        return _try_get("rs", self.token)
+        return _cached_get(self, "rs")
 
     @rs.setter
     def rs(self, value):
-        _try_set("rs", value, self.token)
+        _cached_set(self, "rs", value)
 
     @property
     def sample_rate(self):
         'Complex sample rate in samples per second.'
-        return _try_get("sample_rate", self.token)
+        return _cached_get(self, "sample_rate")
 
     @sample_rate.setter
     def sample_rate(self, value):
-        _try_set("sample_rate", value, self.token)
+        _cached_set(self, "sample_rate", value)
 
     @property
     def serial_number(self):
-        return _try_get("serial_number", self.token)
+        return _cached_get(self, "serial_number")
 
     @property
     def tuner_type(self):
-        return _try_get("tuner_type", self.token)
+        return _cached_get(self, "tuner_type")
 
     @property
     def usb_strings(self):
-        return _try_get("usb_strings", self.token)
+        return _cached_get(self, "usb_strings")
 
     @property
     def valid_gains_db(self):
-        return _try_get("valid_gains_db", self.token)
+        return _cached_get(self, "valid_gains_db")
 
     def read_bytes(self, num_bytes=_NO_ARG):
         'Read packed unsigned 8-bit interleaved IQ bytes.'
+        note_call(self, "read_bytes")
         return _try_calln("read_bytes", self.token, {
             "num_bytes": num_bytes,
         })
 
     def read_samples(self, num_samples=_NO_ARG):
         'Read normalized complex64 IQ samples.'
+        note_call(self, "read_samples")
         return _try_calln("read_samples", self.token, {
             "num_samples": num_samples,
         })
 
     def reset_buffer(self):
         'Discard pending USB samples before a new capture.'
+        note_call(self, "reset_buffer")
         return _try_call("reset_buffer", self.token)
@@ -0,0 +1,181 @@
+# Copyright (C) 2026 RemoteRF
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Stream a file-backed waveform through a TX streamer.
+
+``replay`` memory-maps a raw sample file or SigMF recording and sends it in
+``get_max_num_samps()``-sized chunks, so the waveform is read from disk as it
+goes out and never loaded whole. Integer I/Q recordings (``ci16_le``,
+``ci8``) are scaled to complex floats one chunk at a time.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+from ...core.sample_formats import NarrowWireFormat
+from . import uhd_v2
+from .sigmf import _device_value, open_sigmf, sigmf_paths
+
+_UNDERFLOW_EVENTS = {"underflow", "underflow_in_packet"}
+# Consecutive sends that accept no samples before the replay gives up.
+_MAX_STALLS = 3
+# Async messages drained per poll, so a chatty server cannot stall the loop.
+_MAX_ASYNC_PER_POLL = 64
+
+
+def _open_source(source, dtype):
+    """Return ``(samples, sample_rate)`` for a path, memmap or array."""
+    if isinstance(source, np.ndarray):
+        return source, None
+    path = Path(source)
+    if path.suffix in {".sigmf-data", ".sigmf-meta", ".sigmf"} or sigmf_paths(path)[1].exists():
+        samples, record = open_sigmf(path)
+        return samples, record.get("global", {}).get("core:sample_rate")
+    return np.memmap(path, dtype=np.dtype(dtype), mode="r"), None
+
+
+def _channel_major(chunk: np.ndarray, width: int) -> np.ndarray:
+    """Turn a ``(samples, channels)`` slice into what ``send()`` expects."""
+    if chunk.dtype.names is not None:
+        narrow = NarrowWireFormat("sc16" if chunk.dtype.itemsize == 4 else "sc8")
+        converted = np.empty(chunk.shape, dtype=np.complex64)
+        narrow.fill(converted, np.ascontiguousarray(chunk))
+        chunk = converted
+    return chunk.T if width > 1 else chunk
+
+
+def _event_name(metadata) -> str:
+    code = metadata.event_code
+    return str(getattr(code, "value", code) or "")
+
+
+def replay(
+    streamer,
+    source,
+    *,
+    loop=False,
+    dtype=np.complex64,
+    sample_rate=None,
+    pace=True,
+    max_lead=0.25,
+    chunk_samps=None,
+    timeout=1.0,
+    async_every=8,
+    stop_event: threading.Event | None = None,
+) -> dict:
+    """Transmit a raw file, SigMF recording or array through ``streamer``.
+
+    ``loop`` repeats the waveform: ``True`` until ``stop_event`` is set,
+    an integer for that many passes. Loops are sent as one continuous burst.
+    With ``pace`` the sender stays at most ``max_lead`` seconds ahead of
+    ``sample_rate`` (taken from the SigMF metadata or the device when not
+    given). Every ``async_every`` chunks, and once at the end, pending
+    ``TXAsyncMetadata`` messages are drained and counted.
+    """
+    samples, recorded_rate = _open_source(source, dtype)
+    width = samples.shape[1] if samples.ndim == 2 else 1
+    total = int(samples.shape[0])
+    if total == 0:
+        raise ValueError("nothing to replay")
+    channels = list(getattr(streamer, "_channels", ()) or [0])
+    if width != len(channels) and not (width == 1 and len(channels) == 1):
+        raise ValueError(
+            f"waveform has {width} channel(s) but the streamer sends {len(channels)}"
+        )
+    if sample_rate is None:
+        sample_rate = recorded_rate or _device_value(streamer, "get_tx_rate", channels[0])
+    passes = None if loop is True else max(1, int(loop or 1))
+    chunk = int(chunk_samps or streamer.get_max_num_samps())
+    if chunk <= 0:
+        raise ValueError("chunk_samps must be positive")
+    recv_async = getattr(streamer, "recv_async_msg", None)
+
+    metadata = uhd_v2.TXMetadata()
+    async_metadata = uhd_v2.TXAsyncMetadata()
+    events = {}
+    sent = 0
+    completed = 0
+    stalls = 0
+    chunks = 0
+    started = time.monotonic()
+
+    def drain_async():
+        if recv_async is None:
+            return
+        for _ in range(_MAX_ASYNC_PER_POLL):
+            if not recv_async(async_metadata, 0.0):
+                return
+            name = _event_name(async_metadata)
+            events[name] = events.get(name, 0) + 1
+
+    def stopped():
+        return stop_event is not None and stop_event.is_set()
+
+    try:
+        while not stopped() and (passes is None or completed < passes):
+            offset = 0
+            while offset < total and not stopped():
+                end = min(total, offset + chunk)
+                last = end == total and passes is not None and completed + 1 == passes
+                metadata.start_of_burst = sent == 0
+                metadata.end_of_burst = last
+                count = int(
+                    streamer.send(
+                        _channel_major(samples[offset:end], width), metadata, timeout
+                    )
+                )
+                if not count:
+                    stalls += 1
+                    if stalls >= _MAX_STALLS:
+                        raise TimeoutError("TX streamer stopped accepting samples")
+                    continue
+                stalls = 0
+                offset += count
+                sent += count
+                chunks += 1
+                if async_every and chunks % int(async_every) == 0:
+                    drain_async()
+                if pace and sample_rate:
+                    ahead = sent / float(sample_rate) - (time.monotonic() - started)
+                    if ahead > max_lead:
+                        time.sleep(ahead - max_lead)
+            if offset >= total:
+                completed += 1
+    finally:
+        complete = passes is not None and completed == passes
+        if sent and not complete:
+            # Close the burst that was cut short, as UHD examples do on exit.
+            metadata.start_of_burst = False
+            metadata.end_of_burst = True
+            try:
+                streamer.send(
+                    np.zeros((len(channels), 0) if width > 1 else 0, dtype=np.complex64),
+                    metadata,
+                    timeout,
+                )
+            except Exception:
+                pass
+    drain_async()
+    return {
+        "samples": sent,
+        "loops": completed,
+        "complete": complete,
+        "underflows": sum(events.get(name, 0) for name in _UNDERFLOW_EVENTS),
+        "events": events,
+    }
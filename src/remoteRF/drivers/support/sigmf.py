@@ -0,0 +1,250 @@
+# Copyright (C) 2026 RemoteRF
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Record RX streamer output to disk as a SigMF recording, and read it back.
+
+``record_to_sigmf`` preallocates the ``.sigmf-data`` file as an
+``np.memmap`` and hands slices of it to ``RXStreamer.recv()``, so a capture
+never has to fit in memory. Multi-channel captures are received through one
+chunk-sized buffer and interleaved per sample, as SigMF requires. The
+``.sigmf-meta`` sidecar records the sample rate, frequency, the device
+time of each capture segment and every overflow. ``open_sigmf`` maps a
+recording back read-only, e.g. for :func:`~.replay.replay`.
+"""
+from __future__ import annotations
+
+import json
+import math
+import os
+from pathlib import Path
+
+import numpy as np
+
+from ...core.sample_formats import WIRE_DTYPES
+from . import uhd_v2
+
+SIGMF_VERSION = "1.0.0"
+_DATATYPES = {
+    np.dtype("<c8"): "cf32_le",
+    np.dtype("<c16"): "cf64_le",
+    np.dtype("<i2"): "ri16_le",
+    np.dtype("<f4"): "rf32_le",
+    np.dtype("<f8"): "rf64_le",
+}
+_CPU_FORMATS = {
+    "fc32": np.dtype("<c8"),
+    "fc64": np.dtype("<c16"),
+    "s16": np.dtype("<i2"),
+    "f32": np.dtype("<f4"),
+    "f64": np.dtype("<f8"),
+}
+_READ_DATATYPES = {
+    **{name: dtype for dtype, name in _DATATYPES.items()},
+    "ci16_le": WIRE_DTYPES["sc16"],
+    "ci8": WIRE_DTYPES["sc8"],
+}
+# Consecutive empty ``recv()`` timeouts after which the capture is cut short.
+_MAX_TIMEOUTS = 3
+
+
+def sigmf_paths(path) -> tuple[Path, Path]:
+    """Return the ``(.sigmf-data, .sigmf-meta)`` paths for a recording name."""
+    path = Path(path)
+    if path.suffix in {".sigmf-data", ".sigmf-meta", ".sigmf"}:
+        path = path.with_suffix("")
+    return path.with_name(path.name + ".sigmf-data"), path.with_name(path.name + ".sigmf-meta")
+
+
+def open_sigmf(path) -> tuple[np.memmap, dict]:
+    """Memory-map a SigMF recording read-only; return ``(samples, metadata)``.
+
+    Multi-channel recordings come back shaped ``(samples, channels)``.
+    Integer I/Q datatypes (``ci16_le``, ``ci8``) map to ``re``/``im`` pairs.
+    """
+    data_path, meta_path = sigmf_paths(path)
+    record = json.loads(meta_path.read_text(encoding="utf-8"))
+    header = record.get("global", {})
+    dtype = _READ_DATATYPES.get(header.get("core:datatype"))
+    if dtype is None:
+        raise ValueError(f"unsupported SigMF datatype: {header.get('core:datatype')!r}")
+    width = int(header.get("core:num_channels", 1) or 1)
+    samples = np.memmap(data_path, dtype=dtype, mode="r")
+    if width > 1:
+        samples = samples.reshape(-1, width)
+    return samples, record
+
+
+def _device_value(streamer, getter: str, channel: int):
+    """Ask the streamer's device for a setting; None when it cannot say."""
+    device = getattr(streamer, "_owner", None)
+    method = getattr(device, getter, None)
+    if method is None:
+        return None
+    try:
+        value = float(method(channel))
+    except Exception:
+        return None
+    return value if math.isfinite(value) else None
+
+
+def record_to_sigmf(
+    streamer,
+    path,
+    nsamps=None,
+    *,
+    duration=None,
+    sample_rate=None,
+    center_freq=None,
+    timeout=1.0,
+    chunk_samps=None,
+    start_stream=True,
+    description="",
+) -> dict:
+    """Receive ``nsamps`` samples (or ``duration`` seconds) into a SigMF recording.
+
+    ``sample_rate`` and ``center_freq`` default to the device's current RX
+    settings for the streamer's first channel. With ``start_stream`` a
+    continuous stream command is issued before and stopped after the
+    capture. A capture cut short by repeated timeouts is truncated to the
+    samples received and marked incomplete; the returned dict summarises
+    what was written.
+    """
+    channels = list(getattr(streamer, "_channels", ()) or [0])
+    channel = int(channels[0])
+    if sample_rate is None:
+        sample_rate = _device_value(streamer, "get_rx_rate", channel)
+    if center_freq is None:
+        center_freq = _device_value(streamer, "get_rx_freq", channel)
+    if (nsamps is None) == (duration is None):
+        raise ValueError("pass exactly one of nsamps or duration")
+    if nsamps is None:
+        if not sample_rate:
+            raise ValueError("duration needs a sample_rate")
+        nsamps = int(round(float(duration) * float(sample_rate)))
+    nsamps = int(nsamps)
+    if nsamps <= 0:
+        raise ValueError("a recording needs at least one sample")
+
+    dtype = _CPU_FORMATS.get(str(getattr(streamer, "_cpu_format", "fc32")).lower())
+    if dtype is None:
+        raise ValueError("streamer CPU format has no SigMF datatype")
+    width = len(channels)
+    chunk = int(chunk_samps or streamer.get_max_num_samps())
+    if chunk <= 0:
+        raise ValueError("chunk_samps must be positive")
+
+    data_path, meta_path = sigmf_paths(path)
+    data = np.memmap(
+        data_path,
+        dtype=dtype,
+        mode="w+",
+        shape=(nsamps, width) if width > 1 else (nsamps,),
+    )
+    bounce = np.empty((width, chunk), dtype=dtype) if width > 1 else None
+    metadata = uhd_v2.RXMetadata()
+    captures = []
+    annotations = []
+    overflows = 0
+    timeouts = 0
+    written = 0
+    new_segment = True
+    target = None
+
+    if start_stream:
+        command = uhd_v2.StreamCMD(uhd_v2.StreamMode.start_cont)
+        command.stream_now = True
+        streamer.issue_stream_cmd(command)
+    try:
+        while written < nsamps:
+            count = min(chunk, nsamps - written)
+            target = data[written:written + count] if bounce is None else bounce[:, :count]
+            received = int(streamer.recv(target, metadata, timeout))
+            error = str(getattr(metadata.error_code, "value", metadata.error_code))
+            if error == "overflow":
+                overflows += 1
+                new_segment = True
+                annotations.append(
+                    {"core:sample_start": written, "core:label": "overflow"}
+                )
+            elif error == "timeout" and not received:
+                timeouts += 1
+                if timeouts >= _MAX_TIMEOUTS:
+                    break
+                continue
+            elif error not in {"none", "", "timeout"}:
+                # A timeout that still delivered samples is an ordinary receive.
+                raise RuntimeError(f"RX error while recording: {metadata.strerror()}")
+            if not received:
+                continue
+            timeouts = 0
+            if new_segment:
+                captures.append(_capture(written, center_freq, metadata))
+                new_segment = False
+            if bounce is not None:
+                data[written:written + received] = bounce[:, :received].T
+            written += received
+    finally:
+        if start_stream:
+            command = uhd_v2.StreamCMD(uhd_v2.StreamMode.stop_cont)
+            command.stream_now = True
+            try:
+                streamer.issue_stream_cmd(command)
+            except Exception:
+                pass
+        data.flush()
+        # Every view of the map must go before truncating, or Windows refuses.
+        del target, bounce, data
+        if written < nsamps:
+            os.truncate(data_path, written * width * dtype.itemsize)
+
+    record = {
+        "global": {
+            "core:datatype": _DATATYPES[dtype],
+            "core:version": SIGMF_VERSION,
+            "core:num_channels": width,
+            "core:recorder": "remoteRF",
+            "core:extensions": [
+                {"name": "remoterf", "version": "1.0.0", "optional": True}
+            ],
+            "remoterf:channels": channels,
+            "remoterf:overflows": overflows,
+            "remoterf:complete": written == nsamps,
+        },
+        "captures": captures or [_capture(0, center_freq, None)],
+        "annotations": annotations,
+    }
+    if sample_rate:
+        record["global"]["core:sample_rate"] = float(sample_rate)
+    if description:
+        record["global"]["core:description"] = str(description)
+    staging = meta_path.with_name(meta_path.name + ".tmp")
+    staging.write_text(json.dumps(record, indent=2) + "\n", encoding="utf-8")
+    os.replace(staging, meta_path)
+    return {
+        "data_path": str(data_path),
+        "meta_path": str(meta_path),
+        "samples": written,
+        "overflows": overflows,
+        "complete": written == nsamps,
+    }
+
+
+def _capture(sample_start: int, center_freq, metadata) -> dict:
+    capture = {"core:sample_start": int(sample_start)}
+    if center_freq is not None:
+        capture["core:frequency"] = float(center_freq)
+    if metadata is not None and metadata.has_time_spec:
+        capture["remoterf:time_spec"] = metadata.time_spec.get_real_secs()
+    return capture
@@ -20,15 +20,22 @@ _PREFIX = "Ti_mmwave"
 _SCHEMA_HASH = "sha256:320a89d95075a472d7899ff2f98b9fdee05c0be96fa5651bf5c4f0e5d276a1c4"
 _CLIENT_MODULES = {'ti_mmwave': 'remoteRF.drivers.support.ti_mmwave'}
 _CLIENT_OBJECTS = {}
+_CACHE_POLICY = {}
 
 from importlib import import_module as _import_module
 
-from ...core.grpc_client import rpc_client
 from ...common.utils import map_arg, unmap_arg
+from .._property_cache import PropertyCache, cached_get, cached_set, note_call
 
 _NO_ARG = object()
 
 
+def _rpc_client(*, function_name, args):
+    from ...core.grpc_client import rpc_client
+
+    return rpc_client(function_name=function_name, args=args)
+
+
 for _alias, _module_path in _CLIENT_MODULES.items():
     globals()[_alias] = _import_module(_module_path)
 
@@ -71,14 +78,14 @@ def _wrap_client_return(spec, self_obj, result):
 
 
 def _try_get(prop, token):
-    return unmap_arg(rpc_client(
+    return unmap_arg(_rpc_client(
         function_name=f"{_PREFIX}:{prop}:GET",
         args={'a': map_arg(token)},
     ).results[prop])
 
 
 def _try_set(prop, value, token):
-    rpc_client(
+    _rpc_client(
         function_name=f"{_PREFIX}:{prop}:SET",
         args={prop: map_arg(value), 'a': map_arg(token)},
     )
@@ -86,12 +93,12 @@ def _try_set(prop, value, token):
 
 def _try_call(prop, token, arg=_NO_ARG):
     if arg is _NO_ARG:
-        resp = rpc_client(
+        resp = _rpc_client(
             function_name=f"{_PREFIX}:{prop}:CALL0",
             args={'a': map_arg(token)},
         )
     else:
-        resp = rpc_client(
+        resp = _rpc_client(
             function_name=f"{_PREFIX}:{prop}:CALL1",
             args={'a': map_arg(token), 'arg1': map_arg(arg)},
         )
@@ -105,13 +112,21 @@ def _try_calln(prop, token, kwargs):
         if value is _NO_ARG:
             continue
         payload[str(key)] = map_arg(value)
-    resp = rpc_client(
+    resp = _rpc_client(
         function_name=f"{_PREFIX}:{prop}:CALLN",
         args=payload,
     )
     result = resp.results.get(prop)
     return unmap_arg(result) if result is not None else None
 
+
+def _cached_get(device, prop):
+    return cached_get(device, prop, lambda: _try_get(prop, device.token))
+
+
+def _cached_set(device, prop, value):
+    cached_set(device, prop, value, lambda v: _try_set(prop, v, device.token))
+
 class TiMmWave:
 
     def __init__(self, token: str):
@@ -119,26 +134,34 @@ class TiMmWave:
         from ..dynamic_device import install_driver_if_stale
         install_driver_if_stale(token=token, current_hash=_SCHEMA_HASH)
 
+    remoterf_cache = None
+
+    def remoterf_enable_cache(self, ttl=None, *, ttls=None):
+        """Remember property reads and writes client-side; see PropertyCache."""
+        self.remoterf_cache = PropertyCache.from_policy(_CACHE_POLICY, ttl, ttls=ttls)
+        return self.remoterf_cache
+
     @property
     def device_info(self):
         'USB/UART identity, firmware profile, and current stream state.'
-        return _try_get("device_info", self.token)
+        return _cached_get(self, "device_info")
 
     @property
     def firmware_profile(self):
-        return _try_get("firmware_profile", self.token)
+        return _cached_get(self, "firmware_profile")
 
     @property
     def is_running(self):
-        return _try_get("is_running", self.token)
+        return _cached_get(self, "is_running")
 
     @property
     def stream_stats(self):
         'Frame queue, resynchronization, and reader health counters.'
-        return _try_get("stream_stats", self.token)
+        return _cached_get(self, "stream_stats")
 
     def apply_config(self, config_text, start=_NO_ARG, command_timeout=_NO_ARG):
         'Apply newline-delimited TI CLI configuration commands in order.'
+        note_call(self, "apply_config")
         return _try_calln("apply_config", self.token, {
             "config_text": config_text,
             "start": start,
@@ -147,32 +170,38 @@ class TiMmWave:
 
     def flush_frames(self):
         'Discard queued and partially assembled data frames.'
+        note_call(self, "flush_frames")
         return _try_call("flush_frames", self.token)
 
     def query_version(self, timeout=_NO_ARG):
+        note_call(self, "query_version")
         return _try_calln("query_version", self.token, {
             "timeout": timeout,
         })
 
     def read_frame(self, timeout=_NO_ARG):
         'Return one complete raw TI UART packet as bytes.'
+        note_call(self, "read_frame")
         return _try_calln("read_frame", self.token, {
             "timeout": timeout,
         })
 
     def send_command(self, command, timeout=_NO_ARG):
         'Send one runtime CLI command and return the textual response.'
+        note_call(self, "send_command")
         return _try_calln("send_command", self.token, {
             "command": command,
             "timeout": timeout,
         })
 
     def start(self, timeout=_NO_ARG):
+        note_call(self, "start")
         return _try_calln("start", self.token, {
             "timeout": timeout,
         })
 
     def stop(self, timeout=_NO_ARG):
+        note_call(self, "stop")
         return _try_calln("stop", self.token, {
             "timeout": timeout,
         })
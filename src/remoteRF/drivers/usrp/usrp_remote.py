@@ -18,6 +18,8 @@ from ..dynamic_v2 import build_uhd_bindings
 
 _SCHEMA_HASH = 'sha256:69159a5e174635038b732093f12b78f412c422e281bf2855935f8d121f8c7144'
 _SCHEMA = {'schema_version': '2.0', 'device_type': 'usrp', 'client_class': 'MultiUSRP', 'driver_version': '0.0.7', 'native_api': {'family': 'uhd-python', 'version': '4.10.0.0', 'abi': 'runtime-checked', 'generator_version': 'remoterf-uhd-manifest-v1'}, 'hardware_profiles': ['usrp2901', 'usrp-2901', 'ni2901', 'b205mini', 'b205-mini', 'usrp-b205-mini', 'b205mini-i', 'b205i', 'n210', 'usrp-n210', 'b2xx', 'b200', 'b210', 'b200mini', 'n2xx', 'usrp2', 'n200', 'x3xx', 'x300', 'x310', 'n3xx', 'n300', 'n310', 'n320', 'n321', 'x4xx', 'x410', 'x440', 'e3xx', 'e310', 'e320', 'generic_usrp', 'generic'], 'hardware_profile_definitions': [{'profile_id': 'usrp2901', 'display_name': 'NI USRP-2901', 'family': 'b2xx', 'transport': 'usb', 'support_level': 'qualified_native', 'selector': 'serial', 'uhd_device_type': 'b200', 'aliases': ['usrp-2901', 'ni2901'], 'identity_terms': ['ni2901', 'usrp-2901', 'usrp 2901'], 'qualified_models': ['NI USRP-2901'], 'default_link_rate_bps': None, 'notes': 'Qualified against the native UHD B210-compatible implementation.'}, {'profile_id': 'b205mini', 'display_name': 'Ettus Research USRP B205-mini', 'family': 'b2xx', 'transport': 'usb', 'support_level': 'qualified_native', 'selector': 'serial', 'uhd_device_type': 'b200', 'aliases': ['b205-mini', 'usrp-b205-mini', 'b205mini-i', 'b205i'], 'identity_terms': ['b205mini', 'b205-mini', 'b205i'], 'qualified_models': ['USRP B205-mini', 'USRP B205mini-i'], 'default_link_rate_bps': None, 'notes': 'Qualified as the single-channel B2xx-mini implementation over USB 3 with the native UHD driver.'}, {'profile_id': 'n210', 'display_name': 'USRP N210', 'family': 'n2xx', 'transport': 'ethernet', 'support_level': 'qualified_native', 'selector': 'address', 'uhd_device_type': 'usrp2', 'aliases': ['usrp-n210'], 'identity_terms': ['n210'], 'qualified_models': ['USRP N210'], 'default_link_rate_bps': 1000000000, 'notes': 'Qualified over the UHD USRP2 Gigabit Ethernet transport.'}, {'profile_id': 'b2xx', 'display_name': 'Generic USRP B2xx family', 'family': 'b2xx', 'transport': 'usb', 'support_level': 'generic_uhd', 'selector': 'serial', 'uhd_device_type': 'b200', 'aliases': ['b200', 'b210', 'b200mini'], 'identity_terms': ['b200', 'b210', 'b200mini'], 'qualified_models': [], 'default_link_rate_bps': None, 'notes': 'Uses the shared UHD API but requires model-specific qualification.'}, {'profile_id': 'n2xx', 'display_name': 'Generic USRP N2xx family', 'family': 'n2xx', 'transport': 'ethernet', 'support_level': 'generic_uhd', 'selector': 'address', 'uhd_device_type': 'usrp2', 'aliases': ['usrp2', 'n200'], 'identity_terms': ['n200', 'n210'], 'qualified_models': [], 'default_link_rate_bps': 1000000000, 'notes': 'Uses the shared UHD API but requires model-specific qualification.'}, {'profile_id': 'x3xx', 'display_name': 'Generic USRP X3xx family', 'family': 'x3xx', 'transport': 'ethernet', 'support_level': 'generic_uhd', 'selector': 'address', 'uhd_device_type': 'x300', 'aliases': ['x300', 'x310'], 'identity_terms': ['x300', 'x310'], 'qualified_models': [], 'default_link_rate_bps': None, 'notes': 'Generic UHD control/streaming support; hardware is not yet qualified.'}, {'profile_id': 'n3xx', 'display_name': 'Generic USRP N3xx family', 'family': 'n3xx', 'transport': 'ethernet', 'support_level': 'generic_uhd', 'selector': 'address', 'uhd_device_type': 'n3xx', 'aliases': ['n300', 'n310', 'n320', 'n321'], 'identity_terms': ['n300', 'n310', 'n320', 'n321'], 'qualified_models': [], 'default_link_rate_bps': None, 'notes': 'Generic UHD control/streaming support; hardware is not yet qualified.'}, {'profile_id': 'x4xx', 'display_name': 'Generic USRP X4xx family', 'family': 'x4xx', 'transport': 'ethernet', 'support_level': 'generic_uhd', 'selector': 'address', 'uhd_device_type': 'x4xx', 'aliases': ['x410', 'x440'], 'identity_terms': ['x410', 'x440'], 'qualified_models': [], 'default_link_rate_bps': None, 'notes': 'Generic UHD control/streaming support; hardware is not yet qualified.'}, {'profile_id': 'e3xx', 'display_name': 'Generic USRP E3xx family', 'family': 'e3xx', 'transport': 'embedded', 'support_level': 'generic_uhd', 'selector': 'device_args', 'uhd_device_type': 'e3xx', 'aliases': ['e310', 'e320'], 'identity_terms': ['e310', 'e320'], 'qualified_models': [], 'default_link_rate_bps': None, 'notes': 'Generic UHD support for server software running on/near the device.'}, {'profile_id': 'generic_usrp', 'display_name': 'Generic UHD USRP', 'family': 'unknown', 'transport': 'runtime_detected', 'support_level': 'generic_uhd', 'selector': 'device_args', 'uhd_device_type': '', 'aliases': ['generic'], 'identity_terms': [], 'qualified_models': [], 'default_link_rate_bps': None, 'notes': 'Fallback profile; all effective capabilities are runtime-reported.'}], 'protocols': {'control': ['2.0'], 'streaming': ['1.0']}, 'objects': [{'python_path': 'uhd', 'kind': 'namespace', 'aliases': [], 'mutability': 'value', 'constructors': [], 'fields': [], 'methods': []}, {'python_path': 'uhd.usrp', 'kind': 'namespace', 'aliases': [], 'mutability': 'value', 'constructors': [], 'fields': [], 'methods': []}, {'python_path': 'uhd.types', 'kind': 'namespace', 'aliases': [], 'mutability': 'value', 'constructors': [], 'fields': [], 'methods': []}, {'python_path': 'uhd.dsp', 'kind': 'namespace', 'aliases': [], 'mutability': 'value', 'constructors': [], 'fields': [], 'methods': []}, {'python_path': 'uhd.dsp.signals', 'kind': 'namespace', 'aliases': [], 'mutability': 'value', 'constructors': [], 'fields': [], 'methods': []}, {'python_path': 'uhd.filters', 'kind': 'namespace', 'aliases': [], 'mutability': 'value', 'constructors': [], 'fields': [], 'methods': []}, {'python_path': 'uhd.property', 'kind': 'namespace', 'aliases': [], 'mutability': 'value', 'constructors': [], 'fields': [], 'methods': []}, {'python_path': 'uhd.types.TimeSpec', 'kind': 'value_class', 'aliases': ['uhd.libpyuhd.types.time_spec'], 'mutability': 'value', 'constructors': [{'id': 'real_secs', 'parameters': [{'name': 'real_secs', 'type': 'float', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}], 'returns': 'uhd.types.TimeSpec', 'doc': ''}, {'id': 'full_frac', 'parameters': [{'name': 'full_secs', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'frac_secs', 'type': 'float', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}], 'returns': 'uhd.types.TimeSpec', 'doc': ''}], 'fields': [], 'methods': ['get_real_secs', 'get_full_secs', 'get_frac_secs', 'to_ticks', 'get_tick_count', 'from_ticks'], 'codec': 'uhd.time_spec.v1'}, {'python_path': 'uhd.types.DeviceAddr', 'kind': 'value_class', 'aliases': ['uhd.libpyuhd.types.device_addr'], 'mutability': 'value', 'constructors': [], 'fields': [], 'methods': ['to_string', 'keys', 'get', 'update'], 'codec': 'uhd.device_addr.v1'}, {'python_path': 'uhd.types.Range', 'kind': 'value_class', 'aliases': [], 'mutability': 'value', 'constructors': [], 'fields': [], 'methods': ['start', 'stop', 'step', 'clip'], 'codec': 'uhd.range.v1'}, {'python_path': 'uhd.types.MetaRange', 'kind': 'value_class', 'aliases': [], 'mutability': 'value', 'constructors': [], 'fields': [], 'methods': ['start', 'stop', 'step', 'clip'], 'codec': 'uhd.meta_range.v1'}, {'python_path': 'uhd.types.TuneRequest', 'kind': 'value_class', 'aliases': ['uhd.libpyuhd.types.tune_request'], 'mutability': 'inout', 'constructors': [], 'fields': [], 'methods': [], 'codec': 'uhd.tune_request.v1'}, {'python_path': 'uhd.types.TuneResult', 'kind': 'value_class', 'aliases': [], 'mutability': 'value', 'constructors': [], 'fields': [], 'methods': [], 'codec': 'uhd.tune_result.v1'}, {'python_path': 'uhd.usrp.SubdevSpec', 'kind': 'value_class', 'aliases': [], 'mutability': 'value', 'constructors': [], 'fields': [], 'methods': [], 'codec': 'uhd.subdev_spec.v1'}, {'python_path': 'uhd.usrp.SubdevSpecPair', 'kind': 'value_class', 'aliases': [], 'mutability': 'value', 'constructors': [], 'fields': [], 'methods': [], 'codec': 'uhd.subdev_spec_pair.v1'}, {'python_path': 'uhd.usrp.StreamArgs', 'kind': 'value_class', 'aliases': [], 'mutability': 'inout', 'constructors': [], 'fields': [], 'methods': [], 'codec': 'uhd.stream_args.v1'}, {'python_path': 'uhd.types.StreamCMD', 'kind': 'value_class', 'aliases': [], 'mutability': 'inout', 'constructors': [], 'fields': [], 'methods': [], 'codec': 'uhd.stream_cmd.v1'}, {'python_path': 'uhd.types.RXMetadata', 'kind': 'value_class', 'aliases': [], 'mutability': 'inout', 'constructors': [], 'fields': [], 'methods': [], 'codec': 'uhd.rx_metadata.v1'}, {'python_path': 'uhd.types.TXMetadata', 'kind': 'value_class', 'aliases': [], 'mutability': 'inout', 'constructors': [], 'fields': [], 'methods': [], 'codec': 'uhd.tx_metadata.v1'}, {'python_path': 'uhd.types.TXAsyncMetadata', 'kind': 'value_class', 'aliases': [], 'mutability': 'inout', 'constructors': [], 'fields': [], 'methods': [], 'codec': 'uhd.tx_async_metadata.v1'}, {'python_path': 'uhd.types.SensorValue', 'kind': 'value_class', 'aliases': [], 'mutability': 'value', 'constructors': [], 'fields': [], 'methods': [], 'codec': 'uhd.sensor_value.v1'}, {'python_path': 'uhd.filters.FilterInfoBase', 'kind': 'value_class', 'aliases': [], 'mutability': 'value', 'constructors': [{'id': 'default', 'parameters': [{'name': 'filter_type', 'type': 'uhd.filters.FilterType', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'bypassed', 'type': 'bool', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'position', 'type': 'int', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'uhd.filters.FilterInfoBase', 'doc': ''}], 'fields': [], 'methods': ['is_bypassed', 'get_type'], 'codec': 'uhd.filter.v1'}, {'python_path': 'uhd.filters.AnalogFilterBase', 'kind': 'value_class', 'aliases': [], 'mutability': 'value', 'constructors': [{'id': 'default', 'parameters': [{'name': 'filter_type', 'type': 'uhd.filters.FilterType', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'bypassed', 'type': 'bool', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'position', 'type': 'int', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'analog_type', 'type': 'str', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'uhd.filters.AnalogFilterBase', 'doc': ''}], 'fields': [], 'methods': ['is_bypassed', 'get_type', 'get_analog_type']}, {'python_path': 'uhd.filters.AnalogFilterLP', 'kind': 'value_class', 'aliases': [], 'mutability': 'value', 'constructors': [{'id': 'default', 'parameters': [{'name': 'filter_type', 'type': 'uhd.filters.FilterType', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'bypassed', 'type': 'bool', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'position', 'type': 'int', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'analog_type', 'type': 'str', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'cutoff', 'type': 'float', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'rolloff', 'type': 'float', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'uhd.filters.AnalogFilterLP', 'doc': ''}], 'fields': [], 'methods': ['is_bypassed', 'get_type', 'get_analog_type', 'get_cutoff', 'get_rolloff', 'set_cutoff']}, {'python_path': 'uhd.filters.DigitalFilterBaseI16', 'kind': 'value_class', 'aliases': [], 'mutability': 'value', 'constructors': [{'id': 'default', 'parameters': [{'name': 'filter_type', 'type': 'uhd.filters.FilterType', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'bypassed', 'type': 'bool', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'position', 'type': 'int', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'input_rate', 'type': 'float', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'interpolation', 'type': 'int', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'decimation', 'type': 'int', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'tap_full_scale', 'type': 'int', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'max_num_taps', 'type': 'int', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'taps', 'type': 'list[int]', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'uhd.filters.DigitalFilterBaseI16', 'doc': ''}], 'fields': [], 'methods': ['is_bypassed', 'get_type', 'get_output_rate', 'get_input_rate', 'get_interpolation', 'get_decimation', 'get_tap_full_scale', 'get_taps']}, {'python_path': 'uhd.filters.DigitalFilterFIRI16', 'kind': 'value_class', 'aliases': [], 'mutability': 'value', 'constructors': [{'id': 'default', 'parameters': [{'name': 'filter_type', 'type': 'uhd.filters.FilterType', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'bypassed', 'type': 'bool', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'position', 'type': 'int', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'input_rate', 'type': 'float', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'interpolation', 'type': 'int', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'decimation', 'type': 'int', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'tap_full_scale', 'type': 'int', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'max_num_taps', 'type': 'int', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'taps', 'type': 'list[int]', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'uhd.filters.DigitalFilterFIRI16', 'doc': ''}], 'fields': [], 'methods': ['is_bypassed', 'get_type', 'get_output_rate', 'get_input_rate', 'get_interpolation', 'get_decimation', 'get_tap_full_scale', 'get_taps', 'set_taps']}, {'python_path': 'uhd.filters.FilterType', 'kind': 'enum', 'aliases': [], 'mutability': 'value', 'constructors': [], 'fields': [], 'methods': [], 'values': [{'name': 'analog_low_pass', 'value': 'analog_low_pass'}, {'name': 'analog_band_pass', 'value': 'analog_band_pass'}, {'name': 'digital_i16', 'value': 'digital_i16'}, {'name': 'digital_fir_i16', 'value': 'digital_fir_i16'}]}, {'python_path': 'uhd.types.StreamMode', 'kind': 'enum', 'aliases': [], 'mutability': 'value', 'constructors': [], 'fields': [], 'methods': [], 'values': [{'name': 'num_done', 'value': 'num_done'}, {'name': 'num_more', 'value': 'num_more'}, {'name': 'stop_cont', 'value': 'stop_cont'}, {'name': 'start_cont', 'value': 'start_cont'}]}, {'python_path': 'uhd.types.RXMetadataErrorCode', 'kind': 'enum', 'aliases': [], 'mutability': 'value', 'constructors': [], 'fields': [], 'methods': [], 'values': [{'name': 'none', 'value': 'none'}, {'name': 'timeout', 'value': 'timeout'}, {'name': 'overflow', 'value': 'overflow'}, {'name': 'late_command', 'value': 'late_command'}, {'name': 'broken_chain', 'value': 'broken_chain'}, {'name': 'alignment', 'value': 'alignment'}, {'name': 'bad_packet', 'value': 'bad_packet'}]}, {'python_path': 'uhd.types.TXMetadataEventCode', 'kind': 'enum', 'aliases': [], 'mutability': 'value', 'constructors': [], 'fields': [], 'methods': [], 'values': [{'name': 'burst_ack', 'value': 'burst_ack'}, {'name': 'underflow', 'value': 'underflow'}, {'name': 'seq_error', 'value': 'seq_error'}, {'name': 'time_error', 'value': 'time_error'}, {'name': 'underflow_in_packet', 'value': 'underflow_in_packet'}, {'name': 'seq_error_in_burst', 'value': 'seq_error_in_burst'}]}, {'python_path': 'uhd.usrp.MultiUSRP', 'kind': 'remote_handle', 'aliases': [], 'mutability': 'remote_handle', 'constructors': [], 'fields': [], 'methods': [], 'ownership': {'scope': 'session', 'close': True, 'context_manager': True}}, {'python_path': 'uhd.usrp.RXStreamer', 'kind': 'remote_handle', 'aliases': [], 'mutability': 'remote_handle', 'constructors': [], 'fields': [], 'methods': [], 'ownership': {'scope': 'session', 'parent': 'uhd.usrp.MultiUSRP', 'concurrency': 'single_reader', 'close': True, 'context_manager': True}}, {'python_path': 'uhd.usrp.TXStreamer', 'kind': 'remote_handle', 'aliases': [], 'mutability': 'remote_handle', 'constructors': [], 'fields': [], 'methods': [], 'ownership': {'scope': 'session', 'parent': 'uhd.usrp.MultiUSRP', 'concurrency': 'single_sender', 'close': True, 'context_manager': True}}, {'python_path': 'uhd.property_tree', 'kind': 'remote_handle', 'aliases': [], 'mutability': 'remote_handle', 'constructors': [], 'fields': [], 'methods': [], 'ownership': {'scope': 'session', 'default_access': 'read_write'}}, {'python_path': 'uhd.property.bool', 'kind': 'remote_handle', 'aliases': [], 'mutability': 'remote_handle', 'constructors': [], 'fields': [], 'methods': [], 'ownership': {'scope': 'session', 'parent': 'uhd.property_tree', 'default_access': 'read_write'}}, {'python_path': 'uhd.property.int', 'kind': 'remote_handle', 'aliases': [], 'mutability': 'remote_handle', 'constructors': [], 'fields': [], 'methods': [], 'ownership': {'scope': 'session', 'parent': 'uhd.property_tree', 'default_access': 'read_write'}}, {'python_path': 'uhd.property.double', 'kind': 'remote_handle', 'aliases': [], 'mutability': 'remote_handle', 'constructors': [], 'fields': [], 'methods': [], 'ownership': {'scope': 'session', 'parent': 'uhd.property_tree', 'default_access': 'read_write'}}, {'python_path': 'uhd.property.str', 'kind': 'remote_handle', 'aliases': [], 'mutability': 'remote_handle', 'constructors': [], 'fields': [], 'methods': [], 'ownership': {'scope': 'session', 'parent': 'uhd.property_tree', 'default_access': 'read_write'}}, {'python_path': 'uhd.property.device_addr', 'kind': 'remote_handle', 'aliases': [], 'mutability': 'remote_handle', 'constructors': [], 'fields': [], 'methods': [], 'ownership': {'scope': 'session', 'parent': 'uhd.property_tree', 'default_access': 'read_write'}}, {'python_path': 'uhd.property.dboard_iface', 'kind': 'remote_handle', 'aliases': [], 'mutability': 'remote_handle', 'constructors': [], 'fields': [], 'methods': [], 'ownership': {'scope': 'session', 'parent': 'uhd.property_tree', 'default_access': 'read_write'}}, {'python_path': 'uhd.usrp.radio_control', 'kind': 'remote_handle', 'aliases': [], 'mutability': 'remote_handle', 'constructors': [], 'fields': [], 'methods': [], 'ownership': {'scope': 'session', 'default_access': 'read_write'}}, {'python_path': 'uhd.usrp.mboard_controller', 'kind': 'remote_handle', 'aliases': [], 'mutability': 'remote_handle', 'constructors': [], 'fields': [], 'methods': [], 'ownership': {'scope': 'session', 'default_access': 'read_write'}}, {'python_path': 'uhd.usrp.dboard_iface', 'kind': 'remote_handle', 'aliases': [], 'mutability': 'remote_handle', 'constructors': [], 'fields': [], 'methods': [], 'ownership': {'scope': 'session', 'default_access': 'read_write'}}, {'python_path': 'uhd.usrp.user_settings_iface', 'kind': 'remote_handle', 'aliases': [], 'mutability': 'remote_handle', 'constructors': [], 'fields': [], 'methods': [], 'ownership': {'scope': 'session', 'default_access': 'read_write'}}], 'methods': [{'name': 'get_pp_string', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [], 'returns': 'str', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_pp_string'}}, {'name': 'get_mboard_name', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'str', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_mboard_name'}}, {'name': 'get_num_mboards', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [], 'returns': 'int', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_num_mboards'}}, {'name': 'get_tree', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [], 'returns': 'uhd.property_tree', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tree'}}, {'name': 'get_radio_control', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.usrp.radio_control', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_radio_control', 'optional': True}}, {'name': 'get_mb_controller', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.usrp.mboard_controller', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_mb_controller', 'optional': True}}, {'name': 'get_usrp_rx_info', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'dict[str,str]', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_usrp_rx_info'}}, {'name': 'get_usrp_tx_info', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'dict[str,str]', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_usrp_tx_info'}}, {'name': 'get_rx_num_channels', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [], 'returns': 'int', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_num_channels'}}, {'name': 'get_tx_num_channels', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [], 'returns': 'int', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_num_channels'}}, {'name': 'get_rx_radio_channel', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'int', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_radio_channel', 'optional': True}}, {'name': 'get_tx_radio_channel', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'int', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_radio_channel', 'optional': True}}, {'name': 'set_master_clock_rate', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'rate', 'type': 'float', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 18446744073709551615}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_master_clock_rate'}}, {'name': 'get_master_clock_rate', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'float', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_master_clock_rate'}}, {'name': 'get_master_clock_rate_range', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 18446744073709551615}], 'returns': 'uhd.types.MetaRange', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_master_clock_rate_range'}}, {'name': 'get_time_now', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.types.TimeSpec', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_time_now'}}, {'name': 'get_time_last_pps', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.types.TimeSpec', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_time_last_pps'}}, {'name': 'set_time_now', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'time_spec', 'type': 'uhd.types.TimeSpec', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 18446744073709551615}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_time_now'}}, {'name': 'set_time_next_pps', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'time_spec', 'type': 'uhd.types.TimeSpec', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 18446744073709551615}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_time_next_pps'}}, {'name': 'set_time_unknown_pps', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'time_spec', 'type': 'uhd.types.TimeSpec', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_time_unknown_pps'}}, {'name': 'get_time_synchronized', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [], 'returns': 'bool', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_time_synchronized'}}, {'name': 'set_command_time', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'time_spec', 'type': 'uhd.types.TimeSpec', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 18446744073709551615}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_command_time'}}, {'name': 'clear_command_time', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 18446744073709551615}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'clear_command_time'}}, {'name': 'issue_stream_cmd', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'rate', 'type': 'uhd.types.StreamCMD', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 18446744073709551615}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'issue_stream_cmd'}}, {'name': 'set_clock_source', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'source', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 18446744073709551615}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_clock_source'}}, {'name': 'get_clock_source', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'mboard', 'type': 'int', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'str', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_clock_source'}}, {'name': 'get_clock_sources', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'mboard', 'type': 'int', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'list[str]', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_clock_sources'}}, {'name': 'set_time_source', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'source', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 18446744073709551615}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_time_source'}}, {'name': 'get_time_source', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'mboard', 'type': 'int', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'str', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_time_source'}}, {'name': 'get_time_sources', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'mboard', 'type': 'int', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'list[str]', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_time_sources'}}, {'name': 'set_sync_source', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'clock_time', 'parameters': [{'name': 'clock_source', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'time_source', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 18446744073709551615}], 'returns': 'None', 'doc': ''}, {'id': 'device_addr', 'parameters': [{'name': 'sync_source', 'type': 'uhd.types.DeviceAddr', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 18446744073709551615}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_sync_source'}}, {'name': 'get_sync_source', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'mboard', 'type': 'int', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'uhd.types.DeviceAddr', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_sync_source'}}, {'name': 'get_sync_sources', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'mboard', 'type': 'int', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'list[uhd.types.DeviceAddr]', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_sync_sources'}}, {'name': 'set_clock_source_out', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'enb', 'type': 'bool', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 18446744073709551615}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_clock_source_out'}}, {'name': 'set_time_source_out', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'enb', 'type': 'bool', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 18446744073709551615}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_time_source_out'}}, {'name': 'get_mboard_sensor_names', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'list[str]', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_mboard_sensor_names'}}, {'name': 'get_mboard_sensor', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'name', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.types.SensorValue', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_mboard_sensor'}}, {'name': 'set_rx_subdev_spec', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'spec', 'type': 'uhd.usrp.SubdevSpec', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 18446744073709551615}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_rx_subdev_spec'}}, {'name': 'get_rx_subdev_spec', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.usrp.SubdevSpec', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_subdev_spec'}}, {'name': 'get_rx_subdev_name', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'str', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_subdev_name'}}, {'name': 'set_rx_rate', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'rate', 'type': 'float', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 18446744073709551615}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_rx_rate'}}, {'name': 'get_rx_rate', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'float', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_rate'}}, {'name': 'get_rx_rates', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.types.MetaRange', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_rates'}}, {'name': 'set_rx_spp', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'spp', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 18446744073709551615}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_rx_spp', 'optional': True}}, {'name': 'set_rx_freq', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'tune_request', 'type': 'float|uhd.types.TuneRequest', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.types.TuneResult', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_rx_freq'}}, {'name': 'get_rx_freq', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'float', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_freq'}}, {'name': 'get_rx_freq_range', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.types.MetaRange', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_freq_range'}}, {'name': 'get_fe_rx_freq_range', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.types.MetaRange', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_fe_rx_freq_range'}}, {'name': 'get_rx_lo_names', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'list[str]', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_lo_names'}}, {'name': 'set_rx_lo_source', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'src', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'name', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 'all'}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_rx_lo_source'}}, {'name': 'get_rx_lo_source', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'name', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 'all'}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'str', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_lo_source'}}, {'name': 'get_rx_lo_sources', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'name', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 'all'}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'list[str]', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_lo_sources'}}, {'name': 'set_rx_lo_export_enabled', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'enb', 'type': 'bool', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'name', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 'all'}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_rx_lo_export_enabled'}}, {'name': 'get_rx_lo_export_enabled', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'name', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 'all'}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'bool', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_lo_export_enabled'}}, {'name': 'set_rx_lo_freq', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'freq', 'type': 'float', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'name', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'float', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_rx_lo_freq'}}, {'name': 'get_rx_lo_freq', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'name', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'float', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_lo_freq'}}, {'name': 'get_rx_lo_freq_range', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'name', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.types.MetaRange', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_lo_freq_range'}}, {'name': 'set_rx_gain', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'gain_chan', 'parameters': [{'name': 'gain', 'type': 'float', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'None', 'doc': ''}, {'id': 'gain_name_chan', 'parameters': [{'name': 'gain', 'type': 'float', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'name', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_rx_gain'}}, {'name': 'get_rx_gain', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'chan', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'float', 'doc': ''}, {'id': 'name_chan', 'parameters': [{'name': 'name', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'float', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_gain'}}, {'name': 'get_rx_gain_range', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'name_chan', 'parameters': [{'name': 'name', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.types.MetaRange', 'doc': ''}, {'id': 'chan', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.types.MetaRange', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_gain_range'}}, {'name': 'get_rx_gain_names', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'list[str]', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_gain_names'}}, {'name': 'set_normalized_rx_gain', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'gain', 'type': 'float', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_normalized_rx_gain'}}, {'name': 'get_normalized_rx_gain', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'float', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_normalized_rx_gain'}}, {'name': 'set_rx_agc', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'enable', 'type': 'bool', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_rx_agc'}}, {'name': 'set_rx_gain_profile', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'profile', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_rx_gain_profile'}}, {'name': 'get_rx_gain_profile', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'str', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_gain_profile'}}, {'name': 'get_rx_gain_profile_names', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'list[str]', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_gain_profile_names'}}, {'name': 'has_rx_power_reference', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'bool', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'has_rx_power_reference'}}, {'name': 'set_rx_power_reference', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'power_dbm', 'type': 'float', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_rx_power_reference'}}, {'name': 'get_rx_power_reference', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'float', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_power_reference'}}, {'name': 'get_rx_power_range', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.types.MetaRange', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_power_range'}}, {'name': 'set_rx_antenna', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'ant', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_rx_antenna'}}, {'name': 'get_rx_antenna', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'str', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_antenna'}}, {'name': 'get_rx_antennas', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'list[str]', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_antennas'}}, {'name': 'set_rx_bandwidth', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'bandwidth', 'type': 'float', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_rx_bandwidth'}}, {'name': 'get_rx_bandwidth', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'float', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_bandwidth'}}, {'name': 'get_rx_bandwidth_range', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.types.MetaRange', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_bandwidth_range'}}, {'name': 'get_rx_sensor_names', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'list[str]', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_sensor_names'}}, {'name': 'get_rx_sensor', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'name', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.types.SensorValue', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_sensor'}}, {'name': 'set_rx_dc_offset', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'offset', 'parameters': [{'name': 'offset', 'type': 'complex', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'None', 'doc': ''}, {'id': 'enable', 'parameters': [{'name': 'enb', 'type': 'bool', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_rx_dc_offset'}}, {'name': 'set_rx_iq_balance', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'correction', 'parameters': [{'name': 'correction', 'type': 'complex', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'None', 'doc': ''}, {'id': 'enable', 'parameters': [{'name': 'enb', 'type': 'bool', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_rx_iq_balance'}}, {'name': 'get_rx_dboard_iface', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.usrp.dboard_iface', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_dboard_iface'}}, {'name': 'set_tx_subdev_spec', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'spec', 'type': 'uhd.usrp.SubdevSpec', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 18446744073709551615}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_tx_subdev_spec'}}, {'name': 'get_tx_subdev_spec', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.usrp.SubdevSpec', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_subdev_spec'}}, {'name': 'get_tx_subdev_name', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'str', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_subdev_name'}}, {'name': 'set_tx_rate', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'rate', 'type': 'float', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 18446744073709551615}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_tx_rate'}}, {'name': 'get_tx_rate', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'float', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_rate'}}, {'name': 'get_tx_rates', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.types.MetaRange', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_rates'}}, {'name': 'set_tx_freq', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'tune_request', 'type': 'float|uhd.types.TuneRequest', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.types.TuneResult', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_tx_freq'}}, {'name': 'get_tx_freq', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'float', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_freq'}}, {'name': 'get_tx_freq_range', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.types.MetaRange', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_freq_range'}}, {'name': 'get_fe_tx_freq_range', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.types.MetaRange', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_fe_tx_freq_range'}}, {'name': 'get_tx_lo_names', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'list[str]', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_lo_names'}}, {'name': 'set_tx_lo_source', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'src', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'name', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 'all'}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_tx_lo_source'}}, {'name': 'get_tx_lo_source', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'name', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 'all'}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'str', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_lo_source'}}, {'name': 'get_tx_lo_sources', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'name', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 'all'}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'list[str]', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_lo_sources'}}, {'name': 'set_tx_lo_export_enabled', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'enb', 'type': 'bool', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'name', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 'all'}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_tx_lo_export_enabled'}}, {'name': 'get_tx_lo_export_enabled', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'name', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 'all'}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'bool', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_lo_export_enabled'}}, {'name': 'set_tx_lo_freq', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'freq', 'type': 'float', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'name', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'float', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_tx_lo_freq'}}, {'name': 'get_tx_lo_freq', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'name', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'float', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_lo_freq'}}, {'name': 'get_tx_lo_freq_range', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'name', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.types.MetaRange', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_lo_freq_range'}}, {'name': 'set_tx_gain', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'gain_chan', 'parameters': [{'name': 'gain', 'type': 'float', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'None', 'doc': ''}, {'id': 'gain_name_chan', 'parameters': [{'name': 'gain', 'type': 'float', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'name', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_tx_gain'}}, {'name': 'get_tx_gain', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'chan', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'float', 'doc': ''}, {'id': 'name_chan', 'parameters': [{'name': 'name', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'float', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_gain'}}, {'name': 'get_tx_gain_range', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'name_chan', 'parameters': [{'name': 'name', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.types.MetaRange', 'doc': ''}, {'id': 'chan', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.types.MetaRange', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_gain_range'}}, {'name': 'get_tx_gain_names', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'list[str]', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_gain_names'}}, {'name': 'set_normalized_tx_gain', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'gain', 'type': 'float', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_normalized_tx_gain'}}, {'name': 'get_normalized_tx_gain', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'float', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_normalized_tx_gain'}}, {'name': 'set_tx_gain_profile', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'profile', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_tx_gain_profile'}}, {'name': 'get_tx_gain_profile', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'str', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_gain_profile'}}, {'name': 'get_tx_gain_profile_names', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'list[str]', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_gain_profile_names'}}, {'name': 'has_tx_power_reference', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'bool', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'has_tx_power_reference'}}, {'name': 'set_tx_power_reference', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'power_dbm', 'type': 'float', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_tx_power_reference'}}, {'name': 'get_tx_power_reference', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'float', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_power_reference'}}, {'name': 'get_tx_power_range', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.types.MetaRange', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_power_range'}}, {'name': 'set_tx_antenna', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'ant', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_tx_antenna'}}, {'name': 'get_tx_antenna', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'str', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_antenna'}}, {'name': 'get_tx_antennas', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'list[str]', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_antennas'}}, {'name': 'set_tx_bandwidth', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'bandwidth', 'type': 'float', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_tx_bandwidth'}}, {'name': 'get_tx_bandwidth', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'float', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_bandwidth'}}, {'name': 'get_tx_bandwidth_range', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.types.MetaRange', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_bandwidth_range'}}, {'name': 'get_tx_sensor_names', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'list[str]', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_sensor_names'}}, {'name': 'get_tx_sensor', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'name', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.types.SensorValue', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_sensor'}}, {'name': 'set_tx_dc_offset', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'offset', 'type': 'complex', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_tx_dc_offset'}}, {'name': 'set_tx_iq_balance', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'correction', 'type': 'complex', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_tx_iq_balance'}}, {'name': 'get_tx_dboard_iface', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.usrp.dboard_iface', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_dboard_iface'}}, {'name': 'get_rx_stream', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'stream_args', 'type': 'uhd.usrp.StreamArgs', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'uhd.usrp.RXStreamer', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_stream'}}, {'name': 'get_tx_stream', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'stream_args', 'type': 'uhd.usrp.StreamArgs', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'uhd.usrp.TXStreamer', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_stream'}}, {'name': 'get_gpio_banks', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'mboard', 'type': 'int', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'list[str]', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_gpio_banks'}}, {'name': 'set_gpio_attr', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'bank', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'attr', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'value', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'mask', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 4294967295}, {'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_gpio_attr'}}, {'name': 'get_gpio_attr', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'bank', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'attr', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'int', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_gpio_attr'}}, {'name': 'get_gpio_srcs', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'bank', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'list[str]', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_gpio_srcs', 'optional': True}}, {'name': 'get_gpio_src', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'bank', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'list[str]', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_gpio_src', 'optional': True}}, {'name': 'set_gpio_src', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'bank', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'src', 'type': 'list[str]', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_gpio_src', 'optional': True}}, {'name': 'get_gpio_src_banks', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'list[str]', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_gpio_src_banks', 'optional': True}}, {'name': 'get_rx_filter_names', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'list[str]', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_filter_names'}}, {'name': 'get_rx_filter', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'name', 'type': 'str', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'uhd.filters.FilterInfoBase', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_rx_filter'}}, {'name': 'set_rx_filter', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'name', 'type': 'str', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'filter', 'type': 'uhd.filters.FilterInfoBase', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_rx_filter'}}, {'name': 'get_tx_filter_names', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'list[str]', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_filter_names'}}, {'name': 'get_tx_filter', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'name', 'type': 'str', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'uhd.filters.FilterInfoBase', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_tx_filter'}}, {'name': 'set_tx_filter', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'name', 'type': 'str', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'filter', 'type': 'uhd.filters.FilterInfoBase', 'kind': 'positional_only', 'direction': 'in', 'required': True}, {'name': 'chan', 'type': 'int', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_tx_filter'}}, {'name': 'set_user_register', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'addr', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'data', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'mboard', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 18446744073709551615}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'set_user_register'}}, {'name': 'get_user_settings_iface', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_control', 'overloads': [{'id': 'default', 'parameters': [{'name': 'chan', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0}], 'returns': 'uhd.usrp.user_settings_iface', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'get_user_settings_iface'}}, {'name': 'recv_num_samps', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_optimized', 'overloads': [{'id': 'default', 'parameters': [{'name': 'num_samps', 'type': 'int', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'freq', 'type': 'float', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'rate', 'type': 'float', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 1000000.0}, {'name': 'channels', 'type': 'list[int]', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': [0]}, {'name': 'gain', 'type': 'float', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 10}, {'name': 'start_time', 'type': 'uhd.types.TimeSpec|None', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': None}, {'name': 'streamer', 'type': 'uhd.usrp.RXStreamer|None', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': None}], 'returns': 'ndarray', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'recv_num_samps'}}, {'name': 'send_waveform', 'owner': 'uhd.usrp.MultiUSRP', 'execution': 'server_optimized', 'overloads': [{'id': 'default', 'parameters': [{'name': 'waveform_proto', 'type': 'ndarray', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'duration', 'type': 'float', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'freq', 'type': 'float', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'rate', 'type': 'float', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 1000000.0}, {'name': 'channels', 'type': 'list[int]', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': [0]}, {'name': 'gain', 'type': 'float', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 10}, {'name': 'start_time', 'type': 'uhd.types.TimeSpec|None', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': None}, {'name': 'streamer', 'type': 'uhd.usrp.TXStreamer|None', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': None}], 'returns': 'int', 'doc': ''}], 'mutations': [], 'doc': '', 'availability': {'runtime_member': 'send_waveform'}}, {'name': 'get_num_channels', 'owner': 'uhd.usrp.RXStreamer', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [], 'returns': 'int', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'get_max_num_samps', 'owner': 'uhd.usrp.RXStreamer', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [], 'returns': 'int', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'issue_stream_cmd', 'owner': 'uhd.usrp.RXStreamer', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [{'name': 'stream_cmd', 'type': 'uhd.types.StreamCMD', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'recv', 'owner': 'uhd.usrp.RXStreamer', 'execution': 'sample_stream', 'overloads': [{'id': 'default', 'parameters': [{'name': 'buffs', 'type': 'ndarray', 'kind': 'positional_or_keyword', 'direction': 'out', 'required': True, 'ndarray': {'writable': True, 'dtype_from': 'stream.cpu_format', 'channel_major': True}}, {'name': 'metadata', 'type': 'uhd.types.RXMetadata', 'kind': 'positional_or_keyword', 'direction': 'inout', 'required': True}, {'name': 'timeout', 'type': 'float', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0.1}], 'returns': 'int', 'doc': ''}], 'mutations': ['buffs', 'metadata'], 'doc': ''}, {'name': 'get_num_channels', 'owner': 'uhd.usrp.TXStreamer', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [], 'returns': 'int', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'get_max_num_samps', 'owner': 'uhd.usrp.TXStreamer', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [], 'returns': 'int', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'send', 'owner': 'uhd.usrp.TXStreamer', 'execution': 'sample_stream', 'overloads': [{'id': 'default', 'parameters': [{'name': 'buffs', 'type': 'ndarray', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True, 'ndarray': {'channel_major': True}}, {'name': 'metadata', 'type': 'uhd.types.TXMetadata', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}, {'name': 'timeout', 'type': 'float', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0.1}], 'returns': 'int', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'recv_async_msg', 'owner': 'uhd.usrp.TXStreamer', 'execution': 'server_handle', 'overloads': [{'id': 'mutate_metadata', 'parameters': [{'name': 'async_metadata', 'type': 'uhd.types.TXAsyncMetadata', 'kind': 'positional_or_keyword', 'direction': 'inout', 'required': True}, {'name': 'timeout', 'type': 'float', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0.1}], 'returns': 'bool', 'doc': ''}, {'id': 'return_metadata', 'parameters': [{'name': 'timeout', 'type': 'float', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': False, 'default': 0.1}], 'returns': 'uhd.types.TXAsyncMetadata|None', 'doc': ''}], 'mutations': ['async_metadata'], 'doc': ''}, {'name': 'subtree', 'owner': 'uhd.property_tree', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [{'name': 'path', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}], 'returns': 'uhd.property_tree', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'exists', 'owner': 'uhd.property_tree', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [{'name': 'path', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}], 'returns': 'bool', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'list', 'owner': 'uhd.property_tree', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [{'name': 'path', 'type': 'str', 'kind': 'positional_or_keyword', 'direction': 'in', 'required': True}], 'returns': 'list[str]', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'access_bool', 'owner': 'uhd.property_tree', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [{'name': 'path', 'type': 'str', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'uhd.property.bool', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'access_int', 'owner': 'uhd.property_tree', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [{'name': 'path', 'type': 'str', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'uhd.property.int', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'access_double', 'owner': 'uhd.property_tree', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [{'name': 'path', 'type': 'str', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'uhd.property.double', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'access_str', 'owner': 'uhd.property_tree', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [{'name': 'path', 'type': 'str', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'uhd.property.str', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'access_device_addr', 'owner': 'uhd.property_tree', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [{'name': 'path', 'type': 'str', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'uhd.property.device_addr', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'access_dboard_iface', 'owner': 'uhd.property_tree', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [{'name': 'path', 'type': 'str', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'uhd.property.dboard_iface', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'get', 'owner': 'uhd.property.bool', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [], 'returns': 'bool', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'get_desired', 'owner': 'uhd.property.bool', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [], 'returns': 'bool', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'set', 'owner': 'uhd.property.bool', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [{'name': 'value', 'type': 'bool', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'set_coerced', 'owner': 'uhd.property.bool', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [{'name': 'value', 'type': 'bool', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'get', 'owner': 'uhd.property.int', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [], 'returns': 'int', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'get_desired', 'owner': 'uhd.property.int', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [], 'returns': 'int', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'set', 'owner': 'uhd.property.int', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [{'name': 'value', 'type': 'int', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'set_coerced', 'owner': 'uhd.property.int', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [{'name': 'value', 'type': 'int', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'get', 'owner': 'uhd.property.double', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [], 'returns': 'float', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'get_desired', 'owner': 'uhd.property.double', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [], 'returns': 'float', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'set', 'owner': 'uhd.property.double', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [{'name': 'value', 'type': 'float', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'set_coerced', 'owner': 'uhd.property.double', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [{'name': 'value', 'type': 'float', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'get', 'owner': 'uhd.property.str', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [], 'returns': 'str', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'get_desired', 'owner': 'uhd.property.str', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [], 'returns': 'str', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'set', 'owner': 'uhd.property.str', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [{'name': 'value', 'type': 'str', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'set_coerced', 'owner': 'uhd.property.str', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [{'name': 'value', 'type': 'str', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'get', 'owner': 'uhd.property.device_addr', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [], 'returns': 'uhd.types.DeviceAddr', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'get_desired', 'owner': 'uhd.property.device_addr', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [], 'returns': 'uhd.types.DeviceAddr', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'set', 'owner': 'uhd.property.device_addr', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [{'name': 'value', 'type': 'uhd.types.DeviceAddr', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'set_coerced', 'owner': 'uhd.property.device_addr', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [{'name': 'value', 'type': 'uhd.types.DeviceAddr', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'get', 'owner': 'uhd.property.dboard_iface', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [], 'returns': 'uhd.usrp.dboard_iface', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'get_desired', 'owner': 'uhd.property.dboard_iface', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [], 'returns': 'uhd.usrp.dboard_iface', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'set', 'owner': 'uhd.property.dboard_iface', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [{'name': 'value', 'type': 'uhd.usrp.dboard_iface', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': ''}, {'name': 'set_coerced', 'owner': 'uhd.property.dboard_iface', 'execution': 'server_handle', 'overloads': [{'id': 'default', 'parameters': [{'name': 'value', 'type': 'uhd.usrp.dboard_iface', 'kind': 'positional_only', 'direction': 'in', 'required': True}], 'returns': 'None', 'doc': ''}], 'mutations': [], 'doc': ''}], 'errors': [{'code': 'RemoteRFTransportError', 'python_class': 'RemoteRFTransportError'}, {'code': 'RemoteRFSessionExpiredError', 'python_class': 'RemoteRFSessionExpiredError'}, {'code': 'RemoteRFReservationError', 'python_class': 'RemoteRFReservationError'}, {'code': 'RemoteRFStaleHandleError', 'python_class': 'RemoteRFStaleHandleError'}, {'code': 'RemoteRFProtocolError', 'python_class': 'RemoteRFProtocolError'}, {'code': 'RemoteRFOverloadError', 'python_class': 'RemoteRFOverloadError'}, {'code': 'RemoteRFServerOverloadedError', 'python_class': 'RemoteRFServerOverloadedError'}, {'code': 'RemoteRFNativeUHDError', 'python_class': 'RemoteRFNativeUHDError'}], 'capability_fields': ['remote_device_type', 'hardware_profile', 'device_profile', 'profile_resolution', 'native_product', 'native_name', 'native_serial', 'uhd_version', 'uhd_abi', 'firmware_version', 'fpga_version', 'fpga_image', 'transport_type', 'transport_address', 'usb_speed', 'transport_link_rate_bps', 'rx_channel_count', 'tx_channel_count', 'rx_frequency_ranges_per_channel', 'tx_frequency_ranges_per_channel', 'rx_gain_ranges_per_channel', 'tx_gain_ranges_per_channel', 'rx_bandwidth_ranges_per_channel', 'tx_bandwidth_ranges_per_channel', 'master_clock_rate_range', 'time_sources', 'clock_sources', 'gpio_banks', 'sensors', 'supported_cpu_formats', 'supported_otw_formats', 'stream_format_capabilities', 'maximum_remote_payload_bytes', 'supported_streaming_protocol_versions', 'remote_resource_limits', 'advanced_interfaces'], 'deprecations': [], 'coverage': {'uhd.usrp.MultiUSRP.get_pp_string': 'implemented', 'uhd.usrp.MultiUSRP.get_mboard_name': 'implemented', 'uhd.usrp.MultiUSRP.get_num_mboards': 'implemented', 'uhd.usrp.MultiUSRP.get_tree': 'implemented', 'uhd.usrp.MultiUSRP.get_radio_control': 'implemented', 'uhd.usrp.MultiUSRP.get_mb_controller': 'implemented', 'uhd.usrp.MultiUSRP.get_usrp_rx_info': 'implemented', 'uhd.usrp.MultiUSRP.get_usrp_tx_info': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_num_channels': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_num_channels': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_radio_channel': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_radio_channel': 'implemented', 'uhd.usrp.MultiUSRP.set_master_clock_rate': 'implemented', 'uhd.usrp.MultiUSRP.get_master_clock_rate': 'implemented', 'uhd.usrp.MultiUSRP.get_master_clock_rate_range': 'implemented', 'uhd.usrp.MultiUSRP.get_time_now': 'implemented', 'uhd.usrp.MultiUSRP.get_time_last_pps': 'implemented', 'uhd.usrp.MultiUSRP.set_time_now': 'implemented', 'uhd.usrp.MultiUSRP.set_time_next_pps': 'implemented', 'uhd.usrp.MultiUSRP.set_time_unknown_pps': 'implemented', 'uhd.usrp.MultiUSRP.get_time_synchronized': 'implemented', 'uhd.usrp.MultiUSRP.set_command_time': 'implemented', 'uhd.usrp.MultiUSRP.clear_command_time': 'implemented', 'uhd.usrp.MultiUSRP.issue_stream_cmd': 'implemented', 'uhd.usrp.MultiUSRP.set_clock_source': 'implemented', 'uhd.usrp.MultiUSRP.get_clock_source': 'implemented', 'uhd.usrp.MultiUSRP.get_clock_sources': 'implemented', 'uhd.usrp.MultiUSRP.set_time_source': 'implemented', 'uhd.usrp.MultiUSRP.get_time_source': 'implemented', 'uhd.usrp.MultiUSRP.get_time_sources': 'implemented', 'uhd.usrp.MultiUSRP.set_sync_source': 'implemented', 'uhd.usrp.MultiUSRP.get_sync_source': 'implemented', 'uhd.usrp.MultiUSRP.get_sync_sources': 'implemented', 'uhd.usrp.MultiUSRP.set_clock_source_out': 'implemented', 'uhd.usrp.MultiUSRP.set_time_source_out': 'implemented', 'uhd.usrp.MultiUSRP.get_mboard_sensor_names': 'implemented', 'uhd.usrp.MultiUSRP.get_mboard_sensor': 'implemented', 'uhd.usrp.MultiUSRP.set_rx_subdev_spec': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_subdev_spec': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_subdev_name': 'implemented', 'uhd.usrp.MultiUSRP.set_rx_rate': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_rate': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_rates': 'implemented', 'uhd.usrp.MultiUSRP.set_rx_spp': 'implemented', 'uhd.usrp.MultiUSRP.set_rx_freq': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_freq': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_freq_range': 'implemented', 'uhd.usrp.MultiUSRP.get_fe_rx_freq_range': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_lo_names': 'implemented', 'uhd.usrp.MultiUSRP.set_rx_lo_source': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_lo_source': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_lo_sources': 'implemented', 'uhd.usrp.MultiUSRP.set_rx_lo_export_enabled': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_lo_export_enabled': 'implemented', 'uhd.usrp.MultiUSRP.set_rx_lo_freq': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_lo_freq': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_lo_freq_range': 'implemented', 'uhd.usrp.MultiUSRP.set_rx_gain': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_gain': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_gain_range': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_gain_names': 'implemented', 'uhd.usrp.MultiUSRP.set_normalized_rx_gain': 'implemented', 'uhd.usrp.MultiUSRP.get_normalized_rx_gain': 'implemented', 'uhd.usrp.MultiUSRP.set_rx_agc': 'implemented', 'uhd.usrp.MultiUSRP.set_rx_gain_profile': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_gain_profile': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_gain_profile_names': 'implemented', 'uhd.usrp.MultiUSRP.has_rx_power_reference': 'implemented', 'uhd.usrp.MultiUSRP.set_rx_power_reference': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_power_reference': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_power_range': 'implemented', 'uhd.usrp.MultiUSRP.set_rx_antenna': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_antenna': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_antennas': 'implemented', 'uhd.usrp.MultiUSRP.set_rx_bandwidth': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_bandwidth': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_bandwidth_range': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_sensor_names': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_sensor': 'implemented', 'uhd.usrp.MultiUSRP.set_rx_dc_offset': 'implemented', 'uhd.usrp.MultiUSRP.set_rx_iq_balance': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_dboard_iface': 'implemented', 'uhd.usrp.MultiUSRP.set_tx_subdev_spec': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_subdev_spec': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_subdev_name': 'implemented', 'uhd.usrp.MultiUSRP.set_tx_rate': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_rate': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_rates': 'implemented', 'uhd.usrp.MultiUSRP.set_tx_freq': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_freq': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_freq_range': 'implemented', 'uhd.usrp.MultiUSRP.get_fe_tx_freq_range': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_lo_names': 'implemented', 'uhd.usrp.MultiUSRP.set_tx_lo_source': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_lo_source': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_lo_sources': 'implemented', 'uhd.usrp.MultiUSRP.set_tx_lo_export_enabled': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_lo_export_enabled': 'implemented', 'uhd.usrp.MultiUSRP.set_tx_lo_freq': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_lo_freq': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_lo_freq_range': 'implemented', 'uhd.usrp.MultiUSRP.set_tx_gain': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_gain': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_gain_range': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_gain_names': 'implemented', 'uhd.usrp.MultiUSRP.set_normalized_tx_gain': 'implemented', 'uhd.usrp.MultiUSRP.get_normalized_tx_gain': 'implemented', 'uhd.usrp.MultiUSRP.set_tx_gain_profile': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_gain_profile': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_gain_profile_names': 'implemented', 'uhd.usrp.MultiUSRP.has_tx_power_reference': 'implemented', 'uhd.usrp.MultiUSRP.set_tx_power_reference': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_power_reference': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_power_range': 'implemented', 'uhd.usrp.MultiUSRP.set_tx_antenna': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_antenna': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_antennas': 'implemented', 'uhd.usrp.MultiUSRP.set_tx_bandwidth': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_bandwidth': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_bandwidth_range': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_sensor_names': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_sensor': 'implemented', 'uhd.usrp.MultiUSRP.set_tx_dc_offset': 'implemented', 'uhd.usrp.MultiUSRP.set_tx_iq_balance': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_dboard_iface': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_stream': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_stream': 'implemented', 'uhd.usrp.MultiUSRP.get_gpio_banks': 'implemented', 'uhd.usrp.MultiUSRP.set_gpio_attr': 'implemented', 'uhd.usrp.MultiUSRP.get_gpio_attr': 'implemented', 'uhd.usrp.MultiUSRP.get_gpio_srcs': 'implemented', 'uhd.usrp.MultiUSRP.get_gpio_src': 'implemented', 'uhd.usrp.MultiUSRP.set_gpio_src': 'implemented', 'uhd.usrp.MultiUSRP.get_gpio_src_banks': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_filter_names': 'implemented', 'uhd.usrp.MultiUSRP.get_rx_filter': 'implemented', 'uhd.usrp.MultiUSRP.set_rx_filter': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_filter_names': 'implemented', 'uhd.usrp.MultiUSRP.get_tx_filter': 'implemented', 'uhd.usrp.MultiUSRP.set_tx_filter': 'implemented', 'uhd.usrp.MultiUSRP.set_user_register': 'implemented', 'uhd.usrp.MultiUSRP.get_user_settings_iface': 'implemented', 'uhd.usrp.MultiUSRP.recv_num_samps': 'implemented_with_documented_remote_difference', 'uhd.usrp.MultiUSRP.send_waveform': 'implemented_with_documented_remote_difference', 'uhd.usrp.RXStreamer.get_num_channels': 'implemented', 'uhd.usrp.RXStreamer.get_max_num_samps': 'implemented_with_documented_remote_difference', 'uhd.usrp.RXStreamer.issue_stream_cmd': 'implemented', 'uhd.usrp.RXStreamer.recv': 'implemented', 'uhd.usrp.TXStreamer.get_num_channels': 'implemented', 'uhd.usrp.TXStreamer.get_max_num_samps': 'implemented_with_documented_remote_difference', 'uhd.usrp.TXStreamer.send': 'implemented', 'uhd.usrp.TXStreamer.recv_async_msg': 'implemented', 'uhd.property_tree.subtree': 'implemented', 'uhd.property_tree.exists': 'implemented', 'uhd.property_tree.list': 'implemented', 'uhd.property_tree.access_bool': 'implemented', 'uhd.property_tree.access_int': 'implemented', 'uhd.property_tree.access_double': 'implemented', 'uhd.property_tree.access_str': 'implemented', 'uhd.property_tree.access_device_addr': 'implemented', 'uhd.property_tree.access_dboard_iface': 'implemented', 'uhd.property.bool.get': 'implemented', 'uhd.property.bool.get_desired': 'implemented', 'uhd.property.bool.set': 'implemented', 'uhd.property.bool.set_coerced': 'implemented', 'uhd.property.int.get': 'implemented', 'uhd.property.int.get_desired': 'implemented', 'uhd.property.int.set': 'implemented', 'uhd.property.int.set_coerced': 'implemented', 'uhd.property.double.get': 'implemented', 'uhd.property.double.get_desired': 'implemented', 'uhd.property.double.set': 'implemented', 'uhd.property.double.set_coerced': 'implemented', 'uhd.property.str.get': 'implemented', 'uhd.property.str.get_desired': 'implemented', 'uhd.property.str.set': 'implemented', 'uhd.property.str.set_coerced': 'implemented', 'uhd.property.device_addr.get': 'implemented', 'uhd.property.device_addr.get_desired': 'implemented', 'uhd.property.device_addr.set': 'implemented', 'uhd.property.device_addr.set_coerced': 'implemented', 'uhd.property.dboard_iface.get': 'implemented', 'uhd.property.dboard_iface.get_desired': 'implemented', 'uhd.property.dboard_iface.set': 'implemented', 'uhd.property.dboard_iface.set_coerced': 'implemented', 'uhd.dsp.signals.get_continuous_tone': 'implemented', 'uhd.dsp.signals.get_power_dbfs': 'implemented', 'uhd.dsp.signals.get_usrp_power': 'implemented', 'uhd.types.TimeSpec': 'implemented', 'uhd.types.TimeSpec.get_real_secs': 'implemented', 'uhd.types.TimeSpec.get_full_secs': 'implemented', 'uhd.types.TimeSpec.get_frac_secs': 'implemented', 'uhd.types.TimeSpec.to_ticks': 'implemented', 'uhd.types.TimeSpec.get_tick_count': 'implemented', 'uhd.types.TimeSpec.from_ticks': 'implemented', 'uhd.types.DeviceAddr': 'implemented', 'uhd.types.DeviceAddr.to_string': 'implemented', 'uhd.types.DeviceAddr.keys': 'implemented', 'uhd.types.DeviceAddr.get': 'implemented', 'uhd.types.DeviceAddr.update': 'implemented', 'uhd.types.Range': 'implemented', 'uhd.types.Range.start': 'implemented', 'uhd.types.Range.stop': 'implemented', 'uhd.types.Range.step': 'implemented', 'uhd.types.Range.clip': 'implemented', 'uhd.types.MetaRange': 'implemented', 'uhd.types.MetaRange.start': 'implemented', 'uhd.types.MetaRange.stop': 'implemented', 'uhd.types.MetaRange.step': 'implemented', 'uhd.types.MetaRange.clip': 'implemented', 'uhd.types.TuneRequest': 'implemented', 'uhd.types.TuneResult': 'implemented', 'uhd.usrp.SubdevSpec': 'implemented', 'uhd.usrp.SubdevSpecPair': 'implemented', 'uhd.usrp.StreamArgs': 'implemented', 'uhd.types.StreamCMD': 'implemented', 'uhd.types.RXMetadata': 'implemented', 'uhd.types.TXMetadata': 'implemented', 'uhd.types.TXAsyncMetadata': 'implemented', 'uhd.types.SensorValue': 'implemented', 'uhd.filters.FilterInfoBase': 'implemented', 'uhd.filters.FilterInfoBase.is_bypassed': 'implemented', 'uhd.filters.FilterInfoBase.get_type': 'implemented', 'uhd.filters.AnalogFilterBase': 'implemented', 'uhd.filters.AnalogFilterBase.is_bypassed': 'implemented', 'uhd.filters.AnalogFilterBase.get_type': 'implemented', 'uhd.filters.AnalogFilterBase.get_analog_type': 'implemented', 'uhd.filters.AnalogFilterLP': 'implemented', 'uhd.filters.AnalogFilterLP.is_bypassed': 'implemented', 'uhd.filters.AnalogFilterLP.get_type': 'implemented', 'uhd.filters.AnalogFilterLP.get_analog_type': 'implemented', 'uhd.filters.AnalogFilterLP.get_cutoff': 'implemented', 'uhd.filters.AnalogFilterLP.get_rolloff': 'implemented', 'uhd.filters.AnalogFilterLP.set_cutoff': 'implemented', 'uhd.filters.DigitalFilterBaseI16': 'implemented', 'uhd.filters.DigitalFilterBaseI16.is_bypassed': 'implemented', 'uhd.filters.DigitalFilterBaseI16.get_type': 'implemented', 'uhd.filters.DigitalFilterBaseI16.get_output_rate': 'implemented', 'uhd.filters.DigitalFilterBaseI16.get_input_rate': 'implemented', 'uhd.filters.DigitalFilterBaseI16.get_interpolation': 'implemented', 'uhd.filters.DigitalFilterBaseI16.get_decimation': 'implemented', 'uhd.filters.DigitalFilterBaseI16.get_tap_full_scale': 'implemented', 'uhd.filters.DigitalFilterBaseI16.get_taps': 'implemented', 'uhd.filters.DigitalFilterFIRI16': 'implemented', 'uhd.filters.DigitalFilterFIRI16.is_bypassed': 'implemented', 'uhd.filters.DigitalFilterFIRI16.get_type': 'implemented', 'uhd.filters.DigitalFilterFIRI16.get_output_rate': 'implemented', 'uhd.filters.DigitalFilterFIRI16.get_input_rate': 'implemented', 'uhd.filters.DigitalFilterFIRI16.get_interpolation': 'implemented', 'uhd.filters.DigitalFilterFIRI16.get_decimation': 'implemented', 'uhd.filters.DigitalFilterFIRI16.get_tap_full_scale': 'implemented', 'uhd.filters.DigitalFilterFIRI16.get_taps': 'implemented', 'uhd.filters.DigitalFilterFIRI16.set_taps': 'implemented', 'uhd.filters.FilterType': 'implemented', 'uhd.types.StreamMode': 'implemented', 'uhd.types.RXMetadataErrorCode': 'implemented', 'uhd.types.TXMetadataEventCode': 'implemented', 'uhd.usrp.radio_control.*': 'unsupported_by_hardware_native_equivalent', 'uhd.usrp.mboard_controller.*': 'unsupported_by_hardware_native_equivalent', 'uhd.usrp.dboard_iface.*': 'unsupported_by_hardware_native_equivalent', 'uhd.usrp.user_settings_iface.*': 'unsupported_by_hardware_native_equivalent'}, 'schema_hash': 'sha256:69159a5e174635038b732093f12b78f412c422e281bf2855935f8d121f8c7144'}
-uhd, MultiUSRP = build_uhd_bindings(_SCHEMA)
+# Validated when generated; lets the import skip validation.
+_PRECOMPILED = {'format': 1, 'schema_hash': 'sha256:69159a5e174635038b732093f12b78f412c422e281bf2855935f8d121f8c7144', 'signatures': {'uhd.usrp.MultiUSRP.get_pp_string': '($self, /)', 'uhd.usrp.MultiUSRP.get_mboard_name': '($self, /, mboard=0)', 'uhd.usrp.MultiUSRP.get_num_mboards': '($self, /)', 'uhd.usrp.MultiUSRP.get_tree': '($self, /)', 'uhd.usrp.MultiUSRP.get_radio_control': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.get_mb_controller': '($self, /, mboard=0)', 'uhd.usrp.MultiUSRP.get_usrp_rx_info': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.get_usrp_tx_info': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.get_rx_num_channels': '($self, /)', 'uhd.usrp.MultiUSRP.get_tx_num_channels': '($self, /)', 'uhd.usrp.MultiUSRP.get_rx_radio_channel': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.get_tx_radio_channel': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.set_master_clock_rate': '($self, /, rate, mboard=18446744073709551615)', 'uhd.usrp.MultiUSRP.get_master_clock_rate': '($self, /, mboard=0)', 'uhd.usrp.MultiUSRP.get_master_clock_rate_range': '($self, /, mboard=18446744073709551615)', 'uhd.usrp.MultiUSRP.get_time_now': '($self, /, mboard=0)', 'uhd.usrp.MultiUSRP.get_time_last_pps': '($self, /, mboard=0)', 'uhd.usrp.MultiUSRP.set_time_now': '($self, /, time_spec, mboard=18446744073709551615)', 'uhd.usrp.MultiUSRP.set_time_next_pps': '($self, /, time_spec, mboard=18446744073709551615)', 'uhd.usrp.MultiUSRP.set_time_unknown_pps': '($self, time_spec, /)', 'uhd.usrp.MultiUSRP.get_time_synchronized': '($self, /)', 'uhd.usrp.MultiUSRP.set_command_time': '($self, /, time_spec, mboard=18446744073709551615)', 'uhd.usrp.MultiUSRP.clear_command_time': '($self, /, mboard=18446744073709551615)', 'uhd.usrp.MultiUSRP.issue_stream_cmd': '($self, /, rate, chan=18446744073709551615)', 'uhd.usrp.MultiUSRP.set_clock_source': '($self, /, source, mboard=18446744073709551615)', 'uhd.usrp.MultiUSRP.get_clock_source': '($self, mboard, /)', 'uhd.usrp.MultiUSRP.get_clock_sources': '($self, mboard, /)', 'uhd.usrp.MultiUSRP.set_time_source': '($self, /, source, mboard=18446744073709551615)', 'uhd.usrp.MultiUSRP.get_time_source': '($self, mboard, /)', 'uhd.usrp.MultiUSRP.get_time_sources': '($self, mboard, /)', 'uhd.usrp.MultiUSRP.set_sync_source': '($self, /, clock_source, time_source, mboard=18446744073709551615)', 'uhd.usrp.MultiUSRP.get_sync_source': '($self, mboard, /)', 'uhd.usrp.MultiUSRP.get_sync_sources': '($self, mboard, /)', 'uhd.usrp.MultiUSRP.set_clock_source_out': '($self, /, enb, mboard=18446744073709551615)', 'uhd.usrp.MultiUSRP.set_time_source_out': '($self, /, enb, mboard=18446744073709551615)', 'uhd.usrp.MultiUSRP.get_mboard_sensor_names': '($self, /, mboard=0)', 'uhd.usrp.MultiUSRP.get_mboard_sensor': '($self, /, name, mboard=0)', 'uhd.usrp.MultiUSRP.set_rx_subdev_spec': '($self, /, spec, mboard=18446744073709551615)', 'uhd.usrp.MultiUSRP.get_rx_subdev_spec': '($self, /, mboard=0)', 'uhd.usrp.MultiUSRP.get_rx_subdev_name': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.set_rx_rate': '($self, /, rate, chan=18446744073709551615)', 'uhd.usrp.MultiUSRP.get_rx_rate': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.get_rx_rates': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.set_rx_spp': '($self, /, spp, chan=18446744073709551615)', 'uhd.usrp.MultiUSRP.set_rx_freq': '($self, /, tune_request, chan=0)', 'uhd.usrp.MultiUSRP.get_rx_freq': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.get_rx_freq_range': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.get_fe_rx_freq_range': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.get_rx_lo_names': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.set_rx_lo_source': "($self, /, src, name='all', chan=0)", 'uhd.usrp.MultiUSRP.get_rx_lo_source': "($self, /, name='all', chan=0)", 'uhd.usrp.MultiUSRP.get_rx_lo_sources': "($self, /, name='all', chan=0)", 'uhd.usrp.MultiUSRP.set_rx_lo_export_enabled': "($self, /, enb, name='all', chan=0)", 'uhd.usrp.MultiUSRP.get_rx_lo_export_enabled': "($self, /, name='all', chan=0)", 'uhd.usrp.MultiUSRP.set_rx_lo_freq': '($self, /, freq, name, chan=0)', 'uhd.usrp.MultiUSRP.get_rx_lo_freq': '($self, /, name, chan=0)', 'uhd.usrp.MultiUSRP.get_rx_lo_freq_range': '($self, /, name, chan=0)', 'uhd.usrp.MultiUSRP.set_rx_gain': '($self, /, gain, chan=0)', 'uhd.usrp.MultiUSRP.get_rx_gain': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.get_rx_gain_range': '($self, /, name, chan=0)', 'uhd.usrp.MultiUSRP.get_rx_gain_names': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.set_normalized_rx_gain': '($self, /, gain, chan=0)', 'uhd.usrp.MultiUSRP.get_normalized_rx_gain': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.set_rx_agc': '($self, /, enable, chan=0)', 'uhd.usrp.MultiUSRP.set_rx_gain_profile': '($self, /, profile, chan=0)', 'uhd.usrp.MultiUSRP.get_rx_gain_profile': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.get_rx_gain_profile_names': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.has_rx_power_reference': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.set_rx_power_reference': '($self, /, power_dbm, chan=0)', 'uhd.usrp.MultiUSRP.get_rx_power_reference': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.get_rx_power_range': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.set_rx_antenna': '($self, /, ant, chan=0)', 'uhd.usrp.MultiUSRP.get_rx_antenna': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.get_rx_antennas': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.set_rx_bandwidth': '($self, /, bandwidth, chan=0)', 'uhd.usrp.MultiUSRP.get_rx_bandwidth': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.get_rx_bandwidth_range': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.get_rx_sensor_names': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.get_rx_sensor': '($self, /, name, chan=0)', 'uhd.usrp.MultiUSRP.set_rx_dc_offset': '($self, /, offset, chan=0)', 'uhd.usrp.MultiUSRP.set_rx_iq_balance': '($self, /, correction, chan=0)', 'uhd.usrp.MultiUSRP.get_rx_dboard_iface': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.set_tx_subdev_spec': '($self, /, spec, mboard=18446744073709551615)', 'uhd.usrp.MultiUSRP.get_tx_subdev_spec': '($self, /, mboard=0)', 'uhd.usrp.MultiUSRP.get_tx_subdev_name': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.set_tx_rate': '($self, /, rate, chan=18446744073709551615)', 'uhd.usrp.MultiUSRP.get_tx_rate': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.get_tx_rates': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.set_tx_freq': '($self, /, tune_request, chan=0)', 'uhd.usrp.MultiUSRP.get_tx_freq': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.get_tx_freq_range': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.get_fe_tx_freq_range': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.get_tx_lo_names': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.set_tx_lo_source': "($self, /, src, name='all', chan=0)", 'uhd.usrp.MultiUSRP.get_tx_lo_source': "($self, /, name='all', chan=0)", 'uhd.usrp.MultiUSRP.get_tx_lo_sources': "($self, /, name='all', chan=0)", 'uhd.usrp.MultiUSRP.set_tx_lo_export_enabled': "($self, /, enb, name='all', chan=0)", 'uhd.usrp.MultiUSRP.get_tx_lo_export_enabled': "($self, /, name='all', chan=0)", 'uhd.usrp.MultiUSRP.set_tx_lo_freq': '($self, /, freq, name, chan=0)', 'uhd.usrp.MultiUSRP.get_tx_lo_freq': '($self, /, name, chan=0)', 'uhd.usrp.MultiUSRP.get_tx_lo_freq_range': '($self, /, name, chan=0)', 'uhd.usrp.MultiUSRP.set_tx_gain': '($self, /, gain, chan=0)', 'uhd.usrp.MultiUSRP.get_tx_gain': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.get_tx_gain_range': '($self, /, name, chan=0)', 'uhd.usrp.MultiUSRP.get_tx_gain_names': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.set_normalized_tx_gain': '($self, /, gain, chan=0)', 'uhd.usrp.MultiUSRP.get_normalized_tx_gain': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.set_tx_gain_profile': '($self, /, profile, chan=0)', 'uhd.usrp.MultiUSRP.get_tx_gain_profile': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.get_tx_gain_profile_names': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.has_tx_power_reference': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.set_tx_power_reference': '($self, /, power_dbm, chan=0)', 'uhd.usrp.MultiUSRP.get_tx_power_reference': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.get_tx_power_range': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.set_tx_antenna': '($self, /, ant, chan=0)', 'uhd.usrp.MultiUSRP.get_tx_antenna': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.get_tx_antennas': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.set_tx_bandwidth': '($self, /, bandwidth, chan=0)', 'uhd.usrp.MultiUSRP.get_tx_bandwidth': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.get_tx_bandwidth_range': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.get_tx_sensor_names': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.get_tx_sensor': '($self, /, name, chan=0)', 'uhd.usrp.MultiUSRP.set_tx_dc_offset': '($self, /, offset, chan=0)', 'uhd.usrp.MultiUSRP.set_tx_iq_balance': '($self, /, correction, chan=0)', 'uhd.usrp.MultiUSRP.get_tx_dboard_iface': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.get_rx_stream': '($self, stream_args, /)', 'uhd.usrp.MultiUSRP.get_tx_stream': '($self, stream_args, /)', 'uhd.usrp.MultiUSRP.get_gpio_banks': '($self, mboard, /)', 'uhd.usrp.MultiUSRP.set_gpio_attr': '($self, /, bank, attr, value, mask=4294967295, mboard=0)', 'uhd.usrp.MultiUSRP.get_gpio_attr': '($self, /, bank, attr, mboard=0)', 'uhd.usrp.MultiUSRP.get_gpio_srcs': '($self, /, bank, mboard=0)', 'uhd.usrp.MultiUSRP.get_gpio_src': '($self, /, bank, mboard=0)', 'uhd.usrp.MultiUSRP.set_gpio_src': '($self, /, bank, src, mboard=0)', 'uhd.usrp.MultiUSRP.get_gpio_src_banks': '($self, /, mboard=0)', 'uhd.usrp.MultiUSRP.get_rx_filter_names': '($self, chan, /)', 'uhd.usrp.MultiUSRP.get_rx_filter': '($self, name, chan, /)', 'uhd.usrp.MultiUSRP.set_rx_filter': '($self, name, filter, chan, /)', 'uhd.usrp.MultiUSRP.get_tx_filter_names': '($self, chan, /)', 'uhd.usrp.MultiUSRP.get_tx_filter': '($self, name, chan, /)', 'uhd.usrp.MultiUSRP.set_tx_filter': '($self, name, filter, chan, /)', 'uhd.usrp.MultiUSRP.set_user_register': '($self, /, addr, data, mboard=18446744073709551615)', 'uhd.usrp.MultiUSRP.get_user_settings_iface': '($self, /, chan=0)', 'uhd.usrp.MultiUSRP.recv_num_samps': '($self, /, num_samps, freq, rate=1000000.0, channels=[0], gain=10, start_time=None, streamer=None)', 'uhd.usrp.MultiUSRP.send_waveform': '($self, /, waveform_proto, duration, freq, rate=1000000.0, channels=[0], gain=10, start_time=None, streamer=None)', 'uhd.usrp.RXStreamer.get_num_channels': '($self, /)', 'uhd.usrp.RXStreamer.get_max_num_samps': '($self, /)', 'uhd.usrp.RXStreamer.issue_stream_cmd': '($self, stream_cmd, /)', 'uhd.usrp.TXStreamer.get_num_channels': '($self, /)', 'uhd.usrp.TXStreamer.get_max_num_samps': '($self, /)', 'uhd.usrp.TXStreamer.recv_async_msg': '($self, /, async_metadata, timeout=0.1)', 'uhd.property_tree.subtree': '($self, /, path)', 'uhd.property_tree.exists': '($self, /, path)', 'uhd.property_tree.list': '($self, /, path)', 'uhd.property_tree.access_bool': '($self, path, /)', 'uhd.property_tree.access_int': '($self, path, /)', 'uhd.property_tree.access_double': '($self, path, /)', 'uhd.property_tree.access_str': '($self, path, /)', 'uhd.property_tree.access_device_addr': '($self, path, /)', 'uhd.property_tree.access_dboard_iface': '($self, path, /)', 'uhd.property.bool.get': '($self, /)', 'uhd.property.bool.get_desired': '($self, /)', 'uhd.property.bool.set': '($self, value, /)', 'uhd.property.bool.set_coerced': '($self, value, /)', 'uhd.property.int.get': '($self, /)', 'uhd.property.int.get_desired': '($self, /)', 'uhd.property.int.set': '($self, value, /)', 'uhd.property.int.set_coerced': '($self, value, /)', 'uhd.property.double.get': '($self, /)', 'uhd.property.double.get_desired': '($self, /)', 'uhd.property.double.set': '($self, value, /)', 'uhd.property.double.set_coerced': '($self, value, /)', 'uhd.property.str.get': '($self, /)', 'uhd.property.str.get_desired': '($self, /)', 'uhd.property.str.set': '($self, value, /)', 'uhd.property.str.set_coerced': '($self, value, /)', 'uhd.property.device_addr.get': '($self, /)', 'uhd.property.device_addr.get_desired': '($self, /)', 'uhd.property.device_addr.set': '($self, value, /)', 'uhd.property.device_addr.set_coerced': '($self, value, /)', 'uhd.property.dboard_iface.get': '($self, /)', 'uhd.property.dboard_iface.get_desired': '($self, /)', 'uhd.property.dboard_iface.set': '($self, value, /)', 'uhd.property.dboard_iface.set_coerced': '($self, value, /)'}}
+uhd, MultiUSRP = build_uhd_bindings(_SCHEMA, precompiled=_PRECOMPILED)
 
 __all__ = ['uhd', 'MultiUSRP']
@@ -0,0 +1,78 @@
+# Copyright (C) 2026 RemoteRF
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import datetime
+import unittest
+
+from remoteRF.core.availability import AvailabilityIndex, IntervalIndex
+
+DAY = datetime.datetime(2026, 3, 2)
+
+
+def at(hours: float) -> datetime.datetime:
+    return DAY + datetime.timedelta(hours=hours)
+
+
+def reservation(device_id, start, end):
+    return {"username": "u", "device_id": device_id, "start_time": at(start), "end_time": at(end)}
+
+
+class AvailabilityTests(unittest.TestCase):
+    def test_interval_index_merges_and_finds_gaps(self):
+        index = IntervalIndex([(at(1), at(2)), (at(2), at(3)), (at(5), at(6))])
+        self.assertEqual(list(index), [(at(1), at(3)), (at(5), at(6))])
+        self.assertTrue(index.is_free(at(3), at(5)))
+        self.assertFalse(index.is_free(at(4), at(5.5)))
+        self.assertEqual(index.next_free(at(0.5), datetime.timedelta(hours=2)), at(3))
+        self.assertEqual(index.next_free(at(2), datetime.timedelta(hours=3)), at(6))
+
+        index.add(at(2.5), at(5))
+        self.assertEqual(list(index), [(at(1), at(6))])
+
+    def test_next_free_aligned_blocks_skip_reservations_across_midnight(self):
+        index = AvailabilityIndex.from_reservations(
+            [reservation(7, 0.5, 1.5), reservation(7, 23.5, 25)]
+        )
+        hour = datetime.timedelta(hours=1)
+        windows = index.next_free(
+            [7], hour, start=at(0.25), end=at(26), count=None, align=hour
+        )
+        starts = [window.start for window in windows]
+        self.assertEqual(starts[:2], [at(2), at(3)])
+        self.assertEqual(starts[-2:], [at(22), at(25)])
+        self.assertEqual(windows[0].device_ids, (7,))
+
+    def test_next_free_finds_windows_with_devices_together(self):
+        index = AvailabilityIndex.from_reservations(
+            [reservation(1, 0, 2), reservation(2, 1, 3), reservation(2, 4, 5)]
+        )
+        half_hour = datetime.timedelta(minutes=30)
+        first = index.next_free([1, 2], half_hour, start=at(0), end=at(10))
+        self.assertEqual(first[0].device_ids, (2,))
+        self.assertEqual(first[0].start, at(0))
+
+        pairs = index.next_free(
+            [1, 2, 3], datetime.timedelta(hours=1), start=at(0), end=at(10),
+            count=3, together=3,
+        )
+        self.assertEqual(
+            [(window.start, window.end) for window in pairs],
+            [(at(3), at(4)), (at(5), at(6)), (at(6), at(7))],
+        )
+        self.assertEqual(index.next_free([1], half_hour, start=at(0), end=at(1)), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
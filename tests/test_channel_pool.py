@@ -0,0 +1,129 @@
+# Copyright (C) 2026 RemoteRF
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import unittest
+
+import grpc
+
+from remoteRF.core.channel_pool import (
+    ChannelPool,
+    channel_policy_from_env,
+    pool_options_from_env,
+    pool_size_from_env,
+)
+
+
+class FakeChannel:
+    def __init__(self, options):
+        self.options = dict(options)
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeStub:
+    def __init__(self, channel):
+        self.channel = channel
+
+
+class ChannelPoolTests(unittest.TestCase):
+    def test_env_options_prefer_pool_specific_keys(self):
+        environ = {
+            "REMOTERF_KEEPALIVE_TIME_MS": "30000",
+            "REMOTERF_SAMPLE_KEEPALIVE_TIME_MS": "5000",
+            "REMOTERF_SAMPLE_WINDOW_BYTES": "8388608",
+            "REMOTERF_KEEPALIVE_PERMIT_WITHOUT_CALLS": "yes",
+            "REMOTERF_SAMPLE_CHANNELS": "3",
+            "REMOTERF_CHANNEL_POLICY": "per_device",
+        }
+        base = [("grpc.max_send_message_length", 100)]
+        control = dict(pool_options_from_env(environ, "control", base))
+        samples = dict(pool_options_from_env(environ, "samples", base))
+
+        self.assertEqual(control["grpc.keepalive_time_ms"], 30000)
+        self.assertEqual(samples["grpc.keepalive_time_ms"], 5000)
+        self.assertEqual(samples["grpc.keepalive_permit_without_calls"], 1)
+        self.assertEqual(samples["grpc.http2.lookahead_bytes"], 8388608)
+        self.assertEqual(samples["grpc.http2.bdp_probe"], 0)
+        self.assertNotIn("grpc.http2.lookahead_bytes", control)
+        self.assertEqual(control["grpc.max_send_message_length"], 100)
+        self.assertEqual(pool_size_from_env(environ, "samples"), 3)
+        self.assertEqual(pool_size_from_env(environ, "control"), 1)
+        self.assertEqual(channel_policy_from_env(environ), "per_device")
+
+        with self.assertRaisesRegex(ValueError, "integer"):
+            pool_options_from_env({"REMOTERF_KEEPALIVE_TIME_MS": "soon"}, "control", [])
+        with self.assertRaisesRegex(ValueError, "REMOTERF_CHANNEL_POLICY"):
+            channel_policy_from_env({"REMOTERF_CHANNEL_POLICY": "random"})
+
+    def test_round_robin_creates_channels_lazily_and_caches_stubs(self):
+        pool = ChannelPool("samples", FakeChannel, [("a", 1)], size=2)
+        self.assertEqual(pool._channels, [None, None])
+
+        first, second, third = pool.channel(), pool.channel(), pool.channel()
+        self.assertIsNot(first, second)
+        self.assertIs(first, third)
+        self.assertEqual(first.options["grpc.remoterf_channel"], "samples-0")
+        self.assertEqual(second.options["grpc.remoterf_channel"], "samples-1")
+
+        stub = pool.stub(FakeStub)
+        self.assertIs(stub.channel, second)
+        pool.channel()
+        self.assertIs(pool.stub(FakeStub), stub)
+
+        pool.close()
+        self.assertTrue(first.closed and second.closed)
+
+    def test_per_device_pins_each_token_to_one_channel(self):
+        pool = ChannelPool("control", FakeChannel, [], size=4, policy="per_device")
+        for token in ("alpha", "bravo", "charlie"):
+            channel = pool.channel(token)
+            self.assertTrue(all(pool.channel(token) is channel for _ in range(5)))
+        self.assertEqual(len({id(pool.channel(str(i))) for i in range(64)}), 4)
+
+    def test_grpc_accepts_pool_options(self):
+        options = pool_options_from_env(
+            {"REMOTERF_WINDOW_BYTES": "1048576", "REMOTERF_KEEPALIVE_TIME_MS": "1000"},
+            "samples",
+            [],
+        )
+        pool = ChannelPool(
+            "samples",
+            lambda opts: grpc.insecure_channel("localhost:1", options=opts),
+            options,
+        )
+        self.assertIsInstance(pool.channel(), grpc.Channel)
+        pool.close()
+
+    def test_aclose_awaits_aio_channel_close(self):
+        async def run():
+            pool = ChannelPool(
+                "control",
+                lambda opts: grpc.aio.insecure_channel("localhost:1", options=opts),
+                [],
+                size=2,
+            )
+            channels = [pool.channel(), pool.channel()]
+            await pool.aclose()
+            self.assertIsNot(pool.channel(), channels[0])
+            await pool.aclose()
+
+        asyncio.run(run())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,6 +13,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import contextlib
+import io
+import json
 import unittest
 import sys
 import tempfile
@@ -430,6 +433,74 @@ class DynamicDeviceCodegenTests(unittest.TestCase):
             ],
         )
 
+    def test_generated_property_cache_follows_idl_invalidation(self):
+        schema = {
+            "device_type": "fake_cached",
+            "client_class": "FakeCached",
+            "driver_version": "0.0.0",
+            "schema_hash": "sha256:cached",
+            "getters": {
+                "get_freq": {},
+                "get_gain": {},
+                "get_temperature": {"cache_ttl": 0},
+            },
+            "setters": {
+                "set_freq": {"invalidates": []},
+                "set_gain": {},
+            },
+            "calls": {
+                "call_read": {"args": [], "side_effecting": False},
+                "call_retune": {"args": [], "invalidates": ["freq"]},
+                "call_reset": {"args": []},
+            },
+        }
+        code = _codegen(schema)
+        self.assertIn(
+            "_CACHE_POLICY = {'ttls': {'temperature': 0}, "
+            "'setter_invalidates': {'freq': []}, "
+            "'call_invalidates': {'read': [], 'retune': ['freq']}}",
+            code,
+        )
+        module = types.ModuleType("remoteRF.drivers.fake_cached.fake_cached_remote")
+        module.__package__ = "remoteRF.drivers.fake_cached"
+        exec(code, module.__dict__)
+        fetched = []
+        try_get = module._try_get
+
+        def counting_get(prop, token):
+            fetched.append(prop)
+            return try_get(prop, token)
+
+        module._try_get = counting_get
+        device = module.FakeCached(virtual=True)
+        device.freq = 1.0
+        device.gain = 2.0
+        self.assertEqual((device.freq, device.gain, device.freq), (1.0, 2.0, 1.0))
+        self.assertEqual(fetched, ["freq", "gain", "freq"])
+
+        device.remoterf_enable_cache()
+        device.freq, device.gain, device.temperature, device.temperature
+        device.freq = 3.0
+        device.read()
+        self.assertEqual((device.freq, device.gain), (3.0, 2.0))
+        self.assertEqual(
+            fetched[3:],
+            ["freq", "gain", "temperature", "temperature"],
+        )
+
+        device.retune()
+        device.freq, device.gain
+        device.reset()
+        device.gain
+        device.gain = 5.0
+        device.freq, device.gain
+        self.assertEqual(fetched[7:], ["freq", "gain", "freq"])
+
+        with self.assertRaisesRegex(ValueError, "unknown properties: power"):
+            _codegen({**schema, "calls": {"call_x": {"invalidates": ["power"]}}})
+        with self.assertRaisesRegex(ValueError, "cache_ttl"):
+            _codegen({**schema, "getters": {"get_freq": {"cache_ttl": -1}}})
+
     def test_codegen_wraps_declared_client_return_constructors(self):
         schema = {
             "device_type": "usrp",
@@ -1041,6 +1112,100 @@ class DynamicDeviceCodegenTests(unittest.TestCase):
                 },
             })
 
+    def test_stale_check_probes_the_hash_and_reuses_cached_schemas(self):
+        from remoteRF.core import schema_cache
+
+        served = {
+            "device_type": "fake_probe",
+            "client_class": "FakeProbe",
+            "driver_version": "0.0.0",
+            "schema_hash": "sha256:v1",
+            "getters": {},
+            "setters": {},
+            "calls": {},
+        }
+        requests = []
+
+        def get_drivers(args):
+            requests.append(sorted(args))
+            if "hash_only" in args:
+                return {"schema_hash": map_arg(served["schema_hash"])}
+            return {"schema": map_arg(json.dumps(served))}
+
+        written = []
+        old = (dynamic_device._get_drivers, dynamic_device._write_driver_files)
+        old_cache = schema_cache._default_cache
+        with tempfile.TemporaryDirectory() as directory:
+            dynamic_device._get_drivers = get_drivers
+            dynamic_device._write_driver_files = lambda schema: written.append(schema)
+            schema_cache._default_cache = schema_cache.SchemaCache(directory)
+            try:
+                self.assertFalse(
+                    dynamic_device.install_driver_if_stale(token="t", current_hash="sha256:v1")
+                )
+                self.assertEqual(requests, [["hash_only", "token"]])
+
+                with contextlib.redirect_stdout(io.StringIO()):
+                    self.assertTrue(
+                        dynamic_device.install_driver_if_stale(token="t", current_hash="sha256:v0")
+                    )
+                    schema_cache._default_cache = schema_cache.SchemaCache(directory)
+                    self.assertTrue(
+                        dynamic_device.install_driver_if_stale(token="t", current_hash="sha256:v0")
+                    )
+            finally:
+                dynamic_device._get_drivers, dynamic_device._write_driver_files = old
+                schema_cache._default_cache = old_cache
+
+        self.assertEqual(written, [served, served])
+        self.assertEqual(
+            requests,
+            [["hash_only", "token"], ["hash_only", "token"], ["token"], ["hash_only", "token"]],
+            "one probe per check; the full schema is fetched once, then cached",
+        )
+
+    def test_hashless_legacy_schemas_are_keyed_by_content_and_migrated_once(self):
+        from remoteRF.core import schema_cache
+
+        served = {
+            "device_type": "fake_legacy",
+            "client_class": "FakeLegacy",
+            "driver_version": "0.0.0",
+            "getters": {},
+            "setters": {},
+            "calls": {},
+        }
+        requests = []
+
+        def get_drivers(args):
+            # An old server: no schema_hash, and hash_only is ignored.
+            requests.append(sorted(args))
+            return {"schema": map_arg(json.dumps(served))}
+
+        written = []
+        old = (dynamic_device._get_drivers, dynamic_device._write_driver_files)
+        old_cache = schema_cache._default_cache
+        with tempfile.TemporaryDirectory() as directory:
+            dynamic_device._get_drivers = get_drivers
+            dynamic_device._write_driver_files = lambda schema: written.append(schema)
+            schema_cache._default_cache = schema_cache.SchemaCache(directory)
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    self.assertTrue(
+                        dynamic_device.install_driver_if_stale(token="t", current_hash="?")
+                    )
+                migrated = written[0]["schema_hash"]
+                self.assertFalse(
+                    dynamic_device.install_driver_if_stale(token="t", current_hash=migrated)
+                )
+            finally:
+                dynamic_device._get_drivers, dynamic_device._write_driver_files = old
+                schema_cache._default_cache = old_cache
+
+        self.assertEqual(migrated, schema_cache.content_hash(served))
+        self.assertEqual(len(written), 1)
+        self.assertEqual(requests, [["hash_only", "token"], ["hash_only", "token"]])
+
 
 if __name__ == "__main__":
     unittest.main()
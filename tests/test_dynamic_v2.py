@@ -19,7 +19,11 @@ import os
 import subprocess
 import sys
 import tempfile
+import threading
+import types
 import unittest
+import zlib
+from unittest import mock
 from pathlib import Path
 
 import grpc
@@ -27,17 +31,26 @@ import numpy as np
 
 from remoteRF.common.grpc import grpc_pb2
 from remoteRF.common.grpc.v2_codec import decode_value, encode_value
-from remoteRF.core.dynamic_v2_transport import DynamicV2Transport
+from remoteRF.core.channel_pool import ChannelPool
+from remoteRF.core.dynamic_v2_transport import (
+    CONTROL_PROTOCOL_VERSION,
+    SCHEMA_VERSION,
+    STREAMING_PROTOCOL_VERSION,
+    DynamicV2Transport,
+)
+from remoteRF.core.schema_cache import SchemaCache
 from remoteRF.core.v2_errors import (
+    RemoteRFNativeUHDError,
     RemoteRFPolicyError,
     RemoteRFProtocolError,
     RemoteRFTransportError,
     raise_for_envelope,
 )
-from remoteRF.drivers import dynamic_device
+from remoteRF.drivers import dynamic_device, dynamic_v2
 from remoteRF.drivers.dynamic_v2 import (
     OverloadBinder,
     build_uhd_bindings,
+    fetch_schema_v2,
     validate_schema_v2,
 )
 from remoteRF.drivers.support import uhd_v2
@@ -300,6 +313,79 @@ class CapturingSampleStub:
             )
 
 
+def reply_frame(frame, **fields):
+    return grpc_pb2.SampleFrame(
+        session_id=frame.session_id,
+        handle=frame.handle,
+        generation=frame.generation,
+        operation_id=frame.operation_id,
+        sequence=frame.sequence,
+        direction=frame.direction,
+        **fields,
+    )
+
+
+class PersistentSampleStub:
+    """Answer frames one at a time, like a server on a long-lived stream."""
+
+    def __init__(self, *, answer_requests=True):
+        self.calls = 0
+        self.frames = []
+        self.answer_requests = answer_requests
+        self.blocks = 0
+
+    def data_frame(self, request):
+        samples = (
+            np.arange(request.sample_count, dtype=np.float32)
+            + self.blocks * request.sample_count
+        ).astype(np.complex64)
+        self.blocks += 1
+        return reply_frame(
+            request,
+            kind=grpc_pb2.SAMPLE_FRAME_DATA,
+            dtype=samples.dtype.str,
+            shape=[len(samples)],
+            channels=list(request.channels),
+            sample_count=len(samples),
+            payload=samples.tobytes(),
+            metadata_json='{"error_code":"none"}',
+        )
+
+    def SampleStream(self, request_iterator, timeout=None):
+        self.calls += 1
+        pipelined = None
+        for frame in request_iterator:
+            self.frames.append(frame)
+            if frame.kind == grpc_pb2.SAMPLE_FRAME_OPEN:
+                yield reply_frame(frame, kind=grpc_pb2.SAMPLE_FRAME_RESULT)
+            elif frame.kind == grpc_pb2.SAMPLE_FRAME_CLOSE:
+                return
+            elif not self.answer_requests:
+                continue
+            elif frame.kind == grpc_pb2.SAMPLE_FRAME_REQUEST and frame.credits:
+                pipelined = frame
+                for _ in range(frame.credits):
+                    yield self.data_frame(pipelined)
+            elif frame.kind == grpc_pb2.SAMPLE_FRAME_CREDIT:
+                for _ in range(frame.credits):
+                    yield self.data_frame(pipelined)
+            elif frame.kind == grpc_pb2.SAMPLE_FRAME_CANCEL:
+                pipelined = None
+                yield reply_frame(
+                    frame,
+                    kind=grpc_pb2.SAMPLE_FRAME_RESULT,
+                    cancelled=True,
+                )
+            elif frame.kind == grpc_pb2.SAMPLE_FRAME_REQUEST:
+                yield self.data_frame(frame)
+            elif frame.kind == grpc_pb2.SAMPLE_FRAME_DATA:
+                yield reply_frame(
+                    frame,
+                    kind=grpc_pb2.SAMPLE_FRAME_RESULT,
+                    sample_count=frame.sample_count,
+                )
+
+
 class UnavailableRpcError(grpc.RpcError):
     def code(self):
         return grpc.StatusCode.UNAVAILABLE
@@ -308,6 +394,86 @@ class UnavailableRpcError(grpc.RpcError):
         return "test transport outage"
 
 
+class BatchControlStub:
+    """Answer InvokeBatch like a server; ``set_rx_antenna`` fails."""
+
+    def __init__(self, *, implemented=True):
+        self.implemented = implemented
+        self.batches = []
+        self.invokes = []
+
+    def InvokeBatch(self, request, timeout=None):
+        if not self.implemented:
+            raise UnimplementedRpcError()
+        self.batches.append(request)
+        results = []
+        for call in request.calls:
+            results.append(self.Invoke(call, timeout=timeout))
+            if results[-1].error.code:
+                break
+        return grpc_pb2.InvokeBatchResponse(results=results)
+
+    def Invoke(self, request, timeout=None):
+        self.invokes.append(request.method)
+        if request.method == "set_rx_antenna":
+            return grpc_pb2.InvokeResponse(
+                error=grpc_pb2.ErrorEnvelope(
+                    code="RemoteRFNativeUHDError",
+                    message="bad antenna",
+                )
+            )
+        return grpc_pb2.InvokeResponse(result=encode_value(request.method))
+
+
+class SchemaControlStub:
+    """Serve ``schema()``; old servers ignore hash_only and omit_schema."""
+
+    def __init__(self, *, honours_hints=True):
+        self.honours_hints = honours_hints
+        self.schema = schema()
+        self.full_schemas = 0
+        self.requests = []
+
+    def Negotiate(self, request, timeout=None):
+        return grpc_pb2.NegotiateResponse(
+            schema_version=SCHEMA_VERSION,
+            control_protocol_version=CONTROL_PROTOCOL_VERSION,
+            streaming_protocol_version=STREAMING_PROTOCOL_VERSION,
+        )
+
+    def _schema_json(self, omit):
+        if omit and self.honours_hints:
+            return ""
+        self.full_schemas += 1
+        return json.dumps(self.schema)
+
+    def GetSchema(self, request, timeout=None):
+        self.requests.append(request)
+        return grpc_pb2.GetSchemaResponse(
+            schema_version=SCHEMA_VERSION,
+            schema_json=self._schema_json(request.hash_only),
+            schema_hash=self.schema["schema_hash"],
+        )
+
+    def OpenSession(self, request, timeout=None):
+        self.requests.append(request)
+        return grpc_pb2.OpenSessionResponse(
+            session_id="session",
+            device_handle="device",
+            schema_json=self._schema_json(request.omit_schema),
+            schema_hash=request.requested_schema_hash,
+            uhd_version="4.10.0.0",
+        )
+
+
+class UnimplementedRpcError(grpc.RpcError):
+    def code(self):
+        return grpc.StatusCode.UNIMPLEMENTED
+
+    def details(self):
+        return "InvokeBatch is not implemented"
+
+
 class FailingSampleStub:
     def __init__(self):
         self.calls = 0
@@ -463,6 +629,12 @@ class DynamicV2Tests(unittest.TestCase):
 
         device.set_rx_gain(8.0, "PGA", 1)
         self.assertEqual(transport.calls[-1][3], "gain_name_chan")
+        (binder,) = [
+            item
+            for item in MultiUSRP._binders.values()
+            if item.descriptor["name"] == "set_rx_gain"
+        ]
+        self.assertEqual(len(binder._plans), 2, "binders persist across calls")
         with self.assertRaisesRegex(TypeError, "incompatible arguments"):
             device.set_rx_gain(8.0, object())
         with self.assertRaisesRegex(TypeError, "incompatible arguments"):
@@ -504,6 +676,38 @@ class DynamicV2Tests(unittest.TestCase):
         with self.assertRaisesRegex(TypeError, "incompatible arguments"):
             OverloadBinder(positional_descriptor).bind((), {"mboard": 0})
 
+        variadic = OverloadBinder(
+            descriptor(
+                "uhd.usrp.MultiUSRP",
+                "set_user_register",
+                [
+                    overload("addr_data", [param("addr", "int"), param("data", "int|list[int]")]),
+                    overload(
+                        "extra",
+                        [
+                            param("addr", "int"),
+                            {**param("rest", "list"), "kind": "var_positional"},
+                            {**param("options", "dict"), "kind": "var_keyword"},
+                        ],
+                    ),
+                ],
+            )
+        )
+        self.assertEqual(
+            variadic.bind((1, [2, 3]), {}), ("addr_data", {"addr": 1, "data": [2, 3]})
+        )
+        self.assertEqual(
+            variadic.bind((1, [2, "x"]), {}),
+            ("extra", {"addr": 1, "__args__": [[2, "x"]]}),
+        )
+        self.assertEqual(
+            variadic.bind((np.int64(1),), {"data": 2, "mode": "x"}),
+            ("extra", {"addr": 1, "__kwargs__": {"data": 2, "mode": "x"}}),
+        )
+        with self.assertRaisesRegex(TypeError, "incompatible arguments"):
+            variadic.bind((True,), {})
+        self.assertEqual(len(variadic._plans), 3, "plans are cached per call shape")
+
         all_indexes = (1 << 64) - 1
         encoded = encode_value(all_indexes)
         self.assertEqual(encoded.WhichOneof("value"), "json_value")
@@ -645,6 +849,26 @@ class DynamicV2Tests(unittest.TestCase):
             self.assertIn("@overload", stub)
             self.assertIn("def set_rx_gain", stub)
 
+            module = types.ModuleType("remoteRF.drivers.usrp.usrp_remote")
+            module.__package__ = "remoteRF.drivers.usrp"
+            checked = []
+            validate = dynamic_v2.validate_schema_v2
+            dynamic_v2.validate_schema_v2 = lambda value: checked.append(value) or validate(value)
+            try:
+                exec(compile(source, "<usrp_remote>", "exec"), module.__dict__)
+                dynamic_v2.build_uhd_bindings(
+                    module._SCHEMA,
+                    precompiled=dict(module._PRECOMPILED, schema_hash="sha256:other"),
+                )
+            finally:
+                dynamic_v2.validate_schema_v2 = validate
+            self.assertEqual(len(checked), 1, "only the mismatched precompiled form validates")
+            _uhd, MultiUSRP = build_uhd_bindings(schema())
+            self.assertEqual(
+                module.MultiUSRP.set_rx_gain.__text_signature__,
+                MultiUSRP.set_rx_gain.__text_signature__,
+            )
+
     def test_transport_uses_raw_binary_sample_payloads(self):
         sample_stub = CapturingSampleStub()
         transport = DynamicV2Transport(
@@ -688,6 +912,593 @@ class DynamicV2Tests(unittest.TestCase):
         for timeout in sample_stub.timeouts:
             self.assertAlmostEqual(timeout, 5.1)
 
+    def test_transport_decodes_rx_payload_into_caller_buffer(self):
+        transport = DynamicV2Transport(
+            control_stub=object(),
+            sample_stub=CapturingSampleStub(),
+        )
+        buffer = np.full(4, 99 + 0j, dtype=np.complex64)
+        count, received, _metadata = transport.recv(
+            session_id="session",
+            handle="rx",
+            generation=5,
+            sequence=1,
+            buffer=buffer,
+            sample_count=4,
+            channels=[0],
+            timeout=0.1,
+            one_packet=False,
+            metadata=uhd_v2.RXMetadata(),
+        )
+        self.assertEqual(count, 2)
+        self.assertTrue(np.shares_memory(received, buffer))
+        np.testing.assert_array_equal(
+            buffer,
+            np.array([7 + 8j, 9 + 10j, 99, 99], dtype=np.complex64),
+        )
+
+    def test_streamers_reuse_one_sample_stream_until_closed(self):
+        sample_stub = PersistentSampleStub()
+
+        class StreamingTransport(FakeTransport):
+            def open_sample_stream(self, **kwargs):
+                return DynamicV2Transport(
+                    control_stub=object(),
+                    sample_stub=sample_stub,
+                ).open_sample_stream(**kwargs)
+
+        uhd, MultiUSRP = build_uhd_bindings(
+            schema(), transport_factory=StreamingTransport
+        )
+        device = MultiUSRP("token")
+        stream_args = uhd.usrp.StreamArgs("fc32", "sc16")
+        stream_args.channels = [0]
+        rx = device.get_rx_stream(stream_args)
+        buffer = np.zeros(4, dtype=np.complex64)
+        metadata = uhd.types.RXMetadata()
+        for _ in range(3):
+            self.assertEqual(rx.recv(buffer, metadata, 0.5), 4)
+        np.testing.assert_array_equal(buffer, np.arange(8, 12))
+        self.assertEqual(sample_stub.calls, 1)
+        self.assertTrue(rx.close())
+        self.assertEqual(
+            [frame.kind for frame in sample_stub.frames],
+            [
+                grpc_pb2.SAMPLE_FRAME_OPEN,
+                grpc_pb2.SAMPLE_FRAME_REQUEST,
+                grpc_pb2.SAMPLE_FRAME_REQUEST,
+                grpc_pb2.SAMPLE_FRAME_REQUEST,
+                grpc_pb2.SAMPLE_FRAME_CLOSE,
+            ],
+        )
+        self.assertEqual(
+            [frame.sequence for frame in sample_stub.frames],
+            [0, 1, 3, 5, 6],
+        )
+        self.assertEqual(
+            len({frame.operation_id for frame in sample_stub.frames}),
+            1,
+        )
+
+        tx = device.get_tx_stream(stream_args)
+        source = np.ones(3, dtype=np.complex64)
+        self.assertEqual(tx.send(source, uhd.types.TXMetadata(), 0.5), 3)
+        self.assertEqual(tx.send(source, uhd.types.TXMetadata(), 0.5), 3)
+        self.assertEqual(sample_stub.calls, 2)
+        self.assertEqual(sample_stub.frames[-1].payload, source.tobytes())
+        self.assertTrue(tx.close())
+        self.assertEqual(
+            sample_stub.frames[-1].kind,
+            grpc_pb2.SAMPLE_FRAME_CLOSE,
+        )
+
+    def test_large_tx_burst_is_split_into_data_frames_on_one_stream(self):
+        sample_stub = PersistentSampleStub()
+
+        class StreamingTransport(FakeTransport):
+            def open_session(self, token, schema_hash):
+                opened = super().open_session(token, schema_hash)
+                opened["capabilities"]["remote_resource_limits"] = {
+                    "maximum_sample_payload_bytes": 32,
+                }
+                return opened
+
+            def open_sample_stream(self, **kwargs):
+                return DynamicV2Transport(
+                    control_stub=object(),
+                    sample_stub=sample_stub,
+                ).open_sample_stream(**kwargs)
+
+        uhd, MultiUSRP = build_uhd_bindings(
+            schema(), transport_factory=StreamingTransport
+        )
+        device = MultiUSRP("token")
+        stream_args = uhd.usrp.StreamArgs("fc32", "sc16")
+        stream_args.channels = [0]
+        tx = device.get_tx_stream(stream_args)
+        source = np.arange(10, dtype=np.complex64)
+        metadata = uhd.types.TXMetadata()
+        metadata.start_of_burst = True
+        metadata.end_of_burst = True
+        self.assertEqual(tx.send(source, metadata, 0.5), 10)
+        self.assertEqual(sample_stub.calls, 1)
+        data = [
+            frame for frame in sample_stub.frames
+            if frame.kind == grpc_pb2.SAMPLE_FRAME_DATA
+        ]
+        self.assertEqual([frame.sample_count for frame in data], [4, 4, 2])
+        self.assertEqual(
+            b"".join(frame.payload for frame in data),
+            source.tobytes(),
+        )
+        self.assertEqual([frame.sequence for frame in data], [1, 3, 5])
+        bursts = [json.loads(frame.metadata_json) for frame in data]
+        self.assertEqual(
+            [(item["start_of_burst"], item["end_of_burst"]) for item in bursts],
+            [(True, False), (False, False), (False, True)],
+        )
+        self.assertTrue(tx.close())
+
+    def test_negotiated_compression_applies_to_rx_and_tx_with_raw_fallback(self):
+        class CompressingSampleStub(PersistentSampleStub):
+            def __init__(self):
+                super().__init__()
+                self.received = []
+
+            def data_frame(self, request):
+                # Small int16 codes, as a real radio idles near zero.
+                samples = (np.arange(request.sample_count) % 5).astype(np.int16)
+                payload = samples.tobytes()
+                flags = request.flags
+                if flags & 2:
+                    payload = samples.view(np.uint8).reshape(-1, 2).T.tobytes()
+                if flags & 1:
+                    payload = zlib.compress(payload, flags >> 8)
+                return reply_frame(
+                    request,
+                    kind=grpc_pb2.SAMPLE_FRAME_DATA,
+                    dtype="<i2",
+                    shape=[len(samples)],
+                    channels=list(request.channels),
+                    sample_count=len(samples),
+                    payload=payload,
+                    flags=flags & 3,
+                    metadata_json='{"error_code":"none"}',
+                )
+
+            def SampleStream(self, request_iterator, timeout=None):
+                for frame in request_iterator:
+                    if frame.kind == grpc_pb2.SAMPLE_FRAME_DATA:
+                        payload = frame.payload
+                        if frame.flags & 1:
+                            payload = zlib.decompress(payload)
+                        self.received.append((frame.flags, payload))
+                    yield from super().SampleStream(iter([frame]))
+
+        sample_stub = CompressingSampleStub()
+
+        class StreamingTransport(FakeTransport):
+            def open_session(self, token, schema_hash):
+                opened = super().open_session(token, schema_hash)
+                opened["capabilities"]["sample_compression"] = ["zlib", "shuffle-zlib"]
+                return opened
+
+            def open_sample_stream(self, **kwargs):
+                return DynamicV2Transport(
+                    control_stub=object(),
+                    sample_stub=sample_stub,
+                ).open_sample_stream(**kwargs)
+
+        uhd, MultiUSRP = build_uhd_bindings(
+            schema(), transport_factory=StreamingTransport
+        )
+        device = MultiUSRP("token")
+        rx_args = uhd.usrp.StreamArgs("s16", "sc16")
+        rx_args.channels = [0]
+        rx = device.get_rx_stream(rx_args)
+        self.assertIsNone(rx.remoterf_compression)
+        with self.assertRaisesRegex(ValueError, "does not accept"):
+            rx.remoterf_compression = "lz4"
+        rx.remoterf_compression_level = 6
+        rx.remoterf_compression = True
+        self.assertEqual(rx.remoterf_compression, "shuffle-zlib")
+
+        buffer = np.zeros(4096, dtype=np.int16)
+        metadata = uhd.types.RXMetadata()
+        self.assertEqual(rx.recv(buffer, metadata, 0.5), 4096)
+        np.testing.assert_array_equal(buffer, np.arange(4096) % 5)
+        request = [
+            frame for frame in sample_stub.frames
+            if frame.kind == grpc_pb2.SAMPLE_FRAME_REQUEST
+        ][-1]
+        self.assertEqual(request.flags, 1 | 2 | (6 << 8))
+        stats = rx.remoterf_compression_stats
+        self.assertEqual(stats["raw_bytes"], buffer.nbytes)
+        self.assertLess(stats["wire_bytes"], buffer.nbytes // 10)
+
+        tx_args = uhd.usrp.StreamArgs("fc32", "sc16")
+        tx_args.channels = [0]
+        tx = device.get_tx_stream(tx_args)
+        tx.remoterf_compression = "zlib"
+        quiet = np.zeros(256, dtype=np.complex64)
+        noise = np.random.default_rng(1).standard_normal(512).astype(np.float32)
+        noisy = noise.view(np.complex64)
+        tx_metadata = uhd.types.TXMetadata()
+        self.assertEqual(tx.send(quiet, tx_metadata, 0.5), 256)
+        self.assertEqual(tx.send(noisy, tx_metadata, 0.5), 256)
+        (quiet_flags, quiet_payload), (noisy_flags, noisy_payload) = sample_stub.received
+        self.assertTrue(quiet_flags & 1)
+        self.assertEqual(quiet_payload, quiet.tobytes())
+        self.assertEqual(noisy_flags, 0)
+        self.assertEqual(noisy_payload, noisy.tobytes())
+
+        rx.remoterf_compression = None
+        self.assertIsNone(rx.remoterf_compression_stats)
+        self.assertEqual(rx.recv(buffer, metadata, 0.5), 4096)
+        self.assertEqual(sample_stub.frames[-1].flags, 0)
+
+    def test_sc16_wire_format_scales_into_float_buffers_in_place(self):
+        class NarrowSampleStub(PersistentSampleStub):
+            def data_frame(self, request):
+                self.assertEqual(request.dtype, "sc16")
+                iq = np.array([[32767, -32767], [16384, 0], [-1, 1]], dtype="<i2")
+                return reply_frame(
+                    request,
+                    kind=grpc_pb2.SAMPLE_FRAME_DATA,
+                    dtype="sc16",
+                    shape=[3],
+                    channels=list(request.channels),
+                    sample_count=3,
+                    payload=iq.tobytes(),
+                    metadata_json='{"error_code":"none"}',
+                )
+
+        sample_stub = NarrowSampleStub()
+        sample_stub.assertEqual = self.assertEqual
+
+        class StreamingTransport(FakeTransport):
+            def open_session(self, token, schema_hash):
+                opened = super().open_session(token, schema_hash)
+                opened["capabilities"]["sample_wire_formats"] = ["sc16", "sc8"]
+                return opened
+
+            def open_sample_stream(self, **kwargs):
+                return DynamicV2Transport(
+                    control_stub=object(),
+                    sample_stub=sample_stub,
+                ).open_sample_stream(**kwargs)
+
+        uhd, MultiUSRP = build_uhd_bindings(
+            schema(), transport_factory=StreamingTransport
+        )
+        device = MultiUSRP("token")
+        rx_args = uhd.usrp.StreamArgs("fc32", "sc16")
+        rx_args.channels = [0]
+        rx = device.get_rx_stream(rx_args)
+        self.assertEqual(rx.remoterf_wire_format, "sc16")
+        buffer = np.full(4, 9 + 9j, dtype=np.complex64)
+        metadata = uhd.types.RXMetadata()
+        self.assertEqual(rx.recv(buffer, metadata, 0.5), 3)
+        np.testing.assert_allclose(
+            buffer,
+            [1 - 1j, 16384 / 32767, (-1 + 1j) / 32767, 9 + 9j],
+            rtol=1e-6,
+        )
+        channel = np.zeros((2, 8), dtype=np.complex64)[0, ::2]
+        self.assertEqual(rx.recv(channel, metadata, 0.5), 3)
+        np.testing.assert_allclose(channel[:3], buffer[:3])
+
+        tx_args = uhd.usrp.StreamArgs("fc64", "sc8")
+        tx_args.channels = [0]
+        tx_args.args["fullscale"] = "2.0"
+        tx = device.get_tx_stream(tx_args)
+        self.assertEqual(tx.remoterf_wire_format, "sc8")
+        source = np.array([2 - 2j, 0.5j, 9 + 0j], dtype=np.complex128)
+        self.assertEqual(tx.send(source, uhd.types.TXMetadata(), 0.5), 3)
+        data = [
+            frame for frame in sample_stub.frames
+            if frame.kind == grpc_pb2.SAMPLE_FRAME_DATA
+        ][-1]
+        self.assertEqual(data.dtype, "sc8")
+        self.assertEqual(
+            np.frombuffer(data.payload, dtype="i1").tolist(),
+            [127, -127, 0, 32, 127, 0],
+        )
+
+        # Frame limits count wire bytes: 4 per sc16 sample, 2 per sc8 sample.
+        device._capabilities["remote_resource_limits"] = {"maximum_sample_payload_bytes": 400}
+        self.assertEqual((rx.get_max_num_samps(), tx.get_max_num_samps()), (100, 200))
+
+        plain_args = uhd.usrp.StreamArgs("s16", "sc16")
+        plain_args.channels = [0]
+        self.assertIsNone(device.get_rx_stream(plain_args).remoterf_wire_format)
+
+    def test_credit_pipelined_rx_drains_pushed_blocks_in_order(self):
+        sample_stub = PersistentSampleStub()
+
+        class StreamingTransport(FakeTransport):
+            def open_sample_stream(self, **kwargs):
+                return DynamicV2Transport(
+                    control_stub=object(),
+                    sample_stub=sample_stub,
+                ).open_sample_stream(**kwargs)
+
+        uhd, MultiUSRP = build_uhd_bindings(
+            schema(), transport_factory=StreamingTransport
+        )
+        device = MultiUSRP("token")
+        stream_args = uhd.usrp.StreamArgs("fc32", "sc16")
+        stream_args.channels = [0]
+        rx = device.get_rx_stream(stream_args)
+        rx.remoterf_credits = 4
+        buffer = np.zeros(4, dtype=np.complex64)
+        metadata = uhd.types.RXMetadata()
+        for block in range(6):
+            self.assertEqual(rx.recv(buffer, metadata, 0.5), 4)
+            np.testing.assert_array_equal(buffer, np.arange(4) + 4 * block)
+            self.assertFalse(metadata.more_fragments)
+
+        small = np.zeros(3, dtype=np.complex64)
+        self.assertEqual(rx.recv(small, metadata, 0.5), 3)
+        self.assertTrue(metadata.more_fragments)
+        self.assertEqual(metadata.fragment_offset, 0)
+        self.assertEqual(rx.recv(small, metadata, 0.5), 1)
+        np.testing.assert_array_equal(small[:1], [27])
+        self.assertFalse(metadata.more_fragments)
+        self.assertEqual(metadata.fragment_offset, 3)
+
+        requests = [
+            frame for frame in sample_stub.frames
+            if frame.kind == grpc_pb2.SAMPLE_FRAME_REQUEST
+        ]
+        self.assertEqual(len(requests), 1)
+        self.assertEqual(requests[0].credits, 4)
+        self.assertTrue(
+            any(
+                frame.kind == grpc_pb2.SAMPLE_FRAME_CREDIT
+                for frame in sample_stub.frames
+            )
+        )
+
+        rx.remoterf_credits = 0
+        self.assertEqual(
+            sample_stub.frames[-1].kind,
+            grpc_pb2.SAMPLE_FRAME_CANCEL,
+        )
+        self.assertEqual(rx.recv(buffer, metadata, 0.5), 4)
+        self.assertEqual(
+            sample_stub.frames[-1].kind,
+            grpc_pb2.SAMPLE_FRAME_REQUEST,
+        )
+        self.assertEqual(sample_stub.calls, 1)
+        self.assertTrue(rx.close())
+
+    def test_prefetch_ring_serves_blocks_and_reports_overflow(self):
+        class GatedTransport(FakeTransport):
+            def __init__(self):
+                super().__init__()
+                self.gate = threading.Semaphore(0)
+                self.entered = threading.Semaphore(0)
+                self.blocks = 0
+
+            def recv(self, **kwargs):
+                self.entered.release()
+                if not self.gate.acquire(timeout=kwargs["timeout"]):
+                    return 0, kwargs["buffer"][..., :0], {"error_code": "timeout"}
+                count = kwargs["sample_count"]
+                samples = np.arange(
+                    self.blocks * count,
+                    (self.blocks + 1) * count,
+                ).astype(kwargs["buffer"].dtype)
+                self.blocks += 1
+                return count, samples, {"error_code": "none"}
+
+        uhd, MultiUSRP = build_uhd_bindings(
+            schema(), transport_factory=GatedTransport
+        )
+        device = MultiUSRP("token")
+        transport = device._transport
+        stream_args = uhd.usrp.StreamArgs("fc32", "sc16")
+        stream_args.channels = [0]
+        rx = device.get_rx_stream(stream_args)
+        rx.remoterf_prefetch = 2
+        buffer = np.zeros(4, dtype=np.complex64)
+        metadata = uhd.types.RXMetadata()
+
+        transport.gate.release()
+        self.assertEqual(rx.recv(buffer, metadata, 0.5), 4)
+        np.testing.assert_array_equal(buffer, np.arange(4))
+        for _ in range(3):
+            transport.gate.release()
+        for _ in range(5):
+            self.assertTrue(transport.entered.acquire(timeout=2.0))
+
+        self.assertEqual(rx.recv(buffer, metadata, 0.5), 0)
+        self.assertEqual(metadata.error_code, uhd.types.RXMetadataErrorCode.overflow)
+        self.assertEqual(rx.recv(buffer[:2], metadata, 0.5), 2)
+        self.assertTrue(metadata.more_fragments)
+        self.assertEqual(rx.recv(buffer[2:], metadata, 0.5), 2)
+        np.testing.assert_array_equal(buffer, np.arange(8, 12))
+        self.assertEqual(rx.recv(buffer, metadata, 0.5), 4)
+        np.testing.assert_array_equal(buffer, np.arange(12, 16))
+        self.assertEqual(rx.recv(buffer, metadata, 0.01), 0)
+        self.assertEqual(metadata.error_code, uhd.types.RXMetadataErrorCode.timeout)
+        self.assertTrue(rx.close())
+
+    def test_batched_calls_apply_results_and_mutations_in_order(self):
+        class BatchingTransport(FakeTransport):
+            batches = []
+
+            def invoke_batch(self, session_id, calls):
+                calls = list(calls)
+                type(self).batches.append([call[1] for call in calls])
+                return [
+                    self.invoke(session_id, handle, method, args, overload_id)
+                    for handle, method, args, overload_id in calls
+                ]
+
+        uhd, MultiUSRP = build_uhd_bindings(
+            schema(), transport_factory=BatchingTransport
+        )
+        device = MultiUSRP("token")
+        with device.remoterf_batch():
+            gain = device.set_rx_gain(12.0, "PGA", 1)
+            now = device.get_time_now()
+            tree = device.get_tree()
+            self.assertFalse(now.done())
+            with self.assertRaises(RemoteRFProtocolError):
+                now.result()
+            with self.assertRaises(TypeError):
+                device.set_rx_gain("loud")
+        self.assertEqual(
+            BatchingTransport.batches,
+            [["set_rx_gain", "get_time_now", "get_tree"]],
+        )
+        self.assertIsNone(gain.result())
+        self.assertEqual(now.result().get_real_secs(), 2.5)
+        self.assertTrue(tree.result().exists("/mboards/0"))
+
+        with self.assertRaises(RuntimeError):
+            with device.remoterf_batch():
+                device.get_time_now()
+                raise RuntimeError("abandon")
+        self.assertEqual(len(BatchingTransport.batches), 1)
+
+    def test_transport_invoke_batch_stops_at_first_failed_call(self):
+        stub = BatchControlStub()
+        transport = DynamicV2Transport(control_stub=stub, sample_stub=object())
+        calls = [
+            ("device", "set_rx_rate", {"rate": 1e6}, ""),
+            ("device", "set_rx_antenna", {"ant": "XX"}, ""),
+            ("device", "set_rx_gain", {"gain": 3.0}, ""),
+        ]
+        outcomes = transport.invoke_batch("session", calls)
+        self.assertEqual(len(stub.batches), 1)
+        self.assertEqual(outcomes[0], ("set_rx_rate", {}))
+        self.assertIsInstance(outcomes[1], RemoteRFNativeUHDError)
+        self.assertEqual(len(outcomes), 2)
+
+        legacy = BatchControlStub(implemented=False)
+        transport = DynamicV2Transport(control_stub=legacy, sample_stub=object())
+        outcomes = transport.invoke_batch("session", calls)
+        self.assertEqual(legacy.invokes, ["set_rx_rate", "set_rx_antenna"])
+        self.assertIsInstance(outcomes[-1], RemoteRFNativeUHDError)
+        transport.invoke_batch("session", calls[:1])
+        self.assertEqual(legacy.batches, [])
+        self.assertEqual(legacy.invokes[-1], "set_rx_rate")
+
+    def test_per_device_policy_gives_each_session_its_own_channels(self):
+        class Channel:
+            def __init__(self, options):
+                self.name = dict(options)["grpc.remoterf_channel"]
+
+        class ChannelControlStub(SchemaControlStub):
+            def __init__(self, channel):
+                super().__init__()
+                self.channel = channel
+
+        pools = {
+            name: ChannelPool(name, Channel, [], size=4, policy="per_device")
+            for name in ("control", "samples")
+        }
+        with mock.patch.multiple(
+            "remoteRF.core.grpc_client",
+            create=True,
+            control_channel=pools["control"].channel,
+            sample_channel=pools["samples"].channel,
+        ), mock.patch.multiple(
+            "remoteRF.core.dynamic_v2_transport.grpc_pb2_grpc",
+            DynamicControlV2Stub=ChannelControlStub,
+            SampleDataV1Stub=lambda channel: types.SimpleNamespace(channel=channel),
+        ):
+            sessions = []
+            for token in ("token-a", "token-b", "token-a"):
+                transport = DynamicV2Transport()
+                transport.negotiate()
+                transport.open_session(token, schema()["schema_hash"])
+                sessions.append((transport.control.channel.name, transport.samples.channel.name))
+        self.assertEqual(sessions[0], ("control-3", "samples-3"))
+        self.assertEqual(sessions[1], ("control-1", "samples-1"))
+        self.assertEqual(sessions[2], sessions[0])
+
+    def test_schema_is_downloaded_only_when_its_hash_is_not_cached(self):
+        with tempfile.TemporaryDirectory() as directory:
+            stub = SchemaControlStub()
+            transport = DynamicV2Transport(control_stub=stub, sample_stub=object())
+            first = fetch_schema_v2("token", transport=transport, cache=SchemaCache(directory))
+            again = fetch_schema_v2("token", transport=transport, cache=SchemaCache(directory))
+            self.assertEqual(first, again)
+            self.assertEqual(stub.full_schemas, 1)
+            self.assertTrue(stub.requests[-1].hash_only)
+
+            changed = dict(stub.schema, driver_version="9.9.9")
+            changed.pop("schema_hash")
+            canonical = json.dumps(changed, sort_keys=True, separators=(",", ":"))
+            changed["schema_hash"] = (
+                "sha256:" + hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+            )
+            stub.schema = changed
+            self.assertEqual(
+                fetch_schema_v2("token", transport=transport, cache=SchemaCache(directory)),
+                changed,
+            )
+            self.assertEqual(stub.full_schemas, 2)
+            self.assertEqual(len(list(Path(directory).glob("sha256-*.json"))), 2)
+
+            legacy = SchemaControlStub(honours_hints=False)
+            transport = DynamicV2Transport(control_stub=legacy, sample_stub=object())
+            self.assertEqual(transport.get_schema_hash("token"), schema()["schema_hash"])
+            opened = transport.open_session("token", schema()["schema_hash"])
+            self.assertEqual(opened["schema"], schema())
+
+        transport = DynamicV2Transport(control_stub=stub, sample_stub=object())
+        opened = transport.open_session("token", stub.schema["schema_hash"])
+        self.assertIsNone(opened["schema"])
+        self.assertTrue(stub.requests[-1].omit_schema)
+        self.assertEqual(stub.full_schemas, 2)
+
+    def test_credit_pipelining_requires_a_persistent_stream_transport(self):
+        uhd, MultiUSRP = build_uhd_bindings(
+            schema(), transport_factory=FakeTransport
+        )
+        rx = MultiUSRP("token").get_rx_stream(uhd.usrp.StreamArgs("fc32"))
+        with self.assertRaisesRegex(ValueError, "persistent sample stream"):
+            rx.remoterf_credits = 2
+        with self.assertRaises(ValueError):
+            rx.remoterf_credits = -1
+
+    def test_silent_persistent_stream_times_out_and_poisons_transport(self):
+        transport = DynamicV2Transport(
+            control_stub=object(),
+            sample_stub=PersistentSampleStub(answer_requests=False),
+            stream_timeout_margin_sec=0.05,
+        )
+        stream = transport.open_sample_stream(
+            session_id="session",
+            handle="rx",
+            generation=1,
+            direction="rx",
+        )
+        with self.assertRaises(RemoteRFTransportError) as raised:
+            stream.recv(
+                sequence=1,
+                buffer=np.empty(2, dtype=np.complex64),
+                sample_count=2,
+                channels=[0],
+                timeout=0.0,
+                one_packet=False,
+                metadata={},
+            )
+        self.assertTrue(raised.exception.fatal_to_session)
+        self.assertTrue(stream.closed)
+        with self.assertRaises(RemoteRFTransportError):
+            transport.open_sample_stream(
+                session_id="session",
+                handle="rx",
+                generation=1,
+                direction="rx",
+            )
+
     def test_transport_applies_control_deadlines_and_validates_timeouts(self):
         seen = []
 
@@ -0,0 +1,309 @@
+# Copyright (C) 2026 RemoteRF
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import inspect
+import types
+import unittest
+from unittest import mock
+
+import grpc
+import numpy as np
+
+from remoteRF.common.grpc import grpc_pb2
+from remoteRF.common.grpc.v2_codec import encode_value
+from remoteRF.core.channel_pool import ChannelPool
+from remoteRF.core.dynamic_v2_aio import AsyncDynamicV2Transport
+from remoteRF.core.v2_errors import RemoteRFError
+from remoteRF.drivers.dynamic_v2_aio import build_async_uhd_bindings
+from remoteRF.drivers.support import uhd_v2
+from test_dynamic_v2 import (
+    BatchControlStub,
+    FakeTransport,
+    SchemaControlStub,
+    reply_frame,
+    schema,
+)
+
+
+class AsyncFakeTransport:
+    """FakeTransport with awaitable methods; ``set_rx_gain`` waits for a peer."""
+
+    waiting = []
+
+    def __init__(self):
+        self.sync = FakeTransport()
+
+    async def negotiate(self):
+        return self.sync.negotiate()
+
+    async def open_session(self, token, schema_hash):
+        return self.sync.open_session(token, schema_hash)
+
+    async def invoke(self, session_id, handle, method, args, overload_id=""):
+        if method == "set_rx_gain":
+            peers = type(self).waiting
+            peers.append(asyncio.Event())
+            if len(peers) == 2:
+                for event in peers:
+                    event.set()
+            await asyncio.wait_for(peers[-1].wait(), 1.0)
+        return self.sync.invoke(
+            session_id, handle, method, args, overload_id=overload_id
+        )
+
+    async def recv(self, **kwargs):
+        return self.sync.recv(**kwargs)
+
+    async def send(self, **kwargs):
+        return self.sync.send(**kwargs)
+
+    async def close_handle(self, session_id, handle):
+        return self.sync.close_handle(session_id, handle)
+
+    async def close_session(self, session_id):
+        return self.sync.close_session(session_id)
+
+
+class FakeAioSampleCall:
+    def __init__(self, stub):
+        self.stub = stub
+        self.replies = asyncio.Queue()
+
+    async def write(self, frame):
+        self.stub.frames.append(frame)
+        if frame.kind == grpc_pb2.SAMPLE_FRAME_OPEN:
+            self.replies.put_nowait(
+                reply_frame(frame, kind=grpc_pb2.SAMPLE_FRAME_RESULT)
+            )
+        elif frame.kind == grpc_pb2.SAMPLE_FRAME_REQUEST:
+            samples = np.arange(frame.sample_count).astype(np.complex64)
+            self.replies.put_nowait(
+                reply_frame(
+                    frame,
+                    kind=grpc_pb2.SAMPLE_FRAME_DATA,
+                    dtype=samples.dtype.str,
+                    shape=[len(samples)],
+                    channels=list(frame.channels),
+                    sample_count=len(samples),
+                    payload=samples.tobytes(),
+                    metadata_json='{"error_code":"none"}',
+                )
+            )
+        elif frame.kind == grpc_pb2.SAMPLE_FRAME_DATA:
+            self.replies.put_nowait(
+                reply_frame(
+                    frame,
+                    kind=grpc_pb2.SAMPLE_FRAME_RESULT,
+                    sample_count=frame.sample_count,
+                )
+            )
+
+    async def read(self):
+        return await self.replies.get()
+
+    async def done_writing(self):
+        self.replies.put_nowait(grpc.aio.EOF)
+
+    def cancel(self):
+        return True
+
+
+class FakeAioSampleStub:
+    def __init__(self):
+        self.calls = 0
+        self.frames = []
+
+    def SampleStream(self, request_iterator=None, timeout=None):
+        self.calls += 1
+        return FakeAioSampleCall(self)
+
+
+class FakeAioControlStub:
+    async def Invoke(self, request, timeout=None):
+        return grpc_pb2.InvokeResponse(result=encode_value(request.method))
+
+
+class AwaitableStub:
+    """Expose a sync fake stub's RPC methods as coroutines."""
+
+    def __init__(self, stub):
+        self.stub = stub
+
+    def __getattr__(self, name):
+        method = getattr(self.stub, name)
+
+        async def call(request, timeout=None):
+            return method(request, timeout=timeout)
+
+        return call
+
+
+class AsyncDynamicV2Tests(unittest.IsolatedAsyncioTestCase):
+    async def test_two_sessions_run_control_calls_concurrently(self):
+        AsyncFakeTransport.waiting = []
+        uhd, AsyncMultiUSRP = build_async_uhd_bindings(
+            schema(), transport_factory=AsyncFakeTransport
+        )
+        first = await AsyncMultiUSRP("token-a")
+        async with AsyncMultiUSRP("token-b") as second:
+            # Each call only finishes once the other has started.
+            await asyncio.gather(
+                first.set_rx_gain(10.0, 0),
+                second.set_rx_gain(20.0, 0),
+            )
+            self.assertEqual(
+                second._transport.sync.calls[-1],
+                ("device", "set_rx_gain", {"gain": 20.0, "chan": 0}, "gain_chan"),
+            )
+            self.assertEqual(
+                (await second.get_time_now()).get_real_secs(),
+                2.5,
+            )
+        self.assertEqual(second._transport.sync.closed_sessions, ["session"])
+        self.assertTrue(await first.close())
+
+    async def test_generated_methods_report_their_schema_signature(self):
+        uhd, AsyncMultiUSRP = build_async_uhd_bindings(
+            schema(), transport_factory=AsyncFakeTransport
+        )
+        method = AsyncMultiUSRP.set_rx_gain
+        self.assertEqual(str(inspect.signature(method)), "(self, /, gain, chan=0)")
+        self.assertTrue(inspect.iscoroutinefunction(method))
+
+    async def test_async_streamers_use_transport_recv_and_send(self):
+        AsyncFakeTransport.waiting = []
+        uhd, AsyncMultiUSRP = build_async_uhd_bindings(
+            schema(), transport_factory=AsyncFakeTransport
+        )
+        async with AsyncMultiUSRP("token") as device:
+            stream_args = uhd.usrp.StreamArgs("fc32", "sc16")
+            stream_args.channels = [0]
+            rx = await device.get_rx_stream(stream_args)
+            buffer = np.zeros(4, dtype=np.complex64)
+            metadata = uhd.types.RXMetadata()
+            self.assertEqual(await rx.recv(buffer, metadata, 0.1), 2)
+            np.testing.assert_array_equal(buffer[:2], [3 + 4j, 5 + 6j])
+            self.assertEqual(metadata.time_spec.get_real_secs(), 7.0)
+            tx = await device.get_tx_stream(stream_args)
+            sent = await tx.send(np.ones(3, np.complex64), uhd.types.TXMetadata())
+            self.assertEqual(sent, 3)
+            self.assertTrue(await rx.close())
+            self.assertEqual(device._transport.sync.closed_handles, ["rx-handle"])
+
+    async def test_transport_invokes_and_streams_over_aio_stubs(self):
+        sample_stub = FakeAioSampleStub()
+        transport = AsyncDynamicV2Transport(
+            control_stub=FakeAioControlStub(),
+            sample_stub=sample_stub,
+        )
+        result, mutations = await transport.invoke(
+            "session", "device", "get_rx_rate", {}
+        )
+        self.assertEqual((result, mutations), ("get_rx_rate", {}))
+
+        stream = transport.open_sample_stream(
+            session_id="session",
+            handle="rx",
+            generation=3,
+            direction="rx",
+        )
+        buffer = np.zeros(4, dtype=np.complex64)
+        for sequence in (1, 3):
+            count, samples, metadata = await stream.recv(
+                sequence=sequence,
+                buffer=buffer,
+                sample_count=4,
+                channels=[0],
+                timeout=0.5,
+                one_packet=False,
+                metadata=uhd_v2.RXMetadata(),
+            )
+            self.assertEqual(count, 4)
+            self.assertTrue(np.shares_memory(samples, buffer))
+        np.testing.assert_array_equal(buffer, np.arange(4))
+        self.assertTrue(await stream.close())
+        self.assertEqual(sample_stub.calls, 1)
+        self.assertEqual(
+            [frame.kind for frame in sample_stub.frames],
+            [
+                grpc_pb2.SAMPLE_FRAME_OPEN,
+                grpc_pb2.SAMPLE_FRAME_REQUEST,
+                grpc_pb2.SAMPLE_FRAME_REQUEST,
+                grpc_pb2.SAMPLE_FRAME_CLOSE,
+            ],
+        )
+
+    async def test_invoke_batch_uses_one_rpc_and_falls_back_to_invoke(self):
+        calls = [
+            ("device", "set_rx_rate", {}, ""),
+            ("device", "set_rx_antenna", {}, ""),
+            ("device", "set_rx_gain", {}, ""),
+        ]
+        for implemented in (True, False):
+            stub = BatchControlStub(implemented=implemented)
+            transport = AsyncDynamicV2Transport(
+                control_stub=AwaitableStub(stub),
+                sample_stub=FakeAioSampleStub(),
+            )
+            for _ in range(2):
+                outcomes = await transport.invoke_batch("session", calls)
+                self.assertEqual(outcomes[0], ("set_rx_rate", {}))
+                self.assertIsInstance(outcomes[1], RemoteRFError)
+                self.assertEqual(len(outcomes), 2)
+            self.assertEqual(len(stub.batches), 2 if implemented else 0)
+            self.assertEqual(transport._invoke_batch_supported, implemented)
+
+    async def test_per_device_policy_gives_each_session_its_own_channels(self):
+        class Channel:
+            def __init__(self, options):
+                self.name = dict(options)["grpc.remoterf_channel"]
+
+        pools = {
+            name: ChannelPool(name, Channel, [], size=4, policy="per_device")
+            for name in ("control", "samples")
+        }
+
+        def aio_channel(pool="control", key=None):
+            return pools[pool].channel(key)
+
+        def control_stub(channel):
+            stub = AwaitableStub(SchemaControlStub())
+            stub.channel = channel
+            return stub
+
+        with mock.patch(
+            "remoteRF.core.grpc_client.aio_channel", aio_channel, create=True
+        ), mock.patch.multiple(
+            "remoteRF.core.dynamic_v2_aio.grpc_pb2_grpc",
+            DynamicControlV2Stub=control_stub,
+            SampleDataV1Stub=lambda channel: types.SimpleNamespace(channel=channel),
+        ):
+            sessions = []
+            for token in ("token-a", "token-b", "token-a"):
+                transport = AsyncDynamicV2Transport()
+                await transport.negotiate()
+                await transport.open_session(token, schema()["schema_hash"])
+                sessions.append(
+                    (transport.control.channel.name, transport.samples.channel.name)
+                )
+                await transport.close()
+        self.assertEqual(sessions[0], ("control-3", "samples-3"))
+        self.assertEqual(sessions[1], ("control-1", "samples-1"))
+        self.assertEqual(sessions[2], sessions[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
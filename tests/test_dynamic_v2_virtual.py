@@ -0,0 +1,110 @@
+# Copyright (C) 2026 RemoteRF
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import time
+import unittest
+
+import numpy as np
+
+from remoteRF.drivers.dynamic_v2_virtual import build_virtual_uhd_bindings
+
+
+class VirtualDynamicV2Tests(unittest.TestCase):
+    def open(self, **options):
+        uhd, MultiUSRP = build_virtual_uhd_bindings(**options)
+        usrp = MultiUSRP("virtual")
+        self.addCleanup(usrp.close)
+        return uhd, usrp
+
+    def stream_args(self, uhd):
+        stream_args = uhd.usrp.StreamArgs("fc32", "sc16")
+        stream_args.channels = [0]
+        return stream_args
+
+    def test_settings_round_trip_with_all_channel_fallback(self):
+        uhd, usrp = self.open(realtime=False)
+        usrp.set_rx_rate(2e6)
+        usrp.set_rx_gain(30.0, 1)
+        result = usrp.set_rx_freq(uhd.types.TuneRequest(2.4e9), 0)
+
+        self.assertEqual(usrp.get_rx_rate(1), 2e6)
+        self.assertEqual(usrp.get_rx_gain(1), 30.0)
+        self.assertEqual(usrp.get_rx_gain(0), 0.0)
+        self.assertEqual(result.actual_rf_freq, 2.4e9)
+        self.assertEqual(usrp.get_rx_freq(0), 2.4e9)
+        self.assertEqual(usrp.get_rx_num_channels(), 2)
+        self.assertEqual(usrp.get_rx_gain_range(0).stop(), 76.0)
+        usrp.set_time_now(uhd.types.TimeSpec(100.0))
+        self.assertGreaterEqual(usrp.get_time_now().get_real_secs(), 100.0)
+
+    def test_rx_stream_is_paced_and_reports_timeout_and_overflow(self):
+        uhd, usrp = self.open(overflow_after_sec=0.05)
+        usrp.set_rx_rate(1e6)
+        rx = usrp.get_rx_stream(self.stream_args(uhd))
+        metadata = uhd.types.RXMetadata()
+        buffer = np.ones(20_000, dtype=np.complex64)
+
+        self.assertEqual(rx.recv(buffer, metadata, 0.01), 0)
+        self.assertEqual(metadata.error_code, uhd.types.RXMetadataErrorCode.timeout)
+
+        rx.issue_stream_cmd(uhd.types.StreamCMD(uhd.types.StreamMode.start_cont))
+        start = time.perf_counter()
+        received = sum(rx.recv(buffer, metadata, 0.5) for _ in range(5))
+        self.assertEqual(received, 100_000)
+        self.assertGreaterEqual(time.perf_counter() - start, 0.09)
+        self.assertEqual(metadata.error_code, uhd.types.RXMetadataErrorCode.none)
+        self.assertTrue(metadata.has_time_spec)
+        self.assertFalse(buffer.any())
+
+        time.sleep(0.1)
+        self.assertEqual(rx.recv(buffer, metadata, 0.5), 0)
+        self.assertEqual(metadata.error_code, uhd.types.RXMetadataErrorCode.overflow)
+
+    def test_num_done_delivers_requested_samples_from_source(self):
+        uhd, usrp = self.open(
+            realtime=False,
+            rx_source=lambda first, count: np.arange(first, first + count),
+        )
+        rx = usrp.get_rx_stream(self.stream_args(uhd))
+        command = uhd.types.StreamCMD(uhd.types.StreamMode.num_done)
+        command.num_samps = 1500
+        rx.issue_stream_cmd(command)
+        metadata = uhd.types.RXMetadata()
+        buffer = np.zeros(1000, dtype=np.complex64)
+
+        self.assertEqual(rx.recv(buffer, metadata, 0.1), 1000)
+        self.assertEqual(rx.recv(buffer, metadata, 0.1), 500)
+        self.assertEqual(buffer[0], 1000)
+        self.assertEqual(rx.recv(buffer, metadata, 0.1), 0)
+
+    def test_tx_bursts_queue_async_events(self):
+        uhd, usrp = self.open(realtime=False)
+        tx = usrp.get_tx_stream(self.stream_args(uhd))
+        metadata = uhd.types.TXMetadata()
+        metadata.start_of_burst = True
+        metadata.end_of_burst = True
+        samples = np.zeros(4000, dtype=np.complex64)
+
+        self.assertEqual(tx.send(samples, metadata, 0.1), 4000)
+        async_metadata = uhd.types.TXAsyncMetadata()
+        self.assertTrue(tx.recv_async_msg(async_metadata, 0.1))
+        self.assertEqual(
+            async_metadata.event_code, uhd.types.TXMetadataEventCode.burst_ack
+        )
+        self.assertFalse(tx.recv_async_msg(async_metadata, 0.1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+# Copyright (C) 2026 RemoteRF
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+_SRC = str(Path(__file__).resolve().parents[1] / "src")
+
+
+def _run_unconfigured(code):
+    """Run ``code`` in a fresh interpreter whose HOME has no RemoteRF config."""
+    with tempfile.TemporaryDirectory() as home:
+        env = dict(os.environ, HOME=home, USERPROFILE=home)
+        env["PYTHONPATH"] = os.pathsep.join(
+            [_SRC, *filter(None, [env.get("PYTHONPATH")])]
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env=env,
+            timeout=60,
+        )
+    if completed.returncode:
+        raise AssertionError(completed.stderr)
+    return json.loads(completed.stdout)
+
+
+class LazyImportTests(unittest.TestCase):
+    def test_v1_drivers_do_not_load_the_network_stack(self):
+        loaded = _run_unconfigured(
+            "import json, sys\n"
+            "import remoteRF.drivers.hackrf, remoteRF.drivers.rtl_sdr\n"
+            "import remoteRF.drivers.ti_mmwave, remoteRF.drivers.adalm_pluto\n"
+            "print(json.dumps([m for m in ('grpc', 'prompt_toolkit', 'dotenv',"
+            " 'remoteRF.core.grpc_client') if m in sys.modules]))\n"
+        )
+        self.assertEqual(loaded, [])
+
+    def test_grpc_client_defers_config_until_first_use(self):
+        result = _run_unconfigured(
+            "import json\n"
+            "import remoteRF.core.grpc_client as client\n"
+            "state = client._client\n"
+            "try:\n"
+            "    client.addr\n"
+            "    error = ''\n"
+            "except RuntimeError as exc:\n"
+            "    error = str(exc)\n"
+            "print(json.dumps([state, error]))\n"
+        )
+        self.assertIsNone(result[0])
+        self.assertIn("not configured", result[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
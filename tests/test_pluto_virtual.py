@@ -1,5 +1,6 @@
 import sys
 import unittest
+from unittest import mock
 
 import numpy as np
 
@@ -43,12 +44,96 @@ class VirtualPlutoTests(unittest.TestCase):
         self.assertIsNone(result)
         sdr.tx_destroy_buffer()
 
+    def test_digital_loopback_replays_tx_once_or_cyclically(self):
+        sdr = adi.Pluto(virtual=True)
+        sdr.loopback = 1
+        sdr.rx_buffer_size = 6
+        waveform = np.arange(1, 5, dtype=np.complex64)
+
+        sdr.tx(waveform)
+        np.testing.assert_array_equal(sdr.rx(), [1, 2, 3, 4, 0, 0])
+        self.assertFalse(np.any(sdr.rx()))
+
+        sdr.tx_cyclic_buffer = True
+        sdr.tx(waveform)
+        received = np.concatenate([sdr.rx(), sdr.rx()])
+        np.testing.assert_array_equal(received, np.tile(waveform, 3))
+
+        sdr.tx_destroy_buffer()
+        self.assertFalse(np.any(sdr.rx()))
+
+    def test_rf_loopback_applies_continuous_lo_offset_and_awgn(self):
+        sdr = adi.Pluto(virtual=True)
+        sdr.loopback = 2
+        sdr.tx_cyclic_buffer = True
+        sdr.sample_rate = 1_000_000
+        sdr.tx_lo = sdr.rx_lo + 125_000
+        sdr.rx_buffer_size = 1000
+        sdr.tx(np.ones(8, dtype=np.complex64))
+
+        received = np.concatenate([sdr.rx(), sdr.rx()])
+        expected = np.exp(2j * np.pi * 0.125 * np.arange(2000))
+        np.testing.assert_allclose(received, expected, atol=1e-5)
+
+        sdr.remoterf_virtual_channel(snr_db=10.0, seed=7)
+        noise = sdr.rx() - np.exp(2j * np.pi * 0.125 * np.arange(2000, 3000))
+        self.assertAlmostEqual(np.mean(np.abs(noise) ** 2), 0.1, delta=0.02)
+
     def test_virtual_instances_have_isolated_state(self):
         first = adi.Pluto(token="same-label", virtual=True)
         second = adi.Pluto(token="same-label", virtual=True)
         first.sample_rate = 123
         self.assertNotEqual(first.sample_rate, second.sample_rate)
 
+    def test_property_cache_expires_and_survives_tx(self):
+        sdr = adi.Pluto(virtual=True)
+        cache = sdr.remoterf_enable_cache(ttl=1.0)
+        now = [0.0]
+        cache._clock = lambda: now[0]
+        with mock.patch.object(adi, "_get", wraps=adi._get) as get:
+            sdr.rx_buffer_size = 4096
+            self.assertEqual(sdr.rx_buffer_size, 4096)
+            sdr.tx(np.zeros(4, dtype=np.complex64))
+            self.assertEqual(sdr.sample_rate, 2_500_000)
+            self.assertEqual(sdr.sample_rate, 2_500_000)
+            self.assertEqual(get.call_count, 1)
+            now[0] = 1.5
+            self.assertEqual(sdr.rx_buffer_size, 4096)
+            self.assertEqual(get.call_count, 2)
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+
+    def test_property_cache_rereads_quantized_values_and_skips_failures(self):
+        sdr = adi.Pluto(virtual=True)
+        sdr.remoterf_enable_cache()
+        with mock.patch.object(adi, "_get", wraps=adi._get) as get:
+            sdr.rx_lo = 915_000_000
+            sdr.rx_lo
+            sdr.rx_hardwaregain_chan0
+            sdr.rx_hardwaregain_chan0
+            self.assertEqual(
+                [call.args[0] for call in get.call_args_list],
+                ["rx_lo", "rx_hardwaregain_chan0", "rx_hardwaregain_chan0"],
+            )
+
+        remote = adi.Pluto.__new__(adi.Pluto)
+        remote.token = "remote-token"
+        remote.remoterf_enable_cache()
+        replies = [RuntimeError("server busy"), 7]
+
+        def flaky(prop, token):
+            reply = replies.pop(0)
+            if isinstance(reply, Exception):
+                raise reply
+            return reply
+
+        rejected = mock.patch.object(adi, "_set", side_effect=RuntimeError("rejected"))
+        with mock.patch.object(adi, "_get", flaky), rejected, mock.patch("builtins.input"):
+            self.assertIsNone(remote.rx_buffer_size)
+            self.assertEqual(remote.rx_buffer_size, 7)
+            self.assertIn("rx_buffer_size", remote.remoterf_cache)
+            remote.filter = "taps.ftr"
+        self.assertNotIn("filter", remote.remoterf_cache)
+
     def test_real_mode_still_requires_token(self):
         with self.assertRaisesRegex(ValueError, "reservation token"):
             adi.Pluto()
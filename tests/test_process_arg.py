@@ -112,6 +112,41 @@ class ProcessArgTests(unittest.TestCase):
             np.array([1 + 2j, 3 + 4j], dtype=np.complex64),
         )
 
+    def test_complex_arrays_decode_in_bulk_with_omitted_components(self):
+        # Proto3 leaves zero real or imaginary parts off the wire.
+        original = np.array([[1 + 2j, 0j, 3j], [-4 + 0j, -0.5 + 1e-30j, 7 - 8j]], dtype=np.complex64)
+        encoded = grpc_pb2.Argument()
+        encoded.complex_array.shape.dim.extend(original.shape)
+        for value in original.ravel():
+            item = encoded.complex_array.data.add()
+            item.real = float(value.real)
+            item.imag = float(value.imag)
+        received = grpc_pb2.Argument.FromString(encoded.SerializeToString())
+
+        decoded = unmap_arg(received)
+
+        self.assertEqual(decoded.dtype, np.complex64)
+        np.testing.assert_array_equal(decoded, original)
+
+    def test_complex_json_arrays_keep_their_dtype_and_shape(self):
+        for dtype in (np.complex64, np.complex128):
+            original = (np.arange(6) * (0.5 - 1j)).astype(dtype).reshape(2, 3)
+            with self.subTest(dtype=dtype):
+                decoded = unmap_arg(map_arg({"samples": original, "empty": original[:0]}))
+                self.assertEqual(decoded["samples"].dtype, original.dtype)
+                np.testing.assert_array_equal(decoded["samples"], original)
+                self.assertEqual(decoded["empty"].shape, (0, 3))
+
+    def test_binary_arrays_can_decode_as_read_only_views(self):
+        encoded = map_arg(np.arange(6, dtype=np.float32).reshape(2, 3))
+
+        view = unmap_arg(encoded, copy=False)
+
+        self.assertFalse(view.flags.writeable)
+        self.assertFalse(view.flags.owndata)
+        np.testing.assert_array_equal(view, np.arange(6).reshape(2, 3))
+        self.assertTrue(unmap_arg(encoded).flags.writeable)
+
     def test_malformed_binary_arrays_are_rejected(self):
         malformed = [
             grpc_pb2.Argument(
@@ -0,0 +1,127 @@
+# Copyright (C) 2026 RemoteRF
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import datetime
+import types
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from remoteRF.common.utils.process_arg import map_arg, unmap_arg
+from remoteRF.core import grpc_acc
+from remoteRF.core.reservations import ReservationCache, ReservationTable
+
+
+def epoch(hour: int) -> int:
+    return int(datetime.datetime(2026, 3, 2, hour).timestamp())
+
+
+def reply(**results):
+    return types.SimpleNamespace(results={key: map_arg(value) for key, value in results.items()})
+
+
+class ReservationQueryTests(unittest.TestCase):
+    def setUp(self):
+        self.account = grpc_acc.RemoteRFAccount("ada", "pw")
+        self.calls = []
+
+    def serve(self, *replies):
+        replies = list(replies)
+
+        def rpc_client(*, function_name, args):
+            self.calls.append((function_name, {key: unmap_arg(value) for key, value in args.items()}))
+            return replies.pop(0)
+
+        patcher = mock.patch.object(grpc_acc, "rpc_client", rpc_client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_cache_sends_filters_and_applies_changes_since_cursor(self):
+        self.serve(
+            reply(
+                id=["7", "8"], user=["ada", "ada"], dd=np.array([2, 1]),
+                st=np.array([epoch(9), epoch(10)]), et=np.array([epoch(10), epoch(11)]),
+                cursor=41, full=True,
+            ),
+            reply(
+                id=["9"], user=["ada"], dd=np.array([1]),
+                st=np.array([epoch(8)]), et=np.array([epoch(9)]),
+                removed=["7"], cursor=42,
+            ),
+        )
+        cache = ReservationCache(self.account)
+        start = datetime.datetime(2026, 3, 2)
+
+        first = cache.get(user="ada", device_ids=[1, 2], start=start)
+        self.assertEqual(list(first.device_ids), [1, 2])
+        table = cache.get(user="ada", device_ids=[2, 1], start=start)
+
+        name, args = self.calls[0]
+        self.assertEqual(name, "ACC:query_res")
+        self.assertEqual((args["fu"], list(args["dd"]), args["st"]), ("ada", [1, 2], int(start.timestamp())))
+        self.assertNotIn("since", args)
+        self.assertEqual(self.calls[1][1]["since"], 41)
+        self.assertEqual(list(table.ids), ["9", "8"])
+        rows = list(table.rows())
+        self.assertEqual(rows[0]["start_time"], datetime.datetime(2026, 3, 2, 8))
+        self.assertEqual(rows[1]["internal_id"], "8")
+
+    def test_legacy_servers_are_parsed_and_filtered_on_the_client(self):
+        legacy = reply(
+            **{
+                "3": "ada,4,2026-03-02 09:00:00,2026-03-02 10:00:00",
+                "5": "bob,4,2026-03-02 11:00:00,2026-03-02 12:00:00",
+            }
+        )
+        self.serve(reply(UE="unknown function"), legacy, legacy)
+
+        changes = self.account.query_reservations(user="bob")
+        self.assertTrue(changes.full)
+        self.assertIsNone(changes.cursor)
+        self.assertEqual(list(changes.rows.ids), ["5"])
+        window = self.account.query_reservations(end=datetime.datetime(2026, 3, 2, 10))
+        self.assertEqual(list(window.rows.users), ["ada"])
+        self.assertEqual([name for name, _args in self.calls], ["ACC:query_res", "ACC:get_res", "ACC:get_res"])
+
+    def test_servers_refusing_query_res_with_an_error_fall_back_once(self):
+        legacy = reply(**{"3": "ada,4,2026-03-02 09:00:00,2026-03-02 10:00:00"})
+        self.serve(reply(ace="Unknown function ACC:query_res"), legacy, legacy)
+
+        for _ in range(2):
+            self.assertEqual(list(self.account.query_reservations().rows.ids), ["3"])
+        self.assertEqual([name for name, _args in self.calls], ["ACC:query_res", "ACC:get_res", "ACC:get_res"])
+
+    def test_errors_from_both_calls_are_raised_and_query_res_is_retried(self):
+        denied = reply(ace="Invalid credentials")
+        self.serve(denied, denied, reply(cursor=1, full=True))
+
+        with self.assertRaisesRegex(RuntimeError, "Invalid credentials"):
+            self.account.query_reservations()
+        self.assertTrue(self.account.query_reservations().full)
+        self.assertEqual([name for name, _args in self.calls], ["ACC:query_res", "ACC:get_res", "ACC:query_res"])
+
+    def test_table_filter_and_merge(self):
+        table = ReservationTable(["a", "b"], ["ada", "bob"], [3, 3], [epoch(12), epoch(9)], [epoch(13), epoch(10)])
+        self.assertEqual(list(table.ids), ["b", "a"])
+        self.assertEqual(list(table.filter(device_ids=[3], start=epoch(10)).ids), ["a"])
+        self.assertEqual(len(table.filter(device_ids=[4])), 0)
+        moved = ReservationTable(["b"], ["bob"], [1], [epoch(14)], [epoch(15)])
+        merged = table.merge(moved, removed=["a"])
+        self.assertEqual((list(merged.ids), list(merged.device_ids)), (["b"], [1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
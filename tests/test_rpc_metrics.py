@@ -0,0 +1,149 @@
+# Copyright (C) 2026 RemoteRF
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import grpc
+
+from remoteRF.common.grpc import grpc_pb2
+from remoteRF.core.dynamic_v2_transport import DynamicV2Transport
+from remoteRF.core.rpc_metrics import RPCMetrics, message_size, metrics, timed
+from remoteRF.core.v2_errors import RemoteRFError, RemoteRFTransportError
+
+
+class UnavailableError(grpc.RpcError):
+    def code(self):
+        return grpc.StatusCode.UNAVAILABLE
+
+    def details(self):
+        return "connection reset"
+
+    def trailing_metadata(self):
+        return (("grpc-previous-rpc-attempts", "2"),)
+
+
+class FinishedCall:
+    def trailing_metadata(self):
+        return (("grpc-previous-rpc-attempts", "1"),)
+
+
+class Callable:
+    """A unary multi-callable exposing ``with_call`` like grpcio's."""
+
+    def __init__(self, response):
+        self.response = response
+
+    def __call__(self, request, timeout=None):
+        raise AssertionError("with_call should be preferred")
+
+    def with_call(self, request, timeout=None):
+        return self.response, FinishedCall()
+
+
+class ControlStub:
+    def __init__(self):
+        self.Invoke = Callable(
+            grpc_pb2.InvokeResponse(
+                error=grpc_pb2.ErrorEnvelope(code="INVALID_ARGUMENT", message="bad gain")
+            )
+        )
+
+    def Negotiate(self, request, timeout=None):
+        raise UnavailableError()
+
+
+class RPCMetricsTests(unittest.TestCase):
+    def setUp(self):
+        metrics.reset()
+        self.addCleanup(metrics.reset)
+
+    def test_snapshot_reports_latency_bytes_and_errors_per_method(self):
+        registry = RPCMetrics()
+        for seconds in (0.0004, 0.003, 0.003, 0.2):
+            registry.record("A/x", seconds, request_bytes=10, response_bytes=100)
+        registry.record("A/x", 20.0, error="DEADLINE_EXCEEDED", retries=3)
+
+        stats = registry.snapshot()["methods"]["A/x"]
+        self.assertEqual(stats["calls"], 5)
+        self.assertEqual(stats["request_bytes"], 40)
+        self.assertEqual(stats["response_bytes"], 400)
+        self.assertEqual(stats["errors"], {"DEADLINE_EXCEEDED": 1})
+        self.assertEqual(stats["retries"], 3)
+        latency = stats["latency_ms"]
+        self.assertAlmostEqual(latency["min"], 0.4)
+        self.assertAlmostEqual(latency["max"], 20000.0)
+        self.assertEqual(latency["p50"], 5.0)
+        self.assertEqual(latency["p99"], 20000.0)
+        self.assertEqual(latency["buckets"]["le_0.5ms"], 1)
+        self.assertEqual(latency["buckets"]["inf"], 1)
+
+        registry.snapshot(reset=True)
+        self.assertEqual(registry.snapshot()["methods"], {})
+        registry.enabled = False
+        registry.record("A/x", 1.0)
+        self.assertEqual(registry.snapshot()["methods"], {})
+
+    def test_sample_frames_are_sized_from_their_payload_and_skipped_when_disabled(self):
+        frame = grpc_pb2.SampleFrame(payload=b"\0" * 4096, dtype="<c8", shape=[512])
+        with mock.patch.object(grpc_pb2.SampleFrame, "ByteSize", side_effect=AssertionError):
+            with timed("S/rx", frame) as timer:
+                timer.response(frame)
+            metrics.enabled = False
+            self.addCleanup(setattr, metrics, "enabled", True)
+            with timed("S/rx", frame) as timer:
+                timer.response(frame)
+        stats = metrics.snapshot()["methods"]["S/rx"]
+        self.assertEqual(stats["calls"], 1)
+        self.assertEqual(stats["request_bytes"], stats["response_bytes"])
+        self.assertGreaterEqual(stats["request_bytes"], frame.ByteSize())
+        self.assertEqual(message_size(grpc_pb2.NegotiateRequest()), 0)
+
+    def test_dump_writes_json_snapshots(self):
+        registry = RPCMetrics()
+        registry.record("A/x", 0.01)
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "metrics" / "rpc.json"
+            registry.start_periodic_dump(path, interval_sec=3600)
+            registry.stop_periodic_dump()
+            written = json.loads(path.read_text(encoding="utf-8"))
+        self.assertEqual(written["methods"]["A/x"]["calls"], 1)
+        with self.assertRaises(ValueError):
+            registry.start_periodic_dump(path, interval_sec=0)
+
+    def test_transport_records_control_rpcs_by_method(self):
+        transport = DynamicV2Transport(control_stub=ControlStub(), sample_stub=object())
+        with self.assertRaises(RemoteRFTransportError):
+            transport.negotiate()
+        with self.assertRaises(RemoteRFError):
+            transport.invoke("session", "device", "set_rx_gain", {"gain": 10.0})
+
+        methods = metrics.snapshot()["methods"]
+        negotiate = methods["DynamicControlV2.Negotiate"]
+        self.assertEqual(negotiate["errors"], {"UNAVAILABLE": 1})
+        self.assertEqual(negotiate["retries"], 2)
+        self.assertGreater(negotiate["request_bytes"], 0)
+        invoke = methods["DynamicControlV2.Invoke/set_rx_gain"]
+        self.assertEqual(invoke["calls"], 1)
+        self.assertEqual(invoke["errors"], {"INVALID_ARGUMENT": 1})
+        self.assertEqual(invoke["retries"], 1)
+        self.assertGreater(invoke["response_bytes"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
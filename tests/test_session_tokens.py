@@ -0,0 +1,123 @@
+# Copyright (C) 2026 RemoteRF
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import os
+import stat
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from remoteRF.common.utils.process_arg import map_arg, unmap_arg
+from remoteRF.core import grpc_acc
+from remoteRF.core.session_tokens import SESSION_METADATA_KEY, SessionStore, store_from_env
+
+
+def reply(**results):
+    return types.SimpleNamespace(results={key: map_arg(value) for key, value in results.items()})
+
+
+class SessionStoreTests(unittest.TestCase):
+    def test_file_is_owner_only_and_shared_files_are_ignored(self):
+        with tempfile.TemporaryDirectory() as root:
+            path = Path(root) / "client" / "sessions.json"
+            store = store_from_env({"REMOTERF_SESSION_FILE": str(path)})
+            store.put("host:1", "ada", "tok", 600)
+            store.put("host:1", "old", "gone", 0)
+
+            self.assertEqual(stat.S_IMODE(path.stat().st_mode), 0o600)
+            self.assertEqual(stat.S_IMODE(path.parent.stat().st_mode), 0o700)
+            reloaded = SessionStore(path)
+            self.assertEqual(reloaded.get("host:1", "ada").value, "tok")
+            self.assertIsNone(reloaded.get("host:1", "old"))
+            self.assertIsNone(reloaded.get("host:2", "ada"))
+
+            os.chmod(path, 0o644)
+            self.assertIsNone(SessionStore(path).get("host:1", "ada"))
+        self.assertIsNone(store_from_env({}).path)
+
+
+class SessionAccountTests(unittest.TestCase):
+    def setUp(self):
+        self.account = grpc_acc.RemoteRFAccount("ada", "secret", sessions=SessionStore())
+        self.calls = []
+        patcher = mock.patch.dict(os.environ, {"REMOTERF_ADDR": "host:1"})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def serve(self, *replies):
+        replies = list(replies)
+
+        def rpc_client(*, function_name, args, metadata=None):
+            self.calls.append((function_name, {key: unmap_arg(value) for key, value in args.items()}, metadata))
+            return replies.pop(0)
+
+        patcher = mock.patch.object(grpc_acc, "rpc_client", rpc_client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_calls_after_login_send_the_token_instead_of_the_password(self):
+        self.serve(reply(UC="ada", session="tok", session_ttl=600), reply(Perms="User"), reply(ok=1))
+        with mock.patch("builtins.print"):
+            self.assertTrue(self.account.login_user())
+        self.account.get_perms()
+        self.account.cancel_reservation(4)
+
+        _name, login_args, login_metadata = self.calls[0]
+        self.assertEqual(login_args["pw"], "secret")
+        self.assertIsNone(login_metadata)
+        for _name, args, metadata in self.calls[1:]:
+            self.assertNotIn("pw", args)
+            self.assertEqual(args["un"], "ada")
+            self.assertEqual(metadata, ((SESSION_METADATA_KEY, "tok"),))
+        self.assertEqual(self.calls[2][1]["res_id"], 4)
+
+    def test_rejected_or_expired_tokens_are_renewed_with_one_login(self):
+        self.account.sessions.put("host:1", "ada", "stale", 600)
+        self.serve(
+            reply(SX="expired"), reply(UC="ada", session="fresh", session_ttl=0), reply(Perms="User"),
+            reply(UC="ada", session="next", session_ttl=600), reply(Perms="User"), reply(Perms="User"),
+        )
+
+        self.assertEqual(unmap_arg(self.account.get_perms().results["Perms"]), "User")
+        self.account.get_perms()  # "fresh" expired on arrival
+        self.account.get_perms()
+
+        names = [name for name, _args, _metadata in self.calls]
+        self.assertEqual(names, ["ACC:get_perms", "ACC:login", "ACC:get_perms", "ACC:login", "ACC:get_perms", "ACC:get_perms"])
+        tokens = [metadata[0][1] for name, _args, metadata in self.calls if name == "ACC:get_perms"]
+        self.assertEqual(tokens, ["stale", "fresh", "next", "next"])
+        self.assertTrue(all("pw" not in args for name, args, _metadata in self.calls if name != "ACC:login"))
+
+    def test_rejected_token_without_a_password_raises(self):
+        account = grpc_acc.RemoteRFAccount("ada", None, sessions=SessionStore())
+        account.sessions.put("host:1", "ada", "stale", 600)
+        self.serve(reply(SX="expired"))
+        with self.assertRaisesRegex(RuntimeError, "expired; log in again"):
+            account.get_devices()
+        self.assertIsNone(account.sessions.get("host:1", "ada"))
+
+    def test_servers_without_sessions_keep_using_the_password(self):
+        self.serve(reply(UC="ada"), reply(Perms="User"))
+        with mock.patch("builtins.print"):
+            self.account.login_user()
+        self.account.get_perms()
+        self.assertEqual(self.calls[1][1]["pw"], "secret")
+        self.assertIsNone(self.calls[1][2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,228 @@
+# Copyright (C) 2026 RemoteRF
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from remoteRF.drivers.support.replay import replay
+from remoteRF.drivers.support.sigmf import open_sigmf, record_to_sigmf, sigmf_paths
+
+
+class FakeDevice:
+    def get_rx_rate(self, chan):
+        return 1e6
+
+    def get_rx_freq(self, chan):
+        return 2.4e9
+
+
+class FakeRXStreamer:
+    """Counts samples up from zero and reports the scripted error codes."""
+
+    def __init__(self, channels=(0,), events=()):
+        self._owner = FakeDevice()
+        self._channels = list(channels)
+        self._cpu_format = "fc32"
+        self.events = list(events)
+        self.commands = []
+        self.buffers = []
+        self.next_value = 0
+
+    def get_max_num_samps(self):
+        return 4
+
+    def issue_stream_cmd(self, command):
+        self.commands.append(command.mode.value)
+
+    def recv(self, buffer, metadata, timeout):
+        self.buffers.append(buffer)
+        event = self.events.pop(0) if self.events else "none"
+        # ("timeout", n): the call timed out after delivering n samples.
+        event, count = event if isinstance(event, tuple) else (event, None)
+        snapshot = {
+            "error_code": event,
+            "has_time_spec": True,
+            "time_spec": {"__uhd_type__": "TimeSpec", "secs": self.next_value / 1e6},
+        }
+        if event != "none" and count is None:
+            metadata.update(snapshot)
+            return 0
+        count = buffer.shape[-1] if count is None else count
+        values = self.next_value + np.arange(count)
+        if buffer.ndim == 2:
+            values = values + 1000j * np.arange(len(self._channels))[:, None]
+        buffer[..., :count] = values
+        self.next_value += count
+        metadata.update(snapshot)
+        return count
+
+
+class FakeTXStreamer:
+    """Accepts at most ``limit`` samples per send and queues async events."""
+
+    def __init__(self, channels=(0,), limit=4, events=()):
+        self._channels = list(channels)
+        self.limit = limit
+        self.events = list(events)
+        self.sent = []
+        self.bursts = []
+
+    def get_max_num_samps(self):
+        return 4
+
+    def send(self, samples, metadata, timeout):
+        count = min(self.limit, samples.shape[-1])
+        self.sent.append(np.array(samples[..., :count]))
+        self.bursts.append((metadata.start_of_burst, metadata.end_of_burst))
+        return count
+
+    def recv_async_msg(self, metadata, timeout):
+        if not self.events:
+            return False
+        metadata.update({"event_code": self.events.pop(0)})
+        return True
+
+
+class SigMFRecordingTests(unittest.TestCase):
+    def test_records_straight_into_the_memory_mapped_data_file(self):
+        streamer = FakeRXStreamer(events=["none", "overflow"])
+        with tempfile.TemporaryDirectory() as directory:
+            base = Path(directory) / "capture"
+            result = record_to_sigmf(streamer, base, duration=10e-6)
+
+            data_path, meta_path = sigmf_paths(base)
+            samples = np.fromfile(data_path, dtype="<c8")
+            meta = json.loads(meta_path.read_text())
+
+        self.assertEqual(result["samples"], 10)
+        self.assertTrue(result["complete"])
+        np.testing.assert_array_equal(samples, np.arange(10))
+        self.assertTrue(all(isinstance(item, np.memmap) for item in streamer.buffers))
+        self.assertEqual(streamer.commands, ["start_cont", "stop_cont"])
+        self.assertEqual(meta["global"]["core:datatype"], "cf32_le")
+        self.assertEqual(meta["global"]["core:sample_rate"], 1e6)
+        self.assertEqual(meta["global"]["remoterf:overflows"], 1)
+        self.assertEqual(
+            meta["annotations"],
+            [{"core:sample_start": 4, "core:label": "overflow"}],
+        )
+        self.assertEqual(
+            [item["core:sample_start"] for item in meta["captures"]], [0, 4]
+        )
+        self.assertEqual(meta["captures"][0]["core:frequency"], 2.4e9)
+        self.assertAlmostEqual(meta["captures"][1]["remoterf:time_spec"], 4e-6)
+
+    def test_multichannel_samples_are_interleaved_and_timeouts_truncate(self):
+        streamer = FakeRXStreamer(
+            channels=[0, 1], events=["none", "timeout", "timeout", "timeout"]
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            result = record_to_sigmf(streamer, Path(directory) / "two.sigmf-data", 12)
+            samples = np.fromfile(result["data_path"], dtype="<c8").reshape(-1, 2)
+            meta = json.loads(Path(result["meta_path"]).read_text())
+
+        self.assertFalse(result["complete"])
+        self.assertEqual(result["samples"], 4)
+        np.testing.assert_array_equal(samples[:, 0], np.arange(4))
+        np.testing.assert_array_equal(samples[:, 1], np.arange(4) + 1000j)
+        self.assertEqual(meta["global"]["core:num_channels"], 2)
+        self.assertFalse(meta["global"]["remoterf:complete"])
+
+    def test_timeouts_that_delivered_samples_keep_them(self):
+        streamer = FakeRXStreamer(events=["none", ("timeout", 2), "timeout"])
+        with tempfile.TemporaryDirectory() as directory:
+            result = record_to_sigmf(streamer, Path(directory) / "slow", 10)
+            samples = np.fromfile(result["data_path"], dtype="<c8")
+
+        self.assertTrue(result["complete"])
+        np.testing.assert_array_equal(samples, np.arange(10))
+
+    def test_argument_errors(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "bad"
+            with self.assertRaises(ValueError):
+                record_to_sigmf(FakeRXStreamer(), path)
+            with self.assertRaises(ValueError):
+                record_to_sigmf(FakeRXStreamer(), path, 0)
+
+
+
+class ReplayTests(unittest.TestCase):
+    def test_replays_a_recording_in_chunks_and_counts_underflows(self):
+        with tempfile.TemporaryDirectory() as directory:
+            result = record_to_sigmf(
+                FakeRXStreamer(), Path(directory) / "wave", 10, sample_rate=1e9
+            )
+            samples, meta = open_sigmf(result["data_path"])
+            self.assertIsInstance(samples, np.memmap)
+            streamer = FakeTXStreamer(limit=3, events=["underflow", "burst_ack"])
+            outcome = replay(streamer, result["meta_path"], loop=2, async_every=1)
+
+        self.assertEqual(meta["global"]["core:sample_rate"], 1e9)
+        self.assertEqual(outcome["samples"], 20)
+        self.assertTrue(outcome["complete"])
+        self.assertEqual(outcome["underflows"], 1)
+        self.assertEqual(outcome["events"], {"underflow": 1, "burst_ack": 1})
+        sent = np.concatenate(streamer.sent)
+        np.testing.assert_array_equal(sent, np.tile(np.arange(10), 2))
+        self.assertTrue(all(len(item) <= 3 for item in streamer.sent))
+        self.assertEqual(streamer.bursts[0], (True, False))
+        self.assertEqual(streamer.bursts[-1], (False, True))
+        # A partially accepted final chunk is resent with end_of_burst, as in UHD.
+        self.assertFalse(any(end for _, end in streamer.bursts[:-2]))
+
+    def test_endless_loop_stops_on_event_and_closes_the_burst(self):
+        stop = threading.Event()
+        waveform = np.arange(6, dtype=np.complex64)
+
+        class StoppingStreamer(FakeTXStreamer):
+            def send(self, samples, metadata, timeout):
+                if len(self.sent) == 5:
+                    stop.set()
+                return super().send(samples, metadata, timeout)
+
+        streamer = StoppingStreamer()
+        outcome = replay(streamer, waveform, loop=True, pace=False, stop_event=stop)
+
+        self.assertFalse(outcome["complete"])
+        self.assertEqual(outcome["loops"], 3)
+        self.assertEqual(streamer.bursts[-1], (False, True))
+        self.assertEqual(streamer.sent[-1].size, 0)
+
+    def test_integer_iq_recordings_and_raw_files_are_scaled_per_chunk(self):
+        with tempfile.TemporaryDirectory() as directory:
+            base = Path(directory) / "iq"
+            data_path, meta_path = sigmf_paths(base)
+            np.array([[32767, 0], [0, -32767]], dtype="<i2").tofile(data_path)
+            meta_path.write_text(json.dumps({"global": {"core:datatype": "ci16_le"}}))
+            streamer = FakeTXStreamer()
+            replay(streamer, base, pace=False)
+
+            raw = Path(directory) / "tone.bin"
+            np.arange(3, dtype=np.complex64).tofile(raw)
+            raw_streamer = FakeTXStreamer()
+            replay(raw_streamer, raw)
+
+        np.testing.assert_allclose(streamer.sent[0], [1, -1j])
+        np.testing.assert_array_equal(raw_streamer.sent[0], [0, 1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()